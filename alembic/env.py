@@ -12,7 +12,7 @@ from alembic import context
 
 # Import your models here so Alembic can detect them
 from app.core.database import Base
-from app.models import user, pet, appointment, clinic, communication
+from app.models import user, pet, appointment, clinic, communication, notification
 from app.core.config import get_settings
 
 # this is the Alembic Config object, which provides
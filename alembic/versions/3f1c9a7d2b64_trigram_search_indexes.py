@@ -0,0 +1,67 @@
+"""Trigram search indexes
+
+Enables pg_trgm and adds GIN trigram indexes on the columns searched by the
+pet, clinic, veterinarian and user list endpoints (see app.core.search).
+Indexes are built concurrently so existing tables stay writable. Tables that
+do not exist yet are skipped; create_all builds their indexes with them.
+
+Revision ID: 3f1c9a7d2b64
+Revises:
+Create Date: 2026-10-16 21:05:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b64'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+SEARCH_COLUMNS = {
+    "pets": ("name", "breed", "species"),
+    "clinics": ("name", "description", "city", "address_line1"),
+    "veterinarians": ("bio", "license_number"),
+    "users": ("first_name", "last_name", "email"),
+}
+
+
+def _existing_tables() -> set:
+    if context.is_offline_mode():
+        return set(SEARCH_COLUMNS)
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    tables = _existing_tables()
+    with op.get_context().autocommit_block():
+        for table_name, column_names in SEARCH_COLUMNS.items():
+            if table_name not in tables:
+                continue
+            for column_name in column_names:
+                op.create_index(
+                    f"ix_{table_name}_{column_name}_trgm",
+                    table_name,
+                    [column_name],
+                    if_not_exists=True,
+                    postgresql_using="gin",
+                    postgresql_ops={column_name: "gin_trgm_ops"},
+                    postgresql_concurrently=True,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name, column_names in SEARCH_COLUMNS.items():
+            for column_name in column_names:
+                op.drop_index(
+                    f"ix_{table_name}_{column_name}_trgm",
+                    table_name=table_name,
+                    if_exists=True,
+                    postgresql_concurrently=True,
+                )
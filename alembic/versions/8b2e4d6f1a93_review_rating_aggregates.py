@@ -0,0 +1,117 @@
+"""Review rating aggregates
+
+Adds the review count, sum and average columns kept on clinics and
+veterinarians (plus the veterinarian sub-rating counts and sums), backfills
+them from the existing reviews and indexes them for sorting by rating.
+Tables that do not exist yet are skipped; create_all builds them with the
+columns.
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-16 22:10:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6f1a93'
+down_revision = '3f1c9a7d2b64'
+branch_labels = None
+depends_on = None
+
+
+SUB_RATINGS = ("bedside_manner_rating", "expertise_rating", "communication_rating")
+
+
+def _existing_tables() -> set:
+    if context.is_offline_mode():
+        return {"clinics", "veterinarians"}
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _add_aggregate_columns(table_name: str, sub_ratings=()) -> None:
+    op.add_column(table_name, sa.Column("rating_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column(table_name, sa.Column("rating_sum", sa.Integer(), server_default="0", nullable=False))
+    op.add_column(table_name, sa.Column("rating_average", sa.Float(), server_default="0", nullable=False))
+    for name in sub_ratings:
+        op.add_column(table_name, sa.Column(f"{name}_count", sa.Integer(), server_default="0", nullable=False))
+        op.add_column(table_name, sa.Column(f"{name}_sum", sa.Integer(), server_default="0", nullable=False))
+
+
+def upgrade() -> None:
+    tables = _existing_tables()
+
+    if "clinics" in tables:
+        _add_aggregate_columns("clinics")
+        op.execute(
+            """
+            UPDATE clinics SET
+                rating_count = r.review_count,
+                rating_sum = r.rating_sum,
+                rating_average = r.rating_sum::float / r.review_count
+            FROM (
+                SELECT clinic_id, count(*) AS review_count, sum(rating) AS rating_sum
+                FROM clinic_reviews
+                GROUP BY clinic_id
+            ) AS r
+            WHERE clinics.id = r.clinic_id
+            """
+        )
+
+    if "veterinarians" in tables:
+        _add_aggregate_columns("veterinarians", SUB_RATINGS)
+        sub_rating_set = "".join(
+            f",\n                {name}_count = r.{name}_count,\n                {name}_sum = r.{name}_sum"
+            for name in SUB_RATINGS
+        )
+        sub_rating_select = "".join(
+            f", count({name}) AS {name}_count, coalesce(sum({name}), 0) AS {name}_sum"
+            for name in SUB_RATINGS
+        )
+        op.execute(
+            f"""
+            UPDATE veterinarians SET
+                rating_count = r.review_count,
+                rating_sum = r.rating_sum,
+                rating_average = r.rating_sum::float / r.review_count{sub_rating_set}
+            FROM (
+                SELECT veterinarian_id, count(*) AS review_count, sum(rating) AS rating_sum{sub_rating_select}
+                FROM veterinarian_reviews
+                GROUP BY veterinarian_id
+            ) AS r
+            WHERE veterinarians.id = r.veterinarian_id
+            """
+        )
+
+    with op.get_context().autocommit_block():
+        for table_name in ("clinics", "veterinarians"):
+            if table_name not in tables:
+                continue
+            op.create_index(
+                f"ix_{table_name}_rating",
+                table_name,
+                ["rating_average", "rating_count", "id"],
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name in ("clinics", "veterinarians"):
+            op.drop_index(
+                f"ix_{table_name}_rating",
+                table_name=table_name,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+    for name in SUB_RATINGS:
+        op.drop_column("veterinarians", f"{name}_sum")
+        op.drop_column("veterinarians", f"{name}_count")
+    for table_name in ("clinics", "veterinarians"):
+        op.drop_column(table_name, "rating_average")
+        op.drop_column(table_name, "rating_sum")
+        op.drop_column(table_name, "rating_count")
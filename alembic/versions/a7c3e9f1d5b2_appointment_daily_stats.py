@@ -0,0 +1,92 @@
+"""Appointment daily stats rollup
+
+Adds appointment_daily_stats, the per clinic, veterinarian, UTC day, status,
+type and priority rollup that the appointment write paths keep up to date
+incrementally, and backfills it from the existing appointments with the
+aggregation rebuild_daily_stats runs (app.appointments.daily_stats).
+
+Without the backfill, the first change to an appointment created before the
+deploy would subtract its contribution from an empty row. Run this upgrade
+before deploying code that writes the rollup; appointments changed in
+between are reconciled by the nightly rebuild.
+
+Revision ID: a7c3e9f1d5b2
+Revises: f2a6d8c4b317
+Create Date: 2026-10-17 01:10:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e9f1d5b2'
+down_revision = 'f2a6d8c4b317'
+branch_labels = None
+depends_on = None
+
+
+def _existing_tables() -> set:
+    if context.is_offline_mode():
+        return {"appointments"}
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    tables = _existing_tables()
+    if "appointments" not in tables:
+        # create_all builds both tables; there is nothing to backfill
+        return
+
+    if "appointment_daily_stats" not in tables:
+        op.create_table(
+            "appointment_daily_stats",
+            sa.Column("clinic_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("clinics.id"), nullable=False),
+            sa.Column(
+                "veterinarian_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("veterinarians.id"), nullable=False
+            ),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("status", postgresql.ENUM(name="appointmentstatus", create_type=False), nullable=False),
+            sa.Column(
+                "appointment_type", postgresql.ENUM(name="appointmenttype", create_type=False), nullable=False
+            ),
+            sa.Column("priority", postgresql.ENUM(name="appointmentpriority", create_type=False), nullable=False),
+            sa.Column("appointment_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("estimated_revenue", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("actual_revenue", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.PrimaryKeyConstraint(
+                "clinic_id", "veterinarian_id", "day", "status", "appointment_type", "priority"
+            ),
+        )
+        op.create_index("ix_appointment_daily_stats_day", "appointment_daily_stats", ["day"])
+
+    # Same aggregation as rebuild_daily_stats, over every day
+    op.execute("DELETE FROM appointment_daily_stats")
+    op.execute(
+        """
+        INSERT INTO appointment_daily_stats (
+            clinic_id, veterinarian_id, day, status, appointment_type, priority,
+            appointment_count, estimated_revenue, actual_revenue
+        )
+        SELECT
+            clinic_id,
+            veterinarian_id,
+            date(timezone('UTC', scheduled_at)) AS day,
+            status,
+            appointment_type,
+            priority,
+            count(id),
+            coalesce(sum(estimated_cost), 0),
+            coalesce(sum(actual_cost), 0)
+        FROM appointments
+        GROUP BY clinic_id, veterinarian_id, date(timezone('UTC', scheduled_at)),
+                 status, appointment_type, priority
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_appointment_daily_stats_day", table_name="appointment_daily_stats", if_exists=True)
+    op.drop_table("appointment_daily_stats")
@@ -0,0 +1,68 @@
+"""Unique appointment slots
+
+Adds a unique index on appointment_slots (veterinarian_id, clinic_id,
+start_time), which slot generation relies on for INSERT ... ON CONFLICT DO
+NOTHING. Existing duplicates are removed first, keeping the copy with the
+most bookings (then the oldest).
+
+Revision ID: c4a7e1b9d052
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-16 22:45:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a7e1b9d052'
+down_revision = '8b2e4d6f1a93'
+branch_labels = None
+depends_on = None
+
+
+def _slots_table_exists() -> bool:
+    if context.is_offline_mode():
+        return True
+    return "appointment_slots" in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    if not _slots_table_exists():
+        return
+
+    op.execute(
+        """
+        DELETE FROM appointment_slots
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY veterinarian_id, clinic_id, start_time
+                    ORDER BY current_bookings DESC, created_at, id
+                ) AS copy
+                FROM appointment_slots
+            ) AS ranked
+            WHERE copy > 1
+        )
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_appointment_slots_vet_clinic_start",
+            "appointment_slots",
+            ["veterinarian_id", "clinic_id", "start_time"],
+            unique=True,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_appointment_slots_vet_clinic_start",
+            table_name="appointment_slots",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
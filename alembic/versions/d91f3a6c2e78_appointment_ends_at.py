@@ -0,0 +1,55 @@
+"""Appointment ends_at
+
+Stores each appointment's end time so overlap checks compare plain columns
+instead of computing scheduled_at + duration_minutes per row, and indexes
+(veterinarian_id, scheduled_at, ends_at) for those checks.
+
+Revision ID: d91f3a6c2e78
+Revises: c4a7e1b9d052
+Create Date: 2026-10-16 23:20:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91f3a6c2e78'
+down_revision = 'c4a7e1b9d052'
+branch_labels = None
+depends_on = None
+
+
+def _appointments_table_exists() -> bool:
+    if context.is_offline_mode():
+        return True
+    return "appointments" in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    if not _appointments_table_exists():
+        return
+
+    op.add_column("appointments", sa.Column("ends_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE appointments SET ends_at = scheduled_at + duration_minutes * interval '1 minute'")
+    op.alter_column("appointments", "ends_at", nullable=False)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_appointments_vet_schedule",
+            "appointments",
+            ["veterinarian_id", "scheduled_at", "ends_at"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_appointments_vet_schedule",
+            table_name="appointments",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_column("appointments", "ends_at")
@@ -0,0 +1,107 @@
+"""Appointment slot booking
+
+Links appointments to the slot they were booked into (appointments.slot_id)
+and adds an exclusion constraint so a veterinarian's active appointments
+cannot overlap, except appointments sharing one slot (max_bookings > 1).
+
+The constraint cannot be added while overlapping active appointments exist;
+upgrade stops with a count of them so they can be resolved by hand rather
+than being changed here.
+
+Revision ID: e5b8c2d7f413
+Revises: d91f3a6c2e78
+Create Date: 2026-10-17 00:10:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b8c2d7f413'
+down_revision = 'd91f3a6c2e78'
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUSES = "('SCHEDULED', 'CONFIRMED', 'IN_PROGRESS')"
+
+
+def _appointments_table_exists() -> bool:
+    if context.is_offline_mode():
+        return True
+    return "appointments" in sa.inspect(op.get_bind()).get_table_names()
+
+
+def _overlapping_appointments() -> int:
+    if context.is_offline_mode():
+        return 0
+    return op.get_bind().execute(sa.text(
+        f"""
+        SELECT count(*)
+        FROM appointments a
+        JOIN appointments b
+          ON a.veterinarian_id = b.veterinarian_id
+         AND a.id < b.id
+         AND a.scheduled_at < b.ends_at
+         AND b.scheduled_at < a.ends_at
+        WHERE a.status IN {ACTIVE_STATUSES}
+          AND b.status IN {ACTIVE_STATUSES}
+        """
+    )).scalar()
+
+
+def upgrade() -> None:
+    if not _appointments_table_exists():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column("appointments", sa.Column("slot_id", postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        "appointments_slot_id_fkey",
+        "appointments",
+        "appointment_slots",
+        ["slot_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    overlapping = _overlapping_appointments()
+    if overlapping:
+        raise RuntimeError(
+            f"{overlapping} pairs of active appointments overlap for the same veterinarian; "
+            "reschedule or cancel them before adding ex_appointments_vet_overlap"
+        )
+    op.execute(
+        f"""
+        ALTER TABLE appointments ADD CONSTRAINT ex_appointments_vet_overlap
+        EXCLUDE USING gist (
+            veterinarian_id WITH =,
+            tstzrange(scheduled_at, ends_at) WITH &&,
+            coalesce(slot_id, id) WITH <>
+        ) WHERE (status IN {ACTIVE_STATUSES})
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_appointments_slot_id",
+            "appointments",
+            ["slot_id"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_appointments_slot_id",
+            table_name="appointments",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.execute("ALTER TABLE appointments DROP CONSTRAINT IF EXISTS ex_appointments_vet_overlap")
+    op.drop_constraint("appointments_slot_id_fkey", "appointments", type_="foreignkey")
+    op.drop_column("appointments", "slot_id")
@@ -0,0 +1,60 @@
+"""Notification outbox
+
+Adds notification_outbox, written in the same transaction as the changes it
+announces and drained by the per-channel notification workers, with a
+partial index over pending rows for their polling query.
+
+Revision ID: f2a6d8c4b317
+Revises: e5b8c2d7f413
+Create Date: 2026-10-17 00:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a6d8c4b317'
+down_revision = 'e5b8c2d7f413'
+branch_labels = None
+depends_on = None
+
+notification_channel = postgresql.ENUM("EMAIL", "SMS", "PUSH", name="notificationchannel")
+outbox_status = postgresql.ENUM("PENDING", "SENT", "SKIPPED", "DEAD", name="outboxstatus")
+
+
+def upgrade() -> None:
+    notification_channel.create(op.get_bind(), checkfirst=True)
+    outbox_status.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "notification_outbox",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("channel", postgresql.ENUM(name="notificationchannel", create_type=False), nullable=False),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("payload", postgresql.JSON(), nullable=True),
+        sa.Column("recipient", sa.String(255), nullable=True),
+        sa.Column("subject", sa.String(255), nullable=True),
+        sa.Column("body", sa.Text(), nullable=True),
+        sa.Column("idempotency_key", sa.String(255), nullable=False, unique=True),
+        sa.Column("status", postgresql.ENUM(name="outboxstatus", create_type=False), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_notification_outbox_pending",
+        "notification_outbox",
+        ["channel", "next_attempt_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_outbox_pending", table_name="notification_outbox")
+    op.drop_table("notification_outbox")
+    outbox_status.drop(op.get_bind(), checkfirst=True)
+    notification_channel.drop(op.get_bind(), checkfirst=True)
@@ -3,20 +3,26 @@ API dependencies and middleware.
 """
 import logging
 from typing import Optional, Dict, Any
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.redis import redis_client
 from app.core.exceptions import AuthenticationError
+from app.core.rate_limit import get_rate_limiter
 from app.services.clerk_service import get_clerk_service
 from app.services.user_sync_service import UserSyncService
 from app.services.auth_cache_service import get_auth_cache_service
 from app.models.user import User, UserRole
+from app.models.clinic import Veterinarian
 from app.schemas.clerk_schemas import ClerkUser
+from app.auth.principal import AuthenticatedPrincipal
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # Security scheme for JWT tokens
 security = HTTPBearer()
@@ -79,6 +85,117 @@ async def verify_clerk_token(
         )
 
 
+async def _sync_local_user(
+    clerk_id: str,
+    user_sync_service: UserSyncService
+) -> User:
+    """
+    Sync a user from Clerk into the local database and return it.
+    
+    Raises:
+        HTTPException: If user sync fails
+    """
+    # Get full user data from Clerk (this may also use cache)
+    clerk_service = get_clerk_service()
+    clerk_user = await clerk_service.get_user_by_clerk_id(clerk_id)
+    
+    # Sync user data
+    sync_response = await user_sync_service.sync_user_data(clerk_user)
+    
+    if not sync_response.success:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"User synchronization failed: {sync_response.message}"
+        )
+    
+    # Get the local user
+    local_user = await user_sync_service.get_user_by_clerk_id(clerk_id)
+    if not local_user:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="User not found after synchronization"
+        )
+    
+    return local_user
+
+
+async def _principal_from_user(user: User, db: AsyncSession) -> AuthenticatedPrincipal:
+    """
+    Build a principal for a loaded user and cache it for later requests.
+    """
+    clinic_id = None
+    if user.role == UserRole.VETERINARIAN:
+        clinic_id = await db.scalar(
+            select(Veterinarian.clinic_id).where(Veterinarian.user_id == user.id)
+        )
+        # Re-cache with the clinic so the next request resolves from cache
+        await get_auth_cache_service().cache_user_data(user, clinic_id=clinic_id)
+    return AuthenticatedPrincipal.from_user(user, clinic_id=clinic_id)
+
+
+async def get_current_principal(
+    token_data: Dict[str, Any] = Depends(verify_clerk_token),
+    db: AsyncSession = Depends(get_db)
+) -> AuthenticatedPrincipal:
+    """
+    Resolve the authenticated principal, from cache whenever possible.
+    
+    A cache hit costs no database round-trip. On a miss the user is synced
+    from Clerk and the result cached for following requests.
+    
+    Args:
+        token_data: Verified token data from Clerk
+        db: Database session, only used on a cache miss
+        
+    Returns:
+        AuthenticatedPrincipal: Identity, role and permissions of the caller
+        
+    Raises:
+        HTTPException: If user sync fails or the account is inactive
+    """
+    from app.services.monitoring_service import get_monitoring_service
+    import time
+    
+    monitoring_service = get_monitoring_service()
+    start_time = time.time()
+    
+    try:
+        clerk_id = token_data["clerk_id"]
+        
+        principal = None
+        cached_user_data = await get_auth_cache_service().get_user_data(clerk_id)
+        if cached_user_data:
+            principal = AuthenticatedPrincipal.from_cached_user_data(cached_user_data)
+        
+        if principal is None:
+            local_user = await _sync_local_user(clerk_id, UserSyncService(db))
+            principal = await _principal_from_user(local_user, db)
+        else:
+            logger.debug("Using cached user data for authentication")
+        
+        if not principal.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User account is inactive"
+            )
+        
+        duration = time.time() - start_time
+        monitoring_service.record_performance_metric("user_sync", duration)
+        return principal
+        
+    except HTTPException:
+        duration = time.time() - start_time
+        monitoring_service.record_performance_metric("user_sync", duration)
+        raise
+    except Exception:
+        duration = time.time() - start_time
+        monitoring_service.record_performance_metric("user_sync", duration)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="User synchronization failed"
+        )
+
+
 async def sync_clerk_user(
     token_data: Dict[str, Any] = Depends(verify_clerk_token),
     db: AsyncSession = Depends(get_db)
@@ -87,6 +204,9 @@ async def sync_clerk_user(
     Ensure user exists in local database and sync with Clerk data.
     Uses caching for performance optimization.
     
+    Only handlers that need the ORM User should depend on this; identity and
+    role checks can use get_current_principal without a database round-trip.
+    
     Args:
         token_data: Verified token data from Clerk
         db: Database session
@@ -104,14 +224,13 @@ async def sync_clerk_user(
     start_time = time.time()
     
     try:
-        clerk_service = get_clerk_service()
         user_sync_service = UserSyncService(db)
         cache_service = get_auth_cache_service()
         
         clerk_id = token_data["clerk_id"]
         
-        # Try to get user from cache first
-        cached_user_data = await cache_service.get_cached_user_data(clerk_id)
+        # Cached user data means the user was synced recently
+        cached_user_data = await cache_service.get_user_data(clerk_id)
         if cached_user_data:
             # Get local user by ID from cached data
             local_user = await user_sync_service.get_user_by_clerk_id(clerk_id)
@@ -121,29 +240,7 @@ async def sync_clerk_user(
                 monitoring_service.record_performance_metric("user_sync", duration)
                 return local_user
         
-        # Get full user data from Clerk (this may also use cache)
-        clerk_user = await clerk_service.get_user_by_clerk_id(clerk_id)
-        
-        # Sync user data
-        sync_response = await user_sync_service.sync_user_data(clerk_user)
-        
-        if not sync_response.success:
-            duration = time.time() - start_time
-            monitoring_service.record_performance_metric("user_sync", duration)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"User synchronization failed: {sync_response.message}"
-            )
-        
-        # Get the local user
-        local_user = await user_sync_service.get_user_by_clerk_id(clerk_id)
-        if not local_user:
-            duration = time.time() - start_time
-            monitoring_service.record_performance_metric("user_sync", duration)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="User not found after synchronization"
-            )
+        local_user = await _sync_local_user(clerk_id, user_sync_service)
         
         duration = time.time() - start_time
         monitoring_service.record_performance_metric("user_sync", duration)
@@ -320,6 +417,34 @@ def require_veterinarian_role():
     return require_role(UserRole.VETERINARIAN)
 
 
+def require_principal_role(required_roles: list[UserRole]):
+    """
+    Dependency factory for role checks that need no ORM User.
+    
+    Args:
+        required_roles: List of acceptable user roles
+        
+    Returns:
+        function: Dependency function returning the AuthenticatedPrincipal
+    """
+    async def role_checker(
+        principal: AuthenticatedPrincipal = Depends(get_current_principal)
+    ) -> AuthenticatedPrincipal:
+        if principal.role not in required_roles:
+            from app.services.monitoring_service import get_monitoring_service
+            monitoring_service = get_monitoring_service()
+            monitoring_service.record_authorization_failure("insufficient_role")
+            
+            role_names = [role.value for role in required_roles]
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied. Required roles: {', '.join(role_names)}, current role: {principal.role.value}"
+            )
+        return principal
+    
+    return role_checker
+
+
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db)
@@ -370,38 +495,82 @@ async def get_redis_client():
 
 
 class RateLimiter:
-    """Rate limiting dependency."""
+    """
+    Sliding-window rate limiting dependency.
     
-    def __init__(self, max_requests: int = 100, window_seconds: int = 3600):
-        self.max_requests = max_requests
-        self.window_seconds = window_seconds
+    Clients are identified by Clerk user ID when their token has already been
+    verified by this worker, otherwise by IP address. Responses carry
+    RateLimit-Limit, RateLimit-Remaining and RateLimit-Reset headers.
+    """
     
-    async def __call__(
+    def __init__(
         self,
-        request,
-        redis_client=Depends(get_redis_client)
+        max_requests: int = 100,
+        window_seconds: int = 3600,
+        name: str = "default",
+        per_route: bool = False
     ):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.name = name
+        self.per_route = per_route
+    
+    def _client_key(self, request: Request) -> str:
+        """Identify the client, and the route when limits are per route."""
+        client = f"ip:{request.client.host if request.client else 'unknown'}"
+        authorization = request.headers.get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            token_data = get_auth_cache_service().peek_jwt_validation(authorization[len("Bearer "):])
+            if token_data and token_data.get("clerk_id"):
+                client = f"user:{token_data['clerk_id']}"
+        
+        if self.per_route:
+            route = request.scope.get("route")
+            return f"{self.name}:{client}:{request.method}:{getattr(route, 'path', request.url.path)}"
+        return f"{self.name}:{client}"
+    
+    async def __call__(self, request: Request, response: Response):
         """
         Check rate limit for the request.
         
         Args:
             request: FastAPI request object
-            redis_client: Redis client
+            response: Response whose headers receive the rate limit state
             
         Raises:
             HTTPException: If rate limit exceeded
         """
-        # This is a placeholder implementation
-        # In a real implementation, you would:
-        # 1. Get client IP or user ID
-        # 2. Check current request count in Redis
-        # 3. Increment counter or raise rate limit error
+        result = await get_rate_limiter().hit(
+            self._client_key(request), self.max_requests, self.window_seconds
+        )
+        headers = {
+            "RateLimit-Limit": str(result.limit),
+            "RateLimit-Remaining": str(result.remaining),
+            "RateLimit-Reset": str(result.reset_seconds),
+        }
         
-        # For now, just pass through
-        return
+        if not result.allowed:
+            from app.services.monitoring_service import get_monitoring_service
+            get_monitoring_service().record_authorization_failure("rate_limited")
+            
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+                headers={**headers, "Retry-After": str(result.reset_seconds)},
+            )
+        
+        response.headers.update(headers)
 
 
 # Common rate limiters
-rate_limit_strict = RateLimiter(max_requests=10, window_seconds=60)  # 10 requests per minute
-rate_limit_moderate = RateLimiter(max_requests=100, window_seconds=3600)  # 100 requests per hour
-rate_limit_lenient = RateLimiter(max_requests=1000, window_seconds=3600)  # 1000 requests per hour
\ No newline at end of file
+rate_limit_strict = RateLimiter(max_requests=10, window_seconds=60, name="strict")  # 10 requests per minute
+rate_limit_moderate = RateLimiter(max_requests=100, window_seconds=3600, name="moderate")  # 100 requests per hour
+rate_limit_lenient = RateLimiter(max_requests=1000, window_seconds=3600, name="lenient")  # 1000 requests per hour
+
+# Route policies
+rate_limit_default = RateLimiter(  # Settings.RATE_LIMIT_PER_MINUTE across the versioned API
+    max_requests=settings.RATE_LIMIT_PER_MINUTE, window_seconds=60, name="api"
+)
+rate_limit_expensive = RateLimiter(  # Per route for statistics, calendar and location search
+    max_requests=settings.RATE_LIMIT_EXPENSIVE_PER_MINUTE, window_seconds=60, name="expensive", per_route=True
+)
\ No newline at end of file
@@ -8,8 +8,11 @@ from typing import Dict, Any, Optional
 import logging
 
 from app.services.monitoring_service import get_monitoring_service, MonitoringService
-from app.api.deps import require_admin_role, get_optional_user
-from app.models.user import User
+from app.services.auth_cache_service import get_auth_cache_service
+from app.core.single_flight import get_single_flight
+from app.api.deps import require_principal_role, get_optional_user
+from app.auth.principal import AuthenticatedPrincipal
+from app.models.user import UserRole
 
 logger = logging.getLogger(__name__)
 
@@ -98,10 +101,10 @@ async def clerk_health_check():
 
 @router.get("/metrics/authentication", response_model=Dict[str, Any])
 async def authentication_metrics(
-    current_user: User = Depends(require_admin_role())
+    principal: AuthenticatedPrincipal = Depends(require_principal_role([UserRole.ADMIN]))
 ):
     """
-    Get authentication metrics.
+    Get authentication metrics, including JWT cache hit ratios per tier.
     Requires admin role for security.
     """
     monitoring_service = get_monitoring_service()
@@ -110,6 +113,8 @@ async def authentication_metrics(
         metrics = monitoring_service.get_authentication_metrics()
         return {
             "metrics": metrics,
+            # Hit ratios of this worker's JWT validation cache tiers
+            "token_cache": get_auth_cache_service().get_jwt_tier_statistics(),
             "timestamp": monitoring_service.metrics.recent_attempts[-1] if monitoring_service.metrics.recent_attempts else None
         }
     except Exception as e:
@@ -122,7 +127,7 @@ async def authentication_metrics(
 
 @router.get("/metrics/performance", response_model=Dict[str, Any])
 async def performance_metrics(
-    current_user: User = Depends(require_admin_role())
+    principal: AuthenticatedPrincipal = Depends(require_principal_role([UserRole.ADMIN]))
 ):
     """
     Get performance metrics.
@@ -134,6 +139,8 @@ async def performance_metrics(
         metrics = monitoring_service.get_performance_metrics()
         return {
             "metrics": metrics,
+            # Expensive reads run by this worker vs. answered by a concurrent identical call
+            "request_coalescing": get_single_flight().statistics(),
             "description": "Performance metrics for various operations"
         }
     except Exception as e:
@@ -146,7 +153,7 @@ async def performance_metrics(
 
 @router.get("/security/suspicious-patterns", response_model=Dict[str, Any])
 async def suspicious_patterns(
-    current_user: User = Depends(require_admin_role())
+    principal: AuthenticatedPrincipal = Depends(require_principal_role([UserRole.ADMIN]))
 ):
     """
     Get detected suspicious authentication patterns.
@@ -198,7 +205,7 @@ async def simple_status_check():
 @router.post("/webhook/alert", response_model=Dict[str, Any])
 async def receive_monitoring_alert(
     alert_data: Dict[str, Any],
-    current_user: User = Depends(require_admin_role())
+    principal: AuthenticatedPrincipal = Depends(require_principal_role([UserRole.ADMIN]))
 ):
     """
     Receive alerts from external monitoring systems.
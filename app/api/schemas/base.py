@@ -46,8 +46,9 @@ class PaginationResponse(BaseSchema):
     
     page: int = Field(description="Current page number")
     per_page: int = Field(description="Items per page")
-    total: int = Field(description="Total number of items")
-    pages: int = Field(description="Total number of pages")
+    total: Optional[int] = Field(description="Total number of items; null when the count was skipped")
+    pages: Optional[int] = Field(description="Total number of pages; null when the count was skipped")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 class SuccessResponse(BaseSchema):
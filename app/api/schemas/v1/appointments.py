@@ -49,6 +49,7 @@ class AppointmentCreateV1(AppointmentBaseV1):
     follow_up_required: bool = Field(False, description="Whether follow-up is required")
     follow_up_date: Optional[datetime] = Field(None, description="Follow-up date if required")
     follow_up_notes: Optional[str] = Field(None, description="Follow-up notes")
+    slot_id: Optional[uuid.UUID] = Field(None, description="Appointment slot to book")
 
 
 class AppointmentUpdateV1(BaseSchema):
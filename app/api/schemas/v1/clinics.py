@@ -54,6 +54,8 @@ class ClinicResponseV1(BaseSchema, IDMixin, TimestampMixin):
     
     # Rating information
     average_rating: Optional[float] = Field(None, description="Average rating from reviews")
+    rating_count: Optional[int] = Field(None, description="Number of reviews")
+    distance_miles: Optional[float] = Field(None, description="Distance from the search location in miles")
 
     class Config:
         from_attributes = True
@@ -109,6 +111,11 @@ class VeterinarianResponseV1(BaseSchema, IDMixin, TimestampMixin):
     
     # Rating information
     average_rating: Optional[float] = Field(None, description="Average rating from reviews")
+    rating_count: Optional[int] = Field(None, description="Number of reviews")
+    average_bedside_manner_rating: Optional[float] = Field(None, description="Average bedside manner rating")
+    average_expertise_rating: Optional[float] = Field(None, description="Average expertise rating")
+    average_communication_rating: Optional[float] = Field(None, description="Average communication rating")
+    distance_miles: Optional[float] = Field(None, description="Distance from the search location in miles")
 
     class Config:
         from_attributes = True
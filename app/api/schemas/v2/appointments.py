@@ -53,6 +53,7 @@ class AppointmentCreateV2(AppointmentBaseV2):
     reminder_preferences: Optional[Dict[str, bool]] = Field(None, description="Reminder preferences")
     pre_appointment_checklist: Optional[List[str]] = Field(None, description="Pre-appointment checklist items")
     emergency_contact: Optional[Dict[str, str]] = Field(None, description="Emergency contact for appointment")
+    slot_id: Optional[uuid.UUID] = Field(None, description="Appointment slot to book")
 
     @validator('scheduled_at')
     def validate_scheduled_at(cls, v):
@@ -298,10 +298,11 @@ class PetListResponseV2(BaseSchema):
     """V2 schema for paginated pet list responses with enhanced information."""
     
     pets: List[PetResponseV2] = Field(..., description="List of pets")
-    total: int = Field(..., description="Total number of pets")
+    total: Optional[int] = Field(..., description="Total number of pets (estimated or omitted per count mode)")
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(None, description="Total number of pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
     # V2 enhanced metadata
     statistics: Optional[Dict[str, Any]] = Field(None, description="List statistics")
     filters_applied: Optional[Dict[str, Any]] = Field(None, description="Applied filters summary")
@@ -310,6 +311,8 @@ class PetListResponseV2(BaseSchema):
     def calculate_total_pages(cls, v, values):
         total = values.get('total', 0)
         per_page = values.get('per_page', 10)
+        if total is None:
+            return None
         if per_page <= 0:
             return 0
         return (total + per_page - 1) // per_page
@@ -1,14 +1,17 @@
 """
 V1 API Routes - Version-specific endpoints using shared controllers
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.api.deps import rate_limit_default
 
 # Import routers
 from app.api.v1 import users, pets, appointments, clinics
 # Future imports (will be created in future tasks)
 # from app.api.v1 import auth, chat, ecommerce, social, emergency
 
-api_router = APIRouter()
+# Every versioned endpoint counts towards Settings.RATE_LIMIT_PER_MINUTE
+api_router = APIRouter(dependencies=[Depends(rate_limit_default)])
 
 # Include routers
 api_router.include_router(users.router, prefix="/users", tags=["users"])
@@ -14,7 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.models.appointment import Appointment, AppointmentStatus, AppointmentType, AppointmentPriority
 from app.appointments.controller import AppointmentController
-from app.api.deps import get_current_user, require_role
+from app.api.deps import get_current_user, rate_limit_expensive, require_role
 from app.app_helpers.dependency_helpers import get_controller
 from app.api.schemas.v1.appointments import (
     AppointmentCreateV1,
@@ -89,7 +89,7 @@ async def list_appointments(
     upcoming_only: bool = Query(False, description="Show only upcoming appointments"),
     today_only: bool = Query(False, description="Show only today's appointments"),
     current_user = Depends(get_current_user),
-    controller: AppointmentController = Depends(get_controller(AppointmentController))
+    controller: AppointmentController = Depends(get_controller(AppointmentController, read_only=True))
 ):
     """
     List appointments with pagination and filtering.
@@ -408,7 +408,38 @@ async def get_availability(
     }
 
 
-@router.get("/calendar", response_model=dict)
+@router.get("/availability/next", response_model=dict)
+async def get_next_available_slots(
+    clinic_id: uuid.UUID = Query(description="Clinic ID"),
+    count: int = Query(5, ge=1, le=50, description="Number of slots to return"),
+    after: Optional[datetime] = Query(None, description="Earliest slot start; defaults to now"),
+    duration_minutes: int = Query(30, description="Required appointment duration", ge=15, le=480),
+    current_user = Depends(get_current_user),
+    controller: AppointmentController = Depends(get_controller(AppointmentController))
+):
+    """
+    Get the next available appointment slots across all veterinarians at a clinic.
+    """
+    available_slots = await controller.get_next_available_slots(
+        clinic_id=clinic_id,
+        count=count,
+        after=after,
+        duration_minutes=duration_minutes
+    )
+    
+    return {
+        "success": True,
+        "data": {
+            "available_slots": available_slots,
+            "clinic_id": clinic_id,
+            "duration_minutes": duration_minutes
+        },
+        "message": "Available slots retrieved successfully",
+        "version": "v1"
+    }
+
+
+@router.get("/calendar", response_model=dict, dependencies=[Depends(rate_limit_expensive)])
 async def get_calendar_view(
     veterinarian_id: Optional[uuid.UUID] = Query(None, description="Filter by veterinarian ID"),
     clinic_id: Optional[uuid.UUID] = Query(None, description="Filter by clinic ID"),
@@ -416,7 +447,7 @@ async def get_calendar_view(
     end_date: Optional[date] = Query(None, description="Calendar end date"),
     view_type: str = Query("week", description="Calendar view type (day, week, month)"),
     current_user = Depends(get_current_user),
-    controller: AppointmentController = Depends(get_controller(AppointmentController))
+    controller: AppointmentController = Depends(get_controller(AppointmentController, read_only=True))
 ):
     """
     Get calendar view of appointments and availability.
@@ -474,41 +505,36 @@ async def check_appointment_conflicts(
     }
 
 
-@router.get("/statistics", response_model=dict)
+@router.get("/statistics", response_model=dict, dependencies=[Depends(rate_limit_expensive)])
 async def get_appointment_statistics(
     veterinarian_id: Optional[uuid.UUID] = Query(None, description="Filter by veterinarian ID"),
     clinic_id: Optional[uuid.UUID] = Query(None, description="Filter by clinic ID"),
     start_date: Optional[date] = Query(None, description="Statistics start date"),
     end_date: Optional[date] = Query(None, description="Statistics end date"),
+    group_by: Optional[str] = Query(None, description="Break down by veterinarian, clinic, day, week or month"),
     current_user = Depends(get_current_user),
-    controller: AppointmentController = Depends(get_controller(AppointmentController))
+    controller: AppointmentController = Depends(get_controller(AppointmentController, read_only=True))
 ):
     """
     Get appointment statistics for reporting and analytics.
     
     V1 provides basic appointment statistics and metrics.
     """
-    try:
-        from app.appointments.services import AppointmentService
-        from app.core.database import get_db
-        
-        async with get_db() as db:
-            service = AppointmentService(db)
-            statistics = await service.get_appointment_statistics(
-                veterinarian_id=veterinarian_id,
-                clinic_id=clinic_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-        
-        return {
-            "success": True,
-            "data": statistics,
-            "message": "Statistics retrieved successfully",
-            "version": "v1"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    statistics = await controller.get_appointment_statistics(
+        veterinarian_id=veterinarian_id,
+        clinic_id=clinic_id,
+        start_date=start_date,
+        end_date=end_date,
+        group_by=group_by,
+        from_rollup=True
+    )
+    
+    return {
+        "success": True,
+        "data": statistics,
+        "message": "Statistics retrieved successfully",
+        "version": "v1"
+    }
 
 
 @router.post("/slots/create", response_model=dict)
@@ -575,4 +601,43 @@ async def create_appointment_slots(
             "version": "v1"
         }
     except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+@router.post("/slots/create-for-clinic", response_model=dict)
+async def create_clinic_appointment_slots(
+    clinic_id: uuid.UUID,
+    start_date: date,
+    end_date: date,
+    slot_duration: Optional[int] = Query(None, ge=5, le=480, description="Slot length in minutes; defaults to each veterinarian's appointment duration"),
+    break_duration: int = Query(0, ge=0, description="Break between slots in minutes"),
+    current_user = Depends(get_current_user),
+    controller: AppointmentController = Depends(get_controller(AppointmentController))
+):
+    """
+    Create appointment slots for every veterinarian at a clinic.
+    
+    Slots follow each veterinarian's weekly availability within the clinic's
+    operating hours. Existing slots are left as they are.
+    """
+    created_slots = await controller.create_clinic_appointment_slots(
+        clinic_id=clinic_id,
+        start_date=start_date,
+        end_date=end_date,
+        slot_duration=slot_duration,
+        break_duration=break_duration
+    )
+    
+    return {
+        "success": True,
+        "data": {
+            "created_slots": created_slots,
+            "total_created": len(created_slots),
+            "clinic_id": clinic_id,
+            "period": {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat()
+            }
+        },
+        "message": f"Successfully created {len(created_slots)} appointment slots",
+        "version": "v1"
+    }
@@ -14,8 +14,9 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_any_role, require_role
+from app.core.database import get_db, get_read_db
+from app.core.response_cache import cached_response
+from app.api.deps import get_current_user, rate_limit_expensive, require_any_role, require_role
 from app.models.user import User, UserRole
 from app.models.clinic import ClinicType, VeterinarianSpecialty, DayOfWeek
 from app.clinics.controller import ClinicController
@@ -53,6 +54,7 @@ router = APIRouter()
 # Clinic Endpoints
 
 @router.get("/clinics", response_model=ClinicListResponseModelV1)
+@cached_response(tags=["clinics"])
 async def list_clinics(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
@@ -66,8 +68,9 @@ async def list_clinics(
     latitude: Optional[float] = Query(None, ge=-90, le=90, description="Latitude for location-based search"),
     longitude: Optional[float] = Query(None, ge=-180, le=180, description="Longitude for location-based search"),
     radius_miles: Optional[float] = Query(None, gt=0, le=500, description="Search radius in miles"),
-    sort_by: Optional[str] = Query(None, description="Sort by field (name, city, distance)"),
-    db: AsyncSession = Depends(get_db),
+    min_rating: Optional[float] = Query(None, ge=1, le=5, description="Minimum average rating"),
+    sort_by: Optional[str] = Query(None, description="Sort by field (name, city, distance, rating)"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -91,6 +94,7 @@ async def list_clinics(
             latitude=latitude,
             longitude=longitude,
             radius_miles=radius_miles,
+            min_rating=min_rating,
             # V1 defaults - no enhanced features
             include_veterinarians=False,
             include_reviews=False,
@@ -125,6 +129,7 @@ async def list_clinics(
 
 
 @router.get("/clinics/{clinic_id}", response_model=ClinicGetResponseV1)
+@cached_response(tags=["clinic:{clinic_id}"])
 async def get_clinic(
     clinic_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
@@ -164,6 +169,7 @@ async def get_clinic(
 # Veterinarian Endpoints
 
 @router.get("/veterinarians", response_model=VeterinarianListResponseModelV1)
+@cached_response(tags=["veterinarians"])
 async def list_veterinarians(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
@@ -175,8 +181,9 @@ async def list_veterinarians(
     city: Optional[str] = Query(None, description="Filter by clinic city"),
     state: Optional[str] = Query(None, description="Filter by clinic state"),
     min_experience_years: Optional[int] = Query(None, ge=0, description="Minimum years of experience"),
+    min_rating: Optional[float] = Query(None, ge=1, le=5, description="Minimum average rating"),
     sort_by: Optional[str] = Query(None, description="Sort by field (name, experience, rating)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -198,6 +205,7 @@ async def list_veterinarians(
             city=city,
             state=state,
             min_experience_years=min_experience_years,
+            min_rating=min_rating,
             # V1 defaults - no enhanced features
             include_clinic=False,
             include_reviews=False,
@@ -233,6 +241,7 @@ async def list_veterinarians(
 
 
 @router.get("/veterinarians/{veterinarian_id}", response_model=VeterinarianGetResponseV1)
+@cached_response(tags=["veterinarian:{veterinarian_id}"])
 async def get_veterinarian(
     veterinarian_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
@@ -270,7 +279,12 @@ async def get_veterinarian(
         )
 
 
-@router.get("/veterinarians/search/location", response_model=VeterinarianListResponseModelV1)
+@router.get(
+    "/veterinarians/search/location",
+    response_model=VeterinarianListResponseModelV1,
+    dependencies=[Depends(rate_limit_expensive)]
+)
+@cached_response(tags=["veterinarians"])
 async def search_veterinarians_by_location(
     latitude: float = Query(..., ge=-90, le=90, description="Latitude coordinate"),
     longitude: float = Query(..., ge=-180, le=180, description="Longitude coordinate"),
@@ -279,7 +293,7 @@ async def search_veterinarians_by_location(
     is_available_for_emergency: Optional[bool] = Query(None, description="Filter by emergency availability"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -329,6 +343,7 @@ async def search_veterinarians_by_location(
 # Availability Endpoints
 
 @router.get("/veterinarians/{veterinarian_id}/availability", response_model=VeterinarianAvailabilityGetResponseV1)
+@cached_response(tags=["veterinarian:{veterinarian_id}"])
 async def get_veterinarian_availability(
     veterinarian_id: uuid.UUID,
     day_of_week: Optional[DayOfWeek] = Query(None, description="Filter by day of week"),
@@ -479,6 +494,7 @@ async def create_veterinarian_review(
 
 
 @router.get("/clinics/{clinic_id}/reviews", response_model=ClinicReviewListResponseModelV1)
+@cached_response(tags=["clinic:{clinic_id}"])
 async def get_clinic_reviews(
     clinic_id: uuid.UUID,
     page: int = Query(1, ge=1, description="Page number"),
@@ -527,6 +543,7 @@ async def get_clinic_reviews(
 
 
 @router.get("/veterinarians/{veterinarian_id}/reviews", response_model=VeterinarianReviewListResponseModelV1)
+@cached_response(tags=["veterinarian:{veterinarian_id}"])
 async def get_veterinarian_reviews(
     veterinarian_id: uuid.UUID,
     page: int = Query(1, ge=1, description="Page number"),
@@ -577,6 +594,7 @@ async def get_veterinarian_reviews(
 # Specialty Endpoints
 
 @router.get("/veterinarians/{veterinarian_id}/specialties", response_model=VeterinarianSpecialtyListResponseV1)
+@cached_response(tags=["veterinarian:{veterinarian_id}"])
 async def get_veterinarian_specialties(
     veterinarian_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
@@ -16,7 +16,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.api.deps import get_current_user, require_any_role, require_role
 from app.models.user import User, UserRole
 from app.models.pet import PetGender, PetSize, HealthRecordType
@@ -55,7 +55,7 @@ async def list_pets(
     size: Optional[PetSize] = Query(None, description="Filter by size"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     search: Optional[str] = Query(None, description="Search pets by name or breed"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -54,7 +54,7 @@ async def list_users(
     role: Optional[UserRole] = Query(None, description="Filter by user role"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     current_user: User = Depends(require_role(UserRole.CLINIC_MANAGER)),
-    controller: UserController = Depends(get_controller(UserController))
+    controller: UserController = Depends(get_controller(UserController, read_only=True))
 ):
     """
     List users with pagination and filtering.
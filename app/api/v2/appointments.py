@@ -14,7 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.models.appointment import Appointment, AppointmentStatus, AppointmentType, AppointmentPriority
 from app.appointments.controller import AppointmentController
-from app.api.deps import get_current_user, require_role
+from app.api.deps import get_current_user, rate_limit_expensive, require_role
 from app.app_helpers.dependency_helpers import get_controller
 from app.api.schemas.v2.appointments import (
     AppointmentCreateV2,
@@ -130,8 +130,11 @@ async def list_appointments(
     cost_max: Optional[float] = Query(None, ge=0, description="Maximum cost filter"),
     sort_by: Optional[str] = Query("scheduled_at", description="Sort field"),
     sort_order: Optional[str] = Query("asc", description="Sort order (asc/desc)"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor (from next_cursor) instead of page"),
+    count_mode: str = Query("exact", alias="count", pattern="^(exact|estimate|none)$",
+                            description="Total count: exact, estimate or none"),
     current_user = Depends(get_current_user),
-    controller: AppointmentController = Depends(get_controller(AppointmentController))
+    controller: AppointmentController = Depends(get_controller(AppointmentController, read_only=True))
 ):
     """
     List appointments with enhanced filtering and pagination.
@@ -158,7 +161,9 @@ async def list_appointments(
         include_owner=False,  # Not requested in this endpoint
         include_veterinarian=include_vet_info,
         include_clinic=include_clinic_info,
-        sort_by=sort_by
+        sort_by=sort_by,
+        cursor=cursor,
+        count_mode=count_mode
     )
     
     # Convert to V2 response format
@@ -169,7 +174,7 @@ async def list_appointments(
     ]
     
     # Calculate pagination metadata
-    total_pages = (total + per_page - 1) // per_page
+    total_pages = (total + per_page - 1) // per_page if total is not None else None
     
     return {
         "success": True,
@@ -179,7 +184,8 @@ async def list_appointments(
                 "page": page,
                 "per_page": per_page,
                 "total": total,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "next_cursor": getattr(appointments, "next_cursor", None)
             },
             "filters_applied": {
                 "pet_id": pet_id,
@@ -517,33 +523,34 @@ async def batch_appointment_operation(
     }
 
 
-@router.get("/statistics", response_model=dict)
+@router.get("/statistics", response_model=dict, dependencies=[Depends(rate_limit_expensive)])
 async def get_appointment_statistics(
     start_date: Optional[date] = Query(None, description="Statistics start date"),
     end_date: Optional[date] = Query(None, description="Statistics end date"),
     clinic_id: Optional[uuid.UUID] = Query(None, description="Filter by clinic"),
     veterinarian_id: Optional[uuid.UUID] = Query(None, description="Filter by veterinarian"),
+    group_by: Optional[str] = Query(None, description="Break down by veterinarian, clinic, day, week or month"),
     current_user = Depends(get_current_user),
-    controller: AppointmentController = Depends(get_controller(AppointmentController))
+    controller: AppointmentController = Depends(get_controller(AppointmentController, read_only=True))
 ):
     """
     Get appointment statistics and analytics.
     
     V2 exclusive feature for appointment analytics.
     """
-    # This would need to be implemented in the controller
-    # For now, return a placeholder response
+    statistics = await controller.get_appointment_statistics(
+        veterinarian_id=veterinarian_id,
+        clinic_id=clinic_id,
+        start_date=start_date,
+        end_date=end_date,
+        group_by=group_by,
+        from_rollup=True
+    )
+    
     return {
         "success": True,
-        "data": {
-            "message": "Statistics feature not yet implemented",
-            "date_range": [start_date, end_date],
-            "filters": {
-                "clinic_id": clinic_id,
-                "veterinarian_id": veterinarian_id
-            }
-        },
-        "message": "Appointment statistics requested",
+        "data": statistics,
+        "message": "Appointment statistics retrieved successfully",
         "version": "v2",
         "timestamp": datetime.utcnow()
     }
\ No newline at end of file
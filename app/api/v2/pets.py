@@ -18,7 +18,7 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.api.deps import get_current_user, require_role
 from app.models.user import User, UserRole
 from app.models.pet import PetGender, PetSize, HealthRecordType
@@ -63,7 +63,10 @@ async def list_pets(
     include_owner: bool = Query(False, description="Include owner information"),
     sort_by: Optional[str] = Query(None, description="Sort by field (name, created_at, age)"),
     include_statistics: bool = Query(False, description="Include list statistics"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor (from next_cursor) instead of page"),
+    count_mode: str = Query("exact", alias="count", pattern="^(exact|estimate|none)$",
+                            description="Total count: exact, estimate or none"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -87,12 +90,11 @@ async def list_pets(
             # V2 specific features
             include_health_records=include_health_records,
             include_owner=include_owner,
-            sort_by=sort_by
+            sort_by=sort_by,
+            cursor=cursor,
+            count_mode=count_mode
         )
         
-        # Calculate pagination metadata
-        total_pages = (total + per_page - 1) // per_page if per_page > 0 else 0
-        
         # Prepare statistics if requested
         statistics = None
         if include_statistics:
@@ -130,7 +132,7 @@ async def list_pets(
             total=total,
             page=page,
             per_page=per_page,
-            total_pages=total_pages,
+            next_cursor=getattr(pets, "next_cursor", None),
             statistics=statistics,
             filters_applied=filters_applied
         )
@@ -141,6 +143,8 @@ async def list_pets(
             version="v2"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -422,7 +426,7 @@ async def mark_pet_deceased(
 @router.get("/{pet_id}/stats", response_model=PetStatisticsResponseV2)
 async def get_pet_statistics(
     pet_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
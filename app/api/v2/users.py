@@ -83,8 +83,11 @@ async def list_users(
     department: Optional[str] = Query(None, description="Filter by department"),
     include_roles: bool = Query(False, description="Include role information"),
     include_relationships: bool = Query(False, description="Include pet/appointment counts"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor (from next_cursor) instead of page"),
+    count_mode: str = Query("exact", alias="count", pattern="^(exact|estimate|none)$",
+                            description="Total count: exact, estimate or none"),
     current_user: User = Depends(require_role(UserRole.CLINIC_MANAGER)),
-    controller: UserController = Depends(get_controller(UserController))
+    controller: UserController = Depends(get_controller(UserController, read_only=True))
 ):
     """
     List users with pagination and enhanced filtering.
@@ -100,7 +103,9 @@ async def list_users(
         is_active=is_active,
         department=department,
         include_roles=include_roles,
-        include_relationships=include_relationships
+        include_relationships=include_relationships,
+        cursor=cursor,
+        count_mode=count_mode
     )
     
     # Convert to V2 response format
@@ -110,7 +115,7 @@ async def list_users(
     ]
     
     # Calculate pagination metadata
-    pages = (total + per_page - 1) // per_page
+    pages = (total + per_page - 1) // per_page if total is not None else None
     
     return {
         "success": True,
@@ -119,7 +124,8 @@ async def list_users(
             "page": page,
             "per_page": per_page,
             "total": total,
-            "pages": pages
+            "pages": pages,
+            "next_cursor": getattr(users, "next_cursor", None)
         },
         "version": "v2"
     }
@@ -404,7 +410,7 @@ async def remove_role(
 async def get_user_stats(
     user_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
-    controller: UserController = Depends(get_controller(UserController))
+    controller: UserController = Depends(get_controller(UserController, read_only=True))
 ):
     """
     Get user statistics (V2 specific endpoint).
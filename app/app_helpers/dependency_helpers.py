@@ -7,17 +7,18 @@ from typing import TypeVar, Type, Callable, Any
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 
 T = TypeVar('T')
 
 
-def get_controller(controller_class: Type[T]) -> Callable[..., T]:
+def get_controller(controller_class: Type[T], read_only: bool = False) -> Callable[..., T]:
     """
     Factory function for version-agnostic controller dependency injection.
     
     Args:
         controller_class: The controller class to instantiate
+        read_only: Use a read replica session when one is available
         
     Returns:
         Callable: Dependency function that returns controller instance
@@ -29,19 +30,20 @@ def get_controller(controller_class: Type[T]) -> Callable[..., T]:
         ):
             return await controller.list_users()
     """
-    def _get_controller_instance(db: AsyncSession = Depends(get_db)) -> T:
+    def _get_controller_instance(db: AsyncSession = Depends(get_read_db if read_only else get_db)) -> T:
         """Create controller instance with database dependency."""
         return controller_class(db)
     
     return _get_controller_instance
 
 
-def get_service(service_class: Type[T]) -> Callable[..., T]:
+def get_service(service_class: Type[T], read_only: bool = False) -> Callable[..., T]:
     """
     Factory function for service dependency injection.
     
     Args:
         service_class: The service class to instantiate
+        read_only: Use a read replica session when one is available
         
     Returns:
         Callable: Dependency function that returns service instance
@@ -53,7 +55,7 @@ def get_service(service_class: Type[T]) -> Callable[..., T]:
         ):
             return await service.list_users()
     """
-    def _get_service_instance(db: AsyncSession = Depends(get_db)) -> T:
+    def _get_service_instance(db: AsyncSession = Depends(get_read_db if read_only else get_db)) -> T:
         """Create service instance with database dependency."""
         return service_class(db)
     
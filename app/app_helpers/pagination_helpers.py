@@ -1,8 +1,31 @@
 """
 Pagination helper functions.
+
+Besides page/size validation this module provides keyset (cursor)
+pagination and cheaper total counts for the list services. A cursor is an
+opaque token holding the sort values and id of the last row on a page; the
+next page starts strictly after that position, so deep pages cost the same
+as the first one.
 """
-from typing import Tuple, Dict, Any
+import base64
+import binascii
+import enum
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
 from fastapi import HTTPException, status
+from sqlalchemy import Table, literal, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import ClauseElement, Executable, Select
+
+from app.core.exceptions import ValidationError
+
+# How list services compute their total: an exact COUNT(*), the planner's
+# row estimate, or no total at all.
+COUNT_MODES = ("exact", "estimate", "none")
 
 
 def get_pagination_params(page: int = 1, size: int = 20) -> Tuple[int, int]:
@@ -67,4 +90,222 @@ def create_pagination_meta(
             "has_next": page < total_pages,
             "has_previous": page > 1
         }
-    }
\ No newline at end of file
+    }
+
+
+class KeysetSort:
+    """
+    Sort order usable for cursor pagination.
+
+    Rows are ordered by the sort columns and then by the id column, all in
+    the same direction, so (sort values, id) identifies a position in the
+    result. Sort columns must be NOT NULL; sorts on nullable columns stay
+    offset-only.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        columns: Sequence[Any],
+        id_column: Any,
+        descending: bool = False,
+        values: Optional[Callable[[Any], Tuple[Any, ...]]] = None
+    ):
+        """
+        Args:
+            name: Sort name, recorded in cursors so they cannot be reused
+                with a different sort
+            columns: Sort columns, most significant first
+            id_column: Unique tiebreaker column
+            descending: Sort all columns descending
+            values: Read the sort values from a result row; defaults to the
+                row attributes named after the columns
+        """
+        self.name = name
+        self.columns = list(columns)
+        self.id_column = id_column
+        self.descending = descending
+        self._values = values or (lambda row: tuple(getattr(row, column.key) for column in self.columns))
+
+    def order_by(self) -> List[Any]:
+        """ORDER BY clauses for this sort."""
+        keys = [*self.columns, self.id_column]
+        return [key.desc() for key in keys] if self.descending else keys
+
+    def cursor_for(self, row: Any) -> str:
+        """Encode the position of a result row."""
+        payload = {
+            "s": self.name,
+            "k": [_cursor_value(value) for value in self._values(row)],
+            "id": _cursor_value(getattr(row, self.id_column.key)),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def after(self, cursor: str) -> ClauseElement:
+        """
+        Condition selecting the rows that follow a cursor position.
+
+        Raises:
+            ValidationError: If the cursor is malformed or was issued for
+                another sort
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = payload["k"]
+            if payload["s"] != self.name or len(values) != len(self.columns):
+                raise ValueError("cursor does not match sort")
+            position = [
+                literal(_from_cursor_value(column, value), column.type)
+                for column, value in zip([*self.columns, self.id_column], [*values, payload["id"]])
+            ]
+        except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError):
+            raise ValidationError("Invalid pagination cursor", field="cursor", value=cursor)
+
+        keys = tuple_(*self.columns, self.id_column)
+        bound = tuple_(*position)
+        return keys < bound if self.descending else keys > bound
+
+
+class KeysetPage(list):
+    """One page of list results plus the cursor of the following page."""
+
+    def __init__(self, items: Iterable[Any] = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def paginate_query(
+    query: Select,
+    page: int,
+    per_page: int,
+    cursor: Optional[str] = None,
+    keyset: Optional[KeysetSort] = None
+) -> Select:
+    """
+    Order and limit a list query for the requested page.
+
+    With a cursor the page starts after the cursor position and page is
+    ignored; otherwise the usual offset applies. One row more than per_page
+    is fetched so keyset_page() can tell whether another page follows.
+
+    Raises:
+        ValidationError: If a cursor is given for a sort without a keyset
+    """
+    if keyset is not None:
+        query = query.order_by(*keyset.order_by())
+
+    if cursor:
+        if keyset is None:
+            raise ValidationError("Cursor pagination is not supported for this sort order", field="cursor")
+        query = query.where(keyset.after(cursor))
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    return query.limit(per_page + 1)
+
+
+def keyset_page(rows: Sequence[Any], per_page: int, keyset: Optional[KeysetSort]) -> KeysetPage:
+    """Trim the look-ahead row from a paginate_query() result and build the next cursor."""
+    items = list(rows[:per_page])
+    next_cursor = None
+    if keyset is not None and len(rows) > per_page:
+        next_cursor = keyset.cursor_for(items[-1])
+    return KeysetPage(items, next_cursor)
+
+
+async def count_rows(
+    db: AsyncSession,
+    count_query: Select,
+    rows_query: Select,
+    mode: str = "exact"
+) -> Optional[int]:
+    """
+    Total for a list query according to the count mode.
+
+    Args:
+        db: Database session
+        count_query: SELECT count(...) with the list filters applied
+        rows_query: The filtered row query, used for estimates
+        mode: One of COUNT_MODES
+
+    Returns:
+        Exact or estimated total, or None when mode is "none"
+
+    Raises:
+        ValidationError: If mode is unknown
+    """
+    if mode not in COUNT_MODES:
+        raise ValidationError(
+            f"count must be one of: {', '.join(COUNT_MODES)}", field="count", value=mode
+        )
+
+    if mode == "none":
+        return None
+
+    if mode == "estimate":
+        return await estimate_rows(db, rows_query)
+
+    result = await db.execute(count_query)
+    return result.scalar() or 0
+
+
+async def estimate_rows(db: AsyncSession, query: Select) -> int:
+    """
+    Planner estimate of the rows a query returns.
+
+    An unfiltered single-table query reads pg_class.reltuples; anything else
+    (or a table that has never been analyzed) asks EXPLAIN for the plan's
+    row estimate. Neither touches the table data.
+    """
+    froms = query.get_final_froms()
+    if query.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+        result = await db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": froms[0].fullname}
+        )
+        reltuples = result.scalar()
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    result = await db.execute(_ExplainJSON(query))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON)
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _cursor_value(value: Any) -> Any:
+    """JSON-safe form of a sort value."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _from_cursor_value(column: Any, value: Any) -> Any:
+    """Restore a sort value to the column's Python type."""
+    if value is None:
+        raise ValueError("cursor values cannot be null")
+    python_type = column.type.python_type
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    return python_type(value)
@@ -0,0 +1,80 @@
+"""
+Race-free booking of appointment slots.
+
+AppointmentSlot.book_slot increments current_bookings in Python after the row
+has been read, so two requests reading the same row both see spare capacity
+and both book it. Here a booking is a single conditional UPDATE:
+
+    UPDATE appointment_slots SET current_bookings = current_bookings + 1
+    WHERE id = :id AND current_bookings < max_bookings AND ...
+    RETURNING ...
+
+The row lock taken by the UPDATE serialises concurrent bookings of one slot
+and each re-checks the condition against the committed count, so a slot can
+never be booked past max_bookings. No row back means the slot is full,
+unavailable or missing.
+
+Overlapping appointments for a veterinarian are refused by the
+ex_appointments_vet_overlap exclusion constraint on appointments.
+"""
+
+from typing import Optional
+import uuid
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ConflictError, NotFoundError
+from app.models.appointment import AppointmentSlot
+
+
+def _slot_update(slot_id: uuid.UUID, current_bookings, *conditions):
+    return (
+        update(AppointmentSlot)
+        .where(and_(AppointmentSlot.id == slot_id, *conditions))
+        .values(current_bookings=current_bookings)
+        .returning(AppointmentSlot)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def claim_slot(db: AsyncSession, slot_id: uuid.UUID) -> AppointmentSlot:
+    """
+    Take one booking on a slot. The caller commits.
+
+    Raises:
+        NotFoundError: If the slot does not exist
+        ConflictError: If the slot is fully booked, blocked or unavailable
+    """
+    slot = (await db.scalars(_slot_update(
+        slot_id,
+        AppointmentSlot.current_bookings + 1,
+        AppointmentSlot.is_available == True,
+        AppointmentSlot.is_blocked == False,
+        AppointmentSlot.current_bookings < AppointmentSlot.max_bookings,
+    ))).first()
+    if slot is not None:
+        return slot
+
+    exists = await db.scalar(select(func.count()).select_from(AppointmentSlot).where(AppointmentSlot.id == slot_id))
+    if not exists:
+        raise NotFoundError(f"Appointment slot with id {slot_id} not found", resource_type="appointment_slot")
+    raise ConflictError(
+        "Appointment slot is fully booked or unavailable",
+        conflicting_resource="appointment_slot",
+        details={"slot_id": str(slot_id)},
+    )
+
+
+async def release_slot(db: AsyncSession, slot_id: uuid.UUID) -> Optional[AppointmentSlot]:
+    """
+    Give back one booking on a slot. The caller commits.
+
+    Returns:
+        The slot, or None if it had no bookings or no longer exists
+    """
+    return (await db.scalars(_slot_update(
+        slot_id,
+        AppointmentSlot.current_bookings - 1,
+        AppointmentSlot.current_bookings > 0,
+    ))).first()
@@ -15,15 +15,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 from app.core.database import get_db
-from app.core.exceptions import VetClinicException, NotFoundError, ValidationError
+from app.core.exceptions import VetClinicException, NotFoundError, ValidationError, ConflictError
 from app.models.appointment import Appointment, AppointmentStatus, AppointmentType, AppointmentPriority
 from .services import AppointmentService
 from ..app_helpers import validate_pagination_params
-from app.tasks.appointment_tasks import (
-    send_appointment_confirmation,
-    send_appointment_cancellation,
-    send_appointment_reschedule
-)
 
 
 logger = logging.getLogger(__name__)
@@ -164,6 +159,7 @@ class AppointmentController:
             follow_up_required = data.get("follow_up_required", False)
             follow_up_date = data.get("follow_up_date")
             follow_up_notes = data.get("follow_up_notes")
+            slot_id = data.get("slot_id")
             
             # Create appointment
             appointment = await self.service.create_appointment(
@@ -184,20 +180,19 @@ class AppointmentController:
                 follow_up_required=follow_up_required,
                 follow_up_date=follow_up_date,
                 follow_up_notes=follow_up_notes,
+                slot_id=slot_id,
                 **kwargs
             )
             
-            # Trigger appointment confirmation notification (async task)
-            try:
-                send_appointment_confirmation.delay(str(appointment.id))
-            except Exception as e:
-                # Log error but don't fail the appointment creation
-                logger.error(f"Failed to trigger appointment confirmation notification: {str(e)}")
-            
+            # Confirmation notifications were queued in the outbox with the appointment
             return appointment
             
         except ValidationError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except NotFoundError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except ConflictError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
         except VetClinicException as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         except Exception as e:
@@ -251,14 +246,6 @@ class AppointmentController:
             await self._validate_appointment_cancellation(appointment_id, cancelled_by)
             
             appointment = await self.service.cancel_appointment(appointment_id, cancellation_reason)
-            
-            # Trigger appointment cancellation notification (async task)
-            try:
-                send_appointment_cancellation.delay(str(appointment.id))
-            except Exception as e:
-                # Log error but don't fail the cancellation
-                logger.error(f"Failed to trigger appointment cancellation notification: {str(e)}")
-            
             return appointment
             
         except NotFoundError as e:
@@ -346,19 +333,7 @@ class AppointmentController:
             # Business rule validation
             await self._validate_appointment_reschedule(appointment_id, new_scheduled_at, rescheduled_by)
             
-            # Store old scheduled time for notification
-            old_appointment = await self.service.get_appointment_by_id(appointment_id)
-            old_scheduled_at = old_appointment.scheduled_at
-            
             appointment = await self.service.reschedule_appointment(appointment_id, new_scheduled_at)
-            
-            # Trigger appointment reschedule notification (async task)
-            try:
-                send_appointment_reschedule.delay(str(appointment.id), old_scheduled_at.isoformat())
-            except Exception as e:
-                # Log error but don't fail the reschedule
-                logger.error(f"Failed to trigger appointment reschedule notification: {str(e)}")
-            
             return appointment
             
         except NotFoundError as e:
@@ -421,6 +396,11 @@ class AppointmentController:
         if isinstance(scheduled_at, datetime) and scheduled_at <= datetime.utcnow():
             raise ValidationError("Appointment must be scheduled in the future")
         
+        # Slot bookings are checked by the service as the slot is claimed, and
+        # may share their time with other bookings of the same slot
+        if data.get("slot_id"):
+            return
+        
         # Check for appointment conflicts
         veterinarian_id = data.get("veterinarian_id")
         duration_minutes = data.get("duration_minutes", 30)
@@ -568,6 +548,87 @@ class AppointmentController:
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
+    async def get_next_available_slots(
+        self,
+        clinic_id: uuid.UUID,
+        count: int = 5,
+        after: Optional[datetime] = None,
+        duration_minutes: int = 30,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the earliest open slots across all veterinarians at a clinic.
+        """
+        try:
+            slots = await self.service.get_next_available_slots(
+                clinic_id=clinic_id,
+                count=count,
+                after=after,
+                duration_minutes=duration_minutes,
+                **kwargs
+            )
+            
+            return [
+                {
+                    "id": str(slot.id),
+                    "veterinarian_id": str(slot.veterinarian_id),
+                    "start_time": slot.start_time.isoformat(),
+                    "end_time": slot.end_time.isoformat(),
+                    "duration_minutes": slot.duration_minutes,
+                    "slot_type": slot.slot_type,
+                    "remaining_capacity": slot.remaining_capacity
+                }
+                for slot in slots
+            ]
+            
+        except VetClinicException as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+    async def create_clinic_appointment_slots(
+        self,
+        clinic_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+        slot_duration: Optional[int] = None,
+        break_duration: int = 0,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Create appointment slots for every veterinarian at a clinic from their availability.
+        """
+        try:
+            if end_date < start_date:
+                raise ValidationError("end_date must not be before start_date")
+            
+            slots = await self.service.create_clinic_appointment_slots(
+                clinic_id=clinic_id,
+                start_date=start_date,
+                end_date=end_date,
+                slot_duration=slot_duration,
+                break_duration=break_duration,
+                **kwargs
+            )
+            
+            return [
+                {
+                    "id": str(slot.id),
+                    "veterinarian_id": str(slot.veterinarian_id),
+                    "start_time": slot.start_time.isoformat(),
+                    "end_time": slot.end_time.isoformat(),
+                    "duration_minutes": slot.duration_minutes,
+                    "slot_type": slot.slot_type,
+                    "is_available": slot.is_available
+                }
+                for slot in slots
+            ]
+            
+        except VetClinicException as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
     async def get_calendar_view(
         self,
         veterinarian_id: Optional[uuid.UUID] = None,
@@ -597,6 +658,33 @@ class AppointmentController:
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
+    async def get_appointment_statistics(
+        self,
+        veterinarian_id: Optional[uuid.UUID] = None,
+        clinic_id: Optional[uuid.UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        group_by: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Get aggregated appointment statistics, optionally broken down by group.
+        """
+        try:
+            return await self.service.get_appointment_statistics(
+                veterinarian_id=veterinarian_id,
+                clinic_id=clinic_id,
+                start_date=start_date,
+                end_date=end_date,
+                group_by=group_by,
+                **kwargs
+            )
+
+        except VetClinicException as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
     async def check_appointment_conflicts(
         self,
         veterinarian_id: uuid.UUID,
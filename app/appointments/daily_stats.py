@@ -0,0 +1,177 @@
+"""
+Incremental maintenance of the appointment_daily_stats rollup.
+
+Every appointment contributes one count plus its estimated and actual cost to
+the rollup row keyed by (clinic, veterinarian, UTC day, status, type,
+priority). Service methods snapshot an appointment's contribution before a
+change and apply the difference afterwards, inside the same transaction.
+rebuild_daily_stats recomputes a date range from the appointments table and
+is run nightly to reconcile any drift.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Dict, Optional, Tuple
+import uuid
+
+from sqlalchemy import and_, delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.appointment import (
+    Appointment,
+    AppointmentDailyStats,
+    AppointmentPriority,
+    AppointmentStatus,
+    AppointmentType,
+)
+
+RollupKey = Tuple[uuid.UUID, uuid.UUID, date, AppointmentStatus, AppointmentType, AppointmentPriority]
+
+
+@dataclass(frozen=True)
+class DailyStatsContribution:
+    """What a single appointment adds to its rollup row."""
+
+    key: RollupKey
+    estimated_revenue: float = 0.0
+    actual_revenue: float = 0.0
+
+
+def utc_day(scheduled_at: datetime) -> date:
+    """UTC calendar day of a timestamp; naive values are treated as UTC."""
+    if scheduled_at.tzinfo is not None:
+        scheduled_at = scheduled_at.astimezone(timezone.utc)
+    return scheduled_at.date()
+
+
+def daily_stats_contribution(appointment: Appointment) -> DailyStatsContribution:
+    """Snapshot an appointment's current contribution to the rollup."""
+    return DailyStatsContribution(
+        key=(
+            appointment.clinic_id,
+            appointment.veterinarian_id,
+            utc_day(appointment.scheduled_at),
+            AppointmentStatus(appointment.status),
+            AppointmentType(appointment.appointment_type),
+            AppointmentPriority(appointment.priority),
+        ),
+        estimated_revenue=appointment.estimated_cost or 0.0,
+        actual_revenue=appointment.actual_cost or 0.0,
+    )
+
+
+def _daily_stats_deltas(
+    before: Optional[DailyStatsContribution],
+    after: Optional[DailyStatsContribution],
+) -> Dict[RollupKey, Tuple[int, float, float]]:
+    """Net (count, estimated, actual) change per rollup key."""
+    deltas: Dict[RollupKey, Tuple[int, float, float]] = {}
+    for contribution, sign in ((before, -1), (after, 1)):
+        if contribution is None:
+            continue
+        count, estimated, actual = deltas.get(contribution.key, (0, 0.0, 0.0))
+        deltas[contribution.key] = (
+            count + sign,
+            estimated + sign * contribution.estimated_revenue,
+            actual + sign * contribution.actual_revenue,
+        )
+    return {key: delta for key, delta in deltas.items() if any(delta)}
+
+
+async def apply_daily_stats_change(
+    db: AsyncSession,
+    before: Optional[DailyStatsContribution],
+    after: Optional[DailyStatsContribution],
+) -> None:
+    """
+    Move an appointment's contribution from one rollup row to another.
+
+    Pass before=None for a new appointment and after=None for a deleted one.
+    Nothing is written when the change does not touch the rollup.
+    """
+    for key, (count, estimated, actual) in _daily_stats_deltas(before, after).items():
+        clinic_id, veterinarian_id, day, status, appointment_type, priority = key
+        statement = insert(AppointmentDailyStats).values(
+            clinic_id=clinic_id,
+            veterinarian_id=veterinarian_id,
+            day=day,
+            status=status,
+            appointment_type=appointment_type,
+            priority=priority,
+            appointment_count=count,
+            estimated_revenue=estimated,
+            actual_revenue=actual,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[column.name for column in AppointmentDailyStats.__table__.primary_key],
+            set_={
+                "appointment_count": AppointmentDailyStats.appointment_count + statement.excluded.appointment_count,
+                "estimated_revenue": AppointmentDailyStats.estimated_revenue + statement.excluded.estimated_revenue,
+                "actual_revenue": AppointmentDailyStats.actual_revenue + statement.excluded.actual_revenue,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(statement)
+
+
+async def rebuild_daily_stats(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    clinic_id: Optional[uuid.UUID] = None,
+) -> int:
+    """
+    Recompute rollup rows for a date range from the appointments table.
+
+    Existing rows in the range are replaced. The caller commits.
+
+    Returns:
+        Number of rollup rows written
+    """
+    day = func.date(func.timezone(literal_column("'UTC'"), Appointment.scheduled_at))
+
+    conditions = [day >= start_date, day <= end_date]
+    stale = [AppointmentDailyStats.day >= start_date, AppointmentDailyStats.day <= end_date]
+    if clinic_id:
+        conditions.append(Appointment.clinic_id == clinic_id)
+        stale.append(AppointmentDailyStats.clinic_id == clinic_id)
+
+    await db.execute(delete(AppointmentDailyStats).where(and_(*stale)))
+
+    aggregate = select(
+        Appointment.clinic_id,
+        Appointment.veterinarian_id,
+        day,
+        Appointment.status,
+        Appointment.appointment_type,
+        Appointment.priority,
+        func.count(Appointment.id),
+        func.coalesce(func.sum(Appointment.estimated_cost), 0),
+        func.coalesce(func.sum(Appointment.actual_cost), 0),
+    ).where(and_(*conditions)).group_by(
+        Appointment.clinic_id,
+        Appointment.veterinarian_id,
+        day,
+        Appointment.status,
+        Appointment.appointment_type,
+        Appointment.priority,
+    )
+
+    result = await db.execute(
+        insert(AppointmentDailyStats).from_select(
+            [
+                "clinic_id",
+                "veterinarian_id",
+                "day",
+                "status",
+                "appointment_type",
+                "priority",
+                "appointment_count",
+                "estimated_revenue",
+                "actual_revenue",
+            ],
+            aggregate,
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,143 @@
+"""
+Chunked queueing of 24-hour and 2-hour appointment reminders.
+
+Each run covers one scheduling window per reminder kind, centred on the
+reminder's lead time and as wide as the interval between runs, so hourly
+runs tile the schedule instead of re-scanning overlapping ranges. The window
+is drained in chunks, each in its own transaction:
+
+1. claim the next chunk in (scheduled_at, id) order with FOR UPDATE SKIP
+   LOCKED, so parallel workers take disjoint chunks;
+2. queue an outbox row per channel for every appointment in the chunk;
+3. set the reminder flag on the chunk with one UPDATE and commit, so the
+   queued reminders and the flags are checkpointed together.
+
+Sending, with its retries, is left to the channel outbox workers
+(app.notifications.worker).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.notification import NotificationChannel
+from app.notifications.outbox import APPOINTMENT_REMINDER, appointment_rows, enqueue_notifications
+from .services import AppointmentService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReminderKind:
+    """A reminder sent a fixed lead time before the appointment."""
+
+    name: str
+    lead: timedelta
+    sent_flag: str
+    channels: Tuple[NotificationChannel, ...]
+
+
+REMINDER_24_HOUR = ReminderKind(
+    "24_hour", timedelta(hours=24), "reminder_sent_24h",
+    (NotificationChannel.EMAIL, NotificationChannel.SMS),
+)
+REMINDER_2_HOUR = ReminderKind(
+    "2_hour", timedelta(hours=2), "reminder_sent_2h",
+    (NotificationChannel.EMAIL, NotificationChannel.SMS, NotificationChannel.PUSH),
+)
+
+
+@dataclass
+class ReminderDispatchResult:
+    """Totals of one dispatch run for one reminder kind."""
+
+    reminder_type: str
+    appointments: int = 0
+    queued: int = 0
+    chunks: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "reminder_type": self.reminder_type,
+            "appointments": self.appointments,
+            "queued": self.queued,
+            "chunks": self.chunks,
+        }
+
+
+def reminder_window(
+    kind: ReminderKind,
+    now: datetime,
+    window: Optional[timedelta] = None
+) -> Tuple[datetime, datetime]:
+    """The [start, end) range of scheduled_at covered by a run at now."""
+    window = window or timedelta(minutes=settings.APPOINTMENT_REMINDER_WINDOW_MINUTES)
+    start = now + kind.lead - window / 2
+    return start, start + window
+
+
+async def dispatch_appointment_reminders(
+    db: AsyncSession,
+    kind: ReminderKind,
+    now: Optional[datetime] = None,
+    window: Optional[timedelta] = None,
+    chunk_size: Optional[int] = None
+) -> ReminderDispatchResult:
+    """
+    Queue one kind of reminder for every appointment in this run's window.
+
+    Args:
+        db: Session used for the chunk transactions
+        kind: REMINDER_24_HOUR or REMINDER_2_HOUR
+        now: Run time (defaults to utcnow)
+        window: Width of the scheduling window (defaults to the configured interval)
+        chunk_size: Appointments per transaction
+
+    Returns:
+        Appointment and queued notification counts
+    """
+    now = now or datetime.utcnow()
+    start_time, end_time = reminder_window(kind, now, window)
+    chunk_size = chunk_size or settings.APPOINTMENT_REMINDER_CHUNK_SIZE
+    appointment_service = AppointmentService(db)
+    result = ReminderDispatchResult(kind.name)
+    after = None
+
+    while True:
+        appointments = await appointment_service.claim_reminder_appointments(
+            kind.sent_flag, start_time, end_time, chunk_size, after=after
+        )
+        if not appointments:
+            await db.rollback()
+            break
+        after = (appointments[-1].scheduled_at, appointments[-1].id)
+        result.chunks += 1
+
+        rows = [
+            row
+            for appointment in appointments
+            for row in appointment_rows(
+                APPOINTMENT_REMINDER,
+                appointment.id,
+                kind.channels,
+                event=f"{kind.name}:{appointment.scheduled_at.isoformat()}",
+                reminder_type=kind.name
+            )
+        ]
+        await enqueue_notifications(db, rows)
+        await appointment_service.mark_reminders_sent(
+            kind.sent_flag, [appointment.id for appointment in appointments], now
+        )
+
+        result.appointments += len(appointments)
+        result.queued += len(rows)
+        logger.info(f"{kind.name} reminder chunk {result.chunks}: {len(rows)} notifications queued")
+
+        if len(appointments) < chunk_size:
+            break
+
+    return result
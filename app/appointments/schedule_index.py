@@ -0,0 +1,307 @@
+"""
+In-process interval index of veterinarian schedules.
+
+Conflict checks and free-slot searches used to query the database on every
+booking attempt. ScheduleIndex instead loads a veterinarian's active
+appointments and open slots one UTC day at a time (a single query each for
+any number of veterinarians and days) into sorted interval lists, and then
+answers overlap and free-slot questions with binary search.
+
+Entries are dropped when AppointmentService writes an appointment or books a
+slot for the veterinarian, and expire after SCHEDULE_CACHE_TTL_SECONDS so
+writes made by other processes are picked up. The database remains the final
+authority at booking time.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from heapq import merge
+from itertools import islice
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import uuid
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.appointment import Appointment, AppointmentSlot, AppointmentStatus
+
+# Statuses that occupy the veterinarian's time
+ACTIVE_STATUSES = (
+    AppointmentStatus.SCHEDULED,
+    AppointmentStatus.CONFIRMED,
+    AppointmentStatus.IN_PROGRESS,
+)
+
+SCHEDULE_CACHE_TTL_SECONDS = 30
+SCHEDULE_CACHE_MAX_DAYS = 10000
+
+DayKey = Tuple[uuid.UUID, date]
+
+
+def as_utc(value: datetime) -> datetime:
+    """Timezone-aware UTC datetime; naive values are treated as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def day_start(day: date) -> datetime:
+    """Midnight UTC at the start of a day."""
+    return datetime.combine(day, datetime.min.time()).replace(tzinfo=timezone.utc)
+
+
+def days_between(start: datetime, end: datetime) -> List[date]:
+    """UTC days touched by the half-open range [start, end)."""
+    first = as_utc(start).date()
+    last = as_utc(end - timedelta(microseconds=1)).date() if end > start else first
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+@dataclass(frozen=True, order=True)
+class Interval:
+    """Half-open [start, end) interval labelled with the row it came from."""
+
+    start: datetime
+    end: datetime
+    id: uuid.UUID
+
+
+class IntervalList:
+    """
+    Intervals sorted by start, with overlap queries in O(log n + k).
+
+    Intervals may overlap each other. The longest interval bounds how far
+    before a query's start an overlapping interval can begin, which limits
+    the scan to a bisected window.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self._intervals = sorted(set(intervals))
+        self._starts = [interval.start for interval in self._intervals]
+        self._longest = max((interval.end - interval.start for interval in self._intervals), default=timedelta(0))
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Interval]:
+        """Intervals sharing time with [start, end)."""
+        low = bisect_right(self._starts, start - self._longest)
+        high = bisect_left(self._starts, end)
+        return [interval for interval in self._intervals[low:high] if interval.end > start]
+
+    def starting_in(self, start: datetime, end: datetime) -> List[Interval]:
+        """Intervals starting within [start, end), in start order."""
+        return self._intervals[bisect_left(self._starts, start):bisect_left(self._starts, end)]
+
+
+@dataclass(frozen=True)
+class OpenSlot:
+    """Bookable slot as served from the index; mirrors AppointmentSlot's fields."""
+
+    id: uuid.UUID
+    veterinarian_id: uuid.UUID
+    clinic_id: uuid.UUID
+    start_time: datetime
+    end_time: datetime
+    duration_minutes: int
+    slot_type: str
+    remaining_capacity: int
+    max_bookings: int = 1
+    is_available: bool = True
+    is_fully_booked: bool = False
+
+
+@dataclass
+class DaySchedule:
+    """One veterinarian's appointments and open slots on one UTC day."""
+
+    appointments: IntervalList
+    slots: IntervalList
+    slot_details: Dict[uuid.UUID, OpenSlot]
+    loaded_at: float
+
+
+class ScheduleIndex:
+    """Per-veterinarian, per-day cache of schedules as interval lists."""
+
+    def __init__(self, ttl_seconds: float = SCHEDULE_CACHE_TTL_SECONDS, max_days: int = SCHEDULE_CACHE_MAX_DAYS):
+        self.ttl_seconds = ttl_seconds
+        self.max_days = max_days
+        self._days: "OrderedDict[DayKey, DaySchedule]" = OrderedDict()
+        # Bumped on invalidation so loads that raced a write are not stored
+        self._generations: Dict[uuid.UUID, int] = {}
+
+    def invalidate(self, veterinarian_id: uuid.UUID) -> None:
+        """Forget everything cached for a veterinarian."""
+        self._generations[veterinarian_id] = self._generations.get(veterinarian_id, 0) + 1
+        for key in [key for key in self._days if key[0] == veterinarian_id]:
+            del self._days[key]
+
+    def clear(self) -> None:
+        """Forget every cached schedule."""
+        for veterinarian_id in {key[0] for key in self._days}:
+            self.invalidate(veterinarian_id)
+
+    async def schedules(
+        self,
+        db: AsyncSession,
+        veterinarian_ids: Sequence[uuid.UUID],
+        days: Sequence[date]
+    ) -> Dict[DayKey, DaySchedule]:
+        """Schedules for every veterinarian and day, loading missing ones together."""
+        now = time.monotonic()
+        found: Dict[DayKey, DaySchedule] = {}
+        missing: List[DayKey] = []
+        for veterinarian_id in veterinarian_ids:
+            for day in days:
+                key = (veterinarian_id, day)
+                schedule = self._days.get(key)
+                if schedule is not None and now - schedule.loaded_at < self.ttl_seconds:
+                    self._days.move_to_end(key)
+                    found[key] = schedule
+                else:
+                    missing.append(key)
+
+        if missing:
+            generations = {key[0]: self._generations.get(key[0], 0) for key in missing}
+            loaded = await self._load(db, missing, now)
+            for key, schedule in loaded.items():
+                found[key] = schedule
+                if self._generations.get(key[0], 0) == generations[key[0]]:
+                    self._days[key] = schedule
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+        return found
+
+    async def conflicts(
+        self,
+        db: AsyncSession,
+        veterinarian_id: uuid.UUID,
+        start: datetime,
+        end: datetime
+    ) -> List[uuid.UUID]:
+        """Ids of active appointments overlapping [start, end)."""
+        start, end = as_utc(start), as_utc(end)
+        schedules = await self.schedules(db, [veterinarian_id], days_between(start, end))
+        ids = []
+        for schedule in schedules.values():
+            ids.extend(interval.id for interval in schedule.appointments.overlapping(start, end))
+        return list(dict.fromkeys(ids))
+
+    async def free_slots(
+        self,
+        db: AsyncSession,
+        veterinarian_ids: Sequence[uuid.UUID],
+        clinic_id: uuid.UUID,
+        start: datetime,
+        end: datetime,
+        duration_minutes: int = 30,
+        limit: Optional[int] = None
+    ) -> List[OpenSlot]:
+        """
+        Open slots starting within [start, end), earliest first.
+
+        A slot is open when it has capacity left and is long enough. Single
+        booking slots must also not overlap one of the veterinarian's active
+        appointments; shared slots (max_bookings > 1) are expected to.
+        """
+        start, end = as_utc(start), as_utc(end)
+        days = days_between(start, end)
+        schedules = await self.schedules(db, veterinarian_ids, days)
+
+        def open_slots(veterinarian_id: uuid.UUID):
+            for day in days:
+                schedule = schedules[(veterinarian_id, day)]
+                for interval in schedule.slots.starting_in(max(start, day_start(day)), end):
+                    slot = schedule.slot_details[interval.id]
+                    if (
+                        slot.clinic_id == clinic_id
+                        and slot.duration_minutes >= duration_minutes
+                        and (
+                            slot.max_bookings > 1
+                            or not self._busy(schedules, veterinarian_id, slot.start_time, slot.end_time)
+                        )
+                    ):
+                        yield slot
+
+        ordered = merge(*(open_slots(vet) for vet in veterinarian_ids), key=lambda slot: (slot.start_time, str(slot.id)))
+        return list(islice(ordered, limit))
+
+    @staticmethod
+    def _busy(schedules: Dict[DayKey, DaySchedule], veterinarian_id: uuid.UUID, start: datetime, end: datetime) -> bool:
+        for day in days_between(start, end):
+            schedule = schedules.get((veterinarian_id, day))
+            if schedule is not None and schedule.appointments.overlapping(start, end):
+                return True
+        return False
+
+    async def _load(self, db: AsyncSession, keys: List[DayKey], loaded_at: float) -> Dict[DayKey, DaySchedule]:
+        veterinarian_ids = sorted({key[0] for key in keys}, key=str)
+        range_start = day_start(min(key[1] for key in keys))
+        range_end = day_start(max(key[1] for key in keys) + timedelta(days=1))
+
+        appointment_rows = await db.execute(
+            select(Appointment.id, Appointment.veterinarian_id, Appointment.scheduled_at, Appointment.ends_at).where(
+                and_(
+                    Appointment.veterinarian_id.in_(veterinarian_ids),
+                    Appointment.status.in_(ACTIVE_STATUSES),
+                    Appointment.scheduled_at < range_end,
+                    Appointment.ends_at > range_start,
+                )
+            )
+        )
+        slot_rows = await db.execute(
+            select(AppointmentSlot).where(
+                and_(
+                    AppointmentSlot.veterinarian_id.in_(veterinarian_ids),
+                    AppointmentSlot.start_time >= range_start,
+                    AppointmentSlot.start_time < range_end,
+                    AppointmentSlot.is_available == True,
+                    AppointmentSlot.is_blocked == False,
+                    AppointmentSlot.current_bookings < AppointmentSlot.max_bookings,
+                )
+            )
+        )
+
+        wanted = set(keys)
+        appointments: Dict[DayKey, List[Interval]] = {key: [] for key in keys}
+        for appointment_id, veterinarian_id, scheduled_at, ends_at in appointment_rows.all():
+            interval = Interval(as_utc(scheduled_at), as_utc(ends_at), appointment_id)
+            for day in days_between(interval.start, interval.end):
+                if (veterinarian_id, day) in wanted:
+                    appointments[(veterinarian_id, day)].append(interval)
+
+        slots: Dict[DayKey, Dict[uuid.UUID, OpenSlot]] = {key: {} for key in keys}
+        for slot in slot_rows.scalars().all():
+            start_time = as_utc(slot.start_time)
+            key = (slot.veterinarian_id, start_time.date())
+            if key in wanted:
+                slots[key][slot.id] = OpenSlot(
+                    id=slot.id,
+                    veterinarian_id=slot.veterinarian_id,
+                    clinic_id=slot.clinic_id,
+                    start_time=start_time,
+                    end_time=as_utc(slot.end_time),
+                    duration_minutes=slot.duration_minutes,
+                    slot_type=slot.slot_type,
+                    remaining_capacity=slot.max_bookings - slot.current_bookings,
+                    max_bookings=slot.max_bookings,
+                )
+
+        return {
+            key: DaySchedule(
+                appointments=IntervalList(appointments[key]),
+                slots=IntervalList(Interval(slot.start_time, slot.end_time, slot.id) for slot in slots[key].values()),
+                slot_details=slots[key],
+                loaded_at=loaded_at,
+            )
+            for key in keys
+        }
+
+
+# Shared by every AppointmentService in the process
+SCHEDULE_INDEX = ScheduleIndex()
@@ -7,20 +7,216 @@ accommodate different API version requirements.
 """
 
 from typing import List, Tuple, Optional, Dict, Any, Union
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, delete, String
+from sqlalchemy import bindparam, select, func, and_, literal_column, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
 from app.models.appointment import (
     Appointment, 
+    AppointmentDailyStats,
     AppointmentSlot, 
     AppointmentStatus, 
     AppointmentType, 
     AppointmentPriority
 )
-from app.core.exceptions import VetClinicException, NotFoundError, ValidationError
+from app.models.clinic import Veterinarian
+from app.core.exceptions import VetClinicException, NotFoundError, ValidationError, handle_database_error
+from app.core.loader_profiles import Include, LoaderProfile
+from app.core.single_flight import get_single_flight, single_flight_key
+from app.core.statement_cache import StatementCache
+from app.app_helpers.pagination_helpers import KeysetSort, count_rows, keyset_page, paginate_query
+from app.notifications.outbox import (
+    APPOINTMENT_CANCELLATION,
+    APPOINTMENT_CONFIRMATION,
+    APPOINTMENT_RESCHEDULE,
+    appointment_rows,
+    enqueue_notifications,
+)
+from .booking import claim_slot, release_slot
+from .daily_stats import apply_daily_stats_change, daily_stats_contribution
+from .schedule_index import ACTIVE_STATUSES, SCHEDULE_INDEX, OpenSlot, as_utc, day_start
+from .slots import DailyWindow, clinic_schedule, day_slots, insert_slots, slot_rows, weekday
+
+
+# Responses and notifications name the veterinarian through its user row
+_VETERINARIAN_WITH_USER = Include(
+    selectinload(Appointment.veterinarian).selectinload(Veterinarian.user),
+    queries=2,
+)
+
+_APPOINTMENT_INCLUDES = {
+    "include_pet": Include(selectinload(Appointment.pet)),
+    "include_owner": Include(selectinload(Appointment.pet_owner)),
+    "include_veterinarian": _VETERINARIAN_WITH_USER,
+    "include_clinic": Include(selectinload(Appointment.clinic)),
+}
+
+APPOINTMENT_LIST_PROFILE = LoaderProfile("appointments.list", includes=_APPOINTMENT_INCLUDES)
+
+APPOINTMENT_DETAIL_PROFILE = LoaderProfile("appointments.detail", includes=_APPOINTMENT_INCLUDES)
+
+APPOINTMENT_BY_ID = StatementCache(
+    "appointments.by_id",
+    lambda: select(Appointment).where(Appointment.id == bindparam("appointment_id")),
+    profile=APPOINTMENT_DETAIL_PROFILE,
+)
+
+APPOINTMENT_CALENDAR_PROFILE = LoaderProfile(
+    "appointments.calendar",
+    always=Include(
+        selectinload(Appointment.pet),
+        selectinload(Appointment.pet_owner),
+        selectinload(Appointment.veterinarian).selectinload(Veterinarian.user),
+        selectinload(Appointment.clinic),
+        queries=5,
+    ),
+)
+
+APPOINTMENT_NOTIFICATION_PROFILE = LoaderProfile(
+    "appointments.notification",
+    always=APPOINTMENT_CALENDAR_PROFILE.always,
+)
+
+APPOINTMENT_CONFLICTS_PROFILE = LoaderProfile(
+    "appointments.conflicts",
+    always=Include(selectinload(Appointment.pet), selectinload(Appointment.pet_owner)),
+)
+
+# list_appointments sorts, keyed by sort_by value; every sort supports cursors.
+APPOINTMENT_SORTS = {
+    "scheduled_at": KeysetSort("scheduled_at", [Appointment.scheduled_at], Appointment.id),
+    "scheduled_at_desc": KeysetSort(
+        "scheduled_at_desc", [Appointment.scheduled_at], Appointment.id, descending=True
+    ),
+    "priority": KeysetSort("priority", [Appointment.priority], Appointment.id, descending=True),
+    "status": KeysetSort("status", [Appointment.status], Appointment.id),
+    "created_at": KeysetSort("created_at", [Appointment.created_at], Appointment.id, descending=True),
+}
+
+
+# Breakdown dimensions for get_appointment_statistics, keyed by group_by value.
+# date_trunc units are inlined so SELECT and GROUP BY render the same expression.
+STATISTICS_GROUPINGS = {
+    "veterinarian": Appointment.veterinarian_id,
+    "clinic": Appointment.clinic_id,
+    "day": func.date_trunc(literal_column("'day'"), Appointment.scheduled_at),
+    "week": func.date_trunc(literal_column("'week'"), Appointment.scheduled_at),
+    "month": func.date_trunc(literal_column("'month'"), Appointment.scheduled_at),
+}
+
+# Same dimensions over the appointment_daily_stats rollup
+ROLLUP_STATISTICS_GROUPINGS = {
+    "veterinarian": AppointmentDailyStats.veterinarian_id,
+    "clinic": AppointmentDailyStats.clinic_id,
+    "day": AppointmentDailyStats.day,
+    "week": func.date_trunc(literal_column("'week'"), AppointmentDailyStats.day),
+    "month": func.date_trunc(literal_column("'month'"), AppointmentDailyStats.day),
+}
+
+
+def _statistics_columns(source=Appointment) -> List[Any]:
+    """Aggregate columns for one statistics row (FILTER per enum value)."""
+    if source is AppointmentDailyStats:
+        tally = func.sum(AppointmentDailyStats.appointment_count)
+        estimated = func.sum(AppointmentDailyStats.estimated_revenue)
+        actual = func.sum(AppointmentDailyStats.actual_revenue)
+    else:
+        tally = func.count(Appointment.id)
+        estimated = func.sum(Appointment.estimated_cost)
+        actual = func.sum(Appointment.actual_cost)
+    
+    completed = source.status == AppointmentStatus.COMPLETED
+    columns = [
+        func.coalesce(tally, 0).label("total"),
+        func.coalesce(estimated, 0).label("estimated_revenue"),
+        func.coalesce(actual.filter(completed), 0).label("actual_revenue"),
+    ]
+    for prefix, column, enum in (
+        ("status", source.status, AppointmentStatus),
+        ("type", source.appointment_type, AppointmentType),
+        ("priority", source.priority, AppointmentPriority),
+    ):
+        columns.extend(
+            tally.filter(column == member).label(f"{prefix}_{member.value}")
+            for member in enum
+        )
+    return columns
+
+
+def _merge_statistics_rows(rows) -> Dict[str, float]:
+    """Sum aggregate rows column by column."""
+    merged: Dict[str, float] = {}
+    for row in rows:
+        for key, value in row.items():
+            if key != "group_key":
+                merged[key] = merged.get(key, 0) + (value or 0)
+    return merged
+
+
+def _format_statistics(aggregates: Dict[str, float]) -> Dict[str, Any]:
+    """Shape aggregate counts and sums into the statistics response."""
+    def counts(prefix: str, enum) -> Dict[str, int]:
+        return {member.value: int(aggregates.get(f"{prefix}_{member.value}", 0)) for member in enum}
+
+    status_counts = counts("status", AppointmentStatus)
+    total_appointments = int(aggregates.get("total", 0))
+    completed_appointments = status_counts[AppointmentStatus.COMPLETED.value]
+    total_estimated_revenue = float(aggregates.get("estimated_revenue", 0))
+    total_actual_revenue = float(aggregates.get("actual_revenue", 0))
+    
+    average_appointment_cost = (
+        total_actual_revenue / completed_appointments
+        if completed_appointments else 0
+    )
+    
+    # Completion rate is measured against appointments that were kept
+    scheduled_or_confirmed = (
+        status_counts[AppointmentStatus.SCHEDULED.value]
+        + status_counts[AppointmentStatus.CONFIRMED.value]
+        + completed_appointments
+    )
+    completion_rate = (
+        completed_appointments / scheduled_or_confirmed * 100
+        if scheduled_or_confirmed > 0 else 0
+    )
+    no_show_rate = (
+        status_counts[AppointmentStatus.NO_SHOW.value] / total_appointments * 100
+        if total_appointments > 0 else 0
+    )
+    cancellation_rate = (
+        status_counts[AppointmentStatus.CANCELLED.value] / total_appointments * 100
+        if total_appointments > 0 else 0
+    )
+    
+    return {
+        "totals": {
+            "total_appointments": total_appointments,
+            "completed_appointments": completed_appointments,
+            "total_estimated_revenue": round(total_estimated_revenue, 2),
+            "total_actual_revenue": round(total_actual_revenue, 2),
+            "average_appointment_cost": round(average_appointment_cost, 2)
+        },
+        "counts_by_status": status_counts,
+        "counts_by_type": counts("type", AppointmentType),
+        "counts_by_priority": counts("priority", AppointmentPriority),
+        "rates": {
+            "completion_rate": round(completion_rate, 2),
+            "no_show_rate": round(no_show_rate, 2),
+            "cancellation_rate": round(cancellation_rate, 2)
+        }
+    }
+
+
+def _format_group_key(key: Any) -> Optional[str]:
+    """Render a group key (UUID, day or truncated timestamp) for the response."""
+    if key is None:
+        return None
+    if isinstance(key, datetime):
+        return key.date().isoformat()
+    return str(key)
 
 
 class AppointmentService:
@@ -49,8 +245,10 @@ class AppointmentService:
         include_veterinarian: bool = False,  # V2 parameter
         include_clinic: bool = False,  # V2 parameter
         sort_by: Optional[str] = None,  # V2 parameter
+        cursor: Optional[str] = None,  # V2 parameter
+        count_mode: str = "exact",  # V2 parameter
         **kwargs
-    ) -> Tuple[List[Appointment], int]:
+    ) -> Tuple[List[Appointment], Optional[int]]:
         """
         List appointments with pagination and filtering.
         Supports dynamic parameters for different API versions.
@@ -74,10 +272,12 @@ class AppointmentService:
             include_veterinarian: Include veterinarian information (V2)
             include_clinic: Include clinic information (V2)
             sort_by: Sort by field (V2)
+            cursor: Continue after this cursor instead of using page (V2)
+            count_mode: Total count mode: exact, estimate or none (V2)
             **kwargs: Additional parameters for future versions
             
         Returns:
-            Tuple of (appointments list, total count)
+            Tuple of (appointments page, total count); the page carries next_cursor
         """
         try:
             # Build base query
@@ -150,50 +350,25 @@ class AppointmentService:
                 query = query.where(and_(*conditions))
                 count_query = count_query.where(and_(*conditions))
             
-            # Add relationships if requested (V2)
-            if include_pet:
-                query = query.options(selectinload(Appointment.pet))
-            
-            if include_owner:
-                query = query.options(selectinload(Appointment.pet_owner))
-            
-            if include_veterinarian:
-                query = query.options(selectinload(Appointment.veterinarian))
-            
-            if include_clinic:
-                query = query.options(selectinload(Appointment.clinic))
-            
             # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
-            
-            # Apply sorting (V2 feature)
-            if sort_by:
-                if sort_by == "scheduled_at":
-                    query = query.order_by(Appointment.scheduled_at)
-                elif sort_by == "scheduled_at_desc":
-                    query = query.order_by(Appointment.scheduled_at.desc())
-                elif sort_by == "priority":
-                    # Custom priority ordering
-                    query = query.order_by(Appointment.priority.desc())
-                elif sort_by == "status":
-                    query = query.order_by(Appointment.status)
-                elif sort_by == "created_at":
-                    query = query.order_by(Appointment.created_at.desc())
-                else:
-                    query = query.order_by(Appointment.scheduled_at)
-            else:
-                query = query.order_by(Appointment.scheduled_at)
-            
-            # Apply pagination
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
-            
-            # Execute query
-            result = await self.db.execute(query)
+            total = await count_rows(self.db, count_query, query, count_mode)
+            
+            # Apply sorting (V2 feature) and pagination
+            keyset = APPOINTMENT_SORTS.get(sort_by, APPOINTMENT_SORTS["scheduled_at"])
+            query = paginate_query(query, page, per_page, cursor=cursor, keyset=keyset)
+            
+            # Execute query with the relationships requested (V2)
+            result = await APPOINTMENT_LIST_PROFILE.execute(
+                self.db,
+                query,
+                include_pet=include_pet,
+                include_owner=include_owner,
+                include_veterinarian=include_veterinarian,
+                include_clinic=include_clinic,
+            )
             appointments = result.scalars().all()
             
-            return list(appointments), total
+            return keyset_page(appointments, per_page, keyset), total
             
         except Exception as e:
             if isinstance(e, VetClinicException):
@@ -227,22 +402,15 @@ class AppointmentService:
             NotFoundError: If appointment not found
         """
         try:
-            query = select(Appointment).where(Appointment.id == appointment_id)
-            
-            # Add optional relationships based on version needs
-            if include_pet:
-                query = query.options(selectinload(Appointment.pet))
-            
-            if include_owner:
-                query = query.options(selectinload(Appointment.pet_owner))
-            
-            if include_veterinarian:
-                query = query.options(selectinload(Appointment.veterinarian))
-            
-            if include_clinic:
-                query = query.options(selectinload(Appointment.clinic))
-            
-            result = await self.db.execute(query)
+            # Prebuilt per include combination; only appointment_id is bound per call
+            result = await APPOINTMENT_BY_ID.execute(
+                self.db,
+                {"appointment_id": appointment_id},
+                include_pet=include_pet,
+                include_owner=include_owner,
+                include_veterinarian=include_veterinarian,
+                include_clinic=include_clinic,
+            )
             appointment = result.scalar_one_or_none()
             
             if not appointment:
@@ -274,58 +442,100 @@ class AppointmentService:
         follow_up_required: bool = False,
         follow_up_date: Optional[datetime] = None,
         follow_up_notes: Optional[str] = None,
+        slot_id: Optional[uuid.UUID] = None,
         **kwargs
     ) -> Appointment:
         """
-        Create a new appointment.
+        Create a new appointment and queue its confirmation notifications.
         Supports dynamic parameters for different API versions.
         
+        Args:
+            pet_id: Pet UUID
+            pet_owner_id: Pet owner UUID
+            veterinarian_id: Veterinarian UUID
+            clinic_id: Clinic UUID
+            appointment_type: Type of appointment
+            scheduled_at: Scheduled date and time
+            reason: Reason for appointment
+            duration_minutes: Duration in minutes
+            priority: Appointment priority
+            symptoms: Pet symptoms
+            notes: Additional notes
+            special_instructions: Special instructions
+            services_requested: List of requested services
+            estimated_cost: Estimated cost
+            follow_up_required: Whether follow-up is required
+            follow_up_date: Follow-up date
+            follow_up_notes: Follow-up notes
+            slot_id: Slot to book the appointment into; one of its bookings
+                is taken in the same transaction
+            **kwargs: Additional parameters for future versions
+            
+        Returns:
+            Created appointment object
+            
+        Raises:
+            ValidationError: If validation fails
+            ConflictError: If the slot is full or the veterinarian is already
+                booked at that time
+        """
         try:
-            # Handle enum pa
-            if isinstance(appointment_ty:
+            # Handle enum parameters
+            if isinstance(appointment_type, str):
                 try:
-                    appointment_type)
+                    appointment_type = AppointmentType(appointment_type)
                 except ValueError:
-                    raise ValidationError(f"Inval
+                    raise ValidationError(f"Invalid appointment type: {appointment_type}")
             
             if isinstance(priority, str):
                 try:
-                    priority = App
+                    priority = AppointmentPriority(priority)
                 except ValueError:
-                    raise ValidationError(f"Invalid pr")
+                    raise ValidationError(f"Invalid priority: {priority}")
             
-            # Validate scheduled time is i
+            # Validate scheduled time is in the future
             if scheduled_at <= datetime.utcnow():
-                raise ValidationError("App")
+                raise ValidationError("Appointment must be scheduled in the future")
             
             # Create appointment data
-            a = {
-                t_id,
-                "pet_owner_id": pet_owr_id,
-            d,
-               
-                "appointment_type": appointment_,
-           _at,
-            ,
-                "priority": priority
+            appointment_data = {
+                "pet_id": pet_id,
+                "pet_owner_id": pet_owner_id,
+                "veterinarian_id": veterinarian_id,
+                "clinic_id": clinic_id,
+                "appointment_type": appointment_type,
+                "scheduled_at": scheduled_at,
+                "duration_minutes": duration_minutes,
+                "priority": priority,
                 "reason": reason.strip(),
-                "sym
+                "symptoms": symptoms.strip() if symptoms else None,
                 "notes": notes.strip() if notes else None,
-                "special_instructi
+                "special_instructions": special_instructions.strip() if special_instructions else None,
                 "services_requested": services_requested,
-            
-                "follow_up_required": fol,
-                "folp_date,
-                "follow_up_notes": follow_up_notes.strip() i
-                "status": AppointmHEDULED
+                "estimated_cost": estimated_cost,
+                "follow_up_required": follow_up_required,
+                "follow_up_date": follow_up_date,
+                "follow_up_notes": follow_up_notes.strip() if follow_up_notes else None,
+                "slot_id": slot_id,
+                "status": AppointmentStatus.SCHEDULED
             }
             
+            if slot_id is not None:
+                slot = await claim_slot(self.db, slot_id)
+                if (slot.veterinarian_id, slot.clinic_id) != (veterinarian_id, clinic_id):
+                    raise ValidationError("Appointment slot belongs to a different veterinarian or clinic")
+                if not as_utc(slot.start_time) <= as_utc(scheduled_at) < as_utc(slot.end_time):
+                    raise ValidationError("Appointment must start within the booked slot")
+            
             # Create new appointment
-            new_appointment = Appointment(**appoi)
+            new_appointment = Appointment(id=uuid.uuid4(), **appointment_data)
             
-            tment)
+            self.db.add(new_appointment)
+            await apply_daily_stats_change(self.db, None, daily_stats_contribution(new_appointment))
+            await enqueue_notifications(self.db, appointment_rows(APPOINTMENT_CONFIRMATION, new_appointment.id))
             await self.db.commit()
-            await self.db.refres)
+            SCHEDULE_INDEX.invalidate(new_appointment.veterinarian_id)
+            await self.db.refresh(new_appointment)
             
             return new_appointment
             
@@ -333,476 +543,798 @@ class AppointmentService:
             await self.db.rollback()
             if isinstance(e, VetClinicException):
                 raise
-            raise VetClinicException(")
+            if isinstance(e, IntegrityError):
+                raise handle_database_error(e)
+            raise VetClinicException(f"Failed to create appointment: {str(e)}")
 
     async def update_appointment(
         self,
         appointment_id: uuid.UUID,
         scheduled_at: Optional[datetime] = None,
-        appointment_type: Optional[Union[Appointm
-        priority: Optional[Union[AppointmentPriority, str
+        appointment_type: Optional[Union[AppointmentType, str]] = None,
+        priority: Optional[Union[AppointmentPriority, str]] = None,
         reason: Optional[str] = None,
         symptoms: Optional[str] = None,
         notes: Optional[str] = None,
-        speci
-        serv
-        estimated_cost: Optional[floe,
+        special_instructions: Optional[str] = None,
+        services_requested: Optional[List[str]] = None,
+        estimated_cost: Optional[float] = None,
         actual_cost: Optional[float] = None,
-        foll,
-        follow_up_date: Optional[datetim= None,
-        follow_up_notes: Optional[
+        follow_up_required: Optional[bool] = None,
+        follow_up_date: Optional[datetime] = None,
+        follow_up_notes: Optional[str] = None,
         duration_minutes: Optional[int] = None,
-        **kw
+        **kwargs
     ) -> Appointment:
-        """U""
+        """
+        Update appointment information.
+        Supports dynamic parameters for different API versions.
+        
+        Returns:
+            Updated appointment object
+        """
         try:
-            appointment = await self
+            appointment = await self.get_appointment_by_id(appointment_id)
+            stats_before = daily_stats_contribution(appointment)
             
-            # Update ded
+            # Update fields if provided
             if scheduled_at is not None:
-
-                    raise Validate")
-             at
+                if scheduled_at <= datetime.utcnow():
+                    raise ValidationError("Appointment must be scheduled in the future")
+                if appointment.slot_id is not None and as_utc(scheduled_at) != as_utc(appointment.scheduled_at):
+                    await self._leave_slot(appointment)
+                appointment.scheduled_at = scheduled_at
             
             if appointment_type is not None:
                 if isinstance(appointment_type, str):
                     try:
-                        appointment_t_type)
+                        appointment_type = AppointmentType(appointment_type)
                     except ValueError:
-                        raise Valida
-                appointment.appointment_type = appope
+                        raise ValidationError(f"Invalid appointment type: {appointment_type}")
+                appointment.appointment_type = appointment_type
             
             if priority is not None:
                 if isinstance(priority, str):
                     try:
-                        priority = AppointmentPrioority)
+                        priority = AppointmentPriority(priority)
                     except ValueError:
-                        raise ValidationError(f")
-                y
+                        raise ValidationError(f"Invalid priority: {priority}")
+                appointment.priority = priority
             
-           e:
-                appointment.reason = rep()
+            if reason is not None:
+                appointment.reason = reason.strip()
             if symptoms is not None:
-        se None
-            if nNone:
-                appointment.notes = no
-           t None:
-            
+                appointment.symptoms = symptoms.strip() if symptoms else None
+            if notes is not None:
+                appointment.notes = notes.strip() if notes else None
+            if special_instructions is not None:
+                appointment.special_instructions = special_instructions.strip() if special_instructions else None
             if services_requested is not None:
-            
+                appointment.services_requested = services_requested
             if estimated_cost is not None:
-                appointment.estimated_coed_cost
+                appointment.estimated_cost = estimated_cost
             if actual_cost is not None:
                 appointment.actual_cost = actual_cost
             if follow_up_required is not None:
-            p_required
+                appointment.follow_up_required = follow_up_required
             if follow_up_date is not None:
-                appointment.follow_up_date = follow_u
-            if follow_up
-                appointment.follow_up_notes = follow_up_notes.strip() if fol
-            if duration_minutes is notone:
+                appointment.follow_up_date = follow_up_date
+            if follow_up_notes is not None:
+                appointment.follow_up_notes = follow_up_notes.strip() if follow_up_notes else None
+            if duration_minutes is not None:
                 appointment.duration_minutes = duration_minutes
             
+            await apply_daily_stats_change(self.db, stats_before, daily_stats_contribution(appointment))
+            await self.db.commit()
+            SCHEDULE_INDEX.invalidate(appointment.veterinarian_id)
+            await self.db.refresh(appointment)
             
-            await self.db.refresh(ap)
-            
-            return appoi
+            return appointment
             
         except Exception as e:
             await self.db.rollback()
-            if isinstance(e, VetClinicException
-            
-            raise VetClinicExcepti)
+            if isinstance(e, VetClinicException):
+                raise
+            if isinstance(e, IntegrityError):
+                raise handle_database_error(e)
+            raise VetClinicException(f"Failed to update appointment: {str(e)}")
 
     async def cancel_appointment(
         self,
         appointment_id: uuid.UUID,
         cancellation_reason: Optional[str] = None
     ) -> Appointment:
-        """Cancel an appointment."""
+        """
+        Cancel an appointment and queue its cancellation notifications.
+        
+        Args:
+            appointment_id: Appointment UUID
+            cancellation_reason: Reason for cancellation
+            
+        Returns:
+            Updated appointment object
+        """
         try:
-            appointment = await self.get_appointment_by_id(appointm
+            appointment = await self.get_appointment_by_id(appointment_id)
+            stats_before = daily_stats_contribution(appointment)
             
-            if not hasattr(appointment, "can_be_cancelled")
-                raise ValidationError(fcelled")
+            if not hasattr(appointment, "can_be_cancelled") or not appointment.can_be_cancelled:
+                raise ValidationError(f"Appointment with status {appointment.status} cannot be cancelled")
             
-            appointment.cancel(cancellation_re
+            appointment.cancel(cancellation_reason)
+            if appointment.slot_id is not None:
+                await self._leave_slot(appointment)
             
+            await apply_daily_stats_change(self.db, stats_before, daily_stats_contribution(appointment))
+            await enqueue_notifications(self.db, appointment_rows(APPOINTMENT_CANCELLATION, appointment.id))
             await self.db.commit()
+            SCHEDULE_INDEX.invalidate(appointment.veterinarian_id)
             await self.db.refresh(appointment)
             
             return appointment
             
         except Exception as e:
-            
-            if isinstance(e, VetCl:
+            await self.db.rollback()
+            if isinstance(e, VetClinicException):
                 raise
-            )
+            raise VetClinicException(f"Failed to cancel appointment: {str(e)}")
 
-    async de:
-        """Confirm an appointm
+    async def confirm_appointment(self, appointment_id: uuid.UUID) -> Appointment:
+        """
+        Confirm an appointment.
+        
+        Args:
+            appointment_id: Appointment UUID
+            
+        Returns:
+            Updated appointment object
+        """
         try:
-            appointment = await self.get_appointm
+            appointment = await self.get_appointment_by_id(appointment_id)
+            stats_before = daily_stats_contribution(appointment)
             
             if appointment.status != AppointmentStatus.SCHEDULED:
-rmed")
+                raise ValidationError("Only scheduled appointments can be confirmed")
             
-            a
+            appointment.confirm()
             
+            await apply_daily_stats_change(self.db, stats_before, daily_stats_contribution(appointment))
             await self.db.commit()
-            await selent)
+            SCHEDULE_INDEX.invalidate(appointment.veterinarian_id)
+            await self.db.refresh(appointment)
             
             return appointment
-           
-        excepon as e:
+            
+        except Exception as e:
             await self.db.rollback()
             if isinstance(e, VetClinicException):
-            e
-            raistr(e)}")
+                raise
+            raise VetClinicException(f"Failed to confirm appointment: {str(e)}")
 
-    async dt:
-        """Snt."""
-        try:
+    async def start_appointment(self, appointment_id: uuid.UUID) -> Appointment:
+        """
+        Start an appointment.
+        
+        Args:
+            appointment_id: Appointment UUID
             
+        Returns:
+            Updated appointment object
+        """
+        try:
+            appointment = await self.get_appointment_by_id(appointment_id)
+            stats_before = daily_stats_contribution(appointment)
             
             if appointment.status not in [AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]:
-            ted")
+                raise ValidationError(f"Appointment with status {appointment.status} cannot be started")
             
-            ()
+            appointment.start()
             
+            await apply_daily_stats_change(self.db, stats_before, daily_stats_contribution(appointment))
             await self.db.commit()
+            SCHEDULE_INDEX.invalidate(appointment.veterinarian_id)
+            await self.db.refresh(appointment)
             
-            
-            ent
+            return appointment
             
         except Exception as e:
             await self.db.rollback()
-            if isinst
+            if isinstance(e, VetClinicException):
                 raise
-}")
+            raise VetClinicException(f"Failed to start appointment: {str(e)}")
 
-    async dt(
+    async def complete_appointment(
         self,
-        
-        actua
+        appointment_id: uuid.UUID,
+        actual_cost: Optional[float] = None
     ) -> Appointment:
-        """C
+        """
+        Complete an appointment.
+        
+        Args:
+            appointment_id: Appointment UUID
+            actual_cost: Actual cost of the appointment
+            
+        Returns:
+            Updated appointment object
+        """
         try:
-            appointment = await self.gntment_id)
+            appointment = await self.get_appointment_by_id(appointment_id)
+            stats_before = daily_stats_contribution(appointment)
             
-            S:
-                raise ValidationError(f"Only in-progress appointments can ted")
+            if appointment.status != AppointmentStatus.IN_PROGRESS:
+                raise ValidationError("Only in-progress appointments can be completed")
             
             appointment.complete(actual_cost)
             
-            it()
-            await self.db.refreshent)
+            await apply_daily_stats_change(self.db, stats_before, daily_stats_contribution(appointment))
+            await self.db.commit()
+            SCHEDULE_INDEX.invalidate(appointment.veterinarian_id)
+            await self.db.refresh(appointment)
             
             return appointment
             
-        exce
-            await self.db.roll)
-            on):
+        except Exception as e:
+            await self.db.rollback()
+            if isinstance(e, VetClinicException):
                 raise
-            raise VetClinicException
+            raise VetClinicException(f"Failed to complete appointment: {str(e)}")
 
-    async def resched
+    async def reschedule_appointment(
         self,
-,
+        appointment_id: uuid.UUID,
         new_scheduled_at: datetime
-    ) -> Ap
-        """Reschedule an appo
-        ry:
-            ad)
+    ) -> Appointment:
+        """
+        Reschedule an appointment and queue its reschedule notifications.
+        
+        Args:
+            appointment_id: Appointment UUID
+            new_scheduled_at: New scheduled date and time
+            
+        Returns:
+            Updated appointment object
+        """
+        try:
+            appointment = await self.get_appointment_by_id(appointment_id)
+            stats_before = daily_stats_contribution(appointment)
             
-            uled:
-                ")
+            if not appointment.can_be_rescheduled:
+                raise ValidationError(f"Appointment with status {appointment.status} cannot be rescheduled")
             
-           
-            e")
+            if new_scheduled_at <= datetime.utcnow():
+                raise ValidationError("New appointment time must be in the future")
             
-            nd status
+            # Update the scheduled time and status
+            if appointment.slot_id is not None:
+                await self._leave_slot(appointment)
+            old_scheduled_at = appointment.scheduled_at
             appointment.scheduled_at = new_scheduled_at
             appointment.status = AppointmentStatus.SCHEDULED  # Reset to scheduled
-            n
-            
-            mit()
-            await self.db.refresh()
+            appointment.confirmed_at = None  # Clear confirmation
+            
+            await apply_daily_stats_change(self.db, stats_before, daily_stats_contribution(appointment))
+            await enqueue_notifications(self.db, appointment_rows(
+                APPOINTMENT_RESCHEDULE,
+                appointment.id,
+                event=new_scheduled_at.isoformat(),
+                old_scheduled_at=old_scheduled_at.isoformat()
+            ))
+            await self.db.commit()
+            SCHEDULE_INDEX.invalidate(appointment.veterinarian_id)
+            await self.db.refresh(appointment)
             
-            tment
+            return appointment
             
-        exce as e:
-            await self.db.rollk()
-            if isinstance(e, VetClinion):
+        except Exception as e:
+            await self.db.rollback()
+            if isinstance(e, VetClinicException):
                 raise
-            raise Vet
+            if isinstance(e, IntegrityError):
+                raise handle_database_error(e)
+            raise VetClinicException(f"Failed to reschedule appointment: {str(e)}")
 
-) -> None:
-        """Hard delete an appointme"
+    async def delete_appointment(self, appointment_id: uuid.UUID) -> None:
+        """
+        Hard delete an appointment.
+        
+        Args:
+            appointment_id: Appointment UUID
+        """
         try:
-            appointment = await se)
+            appointment = await self.get_appointment_by_id(appointment_id)
             
-            await selointment)
-           t()
+            if appointment.slot_id is not None and appointment.status in ACTIVE_STATUSES:
+                await release_slot(self.db, appointment.slot_id)
+            await self.db.delete(appointment)
+            await apply_daily_stats_change(self.db, daily_stats_contribution(appointment), None)
+            await self.db.commit()
+            SCHEDULE_INDEX.invalidate(appointment.veterinarian_id)
             
-         as e:
-            ak()
-            if isinstance(e, VetClinicExcepton):
+        except Exception as e:
+            await self.db.rollback()
+            if isinstance(e, VetClinicException):
                 raise
-            ")
+            raise VetClinicException(f"Failed to delete appointment: {str(e)}")
 
-    async def get_available_slots(
+    async def get_appointments_by_pet(
         self,
-        vete
-        clinic_id: uuid.UUID,
-        starate,
+        pet_id: uuid.UUID,
+        include_past: bool = True,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> List[Appointment]:
+        """
+        Get all appointments for a specific pet.
+        
+        Args:
+            pet_id: Pet UUID
+            include_past: Include past appointments
+            limit: Limit number of results
+            **kwargs: Additional parameters for future versions
+            
+        Returns:
+            List of appointments
+        """
+        try:
+            query = select(Appointment).where(Appointment.pet_id == pet_id)
+            
+            if not include_past:
+                now = datetime.utcnow()
+                query = query.where(Appointment.scheduled_at > now)
+            
+            query = query.order_by(Appointment.scheduled_at.desc())
+            
+            if limit:
+                query = query.limit(limit)
+            
+            result = await self.db.execute(query)
+            appointments = result.scalars().all()
+            
+            return list(appointments)
+            
+        except Exception as e:
+            raise VetClinicException(f"Failed to get appointments by pet: {str(e)}")
+
+    async def get_appointments_by_veterinarian(
+        self,
+        veterinarian_id: uuid.UUID,
+        start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        duration_minutes: int = 30,
         **kwargs
-    ) -> List[AppointmentSlot]:
-        """G"
+    ) -> List[Appointment]:
+        """
+        Get all appointments for a specific veterinarian.
+        
+        Args:
+            veterinarian_id: Veterinarian UUID
+            start_date: Filter by start date
+            end_date: Filter by end date
+            **kwargs: Additional parameters for future versions
+            
+        Returns:
+            List of appointments
+        """
         try:
-            if end_date is None:
+            query = select(Appointment).where(Appointment.veterinarian_id == veterinarian_id)
+            
+            if start_date:
+                start_datetime = datetime.combine(start_date, datetime.min.time())
+                query = query.where(Appointment.scheduled_at >= start_datetime)
             
+            if end_date:
+                end_datetime = datetime.combine(end_date, datetime.max.time())
+                query = query.where(Appointment.scheduled_at <= end_datetime)
             
-            e())
-            end_datetime = dat())
+            query = query.order_by(Appointment.scheduled_at)
             
-            query = select(AppointmentSlot).where
-                and_(
-                    AppointmentSlot.veterinarian_id == veterinarian_id,
+            result = await self.db.execute(query)
+            appointments = result.scalars().all()
+            
+            return list(appointments)
+            
+        except Exception as e:
+            raise VetClinicException(f"Failed to get appointments by veterinarian: {str(e)}")
 
-                    AppointmentSlot.setime,
-             
-                    AppointmentSlo
-                    AppointmentSlolse,
-                    A
-           
-            ).order_by(Appointment)
+    async def get_available_slots(
+        self,
+        veterinarian_id: uuid.UUID,
+        clinic_id: uuid.UUID,
+        start_date: date,
+        end_date: Optional[date] = None,
+        duration_minutes: int = 30,
+        **kwargs
+    ) -> List[OpenSlot]:
+        """
+        Get available appointment slots.
+        
+        Served from the in-process schedule index; slots that are full, too
+        short, or taken by an overlapping appointment are left out.
+        
+        Args:
+            veterinarian_id: Veterinarian UUID
+            clinic_id: Clinic UUID
+            start_date: Start date for slot search
+            end_date: End date for slot search
+            duration_minutes: Required appointment duration
+            **kwargs: Additional parameters for future versions
             
-            ry)
-            slots = result.scalars().all()
+        Returns:
+            List of available appointment slots
+        """
+        try:
+            if end_date is None:
+                end_date = start_date + timedelta(days=7)  # Default to one week
+            
+            return await SCHEDULE_INDEX.free_slots(
+                self.db,
+                [veterinarian_id],
+                clinic_id,
+                day_start(start_date),
+                day_start(end_date + timedelta(days=1)),
+                duration_minutes,
+            )
             
-            ts
-            avai
+        except Exception as e:
+            raise VetClinicException(f"Failed to get available slots: {str(e)}")
+
+    async def get_next_available_slots(
+        self,
+        clinic_id: uuid.UUID,
+        count: int = 5,
+        after: Optional[datetime] = None,
+        duration_minutes: int = 30,
+        horizon_days: int = 14,
+        **kwargs
+    ) -> List[OpenSlot]:
+        """
+        Get the earliest open slots across every active veterinarian at a clinic.
+        
+        Args:
+            clinic_id: Clinic UUID
+            count: Number of slots to return
+            after: Earliest slot start; defaults to now
+            duration_minutes: Required appointment duration
+            horizon_days: How many days ahead to search
+            **kwargs: Additional parameters for future versions
             
-           slots
+        Returns:
+            Up to count slots, earliest first
+        """
+        try:
+            after = as_utc(after or datetime.utcnow())
+            veterinarians_result = await self.db.execute(
+                select(Veterinarian.id).where(
+                    and_(Veterinarian.clinic_id == clinic_id, Veterinarian.is_active == True)
+                )
+            )
+            veterinarian_ids = list(veterinarians_result.scalars().all())
+            if not veterinarian_ids:
+                return []
+            
+            return await SCHEDULE_INDEX.free_slots(
+                self.db,
+                veterinarian_ids,
+                clinic_id,
+                after,
+                after + timedelta(days=horizon_days),
+                duration_minutes,
+                limit=count,
+            )
             
         except Exception as e:
-            e)}")
+            raise VetClinicException(f"Failed to get next available slots: {str(e)}")
 
     async def get_calendar_view(
         self,
         veterinarian_id: Optional[uuid.UUID] = None,
         clinic_id: Optional[uuid.UUID] = None,
-        star= None,
+        start_date: date = None,
         end_date: Optional[date] = None,
         view_type: str = "week",
         **kwargs
     ) -> Dict[str, Any]:
-        """G""
+        """
+        Get calendar view of appointments and availability.
+        
+        Args:
+            veterinarian_id: Filter by veterinarian ID
+            clinic_id: Filter by clinic ID
+            start_date: Calendar start date
+            end_date: Calendar end date
+            view_type: Calendar view type (day, week, month)
+            **kwargs: Additional parameters for future versions
+            
+        Returns:
+            Dictionary containing calendar data with appointments and availability
+        
+        Identical concurrent calls, in this worker or others, share one query.
+        """
+        return await get_single_flight().do(
+            single_flight_key(
+                "appointments.calendar",
+                veterinarian_id=veterinarian_id,
+                clinic_id=clinic_id,
+                start_date=start_date,
+                end_date=end_date,
+                view_type=view_type,
+                **kwargs
+            ),
+            lambda: self._build_calendar_view(veterinarian_id, clinic_id, start_date, end_date, view_type),
+            distributed=True
+        )
+
+    async def _build_calendar_view(
+        self,
+        veterinarian_id: Optional[uuid.UUID],
+        clinic_id: Optional[uuid.UUID],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        view_type: str
+    ) -> Dict[str, Any]:
+        """Query and shape the calendar view for get_calendar_view."""
         try:
             if start_date is None:
-            ate()
+                start_date = datetime.utcnow().date()
             
-            ype
+            # Calculate end date based on view type
             if end_date is None:
-                if view_type == "day:
+                if view_type == "day":
                     end_date = start_date
-                elif ":
+                elif view_type == "week":
                     end_date = start_date + timedelta(days=6)
-:
+                elif view_type == "month":
                     # Get last day of the month
-            == 12:
-                        end_date = ays=1)
-        :
-             1)
+                    if start_date.month == 12:
+                        end_date = date(start_date.year + 1, 1, 1) - timedelta(days=1)
+                    else:
+                        end_date = date(start_date.year, start_date.month + 1, 1) - timedelta(days=1)
                 else:
-           
+                    end_date = start_date + timedelta(days=6)  # Default to week
             
             start_datetime = datetime.combine(start_date, datetime.min.time())
-            me())
+            end_datetime = datetime.combine(end_date, datetime.max.time())
             
-            # Build appointment qu
-            re(
+            # Build appointment query
+            appointment_query = select(Appointment).where(
                 and_(
-                    Appointment.scheme,
-                    Appointment.scheduled_at <= eetime
+                    Appointment.scheduled_at >= start_datetime,
+                    Appointment.scheduled_at <= end_datetime
                 )
-            ).options(
-pet),
-                selectinload(Appointmeowner),
-             
-                selectinlo)
             )
             
-            # Ap filters
+            # Apply filters
             if veterinarian_id:
-           
+                appointment_query = appointment_query.where(Appointment.veterinarian_id == veterinarian_id)
             if clinic_id:
-        linic_id)
+                appointment_query = appointment_query.where(Appointment.clinic_id == clinic_id)
             
-            appointment_quert)
+            appointment_query = appointment_query.order_by(Appointment.scheduled_at)
             
             # Get appointments
-            appointment_result = await self.db.execute(appointm
-            ).all()
+            appointment_result = await APPOINTMENT_CALENDAR_PROFILE.execute(self.db, appointment_query)
+            appointments = appointment_result.scalars().all()
             
             # Build availability query
-           
-            _(
+            slot_query = select(AppointmentSlot).where(
+                and_(
                     AppointmentSlot.start_time >= start_datetime,
-            
-                    AppointmentS,
-                    AppointmentSlot.is_se
+                    AppointmentSlot.start_time <= end_datetime,
+                    AppointmentSlot.is_available == True,
+                    AppointmentSlot.is_blocked == False
                 )
             )
             
-            
-                slot_d)
+            if veterinarian_id:
+                slot_query = slot_query.where(AppointmentSlot.veterinarian_id == veterinarian_id)
             if clinic_id:
-            id)
+                slot_query = slot_query.where(AppointmentSlot.clinic_id == clinic_id)
             
-            slot_query = slot_query.order_by(Appotime)
+            slot_query = slot_query.order_by(AppointmentSlot.start_time)
             
             # Get available slots
-            y)
-            slots = slot_resul()
+            slot_result = await self.db.execute(slot_query)
+            slots = slot_result.scalars().all()
             
-ar
+            # Format appointments for calendar
             calendar_appointments = []
-            fintments:
-                calendar_appointmenpend({
-                    "id": str(appointment.,
-                    "title": f"{appointm",
-                
-                    "end_ti
-           es,
+            for appointment in appointments:
+                calendar_appointments.append({
+                    "id": str(appointment.id),
+                    "title": f"{appointment.pet.name if appointment.pet else 'Unknown Pet'} - {appointment.reason}",
+                    "start_time": appointment.scheduled_at.isoformat(),
+                    "end_time": (appointment.scheduled_at + timedelta(minutes=appointment.duration_minutes)).isoformat(),
+                    "duration_minutes": appointment.duration_minutes,
                     "status": appointment.status.value,
-        ue,
-             
-                    "pet_id": str(appointment.
-                    "pet_name": appointment. None,
-                    "pet_owner_id": str(
-                    "pet_owner_name": f"{appointment.pet_owner.ne,
-            d),
-                one,
-                    "clinic_id":id),
-           ,
-            ost,
+                    "appointment_type": appointment.appointment_type.value,
+                    "priority": appointment.priority.value,
+                    "pet_id": str(appointment.pet_id),
+                    "pet_name": appointment.pet.name if appointment.pet else None,
+                    "pet_owner_id": str(appointment.pet_owner_id),
+                    "pet_owner_name": f"{appointment.pet_owner.first_name} {appointment.pet_owner.last_name}" if appointment.pet_owner else None,
+                    "veterinarian_id": str(appointment.veterinarian_id),
+                    "veterinarian_name": f"Dr. {appointment.veterinarian.user.first_name} {appointment.veterinarian.user.last_name}" if appointment.veterinarian and appointment.veterinarian.user else None,
+                    "clinic_id": str(appointment.clinic_id),
+                    "clinic_name": appointment.clinic.name if appointment.clinic else None,
+                    "estimated_cost": appointment.estimated_cost,
                     "actual_cost": appointment.actual_cost,
-            
-                    "can_buled
+                    "can_be_cancelled": appointment.can_be_cancelled,
+                    "can_be_rescheduled": appointment.can_be_rescheduled
                 })
             
-             calendar
-            available_slts = []
+            # Format available slots for calendar
+            available_slots = []
             for slot in slots:
                 if not slot.is_fully_booked:
-            
+                    available_slots.append({
                         "id": str(slot.id),
-            ),
-                        "end_time": slot.end_timet(),
-                        "duration_minutes": slot.tes,
-            ot_type,
-                        "remaining_ca,
-            
-                        "clini_id),
+                        "start_time": slot.start_time.isoformat(),
+                        "end_time": slot.end_time.isoformat(),
+                        "duration_minutes": slot.duration_minutes,
+                        "slot_type": slot.slot_type,
+                        "remaining_capacity": slot.remaining_capacity,
+                        "veterinarian_id": str(slot.veterinarian_id),
+                        "clinic_id": str(slot.clinic_id),
                         "is_available": True
-
+                    })
             
-            #s
-            total_appointments = le
-            appointments_by_s = {}
-            for appointme
-                status = appointment.staalue
-                appointments_by_sta0) + 1
+            # Calculate summary statistics
+            total_appointments = len(appointments)
+            appointments_by_status = {}
+            for appointment in appointments:
+                status = appointment.status.value
+                appointments_by_status[status] = appointments_by_status.get(status, 0) + 1
             
-            # Calculate utilizate
-           
-            booked_slots = len([slot for> 0])
-        e 0
+            # Calculate utilization rate
+            total_slots = len(slots)
+            booked_slots = len([slot for slot in slots if slot.current_bookings > 0])
+            utilization_rate = (booked_slots / total_slots * 100) if total_slots > 0 else 0
             
             return {
-                "view_type": view_
-                "start_date": start_date.isoformat),
-                "end_date": end_date.isoformat),
+                "view_type": view_type,
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
                 "appointments": calendar_appointments,
                 "available_slots": available_slots,
-            
-                ,
-                    "appointments_by_status": a_status,
-           ,
-            )
+                "summary": {
+                    "total_appointments": total_appointments,
+                    "appointments_by_status": appointments_by_status,
+                    "total_available_slots": len(available_slots),
+                    "utilization_rate": round(utilization_rate, 2)
                 },
                 "filters": {
-            None,
+                    "veterinarian_id": str(veterinarian_id) if veterinarian_id else None,
                     "clinic_id": str(clinic_id) if clinic_id else None
                 }
             }
             
-        except Except
-            raise VetClinicException(f"Failed to get calendar view: {st
+        except Exception as e:
+            raise VetClinicException(f"Failed to get calendar view: {str(e)}")
 
     async def check_appointment_conflicts(
         self,
         veterinarian_id: uuid.UUID,
         scheduled_at: datetime,
         duration_minutes: int = 30,
-        exclude_a= None,
+        exclude_appointment_id: Optional[uuid.UUID] = None,
         **kwargs
-    ) -> Lisment]:
-        """Check for appointment conflicts before
+    ) -> List[Appointment]:
+        """
+        Check for appointment conflicts before booking or rescheduling.
+        
+        Args:
+            veterinarian_id: Veterinarian UUID
+            scheduled_at: Proposed appointment time
+            duration_minutes: Duration of the appointment
+            exclude_appointment_id: Appointment ID to exclude from conflict check (for rescheduling)
+            **kwargs: Additional parameters for future versions; fresh=True
+                bypasses the schedule index and queries the database
+            
+        Returns:
+            List of conflicting appointments
+        """
         try:
-            king
             appointment_start = scheduled_at
             appointment_end = scheduled_at + timedelta(minutes=duration_minutes)
             
-            # Build conflict queryh
-            
-            query = select(Apphere(
-                and_(
-n_id,
-                    Appointment.us.in_([
-             
-                        AppointmentStatus.CONFIRMED,
-                        AppointmentStatus.IN_PS
-                    ]),
-                    # Check for time ovee
-                    # and ends a
-                d,
-                    functetime(
-           duled_at, 
-                        '+' + func.cast(Appointment.durationutes'
-        at
-             
-            ).options(
-                selectinload(Appointment.pet),
-                selectinload(Appointment.peowner)
+            if kwargs.get("fresh"):
+                # Straight from the database: overlapping means starting before
+                # our end and ending after our start
+                query = select(Appointment).where(
+                    and_(
+                        Appointment.veterinarian_id == veterinarian_id,
+                        Appointment.status.in_(ACTIVE_STATUSES),
+                        Appointment.scheduled_at < appointment_end,
+                        Appointment.ends_at > appointment_start
+                    )
+                )
+            else:
+                conflict_ids = await SCHEDULE_INDEX.conflicts(
+                    self.db, veterinarian_id, appointment_start, appointment_end
+                )
+                conflict_ids = [
+                    conflict_id for conflict_id in conflict_ids if conflict_id != exclude_appointment_id
+                ]
+                if not conflict_ids:
+                    return []
+                query = select(Appointment).where(Appointment.id.in_(conflict_ids))
+            
+            # Exclude specific appointment if provided (for rescheduling)
+            if exclude_appointment_id:
+                query = query.where(Appointment.id != exclude_appointment_id)
+            
+            result = await APPOINTMENT_CONFLICTS_PROFILE.execute(
+                self.db, query.order_by(Appointment.scheduled_at)
             )
-            
-            # Exclude specific appointment if provided (for resuling)
-            :
-                d)
-            
-           ery)
-            l()
-            
-            return list(conflicts)
+            return list(result.scalars().all())
             
         except Exception as e:
-            raise VetClinicExcep")(e)}: {strctsonflitment cppoink aled to checFaiion(f"t
-    a
-sync def get_appointment_statistics(
+            raise VetClinicException(f"Failed to check appointment conflicts: {str(e)}")
+
+    async def get_appointment_statistics(
         self,
         veterinarian_id: Optional[uuid.UUID] = None,
         clinic_id: Optional[uuid.UUID] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        group_by: Optional[str] = None,
+        from_rollup: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
-        """Get appointment statistics for reporting and analytics."""
+        """
+        Get appointment statistics for reporting and analytics.
+        
+        Counts, revenue sums and rates are aggregated in the database with a
+        single GROUP BY query; no appointments are loaded. With from_rollup
+        the query reads appointment_daily_stats instead of appointments.
+        
+        Args:
+            veterinarian_id: Filter by veterinarian ID
+            clinic_id: Filter by clinic ID
+            start_date: Start date for statistics
+            end_date: End date for statistics
+            group_by: Optional breakdown (veterinarian, clinic, day, week, month)
+            from_rollup: Read the daily rollup instead of the appointments table
+            **kwargs: Additional parameters for future versions
+            
+        Returns:
+            Dictionary containing appointment statistics
+        
+        Identical concurrent calls, in this worker or others, share one query.
+        """
+        return await get_single_flight().do(
+            single_flight_key(
+                "appointments.statistics",
+                veterinarian_id=veterinarian_id,
+                clinic_id=clinic_id,
+                start_date=start_date,
+                end_date=end_date,
+                group_by=group_by,
+                from_rollup=from_rollup,
+                **kwargs
+            ),
+            lambda: self._build_appointment_statistics(
+                veterinarian_id, clinic_id, start_date, end_date, group_by, from_rollup
+            ),
+            distributed=True
+        )
+
+    async def _build_appointment_statistics(
+        self,
+        veterinarian_id: Optional[uuid.UUID],
+        clinic_id: Optional[uuid.UUID],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        group_by: Optional[str],
+        from_rollup: bool
+    ) -> Dict[str, Any]:
+        """Aggregate and shape the statistics for get_appointment_statistics."""
         try:
+            if group_by is not None and group_by not in STATISTICS_GROUPINGS:
+                raise ValidationError(
+                    f"group_by must be one of: {', '.join(STATISTICS_GROUPINGS)}"
+                )
+            
             # Default to current month if no dates provided
             if start_date is None:
                 today = datetime.utcnow().date()
@@ -818,124 +1350,221 @@ sync def get_appointment_statistics(
             start_datetime = datetime.combine(start_date, datetime.min.time())
             end_datetime = datetime.combine(end_date, datetime.max.time())
             
-            # Build base query
-            query = select(Appointment).where(
-                and_(
+            # Build aggregate query over the rollup or the raw appointments
+            if from_rollup:
+                source, groupings = AppointmentDailyStats, ROLLUP_STATISTICS_GROUPINGS
+                period = and_(
+                    AppointmentDailyStats.day >= start_date,
+                    AppointmentDailyStats.day <= end_date
+                )
+            else:
+                source, groupings = Appointment, STATISTICS_GROUPINGS
+                period = and_(
                     Appointment.scheduled_at >= start_datetime,
                     Appointment.scheduled_at <= end_datetime
                 )
-            )
+            
+            columns = _statistics_columns(source)
+            group_column = None
+            if group_by:
+                group_column = groupings[group_by]
+                columns.insert(0, group_column.label("group_key"))
+            
+            query = select(*columns).where(period)
             
             # Apply filters
             if veterinarian_id:
-                query = query.where(Appointment.veterinarian_id == veterinarian_id)
+                query = query.where(source.veterinarian_id == veterinarian_id)
             if clinic_id:
-                query = query.where(Appointment.clinic_id == clinic_id)
+                query = query.where(source.clinic_id == clinic_id)
             
-            result = await self.db.execute(query)
-            appointments = result.scalars().all()
+            if group_column is not None:
+                query = query.group_by(group_column).order_by(group_column)
             
-            # Calculate statistics
-            total_appointments = len(appointments)
-            
-            # Count by status
-            status_counts = {}
-            for status in AppointmentStatus:
-                status_counts[status.value] = 0
-            
-            for appointment in appointments:
-                status_counts[appointment.status.value] += 1
+            result = await self.db.execute(query)
+            rows = result.mappings().all()
             
-            # Count by type
-            type_counts = {}
-            for appointment_type in AppointmentType:
-                type_counts[appointment_type.value] = 0
+            # Overall figures are the sum of the per-group figures
+            totals = _merge_statistics_rows(rows)
             
-            for appointment in appointments:
-                type_counts[appointment.appointment_type.value] += 1
+            statistics = {
+                "period": {
+                    "start_date": start_date.isoformat(),
+                    "end_date": end_date.isoformat()
+                },
+                "filters": {
+                    "veterinarian_id": str(veterinarian_id) if veterinarian_id else None,
+                    "clinic_id": str(clinic_id) if clinic_id else None
+                },
+                **_format_statistics(totals)
+            }
             
-            # Count by priority
-            priority_counts = {}
-            for priority in AppointmentPriority:
-                priority_counts[priority.value] = 0
+            if group_by:
+                statistics["group_by"] = group_by
+                statistics["groups"] = [
+                    {
+                        "key": _format_group_key(row["group_key"]),
+                        **_format_statistics(_merge_statistics_rows([row]))
+                    }
+                    for row in rows
+                ]
             
-            for appointment in appointments:
-                priority_counts[appointment.priority.value] += 1
+            return statistics
             
-            # Calculate revenue statistics
-            total_estimated_revenue = sum(
-                appointment.estimated_cost or 0 
-                for appointment in appointments 
-                if appointment.estimated_cost
-            )
+        except Exception as e:
+            if isinstance(e, VetClinicException):
+                raise
+            raise VetClinicException(f"Failed to get appointment statistics: {str(e)}")
+
+    async def claim_reminder_appointments(
+        self,
+        sent_flag: str,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[Appointment]:
+        """
+        Lock the next chunk of appointments still owed a reminder.
+        
+        Appointments scheduled in [start_time, end_time) whose sent_flag is
+        unset are taken in (scheduled_at, id) order after the given position
+        with FOR UPDATE SKIP LOCKED, so concurrent workers claim disjoint
+        chunks. The locks are held until the caller commits.
+        
+        Args:
+            sent_flag: Reminder flag column, e.g. "reminder_sent_24h"
+            start_time: Window start (inclusive)
+            end_time: Window end (exclusive)
+            limit: Chunk size
+            after: (scheduled_at, id) of the last appointment of the previous chunk
             
-            total_actual_revenue = sum(
-                appointment.actual_cost or 0 
-                for appointment in appointments 
-                if appointment.actual_cost and appointment.status == AppointmentStatus.COMPLETED
+        Returns:
+            Claimed appointments
+        """
+        try:
+            query = select(Appointment).where(
+                and_(
+                    Appointment.scheduled_at >= start_time,
+                    Appointment.scheduled_at < end_time,
+                    Appointment.status.in_([
+                        AppointmentStatus.SCHEDULED,
+                        AppointmentStatus.CONFIRMED
+                    ]),
+                    getattr(Appointment, sent_flag) == False
+                )
             )
+            if after is not None:
+                query = query.where(tuple_(Appointment.scheduled_at, Appointment.id) > tuple_(*after))
             
-            completed_appointments = [
-                appointment for appointment in appointments 
-                if appointment.status == AppointmentStatus.COMPLETED
-            ]
-            
-            average_appointment_cost = (
-                total_actual_revenue / len(completed_appointments) 
-                if completed_appointments else 0
+            query = (
+                query.order_by(Appointment.scheduled_at, Appointment.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
             )
             
-            # Calculate completion rate
-            scheduled_or_confirmed = len([
-                appointment for appointment in appointments 
-                if appointment.status in [AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED, AppointmentStatus.COMPLETED]
-            ])
-            
-            completion_rate = (
-                status_counts[AppointmentStatus.COMPLETED.value] / scheduled_or_confirmed * 100
-                if scheduled_or_confirmed > 0 else 0
-            )
+            result = await self.db.execute(query)
+            return list(result.scalars().all())
             
-            # Calculate no-show rate
-            no_show_rate = (
-                status_counts[AppointmentStatus.NO_SHOW.value] / total_appointments * 100
-                if total_appointments > 0 else 0
-            )
+        except Exception as e:
+            raise VetClinicException(f"Failed to claim appointments for reminders: {str(e)}")
+
+    async def mark_reminders_sent(
+        self,
+        sent_flag: str,
+        appointment_ids: List[uuid.UUID],
+        sent_at: datetime
+    ) -> int:
+        """
+        Set a reminder flag on appointments with a single UPDATE and commit.
+        
+        Committing also releases the locks taken by
+        claim_reminder_appointments, so it is called even when nothing was sent.
+        
+        Args:
+            sent_flag: Reminder flag column, e.g. "reminder_sent_24h"
+            appointment_ids: Appointment UUIDs
+            sent_at: Value for the flag's *_at column
             
-            # Calculate cancellation rate
-            cancellation_rate = (
-                status_counts[AppointmentStatus.CANCELLED.value] / total_appointments * 100
-                if total_appointments > 0 else 0
-            )
+        Returns:
+            Number of appointments marked
+        """
+        try:
+            marked = 0
+            if appointment_ids:
+                result = await self.db.execute(
+                    update(Appointment)
+                    .where(Appointment.id.in_(appointment_ids))
+                    .values({sent_flag: True, f"{sent_flag}_at": sent_at})
+                    .execution_options(synchronize_session=False)
+                )
+                marked = result.rowcount
             
-            return {
-                "period": {
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat()
-                },
-                "filters": {
-                    "veterinarian_id": str(veterinarian_id) if veterinarian_id else None,
-                    "clinic_id": str(clinic_id) if clinic_id else None
-                },
-                "totals": {
-                    "total_appointments": total_appointments,
-                    "completed_appointments": len(completed_appointments),
-                    "total_estimated_revenue": round(total_estimated_revenue, 2),
-                    "total_actual_revenue": round(total_actual_revenue, 2),
-                    "average_appointment_cost": round(average_appointment_cost, 2)
-                },
-                "counts_by_status": status_counts,
-                "counts_by_type": type_counts,
-                "counts_by_priority": priority_counts,
-                "rates": {
-                    "completion_rate": round(completion_rate, 2),
-                    "no_show_rate": round(no_show_rate, 2),
-                    "cancellation_rate": round(cancellation_rate, 2)
-                }
-            }
+            await self.db.commit()
+            return marked
             
         except Exception as e:
-            raise VetClinicException(f"Failed to get appointment statistics: {str(e)}")
+            await self.db.rollback()
+            raise VetClinicException(f"Failed to mark appointment reminders as sent: {str(e)}")
+
+    async def book_slot(self, slot_id: uuid.UUID) -> AppointmentSlot:
+        """
+        Take one booking on an appointment slot.
+
+        The booking is a single conditional UPDATE, so concurrent callers can
+        never book a slot past its max_bookings.
+
+        Args:
+            slot_id: Appointment slot UUID
+
+        Returns:
+            The slot with its new booking count
+
+        Raises:
+            NotFoundError: If the slot does not exist
+            ConflictError: If the slot is fully booked or unavailable
+        """
+        try:
+            slot = await claim_slot(self.db, slot_id)
+            await self.db.commit()
+            SCHEDULE_INDEX.invalidate(slot.veterinarian_id)
+
+            return slot
+
+        except Exception as e:
+            await self.db.rollback()
+            if isinstance(e, VetClinicException):
+                raise
+            raise VetClinicException(f"Failed to book appointment slot: {str(e)}")
+
+    async def release_slot(self, slot_id: uuid.UUID) -> Optional[AppointmentSlot]:
+        """
+        Give back one booking on an appointment slot.
+
+        Args:
+            slot_id: Appointment slot UUID
+
+        Returns:
+            The slot with its new booking count, or None if it had no bookings
+        """
+        try:
+            slot = await release_slot(self.db, slot_id)
+            await self.db.commit()
+            if slot is not None:
+                SCHEDULE_INDEX.invalidate(slot.veterinarian_id)
+
+            return slot
+
+        except Exception as e:
+            await self.db.rollback()
+            if isinstance(e, VetClinicException):
+                raise
+            raise VetClinicException(f"Failed to release appointment slot: {str(e)}")
+
+    async def _leave_slot(self, appointment: Appointment) -> None:
+        """Release an appointment's slot booking and unlink it; the caller commits."""
+        await release_slot(self.db, appointment.slot_id)
+        appointment.slot_id = None
 
     async def create_appointment_slots(
         self,
@@ -950,75 +1579,113 @@ sync def get_appointment_statistics(
         exclude_weekends: bool = True,
         **kwargs
     ) -> List[AppointmentSlot]:
-        """Create appointment slots for a veterinarian at a clinic."""
+        """
+        Create appointment slots for a veterinarian at a clinic.
+        
+        Args:
+            veterinarian_id: Veterinarian UUID
+            clinic_id: Clinic UUID
+            start_date: Start date for slot creation
+            end_date: End date for slot creation
+            start_time: Daily start time (HH:MM format)
+            end_time: Daily end time (HH:MM format)
+            slot_duration: Duration of each slot in minutes
+            break_duration: Break between slots in minutes
+            exclude_weekends: Whether to exclude weekends
+            **kwargs: Additional parameters for future versions
+            
+        Returns:
+            List of created appointment slots
+        """
         try:
-            created_slots = []
+            window = DailyWindow(
+                time(*map(int, start_time.split(':'))),
+                time(*map(int, end_time.split(':'))),
+            )
+            slots = []
             current_date = start_date
+            while current_date <= end_date:
+                # Skip weekends if requested (Saturday = 5, Sunday = 6)
+                if not (exclude_weekends and current_date.weekday() >= 5):
+                    slots.extend(day_slots(current_date, window, slot_duration, break_duration))
+                current_date += timedelta(days=1)
             
-            # Parse start and end times
-            start_hour, start_minute = map(int, start_time.split(':'))
-            end_hour, end_minute = map(int, end_time.split(':'))
+            created_slots = await insert_slots(
+                self.db, slot_rows(veterinarian_id, clinic_id, slots, slot_duration)
+            )
+            await self.db.commit()
+            SCHEDULE_INDEX.invalidate(veterinarian_id)
             
-            while current_date <= end_date:
-                # Skip weekends if requested
-                if exclude_weekends and current_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                    current_date += timedelta(days=1)
-                    continue
-                
-                # Create slots for the current day
-                current_time = datetime.combine(current_date, datetime.min.time()).replace(
-                    hour=start_hour, minute=start_minute
-                )
-                day_end_time = datetime.combine(current_date, datetime.min.time()).replace(
-                    hour=end_hour, minute=end_minute
+            return created_slots
+            
+        except Exception as e:
+            await self.db.rollback()
+            raise VetClinicException(f"Failed to create appointment slots: {str(e)}")
+
+    async def create_clinic_appointment_slots(
+        self,
+        clinic_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+        slot_duration: Optional[int] = None,
+        break_duration: int = 0,
+        **kwargs
+    ) -> List[AppointmentSlot]:
+        """
+        Create appointment slots for every active veterinarian at a clinic.
+        
+        Each veterinarian gets slots within their weekly availability,
+        limited to the clinic's operating hours and skipping both sides'
+        breaks.
+        
+        Args:
+            clinic_id: Clinic UUID
+            start_date: Start date for slot creation
+            end_date: End date for slot creation
+            slot_duration: Duration of each slot in minutes; defaults to each
+                veterinarian's default appointment duration
+            break_duration: Break between slots in minutes
+            **kwargs: Additional parameters for future versions
+            
+        Returns:
+            List of created appointment slots
+        """
+        try:
+            veterinarians_result = await self.db.execute(
+                select(Veterinarian.id).where(
+                    and_(Veterinarian.clinic_id == clinic_id, Veterinarian.is_active == True)
                 )
-                
-                while current_time + timedelta(minutes=slot_duration) <= day_end_time:
-                    slot_end_time = current_time + timedelta(minutes=slot_duration)
-                    
-                    # Check if slot already exists
-                    existing_slot_query = select(AppointmentSlot).where(
-                        and_(
-                            AppointmentSlot.veterinarian_id == veterinarian_id,
-                            AppointmentSlot.clinic_id == clinic_id,
-                            AppointmentSlot.start_time == current_time
-                        )
-                    )
-                    
-                    existing_result = await self.db.execute(existing_slot_query)
-                    existing_slot = existing_result.scalar_one_or_none()
-                    
-                    if not existing_slot:
-                        # Create new slot
-                        new_slot = AppointmentSlot(
-                            veterinarian_id=veterinarian_id,
-                            clinic_id=clinic_id,
-                            start_time=current_time,
-                            end_time=slot_end_time,
-                            duration_minutes=slot_duration,
-                            is_available=True,
-                            is_blocked=False,
-                            slot_type="regular",
-                            max_bookings=1,
-                            current_bookings=0
-                        )
-                        
-                        self.db.add(new_slot)
-                        created_slots.append(new_slot)
-                    
-                    # Move to next slot
-                    current_time = slot_end_time + timedelta(minutes=break_duration)
-                
+            )
+            veterinarian_ids = list(veterinarians_result.scalars().all())
+            if not veterinarian_ids:
+                return []
+            
+            schedule = await clinic_schedule(self.db, clinic_id, veterinarian_ids)
+            
+            rows = []
+            current_date = start_date
+            while current_date <= end_date:
+                day_of_week = weekday(current_date)
+                for veterinarian_id, windows in schedule.items():
+                    if day_of_week not in windows:
+                        continue
+                    window, default_duration = windows[day_of_week]
+                    duration = slot_duration or default_duration
+                    rows.extend(slot_rows(
+                        veterinarian_id,
+                        clinic_id,
+                        day_slots(current_date, window, duration, break_duration),
+                        duration,
+                    ))
                 current_date += timedelta(days=1)
             
+            created_slots = await insert_slots(self.db, rows)
             await self.db.commit()
-            
-            # Refresh all created slots
-            for slot in created_slots:
-                await self.db.refresh(slot)
+            for veterinarian_id in veterinarian_ids:
+                SCHEDULE_INDEX.invalidate(veterinarian_id)
             
             return created_slots
             
         except Exception as e:
             await self.db.rollback()
-            raise VetClinicException(f"Failed to create appointment slots: {str(e)}")
\ No newline at end of file
+            raise VetClinicException(f"Failed to create clinic appointment slots: {str(e)}")
@@ -0,0 +1,217 @@
+"""
+Set-based generation of appointment slots.
+
+Candidate slots are computed in memory, the start times already taken in the
+whole range are read with one query, and the remaining slots are written with
+a multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING. The unique index on
+(veterinarian_id, clinic_id, start_time) keeps reruns and concurrent
+generators from creating duplicates.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import uuid
+
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.appointment import AppointmentSlot
+from app.models.clinic import ClinicOperatingHours, DayOfWeek, VeterinarianAvailability
+
+SlotKey = Tuple[uuid.UUID, uuid.UUID, datetime]
+
+SLOT_KEY_COLUMNS = ["veterinarian_id", "clinic_id", "start_time"]
+
+
+@dataclass(frozen=True)
+class DailyWindow:
+    """Hours on one day during which slots may start and end."""
+
+    start: time
+    end: time
+    breaks: Tuple[Tuple[time, time], ...] = field(default_factory=tuple)
+
+
+def _at(day: date, clock: time) -> datetime:
+    # Slot times carry no clinic time zone, so they are stored as UTC
+    return datetime.combine(day, clock).replace(tzinfo=timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def day_slots(
+    day: date,
+    window: DailyWindow,
+    slot_duration: int,
+    break_duration: int = 0
+) -> List[Tuple[datetime, datetime]]:
+    """(start, end) of each slot fitting in a day's window, skipping its breaks."""
+    slots = []
+    length = timedelta(minutes=slot_duration)
+    gap = timedelta(minutes=break_duration)
+    breaks = [(_at(day, start), _at(day, end)) for start, end in window.breaks]
+    current, day_end = _at(day, window.start), _at(day, window.end)
+
+    while current + length <= day_end:
+        overlapping = [end for start, end in breaks if start < current + length and current < end]
+        if overlapping:
+            # Resume at the end of the break
+            current = max(overlapping)
+            continue
+        slots.append((current, current + length))
+        current += length + gap
+    return slots
+
+
+def slot_rows(
+    veterinarian_id: uuid.UUID,
+    clinic_id: uuid.UUID,
+    slots: Iterable[Tuple[datetime, datetime]],
+    slot_duration: int
+) -> List[Dict]:
+    """INSERT parameters for regular, open slots."""
+    return [
+        {
+            "veterinarian_id": veterinarian_id,
+            "clinic_id": clinic_id,
+            "start_time": start,
+            "end_time": end,
+            "duration_minutes": slot_duration,
+            "is_available": True,
+            "is_blocked": False,
+            "slot_type": "regular",
+            "max_bookings": 1,
+            "current_bookings": 0,
+        }
+        for start, end in slots
+    ]
+
+
+def intersect_windows(
+    availability: VeterinarianAvailability,
+    hours: Optional[ClinicOperatingHours]
+) -> Optional[DailyWindow]:
+    """
+    Window in which a veterinarian works while the clinic is open.
+
+    Both sides' break times are excluded. A clinic with no operating hours
+    row for the day does not restrict the veterinarian's hours.
+    """
+    if not availability.is_available or not availability.start_time or not availability.end_time:
+        return None
+
+    start, end = availability.start_time, availability.end_time
+    breaks = []
+    if availability.break_start_time and availability.break_end_time:
+        breaks.append((availability.break_start_time, availability.break_end_time))
+
+    if hours is not None:
+        if not hours.is_open or not hours.open_time or not hours.close_time:
+            return None
+        start, end = max(start, hours.open_time), min(end, hours.close_time)
+        if hours.break_start_time and hours.break_end_time:
+            breaks.append((hours.break_start_time, hours.break_end_time))
+
+    if start >= end:
+        return None
+    return DailyWindow(start, end, tuple(sorted(breaks)))
+
+
+async def clinic_schedule(
+    db: AsyncSession,
+    clinic_id: uuid.UUID,
+    veterinarian_ids: List[uuid.UUID]
+) -> Dict[uuid.UUID, Dict[DayOfWeek, Tuple[DailyWindow, int]]]:
+    """
+    Weekly slot windows and default slot length of each veterinarian at a clinic.
+
+    Reads the clinic's operating hours and all the veterinarians' availability
+    with one query each.
+    """
+    hours_result = await db.execute(
+        select(ClinicOperatingHours).where(ClinicOperatingHours.clinic_id == clinic_id)
+    )
+    hours = {DayOfWeek(row.day_of_week): row for row in hours_result.scalars().all()}
+
+    availability_result = await db.execute(
+        select(VeterinarianAvailability).where(VeterinarianAvailability.veterinarian_id.in_(veterinarian_ids))
+    )
+
+    schedule: Dict[uuid.UUID, Dict[DayOfWeek, Tuple[DailyWindow, int]]] = {
+        veterinarian_id: {} for veterinarian_id in veterinarian_ids
+    }
+    for availability in availability_result.scalars().all():
+        day_of_week = DayOfWeek(availability.day_of_week)
+        window = intersect_windows(availability, hours.get(day_of_week))
+        if window is not None:
+            schedule[availability.veterinarian_id][day_of_week] = (
+                window, availability.default_appointment_duration
+            )
+    return schedule
+
+
+def weekday(day: date) -> DayOfWeek:
+    """DayOfWeek of a calendar date."""
+    return list(DayOfWeek)[day.weekday()]
+
+
+async def existing_slot_keys(
+    db: AsyncSession,
+    clinic_id: uuid.UUID,
+    veterinarian_ids: List[uuid.UUID],
+    range_start: datetime,
+    range_end: datetime
+) -> Set[SlotKey]:
+    """Slots already present in a time range, in one query."""
+    result = await db.execute(
+        select(AppointmentSlot.veterinarian_id, AppointmentSlot.clinic_id, AppointmentSlot.start_time).where(
+            and_(
+                AppointmentSlot.clinic_id == clinic_id,
+                AppointmentSlot.veterinarian_id.in_(veterinarian_ids),
+                AppointmentSlot.start_time >= range_start,
+                AppointmentSlot.start_time <= range_end,
+            )
+        )
+    )
+    return {(veterinarian_id, clinic, _as_utc(start)) for veterinarian_id, clinic, start in result.all()}
+
+
+async def insert_slots(db: AsyncSession, rows: List[Dict]) -> List[AppointmentSlot]:
+    """
+    Insert new slots at one clinic, skipping any that exist.
+
+    The caller commits.
+
+    Returns:
+        The slots actually inserted
+    """
+    if not rows:
+        return []
+
+    existing = await existing_slot_keys(
+        db,
+        rows[0]["clinic_id"],
+        sorted({row["veterinarian_id"] for row in rows}),
+        min(row["start_time"] for row in rows),
+        max(row["start_time"] for row in rows),
+    )
+    rows = [
+        row for row in rows
+        if (row["veterinarian_id"], row["clinic_id"], row["start_time"]) not in existing
+    ]
+    if not rows:
+        return []
+
+    # ON CONFLICT covers slots written concurrently since the read above;
+    # RETURNING only yields the rows actually inserted
+    statement = (
+        insert(AppointmentSlot)
+        .on_conflict_do_nothing(index_elements=SLOT_KEY_COLUMNS)
+        .returning(AppointmentSlot)
+    )
+    result = await db.scalars(statement, rows)
+    return list(result.all())
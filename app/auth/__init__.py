@@ -5,5 +5,6 @@ Provides version-agnostic authentication controllers and services.
 
 from .controller import AuthController
 from .services import AuthService
+from .principal import AuthenticatedPrincipal
 
-__all__ = ["AuthController", "AuthService"]
\ No newline at end of file
+__all__ = ["AuthController", "AuthService", "AuthenticatedPrincipal"]
\ No newline at end of file
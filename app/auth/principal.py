@@ -0,0 +1,75 @@
+"""
+Authenticated principal resolved from the authentication cache.
+
+Identity and authorization data for the current request, built from cached
+user data so that handlers which only need who the caller is and what they
+may do never load the ORM User.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional
+import uuid
+
+from app.models.user import ROLE_PERMISSIONS, User, UserRole
+
+
+@dataclass(frozen=True)
+class AuthenticatedPrincipal:
+    """Immutable identity, role and permissions of an authenticated user."""
+
+    id: uuid.UUID
+    clerk_id: str
+    role: UserRole
+    permissions: FrozenSet[str]
+    is_active: bool
+    clinic_id: Optional[uuid.UUID] = None
+
+    @classmethod
+    def from_user(cls, user: User, clinic_id: Optional[uuid.UUID] = None) -> "AuthenticatedPrincipal":
+        """Build a principal from a loaded User."""
+        return cls(
+            id=user.id,
+            clerk_id=user.clerk_id,
+            role=user.role,
+            permissions=frozenset(ROLE_PERMISSIONS.get(user.role, [])),
+            is_active=user.is_active,
+            clinic_id=clinic_id,
+        )
+
+    @classmethod
+    def from_cached_user_data(cls, user_data: Dict[str, Any]) -> Optional["AuthenticatedPrincipal"]:
+        """
+        Build a principal from AuthCacheService user data.
+
+        Returns None when the cached data cannot produce a complete principal,
+        e.g. a veterinarian cached without the clinic they work at.
+        """
+        try:
+            role = UserRole(user_data["role"])
+            clinic_id = user_data.get("clinic_id")
+            if role == UserRole.VETERINARIAN and not clinic_id:
+                return None
+            return cls(
+                id=uuid.UUID(user_data["id"]),
+                clerk_id=user_data["clerk_id"],
+                role=role,
+                permissions=frozenset(ROLE_PERMISSIONS.get(role, [])),
+                is_active=bool(user_data["is_active"]),
+                clinic_id=uuid.UUID(clinic_id) if clinic_id else None,
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @property
+    def is_staff(self) -> bool:
+        """Check if the principal is a staff member."""
+        return self.role in [UserRole.ADMIN, UserRole.VETERINARIAN, UserRole.RECEPTIONIST, UserRole.CLINIC_MANAGER]
+
+    @property
+    def is_admin(self) -> bool:
+        """Check if the principal is an admin."""
+        return self.role == UserRole.ADMIN
+
+    def has_permission(self, permission: str) -> bool:
+        """Check if the principal has a specific permission."""
+        return "*" in self.permissions or permission in self.permissions
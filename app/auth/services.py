@@ -19,6 +19,7 @@ from app.core.exceptions import (
     handle_database_error
 )
 from app.core.config import get_settings
+from app.services.auth_cache_service import get_auth_cache_service
 from app.services.session_service import get_session_service
 from app.app_helpers.auth_helpers import create_access_token, get_user_permissions
 
@@ -32,6 +33,7 @@ class AuthService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.session_service = get_session_service()
+        self.cache_service = get_auth_cache_service()
 
     def _hash_password(self, password: str) -> str:
         """
@@ -240,6 +242,8 @@ class AuthService:
         """
         Logout from a specific session.
         
+        Cached validations of the session's tokens are dropped in every worker.
+        
         Args:
             session_id: Session ID to logout
             
@@ -247,7 +251,9 @@ class AuthService:
             True if session was logged out
         """
         try:
-            return await self.session_service.invalidate_session(session_id)
+            logged_out = await self.session_service.invalidate_session(session_id)
+            await self.cache_service.revoke_jwt_validations(session_id=session_id)
+            return logged_out
         except Exception as e:
             logger.error(f"Error logging out session: {e}")
             return False
@@ -268,9 +274,15 @@ class AuthService:
             Number of sessions logged out
         """
         try:
-            return await self.session_service.invalidate_user_sessions(
+            sessions = await self.session_service.get_user_sessions(user_id)
+            invalidated_count = await self.session_service.invalidate_user_sessions(
                 user_id, exclude_session
             )
+            for session in sessions:
+                session_id = session.get("session_id")
+                if session_id and session_id != exclude_session:
+                    await self.cache_service.revoke_jwt_validations(session_id=session_id)
+            return invalidated_count
         except Exception as e:
             logger.error(f"Error logging out all sessions: {e}")
             return 0
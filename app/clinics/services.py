@@ -10,7 +10,7 @@ from typing import List, Tuple, Optional, Dict, Any, Union
 from datetime import date, datetime, time
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, delete, text
+from sqlalchemy import select, func, and_, delete, update, cast, Float
 from sqlalchemy.orm import selectinload, joinedload
 
 from app.models.clinic import (
@@ -20,6 +20,122 @@ from app.models.clinic import (
 )
 from app.models.user import User
 from app.core.exceptions import VetClinicException, NotFoundError, ValidationError
+from app.core.loader_profiles import Include, LoaderProfile
+from app.core.search import TextSearch
+from app.core.single_flight import get_single_flight, single_flight_key
+from app.core.response_cache import get_response_cache
+from app.core.geo import distance_miles, distance_to, within_radius
+from app.app_helpers.pagination_helpers import KeysetSort, count_rows, keyset_page, paginate_query
+
+
+CLINIC_LIST_PROFILE = LoaderProfile(
+    "clinics.list",
+    includes={
+        "include_veterinarians": Include(selectinload(Clinic.veterinarians)),
+        "include_reviews": Include(selectinload(Clinic.reviews)),
+    },
+)
+
+CLINIC_DETAIL_PROFILE = LoaderProfile(
+    "clinics.detail",
+    includes={
+        "include_veterinarians": Include(selectinload(Clinic.veterinarians)),
+        "include_reviews": Include(selectinload(Clinic.reviews)),
+        "include_operating_hours": Include(selectinload(Clinic.operating_hours)),
+    },
+)
+
+_VETERINARIAN_INCLUDES = {
+    "include_clinic": Include(selectinload(Veterinarian.clinic)),
+    "include_reviews": Include(selectinload(Veterinarian.reviews)),
+    "include_availability": Include(selectinload(Veterinarian.availability)),
+}
+
+VETERINARIAN_LIST_PROFILE = LoaderProfile(
+    "veterinarians.list",
+    always=Include(selectinload(Veterinarian.user)),
+    includes=_VETERINARIAN_INCLUDES,
+)
+
+VETERINARIAN_DETAIL_PROFILE = LoaderProfile(
+    "veterinarians.detail",
+    always=Include(selectinload(Veterinarian.user)),
+    includes=_VETERINARIAN_INCLUDES,
+)
+
+VETERINARIAN_BY_USER_PROFILE = LoaderProfile(
+    "veterinarians.by_user",
+    always=Include(selectinload(Veterinarian.user), selectinload(Veterinarian.clinic)),
+)
+
+VETERINARIAN_LOCATION_PROFILE = LoaderProfile(
+    "veterinarians.location",
+    always=Include(selectinload(Veterinarian.user), selectinload(Veterinarian.clinic)),
+)
+
+CLINIC_REVIEWS_PROFILE = LoaderProfile(
+    "clinics.reviews",
+    always=Include(selectinload(ClinicReview.reviewer)),
+)
+
+VETERINARIAN_REVIEWS_PROFILE = LoaderProfile(
+    "veterinarians.reviews",
+    always=Include(selectinload(VeterinarianReview.reviewer)),
+)
+
+CLINIC_SEARCH = TextSearch(Clinic.name, Clinic.description, Clinic.city, Clinic.address_line1)
+
+VETERINARIAN_SEARCH = TextSearch(
+    User.first_name, User.last_name, Veterinarian.bio, Veterinarian.license_number
+)
+
+# Cursor-capable sorts. Distance and experience sorts (computed or nullable
+# columns) are offset-only. "rating" uses the maintained review aggregates,
+# highest average first, ties broken by review count.
+CLINIC_SORTS = {
+    "name": KeysetSort("name", [Clinic.name], Clinic.id),
+    "city": KeysetSort("city", [Clinic.city, Clinic.name], Clinic.id),
+    "rating": KeysetSort("rating", [Clinic.rating_average, Clinic.rating_count], Clinic.id, descending=True),
+    "created_at": KeysetSort("created_at", [Clinic.created_at], Clinic.id, descending=True),
+}
+
+VETERINARIAN_SORTS = {
+    "name": KeysetSort(
+        "name",
+        [User.first_name, User.last_name],
+        Veterinarian.id,
+        values=lambda veterinarian: (veterinarian.user.first_name, veterinarian.user.last_name),
+    ),
+    "rating": KeysetSort(
+        "rating", [Veterinarian.rating_average, Veterinarian.rating_count], Veterinarian.id, descending=True
+    ),
+}
+
+CLINIC_REVIEW_SORT = KeysetSort("created_at", [ClinicReview.created_at], ClinicReview.id, descending=True)
+
+VETERINARIAN_REVIEW_SORT = KeysetSort(
+    "created_at", [VeterinarianReview.created_at], VeterinarianReview.id, descending=True
+)
+
+
+def _add_rating(model, rating: int, **sub_ratings: Optional[int]) -> Dict[str, Any]:
+    """
+    UPDATE values adding one review to a model's rating aggregates.
+
+    The new values are computed from the row's current ones inside the
+    UPDATE, so concurrent reviews of the same clinic or veterinarian
+    serialize on the row lock instead of overwriting each other.
+    """
+    values = {
+        "rating_count": model.rating_count + 1,
+        "rating_sum": model.rating_sum + rating,
+        "rating_average": cast(model.rating_sum + rating, Float) / (model.rating_count + 1),
+    }
+    for name, value in sub_ratings.items():
+        if value is not None:
+            values[f"{name}_count"] = getattr(model, f"{name}_count") + 1
+            values[f"{name}_sum"] = getattr(model, f"{name}_sum") + value
+    return values
 
 
 class ClinicService:
@@ -44,14 +160,18 @@ class ClinicService:
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
         radius_miles: Optional[float] = None,
+        min_rating: Optional[float] = None,
         include_veterinarians: bool = False,
         include_reviews: bool = False,
         sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
         **kwargs
-    ) -> Tuple[List[Clinic], int]:
+    ) -> Tuple[List[Clinic], Optional[int]]:
         """
         List clinics with pagination and filtering.
         Supports dynamic parameters for different API versions.
+        A cursor continues after the previous page instead of using page.
         """
         try:
             # Build base query
@@ -84,30 +204,17 @@ class ClinicService:
             if is_accepting_patients is not None:
                 conditions.append(Clinic.is_accepting_new_patients == is_accepting_patients)
             
-            if search:
-                search_term = f"%{search}%"
-                conditions.append(
-                    or_(
-                        Clinic.name.ilike(search_term),
-                        Clinic.description.ilike(search_term),
-                        Clinic.city.ilike(search_term),
-                        Clinic.address_line1.ilike(search_term)
-                    )
-                )
+            if min_rating is not None:
+                conditions.append(Clinic.rating_average >= min_rating)
             
-            # Location-based filtering
-            if latitude is not None and longitude is not None and radius_miles is not None:
-                # Use Haversine formula for distance calculation
-                distance_query = text("""
-                    (3959 * acos(
-                        cos(radians(:lat)) * cos(radians(latitude)) * 
-                        cos(radians(longitude) - radians(:lng)) + 
-                        sin(radians(:lat)) * sin(radians(latitude))
-                    )) <= :radius
-                """)
-                conditions.append(distance_query.bindparams(
-                    lat=latitude, lng=longitude, radius=radius_miles
-                ))
+            search_condition = CLINIC_SEARCH.condition(search)
+            if search_condition is not None:
+                conditions.append(search_condition)
+            
+            # Location-based filtering: bounding box, then exact distance
+            located = latitude is not None and longitude is not None
+            if located and radius_miles is not None:
+                conditions.append(within_radius(Clinic.latitude, Clinic.longitude, latitude, longitude, radius_miles))
             
             # Always filter for active clinics
             conditions.append(Clinic.is_active == True)
@@ -116,50 +223,42 @@ class ClinicService:
                 query = query.where(and_(*conditions))
                 count_query = count_query.where(and_(*conditions))
             
-            # Add relationships if requested
-            if include_veterinarians:
-                query = query.options(selectinload(Clinic.veterinarians))
-            
-            if include_reviews:
-                query = query.options(selectinload(Clinic.reviews))
-            
             # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
+            total = await count_rows(self.db, count_query, query, count_mode)
             
             # Apply sorting
+            keyset = None
             if sort_by:
-                if sort_by == "name":
-                    query = query.order_by(Clinic.name)
-                elif sort_by == "city":
-                    query = query.order_by(Clinic.city, Clinic.name)
-                elif sort_by == "rating":
-                    # This would require a subquery for average rating
-                    query = query.order_by(Clinic.created_at.desc())
-                elif sort_by == "distance" and latitude and longitude:
+                if sort_by == "distance" and located:
                     # Order by distance when location is provided
-                    distance_order = text("""
-                        (3959 * acos(
-                            cos(radians(:lat)) * cos(radians(latitude)) * 
-                            cos(radians(longitude) - radians(:lng)) + 
-                            sin(radians(:lat)) * sin(radians(latitude))
-                        ))
-                    """).bindparams(lat=latitude, lng=longitude)
-                    query = query.order_by(distance_order)
+                    query = query.order_by(
+                        distance_miles(Clinic.latitude, Clinic.longitude, latitude, longitude), Clinic.id
+                    )
                 else:
-                    query = query.order_by(Clinic.created_at.desc())
+                    keyset = CLINIC_SORTS.get(sort_by, CLINIC_SORTS["created_at"])
+            elif search_condition is not None:
+                # Searches default to relevance
+                query = query.order_by(CLINIC_SEARCH.rank(search).desc(), Clinic.name, Clinic.id)
             else:
-                query = query.order_by(Clinic.name)
+                keyset = CLINIC_SORTS["name"]
             
             # Apply pagination
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
+            query = paginate_query(query, page, per_page, cursor=cursor, keyset=keyset)
+            
+            # Execute query with the relationships requested
+            result = await CLINIC_LIST_PROFILE.execute(
+                self.db,
+                query,
+                include_veterinarians=include_veterinarians,
+                include_reviews=include_reviews,
+            )
+            clinics = keyset_page(result.scalars().all(), per_page, keyset)
             
-            # Execute query
-            result = await self.db.execute(query)
-            clinics = result.scalars().all()
+            if located:
+                for clinic in clinics:
+                    clinic.distance_miles = distance_to(latitude, longitude, clinic.latitude, clinic.longitude)
             
-            return list(clinics), total
+            return clinics, total
             
         except Exception as e:
             if isinstance(e, VetClinicException):
@@ -178,17 +277,14 @@ class ClinicService:
         try:
             query = select(Clinic).where(Clinic.id == clinic_id)
             
-            # Add optional relationships
-            if include_veterinarians:
-                query = query.options(selectinload(Clinic.veterinarians))
-            
-            if include_reviews:
-                query = query.options(selectinload(Clinic.reviews))
-            
-            if include_operating_hours:
-                query = query.options(selectinload(Clinic.operating_hours))
-            
-            result = await self.db.execute(query)
+            # Load optional relationships
+            result = await CLINIC_DETAIL_PROFILE.execute(
+                self.db,
+                query,
+                include_veterinarians=include_veterinarians,
+                include_reviews=include_reviews,
+                include_operating_hours=include_operating_hours,
+            )
             clinic = result.scalar_one_or_none()
             
             if not clinic:
@@ -215,15 +311,19 @@ class ClinicService:
         city: Optional[str] = None,
         state: Optional[str] = None,
         min_experience_years: Optional[int] = None,
+        min_rating: Optional[float] = None,
         include_clinic: bool = False,
         include_reviews: bool = False,
         include_availability: bool = False,
         sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
         **kwargs
-    ) -> Tuple[List[Veterinarian], int]:
+    ) -> Tuple[List[Veterinarian], Optional[int]]:
         """
         List veterinarians with pagination and filtering.
         Supports dynamic parameters for different API versions.
+        A cursor continues after the previous page instead of using page.
         """
         try:
             # Build base query with user join for search functionality
@@ -257,16 +357,12 @@ class ClinicService:
             if min_experience_years is not None:
                 conditions.append(Veterinarian.years_of_experience >= min_experience_years)
             
-            if search:
-                search_term = f"%{search}%"
-                conditions.append(
-                    or_(
-                        User.first_name.ilike(search_term),
-                        User.last_name.ilike(search_term),
-                        Veterinarian.bio.ilike(search_term),
-                        Veterinarian.license_number.ilike(search_term)
-                    )
-                )
+            if min_rating is not None:
+                conditions.append(Veterinarian.rating_average >= min_rating)
+            
+            search_condition = VETERINARIAN_SEARCH.condition(search)
+            if search_condition is not None:
+                conditions.append(search_condition)
             
             # Location-based filtering through clinic
             if city or state:
@@ -286,46 +382,35 @@ class ClinicService:
                 query = query.where(and_(*conditions))
                 count_query = count_query.where(and_(*conditions))
             
-            # Add relationships if requested
-            if include_clinic:
-                query = query.options(selectinload(Veterinarian.clinic))
-            
-            if include_reviews:
-                query = query.options(selectinload(Veterinarian.reviews))
-            
-            if include_availability:
-                query = query.options(selectinload(Veterinarian.availability))
-            
-            # Always include user information
-            query = query.options(selectinload(Veterinarian.user))
-            
             # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
+            total = await count_rows(self.db, count_query, query, count_mode)
             
-            # Apply sorting
-            if sort_by:
-                if sort_by == "name":
-                    query = query.order_by(User.first_name, User.last_name)
-                elif sort_by == "experience":
-                    query = query.order_by(Veterinarian.years_of_experience.desc())
-                elif sort_by == "rating":
-                    # This would require a subquery for average rating
-                    query = query.order_by(Veterinarian.created_at.desc())
-                else:
-                    query = query.order_by(User.first_name, User.last_name)
+            # Apply sorting; searches default to relevance
+            if search_condition is not None and not sort_by:
+                keyset = None
+                query = query.order_by(
+                    VETERINARIAN_SEARCH.rank(search).desc(), User.first_name, User.last_name, Veterinarian.id
+                )
+            elif sort_by == "experience":
+                keyset = None
+                query = query.order_by(Veterinarian.years_of_experience.desc())
             else:
-                query = query.order_by(User.first_name, User.last_name)
+                keyset = VETERINARIAN_SORTS.get(sort_by, VETERINARIAN_SORTS["name"])
             
             # Apply pagination
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
-            
-            # Execute query
-            result = await self.db.execute(query)
+            query = paginate_query(query, page, per_page, cursor=cursor, keyset=keyset)
+            
+            # Execute query with user information and requested relationships
+            result = await VETERINARIAN_LIST_PROFILE.execute(
+                self.db,
+                query,
+                include_clinic=include_clinic,
+                include_reviews=include_reviews,
+                include_availability=include_availability,
+            )
             veterinarians = result.scalars().all()
             
-            return list(veterinarians), total
+            return keyset_page(veterinarians, per_page, keyset), total
             
         except Exception as e:
             if isinstance(e, VetClinicException):
@@ -345,20 +430,14 @@ class ClinicService:
         try:
             query = select(Veterinarian).where(Veterinarian.id == veterinarian_id)
             
-            # Always include user information
-            query = query.options(selectinload(Veterinarian.user))
-            
-            # Add optional relationships
-            if include_clinic:
-                query = query.options(selectinload(Veterinarian.clinic))
-            
-            if include_reviews:
-                query = query.options(selectinload(Veterinarian.reviews))
-            
-            if include_availability:
-                query = query.options(selectinload(Veterinarian.availability))
-            
-            result = await self.db.execute(query)
+            # Always include user information, plus optional relationships
+            result = await VETERINARIAN_DETAIL_PROFILE.execute(
+                self.db,
+                query,
+                include_clinic=include_clinic,
+                include_reviews=include_reviews,
+                include_availability=include_availability,
+            )
             veterinarian = result.scalar_one_or_none()
             
             if not veterinarian:
@@ -394,10 +473,7 @@ class ClinicService:
         """Get veterinarian by user ID."""
         try:
             query = select(Veterinarian).where(Veterinarian.user_id == user_id)
-            query = query.options(selectinload(Veterinarian.user))
-            query = query.options(selectinload(Veterinarian.clinic))
-            
-            result = await self.db.execute(query)
+            result = await VETERINARIAN_BY_USER_PROFILE.execute(self.db, query)
             return result.scalar_one_or_none()
             
         except Exception as e:
@@ -476,6 +552,7 @@ class ClinicService:
                 new_availability.append(availability)
             
             await self.db.commit()
+            await get_response_cache().invalidate_tags(f"veterinarian:{veterinarian_id}")
             
             # Refresh all objects
             for availability in new_availability:
@@ -521,7 +598,11 @@ class ClinicService:
             )
             
             self.db.add(review)
+            await self.db.execute(
+                update(Clinic).where(Clinic.id == clinic_id).values(**_add_rating(Clinic, rating))
+            )
             await self.db.commit()
+            await get_response_cache().invalidate_tags(f"clinic:{clinic_id}", "clinics")
             await self.db.refresh(review)
             
             return review
@@ -576,7 +657,19 @@ class ClinicService:
             )
             
             self.db.add(review)
+            await self.db.execute(
+                update(Veterinarian)
+                .where(Veterinarian.id == veterinarian_id)
+                .values(**_add_rating(
+                    Veterinarian,
+                    rating,
+                    bedside_manner_rating=bedside_manner_rating,
+                    expertise_rating=expertise_rating,
+                    communication_rating=communication_rating,
+                ))
+            )
             await self.db.commit()
+            await get_response_cache().invalidate_tags(f"veterinarian:{veterinarian_id}", "veterinarians")
             await self.db.refresh(review)
             
             return review
@@ -592,31 +685,30 @@ class ClinicService:
         clinic_id: uuid.UUID,
         page: int = 1,
         per_page: int = 10,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
         **kwargs
-    ) -> Tuple[List[ClinicReview], int]:
-        """Get reviews for a clinic."""
+    ) -> Tuple[List[ClinicReview], Optional[int]]:
+        """Get reviews for a clinic, newest first."""
         try:
             query = select(ClinicReview).where(ClinicReview.clinic_id == clinic_id)
             count_query = select(func.count(ClinicReview.id)).where(ClinicReview.clinic_id == clinic_id)
             
             # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
+            total = await count_rows(self.db, count_query, query, count_mode)
             
             # Apply pagination and ordering
-            query = query.order_by(ClinicReview.created_at.desc())
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
+            query = paginate_query(query, page, per_page, cursor=cursor, keyset=CLINIC_REVIEW_SORT)
             
             # Include reviewer information
-            query = query.options(selectinload(ClinicReview.reviewer))
-            
-            result = await self.db.execute(query)
+            result = await CLINIC_REVIEWS_PROFILE.execute(self.db, query)
             reviews = result.scalars().all()
             
-            return list(reviews), total
+            return keyset_page(reviews, per_page, CLINIC_REVIEW_SORT), total
             
         except Exception as e:
+            if isinstance(e, VetClinicException):
+                raise
             raise VetClinicException(f"Failed to get clinic reviews: {str(e)}")
 
     async def get_veterinarian_reviews(
@@ -624,31 +716,30 @@ class ClinicService:
         veterinarian_id: uuid.UUID,
         page: int = 1,
         per_page: int = 10,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
         **kwargs
-    ) -> Tuple[List[VeterinarianReview], int]:
-        """Get reviews for a veterinarian."""
+    ) -> Tuple[List[VeterinarianReview], Optional[int]]:
+        """Get reviews for a veterinarian, newest first."""
         try:
             query = select(VeterinarianReview).where(VeterinarianReview.veterinarian_id == veterinarian_id)
             count_query = select(func.count(VeterinarianReview.id)).where(VeterinarianReview.veterinarian_id == veterinarian_id)
             
             # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
+            total = await count_rows(self.db, count_query, query, count_mode)
             
             # Apply pagination and ordering
-            query = query.order_by(VeterinarianReview.created_at.desc())
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
+            query = paginate_query(query, page, per_page, cursor=cursor, keyset=VETERINARIAN_REVIEW_SORT)
             
             # Include reviewer information
-            query = query.options(selectinload(VeterinarianReview.reviewer))
-            
-            result = await self.db.execute(query)
+            result = await VETERINARIAN_REVIEWS_PROFILE.execute(self.db, query)
             reviews = result.scalars().all()
             
-            return list(reviews), total
+            return keyset_page(reviews, per_page, VETERINARIAN_REVIEW_SORT), total
             
         except Exception as e:
+            if isinstance(e, VetClinicException):
+                raise
             raise VetClinicException(f"Failed to get veterinarian reviews: {str(e)}")
 
     # Search and Filtering Methods
@@ -664,18 +755,46 @@ class ClinicService:
         per_page: int = 10,
         **kwargs
     ) -> Tuple[List[Veterinarian], int]:
-        """Search veterinarians by location with distance calculation."""
+        """
+        Search veterinarians by the distance of their clinic.
+        
+        Clinics are prefiltered by bounding box; the distance is computed for
+        the remaining candidates only and set on each veterinarian as
+        distance_miles. Identical concurrent searches in this worker share
+        one query and the same veterinarian instances.
+        """
+        return await get_single_flight().do(
+            single_flight_key(
+                "clinics.veterinarians_by_location",
+                latitude=latitude,
+                longitude=longitude,
+                radius_miles=radius_miles,
+                specialty=specialty,
+                is_available_for_emergency=is_available_for_emergency,
+                page=page,
+                per_page=per_page
+            ),
+            lambda: self._search_veterinarians_by_location(
+                latitude, longitude, radius_miles, specialty, is_available_for_emergency, page, per_page
+            )
+        )
+
+    async def _search_veterinarians_by_location(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_miles: float,
+        specialty: Optional[Union[VeterinarianSpecialty, str]],
+        is_available_for_emergency: Optional[bool],
+        page: int,
+        per_page: int
+    ) -> Tuple[List[Veterinarian], int]:
+        """Run the location search for search_veterinarians_by_location."""
         try:
             # Build query with distance calculation
-            distance_formula = text("""
-                (3959 * acos(
-                    cos(radians(:lat)) * cos(radians(clinics.latitude)) * 
-                    cos(radians(clinics.longitude) - radians(:lng)) + 
-                    sin(radians(:lat)) * sin(radians(clinics.latitude))
-                )) as distance
-            """).bindparams(lat=latitude, lng=longitude)
-            
-            query = select(Veterinarian, distance_formula).join(
+            distance = distance_miles(Clinic.latitude, Clinic.longitude, latitude, longitude).label("distance")
+            
+            query = select(Veterinarian, distance).join(
                 Clinic, Veterinarian.clinic_id == Clinic.id
             ).join(User, Veterinarian.user_id == User.id)
             
@@ -684,15 +803,7 @@ class ClinicService:
             ).join(User, Veterinarian.user_id == User.id)
             
             # Apply distance filter
-            distance_condition = text("""
-                (3959 * acos(
-                    cos(radians(:lat)) * cos(radians(clinics.latitude)) * 
-                    cos(radians(clinics.longitude) - radians(:lng)) + 
-                    sin(radians(:lat)) * sin(radians(clinics.latitude))
-                )) <= :radius
-            """).bindparams(lat=latitude, lng=longitude, radius=radius_miles)
-            
-            conditions = [distance_condition]
+            conditions = [within_radius(Clinic.latitude, Clinic.longitude, latitude, longitude, radius_miles)]
             
             # Apply additional filters
             if specialty:
@@ -721,23 +832,21 @@ class ClinicService:
             total = total_result.scalar() or 0
             
             # Order by distance
-            query = query.order_by(text("distance"))
+            query = query.order_by(distance, Veterinarian.id)
             
             # Apply pagination
             offset = (page - 1) * per_page
             query = query.offset(offset).limit(per_page)
             
             # Include related data
-            query = query.options(
-                selectinload(Veterinarian.user),
-                selectinload(Veterinarian.clinic)
-            )
-            
-            result = await self.db.execute(query)
+            result = await VETERINARIAN_LOCATION_PROFILE.execute(self.db, query)
             veterinarians_with_distance = result.all()
             
-            # Extract just the veterinarians (distance is available as second element)
-            veterinarians = [row[0] for row in veterinarians_with_distance]
+            # Extract the veterinarians, keeping the distance on each
+            veterinarians = []
+            for veterinarian, miles in veterinarians_with_distance:
+                veterinarian.distance_miles = round(miles, 2)
+                veterinarians.append(veterinarian)
             
             return veterinarians, total
             
@@ -0,0 +1,100 @@
+"""
+Serialization codec for values cached in Redis.
+
+Every encoded value starts with a header byte naming its format, with the
+high bit set when the payload is zlib-compressed. Values written before the
+codec existed (bare UTF-8 JSON) are still decoded, so workers can be rolled
+onto a new format without flushing Redis: deploy code that reads the new
+format first, then switch REDIS_CACHE_CODEC.
+"""
+
+import json
+import logging
+import zlib
+from typing import Any, Optional
+
+from app.core.config import settings
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_JSON = 0x01
+FORMAT_MSGPACK = 0x02
+FLAG_ZLIB = 0x80
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached value cannot be decoded, e.g. an unknown format."""
+
+
+class CacheCodec:
+    """Encodes cache values to prefixed, optionally compressed bytes."""
+
+    def __init__(
+        self,
+        format_name: str = settings.REDIS_CACHE_CODEC,
+        compress_threshold: int = settings.REDIS_CACHE_COMPRESS_THRESHOLD,
+        compress_level: int = 1
+    ):
+        if format_name == "msgpack" and msgpack is None:
+            logger.warning("msgpack is not installed; caching values as JSON")
+            format_name = "json"
+        if format_name not in ("json", "msgpack"):
+            raise ValueError(f"Unknown cache codec: {format_name}")
+        self.format_name = format_name
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value; payloads of compress_threshold bytes or more are compressed."""
+        if self.format_name == "msgpack":
+            header, payload = FORMAT_MSGPACK, msgpack.packb(value, use_bin_type=True)
+        else:
+            header, payload = FORMAT_JSON, json.dumps(value, separators=(",", ":")).encode()
+
+        if 0 < self.compress_threshold <= len(payload):
+            compressed = zlib.compress(payload, self.compress_level)
+            if len(compressed) < len(payload):
+                header, payload = header | FLAG_ZLIB, compressed
+
+        return bytes((header,)) + payload
+
+    def decode(self, data: Optional[bytes]) -> Any:
+        """
+        Deserialize a value written by any codec format, or by plain JSON.
+
+        Raises:
+            CacheCodecError: If the value is in a format this version cannot read
+        """
+        if data is None:
+            return None
+        if isinstance(data, str):
+            data = data.encode()
+        if not data:
+            raise CacheCodecError("Empty cache value")
+
+        header = data[0]
+        if header not in (FORMAT_JSON, FORMAT_MSGPACK, FORMAT_JSON | FLAG_ZLIB, FORMAT_MSGPACK | FLAG_ZLIB):
+            # Values cached before the codec existed are bare JSON
+            try:
+                return json.loads(data)
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise CacheCodecError(f"Unknown cache value format: {header:#x}") from e
+
+        payload = data[1:]
+        try:
+            if header & FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            if header & ~FLAG_ZLIB == FORMAT_MSGPACK:
+                if msgpack is None:
+                    raise CacheCodecError("msgpack cache value but msgpack is not installed")
+                return msgpack.unpackb(payload, raw=False)
+            return json.loads(payload)
+        except CacheCodecError:
+            raise
+        except Exception as e:
+            raise CacheCodecError(f"Corrupt cache value: {e}") from e
@@ -1,9 +1,14 @@
 """
 Celery application configuration.
 """
+import functools
+
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 
 from app.core.config import settings
+from app.core.worker_runtime import worker_runtime
 
 # Create Celery instance
 celery_app = Celery(
@@ -11,6 +16,7 @@ celery_app = Celery(
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
     include=[
+        "app.tasks.appointment_tasks",
         "app.tasks.notification_tasks",
         "app.tasks.report_tasks",
         "app.tasks.maintenance_tasks",
@@ -36,4 +42,57 @@ celery_app.conf.task_routes = {
     "app.tasks.notification_tasks.*": {"queue": "notifications"},
     "app.tasks.report_tasks.*": {"queue": "reports"},
     "app.tasks.maintenance_tasks.*": {"queue": "maintenance"},
-}
\ No newline at end of file
+}
+
+# Periodic tasks
+celery_app.conf.beat_schedule = {
+    # Reconcile the appointment_daily_stats rollup nightly
+    "reconcile-appointment-daily-stats": {
+        "task": "app.tasks.report_tasks.generate_appointment_report",
+        "schedule": crontab(hour=2, minute=0),
+    },
+    # Drain each channel's notification outbox (routed to the notifications queue)
+    **{
+        f"drain-{channel}-outbox": {
+            "task": "app.tasks.notification_tasks.drain_notification_outbox",
+            "schedule": settings.NOTIFICATION_OUTBOX_POLL_SECONDS,
+            "args": (channel,),
+        }
+        for channel in ("email", "sms", "push")
+    },
+}
+
+
+@worker_process_init.connect
+def start_worker_runtime(**kwargs):
+    """Open this worker process's event loop and connection pools."""
+    worker_runtime.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_worker_runtime(**kwargs):
+    """Dispose this worker process's connection pools."""
+    worker_runtime.stop()
+
+
+def async_task(*task_args, **task_options):
+    """
+    Register a coroutine function as a Celery task.
+
+    The task runs on the worker process's persistent event loop, reusing its
+    database and Redis pools. Arguments are passed to celery_app.task.
+
+    Example:
+        @async_task(name="send_appointment_reminders")
+        async def send_appointment_reminders():
+            ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            return worker_runtime.run(func(*args, **kwargs))
+
+        return celery_app.task(*task_args, **task_options)(run)
+
+    return decorator
@@ -25,16 +25,42 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int
     DATABASE_MAX_OVERFLOW: int
+    DATABASE_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a pooled connection
+    DATABASE_POOL_RECYCLE: int = 3600  # Seconds before a connection is replaced
+    DATABASE_POOL_PRE_PING: bool = True  # One extra round-trip per checkout to detect dead connections
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 0  # Server-side statement_timeout, 0 leaves the server default
+    DATABASE_COMMAND_TIMEOUT: Optional[float] = None  # Client-side asyncpg timeout per statement
+    DATABASE_REPLICA_URLS: List[str] = []  # Read replicas for read-only endpoints
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 5.0  # Replicas further behind are skipped
+    DATABASE_REPLICA_CHECK_INTERVAL: int = 10  # Seconds between replica lag checks
+    DATABASE_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy compiled SQL cache entries per engine
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statements per connection, 0 behind PgBouncer
+    QUERY_BUDGET_MODE: str = "off"  # off, warn or strict loader profile budgets
     
     # Redis Settings
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50  # Connection pool size per process
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # Seconds idle before a connection is pinged
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0
     REDIS_CACHE_TTL: int = 900  # 15 minutes default TTL
+    REDIS_CACHE_CODEC: str = "msgpack"  # json or msgpack; readers accept both
+    REDIS_CACHE_COMPRESS_THRESHOLD: int = 1024  # zlib payloads from this size, 0 disables
     REDIS_USER_CACHE_TTL: int = 900  # 15 minutes for user data
     REDIS_JWT_CACHE_TTL: int = 3600  # 1 hour for JWT validation results
+    JWT_LOCAL_CACHE_SIZE: int = 10000  # In-process JWT validations per worker
+    JWT_LOCAL_CACHE_TTL: int = 300  # 5 minutes in-process, bounded by token exp
+    USER_LOCAL_CACHE_TTL: int = 60  # 1 minute in-process for user data behind principals
+    RESPONSE_CACHE_ENABLED: bool = True  # Read-through cache for hot GET endpoints
+    RESPONSE_CACHE_TTL: int = 300  # 5 minutes fresh
+    RESPONSE_CACHE_STALE_TTL: int = 60  # Served stale while one request revalidates
     
     # Celery Settings
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
+    HEALTH_REMINDER_CHUNK_SIZE: int = 500  # Reminders claimed, queued and marked per transaction
+    APPOINTMENT_REMINDER_CHUNK_SIZE: int = 200  # Appointments claimed, queued and marked per transaction
+    APPOINTMENT_REMINDER_WINDOW_MINUTES: int = 60  # Scheduling window per run; match the reminder task interval
     
     # Authentication Settings (Clerk)
     CLERK_API_URL: str = "https://api.clerk.com"
@@ -43,6 +69,10 @@ class Settings(BaseSettings):
     CLERK_WEBHOOK_SECRET: Optional[str] = None
     CLERK_JWT_ISSUER: str = "https://clerk.dev"
     CLERK_JWKS_URL: Optional[str] = None
+    JWKS_CACHE_TTL: int = 3600  # 1 hour before signing keys must be refetched
+    JWKS_REFRESH_AHEAD: int = 300  # Refresh in the background 5 minutes before that
+    JWKS_MIN_REFRESH_INTERVAL: int = 30  # Unknown kids refetch at most this often
+    JWKS_SHARED_CACHE: bool = True  # Share the key set between workers via Redis
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -65,6 +95,7 @@ class Settings(BaseSettings):
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int
+    RATE_LIMIT_EXPENSIVE_PER_MINUTE: int = 20  # Statistics, calendar and location search, per route
     
     # Email Settings
     SMTP_HOST: str
@@ -72,6 +103,17 @@ class Settings(BaseSettings):
     SMTP_USERNAME: str
     SMTP_PASSWORD: str
     SMTP_USE_TLS: bool
+    SMTP_FROM_EMAIL: Optional[str] = None  # Defaults to SMTP_USERNAME
+    SMTP_POOL_SIZE: int = 2  # SMTP connections kept open per email worker process
+    SMTP_TIMEOUT: float = 30.0
+    
+    # Notification Outbox Settings
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 100  # Rows claimed and sent per transaction
+    NOTIFICATION_OUTBOX_MAX_BATCHES: int = 50  # Batches per drain run before yielding the worker
+    NOTIFICATION_OUTBOX_POLL_SECONDS: int = 10  # Interval between drain runs per channel
+    NOTIFICATION_MAX_ATTEMPTS: int = 5  # Deliveries tried before a row is dead-lettered
+    NOTIFICATION_RETRY_BASE_SECONDS: int = 30  # First retry delay, doubled per attempt
+    NOTIFICATION_RETRY_MAX_SECONDS: int = 3600
     
     # Monitoring Settings
     SENTRY_DSN: Optional[str] = None
@@ -86,6 +128,15 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of: {allowed_environments}")
         return v
     
+    @field_validator("QUERY_BUDGET_MODE")
+    @classmethod
+    def validate_query_budget_mode(cls, v):
+        """Validate query budget enforcement mode."""
+        allowed_modes = ["off", "warn", "strict"]
+        if v not in allowed_modes:
+            raise ValueError(f"QUERY_BUDGET_MODE must be one of: {allowed_modes}")
+        return v
+    
     @field_validator("DATABASE_URL")
     @classmethod
     def validate_database_url(cls, v):
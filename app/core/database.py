@@ -3,12 +3,14 @@ Database connection and session management for the Veterinary Clinic Backend.
 Uses SQLAlchemy 2.0 with async support and Supabase PostgreSQL.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.pool import NullPool
-from sqlalchemy import MetaData
-from typing import AsyncGenerator
+from sqlalchemy import DDL, MetaData, event, text
+from typing import Any, AsyncGenerator, Dict, List, Optional
 import logging
+import time
 
 from .config import get_settings
 
@@ -18,40 +20,177 @@ settings = get_settings()
 # SQLAlchemy Base
 Base = declarative_base()
 
+# Trigram search indexes (app.core.search) need pg_trgm before create_all
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+# The appointment overlap exclusion constraint needs gist operators for uuid
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+
 # Metadata for migrations
 metadata = MetaData()
 
-# Async engine configuration
-if "sqlite" in settings.DATABASE_URL:
-    # SQLite configuration (for testing)
-    engine = create_async_engine(
-        settings.DATABASE_URL,
-        echo=settings.DEBUG,  # Log SQL queries in debug mode
-        poolclass=NullPool,  # SQLite doesn't support connection pooling
-    )
-else:
+def create_engine_for(url: str, read_only: bool = False) -> AsyncEngine:
+    """
+    Create an async engine with the pool and timeout settings.
+
+    Args:
+        url: Database URL
+        read_only: Open every transaction read-only (replicas)
+    """
+    if "sqlite" in url:
+        # SQLite configuration (for testing)
+        return create_async_engine(
+            url,
+            echo=settings.DEBUG,  # Log SQL queries in debug mode
+            poolclass=NullPool,  # SQLite doesn't support connection pooling
+        )
+
+    server_settings = {}
+    if settings.DATABASE_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(settings.DATABASE_STATEMENT_TIMEOUT_MS)
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+
+    connect_args = {"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE}
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+    if settings.DATABASE_COMMAND_TIMEOUT:
+        connect_args["command_timeout"] = settings.DATABASE_COMMAND_TIMEOUT
+
     # PostgreSQL configuration (for production)
-    engine = create_async_engine(
-        settings.DATABASE_URL,
+    return create_async_engine(
+        url,
         echo=settings.DEBUG,  # Log SQL queries in debug mode
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
-        pool_pre_ping=True,  # Validate connections before use
-        pool_recycle=3600,  # Recycle connections every hour
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,  # Validate connections before use
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+        connect_args=connect_args,
+    )
+
+
+def _session_factory(bind: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
     )
 
+
+# Primary engine for writes, replica engines for read-only endpoints
+engine = create_engine_for(settings.DATABASE_URL)
+replica_engines = [create_engine_for(url, read_only=True) for url in settings.DATABASE_REPLICA_URLS]
+
+if settings.QUERY_BUDGET_MODE != "off":
+    # Count statements per loader profile and per request
+    from .loader_profiles import install_query_counter
+    for counted_engine in [engine, *replica_engines]:
+        install_query_counter(counted_engine)
+
 # Async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-    autocommit=False,
-)
+AsyncSessionLocal = _session_factory(engine)
 
 # Alias for background tasks
 async_session_maker = AsyncSessionLocal
 
+# Seconds the replica is behind; 0 when it has replayed everything it received
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class Replica:
+    """A read replica and its last lag check."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.session_factory = _session_factory(engine)
+        self.lag: Optional[float] = None
+        self.healthy = False
+        self.checked_at = float("-inf")
+
+
+class DatabaseRouter:
+    """
+    Routes read-only sessions to replicas.
+
+    Replicas are used round-robin while their replication lag, checked at
+    most every DATABASE_REPLICA_CHECK_INTERVAL seconds, is within
+    DATABASE_REPLICA_MAX_LAG_SECONDS. When none qualifies, reads go to the
+    primary.
+    """
+
+    def __init__(
+        self,
+        replicas: List[AsyncEngine],
+        max_lag: float = settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+        check_interval: float = settings.DATABASE_REPLICA_CHECK_INTERVAL,
+    ):
+        self.replicas = [Replica(replica) for replica in replicas]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._next = 0
+
+    async def read_replica(self) -> Optional[Replica]:
+        """The next replica within the lag limit, or None to use the primary."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if time.monotonic() - replica.checked_at >= self.check_interval:
+                await self._check(replica)
+            if replica.healthy:
+                return replica
+        return None
+
+    async def _check(self, replica: Replica) -> None:
+        # Claim the check first so concurrent requests keep routing meanwhile
+        replica.checked_at = time.monotonic()
+        try:
+            async with replica.engine.connect() as conn:
+                replica.lag = float((await conn.execute(REPLICA_LAG_SQL)).scalar() or 0)
+            replica.healthy = replica.lag <= self.max_lag
+            if not replica.healthy:
+                logger.warning(f"Replica {replica.engine.url.host} is {replica.lag:.1f}s behind; reading from primary")
+        except Exception as e:
+            replica.lag, replica.healthy = None, False
+            logger.error(f"Replica {replica.engine.url.host} lag check failed: {e}")
+
+    def statistics(self) -> List[Dict[str, Any]]:
+        """Last known state of each replica."""
+        return [
+            {
+                "host": replica.engine.url.host,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag,
+                "checked_out": replica.engine.pool.checkedout(),
+            }
+            for replica in self.replicas
+        ]
+
+
+# Global database router instance
+database_router = DatabaseRouter(replica_engines)
+
+
+def get_database_router() -> DatabaseRouter:
+    """Get database router instance."""
+    return database_router
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -71,6 +210,33 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db(primary: AsyncSession = Depends(get_db)) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get a read-only database session.
+
+    Yields a replica session when a replica is within the lag limit, and the
+    primary session otherwise. The primary session does not connect unless
+    it is used, and overriding get_db overrides this dependency too.
+
+    Yields:
+        AsyncSession: Database session for read-only endpoints
+    """
+    replica = await database_router.read_replica()
+    if replica is None:
+        yield primary
+        return
+
+    async with replica.session_factory() as session:
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"Replica session error: {e}")
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
 def get_db_session():
     """Get database session for background tasks."""
     return AsyncSessionLocal()
@@ -89,7 +255,7 @@ async def init_db() -> None:
         try:
             async with engine.begin() as conn:
                 # Import all models to ensure they're registered (order matters for foreign keys)
-                from app.models import user, pet, clinic, appointment, communication
+                from app.models import user, pet, clinic, appointment, communication, notification
 
                 # Create all tables if they don't exist
                 await conn.run_sync(Base.metadata.create_all)
@@ -128,7 +294,8 @@ async def close_db() -> None:
     This should be called during application shutdown.
     """
     try:
-        await engine.dispose()
+        for disposed_engine in [engine, *replica_engines]:
+            await disposed_engine.dispose()
         logger.info("Database connections closed successfully")
     except Exception as e:
         logger.error(f"Failed to close database connections: {e}")
@@ -192,6 +359,7 @@ class DatabaseHealthCheck:
                     "pool_size": engine.pool.size(),
                     "checked_out": engine.pool.checkedout(),
                     "overflow": engine.pool.overflow(),
+                    "replicas": database_router.statistics(),
                 }
         except Exception as e:
             logger.error(f"Failed to get database connection info: {e}")
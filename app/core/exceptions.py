@@ -196,6 +196,33 @@ class ExternalServiceError(VetClinicException):
         )
 
 
+class QueryBudgetExceededError(VetClinicException):
+    """Loader profile issued more queries than its budget allows."""
+
+    def __init__(
+        self,
+        message: str = "Query budget exceeded",
+        profile: Optional[str] = None,
+        allowed: Optional[int] = None,
+        executed: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        error_details = details or {}
+        if profile:
+            error_details["profile"] = profile
+        if allowed is not None:
+            error_details["allowed"] = allowed
+        if executed is not None:
+            error_details["executed"] = executed
+
+        super().__init__(
+            message=message,
+            error_code="QUERY_BUDGET_EXCEEDED",
+            details=error_details,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 def create_http_exception(
     exception: VetClinicException,
     request_id: Optional[str] = None
@@ -245,6 +272,11 @@ def handle_database_error(error: Exception) -> VetClinicException:
             message="Resource already exists",
             details={"database_error": str(error)}
         )
+    elif "exclusion constraint" in error_str:
+        return ConflictError(
+            message="Conflicts with an existing booking",
+            details={"database_error": str(error)}
+        )
     elif "foreign key constraint" in error_str:
         return ValidationError(
             message="Invalid reference to related resource",
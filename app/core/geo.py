@@ -0,0 +1,100 @@
+"""
+Radius search over latitude/longitude columns.
+
+within_radius() combines a bounding-box prefilter with the exact great-circle
+distance. The box is plain range conditions on the latitude and longitude
+columns, which their btree indexes answer; the haversine distance is then
+only evaluated for the rows inside the box instead of the whole table. Boxes
+that cross the antimeridian or reach a pole are handled by widening the
+longitude range.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+EARTH_RADIUS_MILES = 3959.0
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """Latitude/longitude box enclosing a search circle."""
+
+    min_latitude: float
+    max_latitude: float
+    min_longitude: float
+    max_longitude: float
+
+    def condition(self, latitude_column, longitude_column) -> ColumnElement:
+        """Range conditions selecting the rows inside the box."""
+        latitude = latitude_column.between(self.min_latitude, self.max_latitude)
+
+        if self.min_longitude <= -180 and self.max_longitude >= 180:
+            return latitude
+        if self.min_longitude < -180:
+            longitude = or_(longitude_column >= self.min_longitude + 360, longitude_column <= self.max_longitude)
+        elif self.max_longitude > 180:
+            longitude = or_(longitude_column >= self.min_longitude, longitude_column <= self.max_longitude - 360)
+        else:
+            longitude = longitude_column.between(self.min_longitude, self.max_longitude)
+        return and_(latitude, longitude)
+
+
+def bounding_box(latitude: float, longitude: float, radius_miles: float) -> BoundingBox:
+    """Smallest latitude/longitude box containing every point within radius_miles."""
+    angular_radius = radius_miles / EARTH_RADIUS_MILES
+    min_latitude = latitude - math.degrees(angular_radius)
+    max_latitude = latitude + math.degrees(angular_radius)
+
+    if min_latitude <= -90 or max_latitude >= 90:
+        # The circle contains a pole, so every longitude is in range
+        return BoundingBox(max(min_latitude, -90.0), min(max_latitude, 90.0), -180.0, 180.0)
+
+    longitude_delta = math.degrees(math.asin(min(1.0, math.sin(angular_radius) / math.cos(math.radians(latitude)))))
+    return BoundingBox(min_latitude, max_latitude, longitude - longitude_delta, longitude + longitude_delta)
+
+
+def haversine_miles(latitude: float, longitude: float, other_latitude: float, other_longitude: float) -> float:
+    """Great-circle distance between two points in miles."""
+    d_latitude = math.radians(other_latitude - latitude)
+    d_longitude = math.radians(other_longitude - longitude)
+    a = (
+        math.sin(d_latitude / 2) ** 2
+        + math.cos(math.radians(latitude)) * math.cos(math.radians(other_latitude)) * math.sin(d_longitude / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distance_miles(latitude_column, longitude_column, latitude: float, longitude: float) -> ColumnElement:
+    """SQL great-circle distance in miles from a point to the row's coordinates."""
+    a = (
+        func.power(func.sin(func.radians(latitude_column - latitude) / 2), 2)
+        + func.cos(func.radians(latitude))
+        * func.cos(func.radians(latitude_column))
+        * func.power(func.sin(func.radians(longitude_column - longitude) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_MILES * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def within_radius(
+    latitude_column,
+    longitude_column,
+    latitude: float,
+    longitude: float,
+    radius_miles: float
+) -> ColumnElement:
+    """Rows within radius_miles of a point: bounding box first, then exact distance."""
+    return and_(
+        bounding_box(latitude, longitude, radius_miles).condition(latitude_column, longitude_column),
+        distance_miles(latitude_column, longitude_column, latitude, longitude) <= radius_miles,
+    )
+
+
+def distance_to(latitude: float, longitude: float, other_latitude: Optional[float], other_longitude: Optional[float]) -> Optional[float]:
+    """Distance to a possibly unlocated point, rounded for responses."""
+    if other_latitude is None or other_longitude is None:
+        return None
+    return round(haversine_miles(latitude, longitude, other_latitude, other_longitude), 2)
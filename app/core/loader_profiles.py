@@ -0,0 +1,218 @@
+"""
+Named loader profiles for ORM relationship loading.
+
+Model relationships default to ``lazy="raise"`` (or ``lazy="noload"`` for the
+few that response schemas read), so a query only loads the rows it selects.
+Service methods declare what they need with a named LoaderProfile whose
+optional includes map onto their ``include_*`` flags.
+
+Every profile carries a query budget: one SELECT for the rows plus one per
+eager load. With QUERY_BUDGET_MODE set to "warn" or "strict" the statements
+issued while a profile executes are counted and compared against it, and
+QueryBudgetMiddleware reports the per-endpoint totals.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.exceptions import QueryBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+BUDGET_MODES = ("off", "warn", "strict")
+
+
+class Include:
+    """An eager load for a profile and the number of SELECTs it adds."""
+
+    def __init__(self, *options: Any, queries: Optional[int] = None):
+        self.options = options
+        self.queries = len(options) if queries is None else queries
+
+
+class ProfileExecution:
+    """Statement count for one execution of a loader profile."""
+
+    def __init__(self, name: str, allowed: int):
+        self.name = name
+        self.allowed = allowed
+        self.executed = 0
+
+    @property
+    def exceeded(self) -> bool:
+        return self.executed > self.allowed
+
+
+class RequestQueryLog:
+    """Statements issued while serving a single request."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.total = 0
+        self.executions: List[ProfileExecution] = []
+
+    @property
+    def violations(self) -> List[ProfileExecution]:
+        return [execution for execution in self.executions if execution.exceeded]
+
+
+_budget_mode: ContextVar[str] = ContextVar(
+    "query_budget_mode", default=get_settings().QUERY_BUDGET_MODE
+)
+_current_execution: ContextVar[Optional[ProfileExecution]] = ContextVar(
+    "loader_profile_execution", default=None
+)
+_request_log: ContextVar[Optional[RequestQueryLog]] = ContextVar(
+    "request_query_log", default=None
+)
+
+
+class LoaderProfile:
+    """
+    Explicit load plan for a service method.
+
+    ``always`` is loaded on every execution; ``includes`` maps the keyword
+    flags accepted by options()/apply()/execute() onto optional loads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        always: Optional[Include] = None,
+        includes: Optional[Dict[str, Include]] = None,
+    ):
+        self.name = name
+        self.always = always or Include()
+        self.includes = includes or {}
+
+    def __repr__(self) -> str:
+        return f"<LoaderProfile(name={self.name}, includes={sorted(self.includes)})>"
+
+    def _selected(self, flags: Dict[str, bool]) -> List[Include]:
+        unknown = set(flags) - set(self.includes)
+        if unknown:
+            raise ValueError(f"Loader profile {self.name} has no includes named {sorted(unknown)}")
+        return [self.always] + [
+            include for key, include in self.includes.items() if flags.get(key)
+        ]
+
+    def options(self, **flags: bool) -> List[Any]:
+        """Loader options for the requested includes."""
+        return [option for include in self._selected(flags) for option in include.options]
+
+    def budget(self, **flags: bool) -> int:
+        """Maximum number of SELECTs the profile may issue."""
+        return 1 + sum(include.queries for include in self._selected(flags))
+
+    def apply(self, query, **flags: bool):
+        """Attach the profile's loader options to a select()."""
+        options = self.options(**flags)
+        return query.options(*options) if options else query
+
+    async def execute(self, db: AsyncSession, query, **flags: bool):
+        """Execute a select() under this profile, counting statements when enabled."""
+        return await self.execute_statement(db, self.apply(query, **flags), None, **flags)
+
+    async def execute_statement(
+        self, db: AsyncSession, statement, params: Optional[Dict[str, Any]], **flags: bool
+    ):
+        """Execute a statement that already carries this profile's options."""
+        if _budget_mode.get() == "off":
+            return await db.execute(statement, params)
+
+        with track_profile(self.name, self.budget(**flags)):
+            return await db.execute(statement, params)
+
+
+@contextmanager
+def track_profile(name: str, allowed: int) -> Iterator[ProfileExecution]:
+    """Count statements issued inside the block against a budget."""
+    execution = ProfileExecution(name, allowed)
+    token = _current_execution.set(execution)
+    try:
+        yield execution
+    finally:
+        _current_execution.reset(token)
+
+    request_log = _request_log.get()
+    if request_log is not None:
+        request_log.executions.append(execution)
+
+    if execution.exceeded:
+        message = (
+            f"Loader profile {name} issued {execution.executed} queries "
+            f"(budget {execution.allowed})"
+        )
+        if _budget_mode.get() == "strict":
+            raise QueryBudgetExceededError(
+                message, profile=name, allowed=execution.allowed, executed=execution.executed
+            )
+        logger.warning(message)
+
+
+@contextmanager
+def track_request_queries(endpoint: str) -> Iterator[RequestQueryLog]:
+    """Collect the statements and profile executions for one request."""
+    request_log = RequestQueryLog(endpoint)
+    token = _request_log.set(request_log)
+    try:
+        yield request_log
+    finally:
+        _request_log.reset(token)
+
+
+@contextmanager
+def enforce_query_budgets(mode: str = "strict") -> Iterator[None]:
+    """Override QUERY_BUDGET_MODE for the current context (used by tests)."""
+    if mode not in BUDGET_MODES:
+        raise ValueError(f"Query budget mode must be one of: {BUDGET_MODES}")
+    token = _budget_mode.set(mode)
+    try:
+        yield
+    finally:
+        _budget_mode.reset(token)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    execution = _current_execution.get()
+    if execution is not None:
+        execution.executed += 1
+    request_log = _request_log.get()
+    if request_log is not None:
+        request_log.total += 1
+
+
+def install_query_counter(engine) -> None:
+    """Register the statement counter on an engine (sync or async)."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(sync_engine, "before_cursor_execute", _count_statement):
+        event.listen(sync_engine, "before_cursor_execute", _count_statement)
+
+
+class QueryBudgetMiddleware:
+    """ASGI middleware that reports statements issued per endpoint."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        endpoint = f"{scope['method']} {scope['path']}"
+        with track_request_queries(endpoint) as request_log:
+            await self.app(scope, receive, send)
+
+        profiles = ", ".join(
+            f"{execution.name} {execution.executed}/{execution.allowed}"
+            for execution in request_log.executions
+        )
+        log = logger.warning if request_log.violations else logger.debug
+        log(f"{endpoint}: {request_log.total} queries [{profiles}]")
@@ -0,0 +1,135 @@
+"""
+Sliding-window rate limiting backed by Redis.
+
+Each limited key is a Redis sorted set of request timestamps, trimmed and
+checked by one Lua script so concurrent workers cannot race past the limit.
+An in-process pre-check sheds clients that already exceeded the limit at this
+worker alone, without a Redis round-trip.
+"""
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import Dict, Tuple
+import uuid
+
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = window key; ARGV = window_ms, limit, member.
+# Returns {allowed, remaining, reset_ms}.
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    count = count + 1
+    allowed = 1
+end
+
+local reset = window
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+return {allowed, limit - count, reset}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: int
+
+
+class LocalRateLimitPrecheck:
+    """Per-worker fixed-window counters used to shed floods before Redis."""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._windows: Dict[str, Tuple[float, int]] = {}
+
+    def exceeded(self, key: str, limit: int, window_seconds: int) -> Tuple[bool, int]:
+        """
+        Count a request and report whether this worker alone saw more than limit.
+
+        Returns:
+            Tuple of (exceeded, seconds until the local window resets)
+        """
+        now = time.monotonic()
+        window_start, count = self._windows.get(key, (now, 0))
+        if now - window_start >= window_seconds:
+            window_start, count = now, 0
+        count += 1
+
+        if len(self._windows) >= self.max_keys and key not in self._windows:
+            self._prune(now, window_seconds)
+        self._windows[key] = (window_start, count)
+
+        reset = max(1, int(window_start + window_seconds - now))
+        return count > limit, reset
+
+    def _prune(self, now: float, window_seconds: int) -> None:
+        self._windows = {
+            key: value for key, value in self._windows.items()
+            if now - value[0] < window_seconds
+        }
+        if len(self._windows) >= self.max_keys:
+            self._windows.clear()
+
+
+class SlidingWindowRateLimiter:
+    """Redis sliding-window limiter shared by every worker."""
+
+    def __init__(self, key_prefix: str = "rate_limit"):
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.precheck = LocalRateLimitPrecheck()
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
+        """
+        Record a request for key and check it against limit per window_seconds.
+
+        Redis errors fail open: the request is allowed and the error logged.
+        """
+        exceeded, reset = self.precheck.exceeded(key, limit, window_seconds)
+        if exceeded:
+            return RateLimitResult(allowed=False, limit=limit, remaining=0, reset_seconds=reset)
+
+        try:
+            allowed, remaining, reset_ms = await self.redis.run_script(
+                SLIDING_WINDOW_SCRIPT,
+                keys=[f"{self.key_prefix}:{key}"],
+                args=[window_seconds * 1000, limit, f"{time.time()}:{uuid.uuid4().hex[:8]}"]
+            )
+        except Exception as e:
+            logger.error("Rate limit check failed for %s: %s", key, str(e))
+            return RateLimitResult(allowed=True, limit=limit, remaining=limit, reset_seconds=window_seconds)
+
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=max(0, int(remaining)),
+            reset_seconds=max(1, -(-int(reset_ms) // 1000))
+        )
+
+
+# Global rate limiter instance
+rate_limiter = SlidingWindowRateLimiter()
+
+
+def get_rate_limiter() -> SlidingWindowRateLimiter:
+    """Get rate limiter instance."""
+    return rate_limiter
@@ -1,32 +1,63 @@
 """
 Redis connection and caching utilities.
+
+Structured values (dicts and lists) are stored through CacheCodec on a
+bytes connection; plain strings, sets, counters and pub/sub use a text one.
 """
 import json
-from typing import Any, Optional, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, List, Optional, Set, Union
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline, PubSub
+from redis.commands.core import AsyncScript
 
+from app.core.cache_codec import CacheCodec, CacheCodecError
 from app.core.config import settings
 
 
 class RedisClient:
     """Redis client wrapper for caching operations."""
     
-    def __init__(self):
+    def __init__(self, codec: Optional[CacheCodec] = None):
         self.redis: Optional[Redis] = None
+        self.binary: Optional[Redis] = None
+        self.codec = codec or CacheCodec()
+        self._scripts: Dict[str, AsyncScript] = {}
     
     async def connect(self) -> None:
         """Connect to Redis."""
+        pool_options = dict(
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT
+        )
         self.redis = redis.from_url(
             settings.REDIS_URL,
             encoding="utf-8",
-            decode_responses=True
+            decode_responses=True,
+            **pool_options
         )
+        self.binary = redis.from_url(settings.REDIS_URL, decode_responses=False, **pool_options)
     
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
         if self.redis:
             await self.redis.close()
+        if self.binary:
+            await self.binary.close()
+    
+    def encode_value(self, value: Any) -> bytes:
+        """Encode a structured value for storage, e.g. inside a binary pipeline."""
+        return self.codec.encode(value)
+    
+    def decode_value(self, data: Optional[bytes]) -> Any:
+        """Decode a stored structured value; None if missing or unreadable."""
+        try:
+            return self.codec.decode(data)
+        except CacheCodecError:
+            return None
     
     async def get(self, key: str) -> Optional[str]:
         """Get value from Redis."""
@@ -44,13 +75,20 @@ class RedisClient:
         if not self.redis:
             await self.connect()
         
+        ttl = ttl or settings.REDIS_CACHE_TTL
+        
         # Serialize complex data types
         if isinstance(value, (dict, list)):
-            value = json.dumps(value)
+            return await self.binary.setex(key, ttl, self.encode_value(value))
         
-        ttl = ttl or settings.REDIS_CACHE_TTL
         return await self.redis.setex(key, ttl, value)
     
+    async def set_if_absent(self, key: str, value: str, ttl: int) -> bool:
+        """Set a string value only if the key does not exist, e.g. to take a short lock."""
+        if not self.redis:
+            await self.connect()
+        return bool(await self.redis.set(key, value, ex=ttl, nx=True))
+    
     async def delete(self, key: str) -> bool:
         """Delete key from Redis."""
         if not self.redis:
@@ -65,13 +103,9 @@ class RedisClient:
     
     async def get_json(self, key: str) -> Optional[Union[dict, list]]:
         """Get JSON value from Redis."""
-        value = await self.get(key)
-        if value:
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return None
-        return None
+        if not self.redis:
+            await self.connect()
+        return self.decode_value(await self.binary.get(key))
     
     async def set_json(
         self, 
@@ -82,6 +116,139 @@ class RedisClient:
         """Set JSON value in Redis."""
         return await self.set(key, value, ttl)
 
+    async def ttl(self, key: str) -> int:
+        """Get the remaining TTL of a key in seconds (-2 if missing, -1 if none)."""
+        if not self.redis:
+            await self.connect()
+        return await self.redis.ttl(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get several values in one round-trip, None for missing keys."""
+        if not keys:
+            return []
+        if not self.redis:
+            await self.connect()
+        return await self.redis.mget(keys)
+
+    async def mget_json(self, keys: List[str]) -> List[Optional[Union[dict, list]]]:
+        """Get several JSON values in one round-trip, None for missing or invalid ones."""
+        if not keys:
+            return []
+        if not self.redis:
+            await self.connect()
+        return [self.decode_value(value) for value in await self.binary.mget(keys)]
+
+    async def hash_get(self, key: str, *fields: str, binary: bool = False) -> List[Optional[Any]]:
+        """Get several fields of a hash in one command, None for missing ones."""
+        if not self.redis:
+            await self.connect()
+        client = self.binary if binary else self.redis
+        return await client.hmget(key, list(fields))
+
+    async def mset(
+        self,
+        mapping: Dict[str, Union[str, dict, list]],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Set several values with a shared TTL in one round-trip."""
+        if not mapping:
+            return True
+        ttl = ttl or settings.REDIS_CACHE_TTL
+        async with self.pipeline(binary=True) as pipe:
+            for key, value in mapping.items():
+                if isinstance(value, (dict, list)):
+                    value = self.encode_value(value)
+                pipe.setex(key, ttl, value)
+            return all(await pipe.execute())
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False, binary: bool = False) -> AsyncIterator[Pipeline]:
+        """
+        Queue commands and send them in one round-trip.
+
+        Commands queued on the yielded pipeline run when the caller awaits
+        pipe.execute(), which returns their results in order. Use binary=True
+        to read or write values made with encode_value.
+        """
+        if not self.redis:
+            await self.connect()
+        client = self.binary if binary else self.redis
+        async with client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
+    def transaction(self) -> AsyncContextManager[Pipeline]:
+        """Like pipeline(), but the queued commands run atomically in MULTI/EXEC."""
+        return self.pipeline(transaction=True)
+
+    async def add_to_sets(self, keys: List[str], member: str, ttl: int) -> None:
+        """Add a member to several sets and reset their TTLs, in one round-trip."""
+        async with self.pipeline() as pipe:
+            for key in keys:
+                pipe.sadd(key, member)
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def set_add(self, key: str, *members: str, ttl: Optional[int] = None) -> None:
+        """Add members to a set, optionally resetting its TTL in the same round-trip."""
+        async with self.pipeline() as pipe:
+            pipe.sadd(key, *members)
+            if ttl:
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def set_remove(self, key: str, *members: str) -> int:
+        """Remove members from a set; returns how many were present."""
+        if not members:
+            return 0
+        if not self.redis:
+            await self.connect()
+        return await self.redis.srem(key, *members)
+
+    async def set_members(self, key: str) -> Set[str]:
+        """Get the members of a set."""
+        if not self.redis:
+            await self.connect()
+        return await self.redis.smembers(key)
+
+    async def delete_many(self, *keys: str) -> int:
+        """Delete several keys in one command; returns how many existed."""
+        if not keys:
+            return 0
+        if not self.redis:
+            await self.connect()
+        return await self.redis.delete(*keys)
+
+    async def scan_keys(self, pattern: str) -> AsyncIterator[str]:
+        """Iterate over keys matching a pattern without blocking the server."""
+        if not self.redis:
+            await self.connect()
+        async for key in self.redis.scan_iter(match=pattern):
+            yield key
+
+    async def run_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Run a Lua script atomically, loading it once and calling it by SHA after."""
+        if not self.redis:
+            await self.connect()
+        if script not in self._scripts:
+            self._scripts[script] = self.redis.register_script(script)
+        return await self._scripts[script](keys=keys, args=args)
+
+    async def publish(self, channel: str, message: Union[str, dict]) -> int:
+        """Publish a message; returns the number of subscribers that got it."""
+        if not self.redis:
+            await self.connect()
+        if isinstance(message, dict):
+            message = json.dumps(message)
+        return await self.redis.publish(channel, message)
+
+    async def subscribe(self, *channels: str) -> PubSub:
+        """Subscribe to channels; the caller reads and closes the PubSub."""
+        if not self.redis:
+            await self.connect()
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(*channels)
+        return pubsub
+
 
 # Global Redis client instance
 redis_client = RedisClient()
\ No newline at end of file
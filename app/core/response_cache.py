@@ -0,0 +1,269 @@
+"""
+Read-through response cache for hot GET endpoints.
+
+Endpoints decorated with cached_response keep their serialized JSON body in
+Redis, keyed by route, normalized query parameters and the caller's role, so
+a hit skips both the database and Pydantic serialization. Every entry has an
+ETag for If-None-Match revalidation and is indexed under tags such as
+clinic:{id}, which write paths invalidate. Expired entries are served stale
+for a short grace period while a single request recomputes them.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.params import Depends
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+_REQUEST_PARAM = "_response_cache_request"
+_RESPONSE_PARAM = "_response_cache_response"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized response body with its ETag."""
+
+    body: bytes
+    etag: str
+    fresh_until: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag of a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+
+
+def render_body(result: Any) -> bytes:
+    """Serialize an endpoint result the way FastAPI would."""
+    if isinstance(result, BaseModel):
+        return result.model_dump_json(by_alias=True).encode()
+    return json.dumps(jsonable_encoder(result)).encode()
+
+
+class ResponseCache:
+    """Redis storage, tag index and revalidation locks for cached responses."""
+
+    def __init__(
+        self,
+        key_prefix: str = "response",
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None
+    ):
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.enabled = settings.RESPONSE_CACHE_ENABLED
+        self.ttl = ttl or settings.RESPONSE_CACHE_TTL
+        self.stale_ttl = settings.RESPONSE_CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+        self.revalidation_lock_ttl = 10
+
+    def build_key(self, route: str, role: Optional[str], params: Dict[str, Any]) -> str:
+        """
+        Cache key for a route, the caller's role and the endpoint's validated parameters.
+
+        Parameters are the values FastAPI bound after applying defaults, so
+        ?page=1 and no page at all, or parameters in a different order, share
+        an entry, and undeclared query parameters cannot fragment the cache.
+        """
+        normalized = sorted(
+            (name, value.value if isinstance(value, Enum) else value)
+            for name, value in params.items()
+        )
+        digest = hashlib.blake2b(
+            json.dumps([role, normalized], default=str).encode(), digest_size=16
+        ).hexdigest()
+        return f"{self.key_prefix}:{route}:{digest}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.key_prefix}:tag:{tag}"
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached response, fresh or stale; None if missing or Redis fails."""
+        try:
+            body, etag, fresh_until = await self.redis.hash_get(
+                key, "body", "etag", "fresh_until", binary=True
+            )
+        except Exception as e:
+            logger.error("Response cache read failed for %s: %s", key, str(e))
+            return None
+
+        if body is None or etag is None or fresh_until is None:
+            return None
+        return CachedResponse(body=body, etag=etag.decode(), fresh_until=float(fresh_until))
+
+    async def store(self, key: str, body: bytes, tags: Sequence[str] = ()) -> CachedResponse:
+        """Store a response body and index it under tags, in one round-trip."""
+        entry = CachedResponse(body=body, etag=etag_for(body), fresh_until=time.time() + self.ttl)
+        expire = self.ttl + self.stale_ttl
+
+        try:
+            async with self.redis.pipeline(binary=True) as pipe:
+                pipe.hset(key, mapping={
+                    "body": entry.body,
+                    "etag": entry.etag,
+                    "fresh_until": entry.fresh_until,
+                })
+                pipe.expire(key, expire)
+                for tag in tags:
+                    pipe.sadd(self._tag_key(tag), key)
+                    pipe.expire(self._tag_key(tag), expire)
+                await pipe.execute()
+        except Exception as e:
+            logger.error("Response cache write failed for %s: %s", key, str(e))
+
+        return entry
+
+    async def acquire_revalidation(self, key: str) -> bool:
+        """Claim the right to recompute a stale entry; other requests keep serving it."""
+        try:
+            return await self.redis.set_if_absent(
+                f"{key}:revalidating", "1", self.revalidation_lock_ttl
+            )
+        except Exception as e:
+            logger.error("Response cache lock failed for %s: %s", key, str(e))
+            return True
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Drop every cached response indexed under any of tags.
+
+        Returns:
+            Number of cached responses removed
+        """
+        if not tags:
+            return 0
+
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        try:
+            async with self.redis.pipeline() as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+
+            keys = set().union(*members)
+            await self.redis.delete_many(*keys, *tag_keys)
+            return len(keys)
+        except Exception as e:
+            logger.error("Response cache invalidation failed for %s: %s", ", ".join(tags), str(e))
+            return 0
+
+    def respond(
+        self,
+        request: Request,
+        entry: CachedResponse,
+        sub_response: Response,
+        cache_status: str
+    ) -> Response:
+        """Build the response for an entry, 304 if the client already has it."""
+        headers = {
+            name: value for name, value in sub_response.headers.items()
+            if name not in ("content-length", "content-type")
+        }
+        headers.update({
+            "ETag": entry.etag,
+            "Cache-Control": "private, no-cache",
+            "X-Cache": cache_status,
+        })
+
+        if etag_matches(request.headers.get("If-None-Match"), entry.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def cached_response(
+    tags: Iterable[str] = (),
+    role_param: Optional[str] = "current_user"
+) -> Callable:
+    """
+    Cache a GET endpoint's serialized response.
+
+    Args:
+        tags: Invalidation tags, formatted with the endpoint's parameters,
+            e.g. "clinic:{clinic_id}"
+        role_param: Endpoint parameter holding the caller, whose role is part
+            of the key; None if the response does not depend on the caller
+
+    Must be applied below the router decorator. Dependency parameters are not
+    part of the key; everything else the endpoint declares is.
+    """
+    tags = tuple(tags)
+
+    def decorator(endpoint: Callable) -> Callable:
+        signature = inspect.signature(endpoint)
+        vary_on = [
+            name for name, parameter in signature.parameters.items()
+            if not isinstance(parameter.default, Depends)
+        ]
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs.pop(_REQUEST_PARAM)
+            sub_response: Response = kwargs.pop(_RESPONSE_PARAM)
+            cache = get_response_cache()
+            if not cache.enabled:
+                return await endpoint(*args, **kwargs)
+
+            role = getattr(kwargs.get(role_param), "role", None) if role_param else None
+            route = getattr(request.scope.get("route"), "path", request.url.path)
+            params = {name: kwargs.get(name) for name in vary_on}
+            key = cache.build_key(route, getattr(role, "value", role), params)
+
+            entry = await cache.get(key)
+            if entry is not None:
+                if entry.is_fresh:
+                    return cache.respond(request, entry, sub_response, "HIT")
+                if not await cache.acquire_revalidation(key):
+                    return cache.respond(request, entry, sub_response, "STALE")
+
+            result = await endpoint(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+
+            entry = await cache.store(
+                key, render_body(result), [tag.format(**params) for tag in tags]
+            )
+            return cache.respond(request, entry, sub_response, "MISS")
+
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter(_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+
+    return decorator
+
+
+# Global response cache instance
+response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get response cache instance."""
+    return response_cache
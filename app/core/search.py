@@ -0,0 +1,119 @@
+"""
+Text search over short text columns, backed by pg_trgm.
+
+A search term is split into words and every word must match at least one of
+the searched columns. Words of MIN_INFIX_LENGTH characters or more match
+anywhere in a column (ILIKE '%word%'); the pg_trgm GIN index on each searched
+column answers that without a sequential scan, and the planner combines the
+per-column indexes with a BitmapOr. Shorter words only match as a prefix
+(ILIKE 'wo%'): a one- or two-letter infix has no trigrams to look up, while a
+prefix still does thanks to pg_trgm's word padding.
+
+rank() orders results by trigram word similarity, with prefix matches first.
+On SQLite (used in tests) the same conditions run as plain LIKE and the rank
+falls back to contains/prefix scoring.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, Index, and_, case, literal, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+
+# Shortest word matched anywhere in a column; shorter words match as a prefix
+MIN_INFIX_LENGTH = 3
+
+
+def trigram_indexes(table_name: str, *column_names: str) -> Tuple[Index, ...]:
+    """GIN trigram indexes for searched columns, for a model's __table_args__."""
+    return tuple(
+        Index(
+            f"ix_{table_name}_{column_name}_trgm",
+            column_name,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+        for column_name in column_names
+    )
+
+
+def search_words(search: Optional[str]) -> List[str]:
+    """Lower-cased words of a search term."""
+    return (search or "").lower().split()
+
+
+def _escape_like(word: str) -> str:
+    return word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class word_similarity(FunctionElement):
+    """pg_trgm word_similarity(term, column); 0..1, higher is closer."""
+
+    name = "word_similarity"
+    type = Float()
+    inherit_cache = True
+
+
+@compiles(word_similarity)
+def _word_similarity(element, compiler, **kw):
+    return "word_similarity(%s)" % compiler.process(element.clause_expr.element, **kw)
+
+
+@compiles(word_similarity, "sqlite")
+def _word_similarity_sqlite(element, compiler, **kw):
+    term, column = [compiler.process(clause, **kw) for clause in element.clauses]
+    return f"(CASE WHEN instr(lower({column}), lower({term})) > 0 THEN 0.5 ELSE 0.0 END)"
+
+
+class greatest(FunctionElement):
+    """Largest of several values."""
+
+    name = "greatest"
+    type = Float()
+    inherit_cache = True
+
+
+@compiles(greatest)
+def _greatest(element, compiler, **kw):
+    return "greatest(%s)" % compiler.process(element.clause_expr.element, **kw)
+
+
+@compiles(greatest, "sqlite")
+def _greatest_sqlite(element, compiler, **kw):
+    # SQLite's multi-argument max() is scalar
+    return "max(%s)" % compiler.process(element.clause_expr.element, **kw)
+
+
+class TextSearch:
+    """Search definition over a fixed set of text columns."""
+
+    def __init__(self, *columns):
+        """
+        Args:
+            *columns: Columns searched, each backed by a trigram index
+        """
+        self.columns = columns
+
+    def condition(self, search: Optional[str]) -> Optional[ColumnElement]:
+        """WHERE clause for a search term; None when the term has no words."""
+        words = search_words(search)
+        if not words:
+            return None
+        return and_(*(or_(*(self._match(column, word) for column in self.columns)) for word in words))
+
+    def rank(self, search: Optional[str]) -> ColumnElement:
+        """Relevance of a row for a search term: prefix matches first, then similarity."""
+        term = " ".join(search_words(search))
+        prefix = f"{_escape_like(term)}%"
+        similarities = [word_similarity(literal(term), column) for column in self.columns]
+        similarity = similarities[0] if len(similarities) == 1 else greatest(*similarities)
+        is_prefix = or_(*(column.ilike(prefix, escape="\\") for column in self.columns))
+        return case((is_prefix, 1.0), else_=0.0) + similarity
+
+    @staticmethod
+    def _match(column, word: str) -> ColumnElement:
+        pattern = _escape_like(word) + "%"
+        if len(word) >= MIN_INFIX_LENGTH:
+            pattern = "%" + pattern
+        return column.ilike(pattern, escape="\\")
@@ -0,0 +1,189 @@
+"""
+Request coalescing for identical concurrent reads.
+
+While a call for a key is in flight, identical calls in the same worker wait
+for its result instead of running the query again. With distributed=True the
+leader also takes a short Redis lock and publishes its result under a result
+key, so followers in other workers wait for that instead of the database.
+Results are shared between callers and must be treated as read-only.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+import uuid
+
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class _LeaderCancelled(Exception):
+    """The leading call was cancelled; its followers start over."""
+
+
+def single_flight_key(name: str, **params: Any) -> str:
+    """Key for a call to name with params, independent of argument order."""
+    digest = hashlib.blake2b(
+        json.dumps(sorted(params.items()), default=str).encode(), digest_size=16
+    ).hexdigest()
+    return f"{name}:{digest}"
+
+
+class SingleFlight:
+    """Deduplicates identical in-flight calls within a worker and, optionally, across workers."""
+
+    def __init__(self, key_prefix: str = "single_flight"):
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self._calls: Dict[str, asyncio.Future] = {}
+        self._leaders = 0
+        self._coalesced = 0
+        self._remote_coalesced = 0
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        distributed: bool = False,
+        lock_ttl: float = 10.0,
+        result_ttl: int = 2
+    ) -> T:
+        """
+        Run fn unless an identical call is already running, then share its outcome.
+
+        Args:
+            key: Identity of the call, e.g. from single_flight_key
+            fn: Zero-argument coroutine function doing the actual work
+            distributed: Also coalesce with workers sharing Redis; the
+                result must be serializable by the Redis cache codec
+            lock_ttl: Seconds another worker's leader is waited for
+            result_ttl: Seconds a published result stays readable
+
+        Exceptions raised by the leader are raised in every follower.
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self._leaders += 1
+        try:
+            if distributed:
+                result = await self._run_distributed(key, fn, lock_ttl, result_ttl)
+            else:
+                result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+    async def _run_distributed(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        lock_ttl: float,
+        result_ttl: int
+    ) -> T:
+        """Lead across workers, or wait for the worker that does."""
+        lock_key = f"{self.key_prefix}:{key}:lock"
+        result_key = f"{self.key_prefix}:{key}:result"
+
+        try:
+            published = await self.redis.get_json(result_key)
+            if published is not None:
+                self._remote_coalesced += 1
+                return published["value"]
+            leader = await self.redis.set_if_absent(lock_key, uuid.uuid4().hex, max(1, int(lock_ttl)))
+        except Exception as e:
+            logger.error("Single-flight lock failed for %s: %s", key, str(e))
+            return await fn()
+
+        if not leader:
+            result = await self._wait_for_result(lock_key, result_key, lock_ttl)
+            if result is not _MISSING:
+                self._remote_coalesced += 1
+                return result
+            return await fn()
+
+        try:
+            result = await fn()
+            try:
+                await self.redis.set_json(result_key, {"value": result}, ttl=result_ttl)
+            except Exception as e:
+                logger.warning("Single-flight result for %s not published: %s", key, str(e))
+            return result
+        finally:
+            try:
+                await self.redis.delete(lock_key)
+            except Exception as e:
+                logger.error("Single-flight unlock failed for %s: %s", key, str(e))
+
+    async def _wait_for_result(self, lock_key: str, result_key: str, timeout: float) -> Any:
+        """
+        Poll for another worker's result.
+
+        Returns _MISSING if the leader released its lock without publishing a
+        result, or did not finish within timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+            try:
+                async with self.redis.pipeline(binary=True) as pipe:
+                    pipe.get(result_key)
+                    pipe.exists(lock_key)
+                    published, locked = await pipe.execute()
+            except Exception as e:
+                logger.error("Single-flight wait failed for %s: %s", result_key, str(e))
+                return _MISSING
+
+            published = self.redis.decode_value(published)
+            if published is not None:
+                return published["value"]
+            if not locked:
+                return _MISSING
+        return _MISSING
+
+    def statistics(self) -> Dict[str, int]:
+        """Calls run, and calls answered by another call's result."""
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self._leaders,
+            "coalesced": self._coalesced,
+            "remote_coalesced": self._remote_coalesced,
+        }
+
+
+# Global single-flight instance
+single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get single-flight instance."""
+    return single_flight
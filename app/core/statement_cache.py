@@ -0,0 +1,69 @@
+"""
+Reusable statements for hot lookups.
+
+Building a select() chain, attaching loader options and computing the
+statement's cache key costs Python CPU on every call, even though SQLAlchemy's
+compiled cache then maps it to SQL it has already compiled. A StatementCache
+builds each statement once per combination of loader profile includes, with
+values left as bindparam() placeholders supplied at execution, so the
+statement object and its memoized cache key are reused as well.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
+
+from app.core.loader_profiles import LoaderProfile
+
+
+class StatementCache:
+    """One prebuilt statement per include combination of a loader profile."""
+
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[], Executable],
+        profile: Optional[LoaderProfile] = None,
+        maxsize: int = 64
+    ):
+        self.name = name
+        self.profile = profile
+        self.maxsize = maxsize
+        self._build = build
+        self._statements: "OrderedDict[FrozenSet[str], Executable]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<StatementCache(name={self.name}, statements={len(self._statements)})>"
+
+    def get(self, **flags: bool) -> Executable:
+        """The statement for the given includes, built on first use."""
+        # Disabled includes add no options, so only the enabled ones tell statements apart
+        key = frozenset(name for name, value in flags.items() if value)
+        statement = self._statements.get(key)
+        if statement is not None:
+            self.hits += 1
+            self._statements.move_to_end(key)
+            return statement
+
+        self.misses += 1
+        statement = self._build()
+        if self.profile is not None:
+            statement = self.profile.apply(statement, **flags)
+        self._statements[key] = statement
+        if len(self._statements) > self.maxsize:
+            self._statements.popitem(last=False)
+        return statement
+
+    async def execute(self, db: AsyncSession, params: Dict[str, Any], **flags: bool):
+        """Execute the statement for flags with params bound to its placeholders."""
+        statement = self.get(**flags)
+        if self.profile is None:
+            return await db.execute(statement, params)
+        return await self.profile.execute_statement(db, statement, params, **flags)
+
+    def statistics(self) -> Dict[str, int]:
+        return {"statements": len(self._statements), "hits": self.hits, "misses": self.misses}
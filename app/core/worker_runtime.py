@@ -0,0 +1,139 @@
+"""
+Async runtime for Celery worker processes.
+
+asyncio.run() per task starts a new event loop each time, while the
+module-level database engine and Redis client keep connections bound to the
+loop that opened them. Tasks then either reconnect on every run or fail with
+"attached to a different loop" errors. WorkerRuntime keeps one event loop per
+worker process on a background thread, and every async task runs on it, so
+pooled connections are opened once and reused by every task the process
+runs.
+
+The loop thread works under every pool: the prefork main thread, the
+threads pool and the solo pool all hand their coroutines to the same loop.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerRuntime:
+    """One long-lived event loop per worker process."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.tasks_run = 0
+
+    def start(self, warm_up: bool = True) -> None:
+        """
+        Start the loop thread and open the connection pools on it.
+
+        Safe to call more than once; only the first call starts a loop.
+
+        Args:
+            warm_up: Open one database and Redis connection up front
+        """
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def serve() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=serve, name="celery-async-runtime", daemon=True)
+            self._thread.start()
+            ready.wait()
+
+            from app.notifications.templates import notification_templates
+            notification_templates.load()
+
+            # Tasks arriving meanwhile wait on the lock until the pools are open
+            asyncio.run_coroutine_threadsafe(self._open_pools(warm_up), loop).result()
+            self._loop = loop
+        logger.info("Worker async runtime started")
+
+    def stop(self) -> None:
+        """Dispose the connection pools and stop the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_pools(), loop).result(timeout=30)
+        except Exception as e:
+            logger.error(f"Failed to close worker connection pools: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        loop.close()
+        logger.info(f"Worker async runtime stopped after {self.tasks_run} tasks")
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine on the worker loop and wait for its result.
+
+        Starts the runtime on first use, for pools that send no
+        worker_process_init. If the waiting thread is interrupted, e.g. by a
+        soft time limit, the coroutine is cancelled before the error propagates.
+        """
+        if self._loop is None:
+            self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self.tasks_run += 1
+
+    async def _open_pools(self, warm_up: bool) -> None:
+        from app.core.database import engine, replica_engines
+        from app.core.redis import redis_client
+
+        # Connections inherited from the parent process belong to its loop;
+        # drop them without closing the parent's sockets.
+        for inherited in [engine, *replica_engines]:
+            await inherited.dispose(close=False)
+        redis_client.redis = redis_client.binary = None
+        await redis_client.connect()
+
+        if not warm_up:
+            return
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            await redis_client.redis.ping()
+        except Exception as e:
+            logger.warning(f"Worker connection warm-up failed, connecting on first use: {e}")
+
+    async def _close_pools(self) -> None:
+        from app.core.database import close_db
+        from app.core.redis import redis_client
+        from app.notifications.transports import close_transports
+
+        await close_transports()
+        await close_db()
+        await redis_client.disconnect()
+
+
+# Global worker runtime instance
+worker_runtime = WorkerRuntime()
+
+
+def get_worker_runtime() -> WorkerRuntime:
+    """Get worker runtime instance."""
+    return worker_runtime
@@ -6,13 +6,16 @@ Handles application startup, middleware, and route registration.
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from app.core.config import get_settings
 from app.core.database import init_db, close_db, ensure_tables_exist
 from app.core.exceptions import VetClinicException, create_http_exception
 from app.app_helpers.response_helpers import error_response, generate_request_id
+from app.services.auth_cache_service import get_auth_cache_service
+from app.notifications.templates import get_notification_templates
 
 # Setup enhanced logging
 from app.core.logging_config import setup_logging
@@ -105,6 +108,12 @@ async def lifespan(app: FastAPI):
                 "💡 Ensure database migrations are applied: alembic upgrade head"
             )
 
+        # Compile notification templates once per process
+        get_notification_templates().load()
+
+        # Evict revoked tokens from this worker's in-process JWT cache
+        revocation_listener = asyncio.create_task(get_auth_cache_service().listen_for_revocations())
+
         logger.info("✅ Application startup completed")
 
     except Exception as e:
@@ -116,6 +125,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🛑 Shutting down Veterinary Clinic Backend")
     try:
+        revocation_listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await revocation_listener
         await close_db()
         logger.info("✅ Application shutdown completed")
     except Exception as e:
@@ -141,6 +153,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-endpoint query counts for loader profile budgets
+if settings.QUERY_BUDGET_MODE != "off":
+    from app.core.loader_profiles import QueryBudgetMiddleware
+    app.add_middleware(QueryBudgetMiddleware)
+
 
 # Global exception handler
 @app.exception_handler(VetClinicException)
@@ -5,9 +5,10 @@ Contains SQLAlchemy models for all entities in the system.
 
 from .user import User, UserRole
 from .pet import Pet, PetGender, HealthRecord, HealthRecordType
-from .appointment import Appointment, AppointmentStatus, AppointmentType
+from .appointment import Appointment, AppointmentDailyStats, AppointmentStatus, AppointmentType
 from .clinic import Clinic, Veterinarian, VeterinarianSpecialty
 from .communication import Conversation, Message, MessageType
+from .notification import NotificationChannel, NotificationOutbox, OutboxStatus
 
 __all__ = [
     # User models
@@ -22,6 +23,7 @@ __all__ = [
     
     # Appointment models
     "Appointment",
+    "AppointmentDailyStats",
     "AppointmentStatus",
     "AppointmentType",
     
@@ -34,4 +36,9 @@ __all__ = [
     "Conversation",
     "Message",
     "MessageType",
+    
+    # Notification models
+    "NotificationChannel",
+    "NotificationOutbox",
+    "OutboxStatus",
 ]
\ No newline at end of file
@@ -2,13 +2,13 @@
 Appointment models with veterinarian and clinic associations.
 """
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Float, Boolean, Integer
-from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Date, Text, ForeignKey, Float, Boolean, Integer, Index, literal_column, text
+from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON, ExcludeConstraint
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -53,6 +53,20 @@ class Appointment(Base):
     """Appointment model for scheduling veterinary services."""
     
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Overlap lookups: veterinarian_id = ? AND scheduled_at < ? AND ends_at > ?
+        Index("ix_appointments_vet_schedule", "veterinarian_id", "scheduled_at", "ends_at"),
+        # A veterinarian's active appointments may not overlap, except those
+        # booked into the same shared slot (needs btree_gist for the = and <>)
+        ExcludeConstraint(
+            ("veterinarian_id", "="),
+            (func.tstzrange(literal_column("scheduled_at"), literal_column("ends_at")), "&&"),
+            (func.coalesce(literal_column("slot_id"), literal_column("id")), "<>"),
+            name="ex_appointments_vet_overlap",
+            using="gist",
+            where=text("status IN ('SCHEDULED', 'CONFIRMED', 'IN_PROGRESS')"),
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -62,6 +76,7 @@ class Appointment(Base):
     pet_owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     veterinarian_id = Column(UUID(as_uuid=True), ForeignKey("veterinarians.id"), nullable=False, index=True)
     clinic_id = Column(UUID(as_uuid=True), ForeignKey("clinics.id"), nullable=False, index=True)
+    slot_id = Column(UUID(as_uuid=True), ForeignKey("appointment_slots.id", ondelete="SET NULL"), nullable=True, index=True)
     
     # Appointment details
     appointment_type = Column(ENUM(AppointmentType), nullable=False, index=True)
@@ -71,6 +86,9 @@ class Appointment(Base):
     # Scheduling information
     scheduled_at = Column(DateTime(timezone=True), nullable=False, index=True)
     duration_minutes = Column(Integer, default=30, nullable=False)
+    # scheduled_at + duration_minutes, kept in step by _update_ends_at so
+    # overlap queries can compare plain columns
+    ends_at = Column(DateTime(timezone=True), nullable=False)
     
     # Appointment content
     reason = Column(String(500), nullable=False)
@@ -107,14 +125,23 @@ class Appointment(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    pet = relationship("Pet", back_populates="appointments", lazy="selectin")
-    pet_owner = relationship("User", back_populates="appointments", lazy="selectin")
-    veterinarian = relationship("Veterinarian", back_populates="appointments", lazy="selectin")
-    clinic = relationship("Clinic", back_populates="appointments", lazy="selectin")
+    pet = relationship("Pet", back_populates="appointments", lazy="noload")
+    pet_owner = relationship("User", back_populates="appointments", lazy="noload")
+    veterinarian = relationship("Veterinarian", back_populates="appointments", lazy="noload")
+    clinic = relationship("Clinic", back_populates="appointments", lazy="noload")
     
     def __repr__(self) -> str:
         return f"<Appointment(id={self.id}, pet_id={self.pet_id}, vet_id={self.veterinarian_id}, scheduled_at={self.scheduled_at})>"
     
+    @validates("scheduled_at", "duration_minutes")
+    def _update_ends_at(self, key, value):
+        """Recompute ends_at whenever the start time or duration changes."""
+        scheduled_at = value if key == "scheduled_at" else self.scheduled_at
+        duration_minutes = value if key == "duration_minutes" else self.duration_minutes
+        if scheduled_at is not None:
+            self.ends_at = scheduled_at + timedelta(minutes=duration_minutes if duration_minutes is not None else 30)
+        return value
+    
     @property
     def is_upcoming(self) -> bool:
         """Check if appointment is upcoming."""
@@ -181,6 +208,11 @@ class AppointmentSlot(Base):
     """Available appointment slots for scheduling."""
     
     __tablename__ = "appointment_slots"
+    __table_args__ = (
+        # One slot per veterinarian, clinic and start time; slot generation
+        # inserts with ON CONFLICT DO NOTHING against it
+        Index("uq_appointment_slots_vet_clinic_start", "veterinarian_id", "clinic_id", "start_time", unique=True),
+    )
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -209,8 +241,8 @@ class AppointmentSlot(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    veterinarian = relationship("Veterinarian", lazy="selectin")
-    clinic = relationship("Clinic", lazy="selectin")
+    veterinarian = relationship("Veterinarian", lazy="raise")
+    clinic = relationship("Clinic", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<AppointmentSlot(id={self.id}, vet_id={self.veterinarian_id}, start_time={self.start_time}, available={self.is_available})>"
@@ -226,7 +258,12 @@ class AppointmentSlot(Base):
         return max(0, self.max_bookings - self.current_bookings)
     
     def book_slot(self) -> bool:
-        """Book the slot if available."""
+        """
+        Book the slot if available, in memory only.
+        
+        Not safe against concurrent bookings; AppointmentService.book_slot
+        takes the booking with a single conditional UPDATE instead.
+        """
         if self.is_available and not self.is_fully_booked:
             self.current_bookings += 1
             return True
@@ -237,4 +274,29 @@ class AppointmentSlot(Base):
         if self.current_bookings > 0:
             self.current_bookings -= 1
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+class AppointmentDailyStats(Base):
+    """Daily appointment rollup per clinic, veterinarian, status, type and priority."""
+    
+    __tablename__ = "appointment_daily_stats"
+    
+    # Rollup key (UTC day of scheduled_at)
+    clinic_id = Column(UUID(as_uuid=True), ForeignKey("clinics.id"), primary_key=True)
+    veterinarian_id = Column(UUID(as_uuid=True), ForeignKey("veterinarians.id"), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    status = Column(ENUM(AppointmentStatus), primary_key=True)
+    appointment_type = Column(ENUM(AppointmentType), primary_key=True)
+    priority = Column(ENUM(AppointmentPriority), primary_key=True)
+    
+    # Aggregates
+    appointment_count = Column(Integer, default=0, nullable=False)
+    estimated_revenue = Column(Float, default=0, nullable=False)
+    actual_revenue = Column(Float, default=0, nullable=False)
+    
+    # Timestamps
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<AppointmentDailyStats(clinic_id={self.clinic_id}, vet_id={self.veterinarian_id}, day={self.day}, status={self.status}, count={self.appointment_count})>"
@@ -6,12 +6,20 @@ from datetime import datetime, time
 from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Float, Boolean, Time, Integer, Table
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Float, Boolean, Time, Integer, Table, Index
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.core.search import trigram_indexes
+
+
+def _average(total: Optional[int], count: Optional[int]) -> Optional[float]:
+    """Average of a maintained sum/count pair; None before the first rating."""
+    if not count:
+        return None
+    return total / count
 
 
 class ClinicType(str, Enum):
@@ -68,6 +76,10 @@ class Clinic(Base):
     """Clinic model with location and service information."""
     
     __tablename__ = "clinics"
+    __table_args__ = (
+        Index("ix_clinics_rating", "rating_average", "rating_count", "id"),
+        *trigram_indexes("clinics", "name", "description", "city", "address_line1"),
+    )
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -116,15 +128,24 @@ class Clinic(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     is_accepting_new_patients = Column(Boolean, default=True, nullable=False)
     
+    # Review aggregates, maintained by ClinicService.create_clinic_review.
+    # rating_average is 0 until the first review so it can be sorted on.
+    rating_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_sum = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_average = Column(Float, default=0.0, server_default="0", nullable=False)
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    veterinarians = relationship("Veterinarian", back_populates="clinic", lazy="selectin")
-    appointments = relationship("Appointment", back_populates="clinic", lazy="selectin")
-    operating_hours = relationship("ClinicOperatingHours", back_populates="clinic", lazy="selectin", cascade="all, delete-orphan")
-    reviews = relationship("ClinicReview", back_populates="clinic", lazy="selectin", cascade="all, delete-orphan")
+    veterinarians = relationship("Veterinarian", back_populates="clinic", lazy="raise")
+    appointments = relationship("Appointment", back_populates="clinic", lazy="raise")
+    operating_hours = relationship("ClinicOperatingHours", back_populates="clinic", lazy="raise", cascade="all, delete-orphan")
+    reviews = relationship("ClinicReview", back_populates="clinic", lazy="noload", cascade="all, delete-orphan")
+    
+    # Miles from the search point; set by location searches, not stored
+    distance_miles = None
     
     def __repr__(self) -> str:
         return f"<Clinic(id={self.id}, name={self.name}, city={self.city}, state={self.state})>"
@@ -140,11 +161,8 @@ class Clinic(Base):
     
     @property
     def average_rating(self) -> Optional[float]:
-        """Calculate average rating from reviews."""
-        if not self.reviews:
-            return None
-        total_rating = sum(review.rating for review in self.reviews if review.rating)
-        return total_rating / len(self.reviews) if self.reviews else None
+        """Average review rating; None when there are no reviews."""
+        return _average(self.rating_sum, self.rating_count)
 
 
 class ClinicOperatingHours(Base):
@@ -172,7 +190,7 @@ class ClinicOperatingHours(Base):
     notes = Column(String(200), nullable=True)
     
     # Relationships
-    clinic = relationship("Clinic", back_populates="operating_hours", lazy="selectin")
+    clinic = relationship("Clinic", back_populates="operating_hours", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<ClinicOperatingHours(clinic_id={self.clinic_id}, day={self.day_of_week}, open={self.is_open})>"
@@ -182,6 +200,10 @@ class Veterinarian(Base):
     """Veterinarian model with profile and specialty information."""
     
     __tablename__ = "veterinarians"
+    __table_args__ = (
+        Index("ix_veterinarians_rating", "rating_average", "rating_count", "id"),
+        *trigram_indexes("veterinarians", "bio", "license_number"),
+    )
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -213,22 +235,38 @@ class Veterinarian(Base):
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
     
+    # Review aggregates, maintained by ClinicService.create_veterinarian_review.
+    # rating_average is 0 until the first review so it can be sorted on; the
+    # optional sub-ratings keep their own counts.
+    rating_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_sum = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_average = Column(Float, default=0.0, server_default="0", nullable=False)
+    bedside_manner_rating_count = Column(Integer, default=0, server_default="0", nullable=False)
+    bedside_manner_rating_sum = Column(Integer, default=0, server_default="0", nullable=False)
+    expertise_rating_count = Column(Integer, default=0, server_default="0", nullable=False)
+    expertise_rating_sum = Column(Integer, default=0, server_default="0", nullable=False)
+    communication_rating_count = Column(Integer, default=0, server_default="0", nullable=False)
+    communication_rating_sum = Column(Integer, default=0, server_default="0", nullable=False)
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="veterinarian_profile", lazy="selectin")
-    clinic = relationship("Clinic", back_populates="veterinarians", lazy="selectin")
+    user = relationship("User", back_populates="veterinarian_profile", lazy="noload")
+    clinic = relationship("Clinic", back_populates="veterinarians", lazy="raise")
     # Note: specialties relationship is handled through the veterinarian_specialties association table
     # The specialties are accessed via the veterinarian_specialties table directly
-    appointments = relationship("Appointment", back_populates="veterinarian", lazy="selectin")
-    availability = relationship("VeterinarianAvailability", back_populates="veterinarian", lazy="selectin", cascade="all, delete-orphan")
-    reviews = relationship("VeterinarianReview", back_populates="veterinarian", lazy="selectin", cascade="all, delete-orphan")
-    health_records = relationship("HealthRecord", back_populates="veterinarian", lazy="selectin")
+    appointments = relationship("Appointment", back_populates="veterinarian", lazy="raise")
+    availability = relationship("VeterinarianAvailability", back_populates="veterinarian", lazy="raise", cascade="all, delete-orphan")
+    reviews = relationship("VeterinarianReview", back_populates="veterinarian", lazy="noload", cascade="all, delete-orphan")
+    health_records = relationship("HealthRecord", back_populates="veterinarian", lazy="raise")
     
     # Many-to-many relationship with pets
-    pets = relationship("Pet", secondary="pet_veterinarians", back_populates="veterinarians", lazy="selectin")
+    pets = relationship("Pet", secondary="pet_veterinarians", back_populates="veterinarians", lazy="raise")
+    
+    # Miles from the search point to the clinic; set by location searches, not stored
+    distance_miles = None
     
     def __repr__(self) -> str:
         return f"<Veterinarian(id={self.id}, user_id={self.user_id}, license_number={self.license_number})>"
@@ -240,11 +278,23 @@ class Veterinarian(Base):
     
     @property
     def average_rating(self) -> Optional[float]:
-        """Calculate average rating from reviews."""
-        if not self.reviews:
-            return None
-        total_rating = sum(review.rating for review in self.reviews if review.rating)
-        return total_rating / len(self.reviews) if self.reviews else None
+        """Average review rating; None when there are no reviews."""
+        return _average(self.rating_sum, self.rating_count)
+    
+    @property
+    def average_bedside_manner_rating(self) -> Optional[float]:
+        """Average bedside manner rating of the reviews that gave one."""
+        return _average(self.bedside_manner_rating_sum, self.bedside_manner_rating_count)
+    
+    @property
+    def average_expertise_rating(self) -> Optional[float]:
+        """Average expertise rating of the reviews that gave one."""
+        return _average(self.expertise_rating_sum, self.expertise_rating_count)
+    
+    @property
+    def average_communication_rating(self) -> Optional[float]:
+        """Average communication rating of the reviews that gave one."""
+        return _average(self.communication_rating_sum, self.communication_rating_count)
 
 
 class VeterinarianAvailability(Base):
@@ -275,7 +325,7 @@ class VeterinarianAvailability(Base):
     notes = Column(String(200), nullable=True)
     
     # Relationships
-    veterinarian = relationship("Veterinarian", back_populates="availability", lazy="selectin")
+    veterinarian = relationship("Veterinarian", back_populates="availability", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<VeterinarianAvailability(vet_id={self.veterinarian_id}, day={self.day_of_week}, available={self.is_available})>"
@@ -307,8 +357,8 @@ class ClinicReview(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    clinic = relationship("Clinic", back_populates="reviews", lazy="selectin")
-    reviewer = relationship("User", lazy="selectin")
+    clinic = relationship("Clinic", back_populates="reviews", lazy="raise")
+    reviewer = relationship("User", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<ClinicReview(id={self.id}, clinic_id={self.clinic_id}, rating={self.rating})>"
@@ -345,8 +395,8 @@ class VeterinarianReview(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    veterinarian = relationship("Veterinarian", back_populates="reviews", lazy="selectin")
-    reviewer = relationship("User", lazy="selectin")
+    veterinarian = relationship("Veterinarian", back_populates="reviews", lazy="raise")
+    reviewer = relationship("User", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<VeterinarianReview(id={self.id}, veterinarian_id={self.veterinarian_id}, rating={self.rating})>"
\ No newline at end of file
@@ -95,9 +95,9 @@ class Conversation(Base):
         "User",
         secondary=conversation_participants,
         back_populates="conversations",
-        lazy="selectin"
+        lazy="raise"
     )
-    messages = relationship("Message", back_populates="conversation", lazy="selectin", cascade="all, delete-orphan")
+    messages = relationship("Message", back_populates="conversation", lazy="raise", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
         return f"<Conversation(id={self.id}, type={self.conversation_type}, title={self.title})>"
@@ -173,10 +173,10 @@ class Message(Base):
     read_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    conversation = relationship("Conversation", back_populates="messages", lazy="selectin")
-    sender = relationship("User", back_populates="messages_sent", lazy="selectin")
-    reply_to = relationship("Message", remote_side=[id], lazy="selectin")
-    reactions = relationship("MessageReaction", back_populates="message", lazy="selectin", cascade="all, delete-orphan")
+    conversation = relationship("Conversation", back_populates="messages", lazy="raise")
+    sender = relationship("User", back_populates="messages_sent", lazy="raise")
+    reply_to = relationship("Message", remote_side=[id], lazy="raise")
+    reactions = relationship("MessageReaction", back_populates="message", lazy="raise", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, conversation_id={self.conversation_id}, sender_id={self.sender_id}, type={self.message_type})>"
@@ -229,8 +229,8 @@ class MessageReaction(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    message = relationship("Message", back_populates="reactions", lazy="selectin")
-    user = relationship("User", lazy="selectin")
+    message = relationship("Message", back_populates="reactions", lazy="raise")
+    user = relationship("User", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<MessageReaction(id={self.id}, message_id={self.message_id}, user_id={self.user_id}, emoji={self.emoji})>"
@@ -320,7 +320,7 @@ class NotificationPreference(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", lazy="selectin")
+    user = relationship("User", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<NotificationPreference(id={self.id}, user_id={self.user_id}, chat_enabled={self.chat_notifications_enabled})>"
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Notification outbox model.
+"""
+import uuid
+from enum import Enum
+
+from sqlalchemy import Column, String, DateTime, Text, Integer, Index, text
+from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class NotificationChannel(str, Enum):
+    """Notification channel enumeration."""
+    EMAIL = "email"
+    SMS = "sms"
+    PUSH = "push"
+
+
+class OutboxStatus(str, Enum):
+    """Outbox row status enumeration."""
+    PENDING = "pending"
+    SENT = "sent"
+    SKIPPED = "skipped"  # Nothing to send, e.g. an SMS for an owner without a phone number
+    DEAD = "dead"        # Gave up after NOTIFICATION_MAX_ATTEMPTS
+
+
+class NotificationOutbox(Base):
+    """
+    A notification waiting to be sent on one channel.
+
+    Rows are written in the same transaction as the change they announce and
+    sent later by the channel's outbox worker. Rows of kind "message" carry
+    their recipient, subject and body; other kinds carry the IDs of what they
+    announce in payload and are rendered when sent.
+    """
+
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        # Channel workers poll: channel = ? AND status = 'PENDING' AND next_attempt_at <= now()
+        Index(
+            "ix_notification_outbox_pending",
+            "channel",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # What to send
+    channel = Column(ENUM(NotificationChannel), nullable=False)
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=True)
+    recipient = Column(String(255), nullable=True)
+    subject = Column(String(255), nullable=True)
+    body = Column(Text, nullable=True)
+
+    # Retried enqueues and deliveries are recognised by this key
+    idempotency_key = Column(String(255), nullable=False, unique=True)
+
+    # Delivery state
+    status = Column(ENUM(OutboxStatus), default=OutboxStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<NotificationOutbox(id={self.id}, channel={self.channel}, kind={self.kind}, status={self.status})>"
@@ -12,6 +12,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.core.search import trigram_indexes
 
 
 # Association table for pet-veterinarian many-to-many relationship
@@ -61,6 +62,7 @@ class Pet(Base):
     """Pet model with comprehensive profile information."""
     
     __tablename__ = "pets"
+    __table_args__ = trigram_indexes("pets", "name", "breed", "species")
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -114,13 +116,13 @@ class Pet(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    owner = relationship("User", back_populates="pets", lazy="selectin")
-    health_records = relationship("HealthRecord", back_populates="pet", lazy="selectin", cascade="all, delete-orphan")
-    appointments = relationship("Appointment", back_populates="pet", lazy="selectin")
-    reminders = relationship("Reminder", back_populates="pet", lazy="selectin", cascade="all, delete-orphan")
+    owner = relationship("User", back_populates="pets", lazy="noload")
+    health_records = relationship("HealthRecord", back_populates="pet", lazy="noload", cascade="all, delete-orphan")
+    appointments = relationship("Appointment", back_populates="pet", lazy="raise")
+    reminders = relationship("Reminder", back_populates="pet", lazy="raise", cascade="all, delete-orphan")
     
     # Many-to-many relationship with veterinarians
-    veterinarians = relationship("Veterinarian", secondary="pet_veterinarians", back_populates="pets", lazy="selectin")
+    veterinarians = relationship("Veterinarian", secondary="pet_veterinarians", back_populates="pets", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Pet(id={self.id}, name={self.name}, species={self.species}, owner_id={self.owner_id})>"
@@ -195,8 +197,8 @@ class HealthRecord(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    pet = relationship("Pet", back_populates="health_records", lazy="selectin")
-    veterinarian = relationship("Veterinarian", back_populates="health_records", lazy="selectin")
+    pet = relationship("Pet", back_populates="health_records", lazy="raise")
+    veterinarian = relationship("Veterinarian", back_populates="health_records", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<HealthRecord(id={self.id}, pet_id={self.pet_id}, type={self.record_type}, title={self.title})>"
@@ -240,8 +242,8 @@ class Reminder(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    pet = relationship("Pet", back_populates="reminders", lazy="selectin")
-    health_record = relationship("HealthRecord", lazy="selectin")
+    pet = relationship("Pet", back_populates="reminders", lazy="raise")
+    health_record = relationship("HealthRecord", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Reminder(id={self.id}, pet_id={self.pet_id}, title={self.title}, due_date={self.due_date})>"
\ No newline at end of file
@@ -11,6 +11,7 @@ from enum import Enum
 import uuid
 
 from app.core.database import Base
+from app.core.search import trigram_indexes
 
 
 class UserRole(str, Enum):
@@ -22,12 +23,34 @@ class UserRole(str, Enum):
     CLINIC_MANAGER = "clinic_manager"
 
 
+# Basic role-based permissions
+ROLE_PERMISSIONS = {
+    UserRole.ADMIN: ["*"],  # Admin has all permissions
+    UserRole.VETERINARIAN: [
+        "pets:read", "pets:write", "appointments:read", "appointments:write",
+        "health_records:read", "health_records:write", "users:read"
+    ],
+    UserRole.RECEPTIONIST: [
+        "appointments:read", "appointments:write", "users:read", "pets:read"
+    ],
+    UserRole.CLINIC_MANAGER: [
+        "clinic:read", "clinic:write", "staff:read", "appointments:read",
+        "reports:read"
+    ],
+    UserRole.PET_OWNER: [
+        "pets:read", "pets:write", "appointments:read", "appointments:write",
+        "profile:read", "profile:write"
+    ]
+}
+
+
 class User(Base):
     """
     User model for authentication and profile management.
     Integrates with Clerk for authentication and supports role-based access control.
     """
     __tablename__ = "users"
+    __table_args__ = trigram_indexes("users", "first_name", "last_name", "email")
 
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
@@ -64,12 +87,12 @@ class User(Base):
     # Relationships
     pets = relationship("Pet", back_populates="owner", lazy="dynamic")
     appointments = relationship("Appointment", back_populates="pet_owner", lazy="dynamic")
-    veterinarian_profile = relationship("Veterinarian", back_populates="user", lazy="selectin", uselist=False)
+    veterinarian_profile = relationship("Veterinarian", back_populates="user", lazy="raise", uselist=False)
     conversations = relationship(
         "Conversation",
         secondary="conversation_participants",
         back_populates="participants",
-        lazy="selectin"
+        lazy="raise"
     )
     messages_sent = relationship("Message", back_populates="sender", lazy="dynamic")
     
@@ -106,27 +129,7 @@ class User(Base):
         Returns:
             bool: True if user has permission
         """
-        # Basic role-based permissions
-        role_permissions = {
-            UserRole.ADMIN: ["*"],  # Admin has all permissions
-            UserRole.VETERINARIAN: [
-                "pets:read", "pets:write", "appointments:read", "appointments:write",
-                "health_records:read", "health_records:write", "users:read"
-            ],
-            UserRole.RECEPTIONIST: [
-                "appointments:read", "appointments:write", "users:read", "pets:read"
-            ],
-            UserRole.CLINIC_MANAGER: [
-                "clinic:read", "clinic:write", "staff:read", "appointments:read",
-                "reports:read"
-            ],
-            UserRole.PET_OWNER: [
-                "pets:read", "pets:write", "appointments:read", "appointments:write",
-                "profile:read", "profile:write"
-            ]
-        }
-        
-        user_permissions = role_permissions.get(self.role, [])
+        user_permissions = ROLE_PERMISSIONS.get(self.role, [])
         
         # Admin has all permissions
         if "*" in user_permissions:
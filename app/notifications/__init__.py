@@ -0,0 +1 @@
+# Notifications package - Outbox queueing, rendering and delivery
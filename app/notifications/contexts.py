@@ -0,0 +1,68 @@
+"""
+Template contexts for notification messages.
+
+A context is a plain dict with the fields the templates in
+templates/notifications use. Bulk rendering selects these fields as columns
+(app.notifications.renderers); the builders here produce the same dicts from
+loaded ORM objects, for single messages.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def reminder_lead(reminder_type: Optional[str]) -> str:
+    """Normalize an appointment reminder type to "24_hour" or "2_hour"."""
+    return "24_hour" if reminder_type in ("24h", "24_hour") else "2_hour"
+
+
+def appointment_type_label(appointment_type: Any) -> str:
+    """Display label of an AppointmentType, e.g. "Routine Checkup"."""
+    value = getattr(appointment_type, "value", appointment_type)
+    return str(value).replace("_", " ").title() if value else ""
+
+
+def reminder_context(owner: Any, pet: Any, reminder: Any) -> Dict[str, Any]:
+    """Context of a health reminder."""
+    return {
+        "owner_first_name": owner.first_name,
+        "pet_name": pet.name,
+        "title": reminder.title,
+        "description": reminder.description,
+        "due_date": reminder.due_date,
+        "reminder_type": reminder.reminder_type,
+    }
+
+
+def appointment_context(
+    appointment: Any,
+    owner: Any = None,
+    pet: Any = None,
+    reminder_type: Optional[str] = None,
+    old_scheduled_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Context of an appointment notification.
+
+    Args:
+        appointment: Appointment with its relationships loaded
+        owner: Pet owner (defaults to appointment.pet_owner)
+        pet: Pet (defaults to appointment.pet)
+        reminder_type: Reminder type, for reminders
+        old_scheduled_at: Previous time, for reschedules
+    """
+    owner = owner or appointment.pet_owner
+    pet = pet or appointment.pet
+    veterinarian = getattr(appointment, "veterinarian", None)
+    clinic = getattr(appointment, "clinic", None)
+    return {
+        "owner_first_name": owner.first_name,
+        "pet_name": pet.name,
+        "scheduled_at": appointment.scheduled_at,
+        "appointment_type": appointment_type_label(getattr(appointment, "appointment_type", None)),
+        "veterinarian_last_name": veterinarian.user.last_name if veterinarian else None,
+        "clinic_name": clinic.name if clinic else None,
+        "cancellation_reason": getattr(appointment, "cancellation_reason", None),
+        "reminder_type": reminder_lead(reminder_type),
+        "old_scheduled_at": old_scheduled_at,
+    }
@@ -0,0 +1,112 @@
+"""
+Queueing notifications in the outbox.
+
+Notifications are written as notification_outbox rows inside the caller's
+transaction, so they go out exactly when the change they announce commits,
+and request handlers never wait on SMTP or provider APIs. Each row has an
+idempotency key; queueing is an INSERT ... ON CONFLICT DO NOTHING on it, so
+retried requests and re-run tasks queue a notification once.
+
+Rows of kind MESSAGE carry their recipient, subject and body. The other
+kinds carry only the IDs of what they announce and are rendered by the
+channel worker when sent (see app.notifications.renderers).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+import uuid
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import NotificationChannel, NotificationOutbox, OutboxStatus
+
+# Notification kinds
+MESSAGE = "message"
+APPOINTMENT_CONFIRMATION = "appointment_confirmation"
+APPOINTMENT_CANCELLATION = "appointment_cancellation"
+APPOINTMENT_RESCHEDULE = "appointment_reschedule"
+APPOINTMENT_REMINDER = "appointment_reminder"
+HEALTH_REMINDER = "health_reminder"
+
+# Appointment changes are announced by email and, where the owner has a
+# phone number, SMS; SMS rows for owners without one are skipped when sent.
+APPOINTMENT_CHANNELS = (NotificationChannel.EMAIL, NotificationChannel.SMS)
+
+
+def outbox_row(
+    channel: NotificationChannel,
+    kind: str,
+    idempotency_key: str,
+    payload: Optional[Dict[str, Any]] = None,
+    recipient: Optional[str] = None,
+    subject: Optional[str] = None,
+    body: Optional[str] = None
+) -> Dict[str, Any]:
+    """Column values for one pending outbox row."""
+    return {
+        "id": uuid.uuid4(),
+        "channel": channel,
+        "kind": kind,
+        "payload": payload,
+        "recipient": recipient,
+        "subject": subject,
+        "body": body,
+        "idempotency_key": idempotency_key,
+        "status": OutboxStatus.PENDING,
+        "attempts": 0,
+    }
+
+
+def message_row(
+    channel: NotificationChannel,
+    recipient: str,
+    body: str,
+    subject: Optional[str] = None,
+    idempotency_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """A pre-rendered message; without a key it is never deduplicated."""
+    return outbox_row(
+        channel,
+        MESSAGE,
+        idempotency_key or f"{MESSAGE}:{uuid.uuid4()}",
+        recipient=recipient,
+        subject=subject,
+        body=body,
+    )
+
+
+def appointment_rows(
+    kind: str,
+    appointment_id: uuid.UUID,
+    channels: Iterable[NotificationChannel] = APPOINTMENT_CHANNELS,
+    event: Optional[str] = None,
+    **payload: Any
+) -> List[Dict[str, Any]]:
+    """
+    Rows announcing one appointment event on each channel.
+
+    Args:
+        kind: Notification kind, e.g. APPOINTMENT_CONFIRMATION
+        appointment_id: Appointment UUID
+        channels: Channels to notify on
+        event: Distinguishes repeatable events of one kind, e.g. each reschedule
+        **payload: Extra JSON values for rendering
+    """
+    key = ":".join(part for part in (kind, event, str(appointment_id)) if part)
+    payload = {"appointment_id": str(appointment_id), **payload}
+    return [
+        outbox_row(channel, kind, f"{key}:{channel.value}", payload=payload)
+        for channel in channels
+    ]
+
+
+async def enqueue_notifications(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """
+    Queue outbox rows in the current transaction without committing.
+
+    Rows whose idempotency key is already queued are ignored.
+    """
+    if not rows:
+        return
+    statement = insert(NotificationOutbox).on_conflict_do_nothing(index_elements=["idempotency_key"])
+    await db.execute(statement, rows)
@@ -0,0 +1,189 @@
+"""
+Rendering outbox rows into messages.
+
+Rows other than MESSAGE carry only the IDs of what they announce. A batch is
+rendered with one query per kind that selects, column by column, just the
+fields its templates use, so no ORM objects or relationships are loaded.
+Each row becomes a message from its kind's precompiled template for its
+channel (app.notifications.templates), or None when there is nothing to
+send, such as an SMS for an owner without a phone number.
+"""
+
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Union
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.appointment import Appointment
+from app.models.clinic import Clinic, Veterinarian
+from app.models.notification import NotificationChannel, NotificationOutbox
+from app.models.pet import Pet, Reminder
+from app.models.user import User
+from .contexts import appointment_type_label, reminder_lead
+from .outbox import (
+    APPOINTMENT_CANCELLATION,
+    APPOINTMENT_CONFIRMATION,
+    APPOINTMENT_REMINDER,
+    APPOINTMENT_RESCHEDULE,
+    HEALTH_REMINDER,
+    MESSAGE,
+)
+from .templates import notification_templates
+from .transports import OutboundMessage
+
+Rendered = Union[OutboundMessage, None, Exception]
+Renderer = Callable[[AsyncSession, List[NotificationOutbox]], Awaitable[Dict[uuid.UUID, Rendered]]]
+
+VeterinarianUser = aliased(User)
+
+# Template fields of appointment notifications, plus the owner's addresses
+APPOINTMENT_CONTEXT = (
+    select(
+        Appointment.id,
+        Appointment.scheduled_at,
+        Appointment.appointment_type,
+        Appointment.cancellation_reason,
+        Pet.name.label("pet_name"),
+        User.id.label("owner_id"),
+        User.first_name.label("owner_first_name"),
+        User.email.label("owner_email"),
+        User.phone_number.label("owner_phone_number"),
+        VeterinarianUser.last_name.label("veterinarian_last_name"),
+        Clinic.name.label("clinic_name"),
+    )
+    .join(Pet, Pet.id == Appointment.pet_id)
+    .join(User, User.id == Appointment.pet_owner_id)
+    .outerjoin(Veterinarian, Veterinarian.id == Appointment.veterinarian_id)
+    .outerjoin(VeterinarianUser, VeterinarianUser.id == Veterinarian.user_id)
+    .outerjoin(Clinic, Clinic.id == Appointment.clinic_id)
+)
+
+# Template fields of health reminders, plus the owner's addresses
+HEALTH_REMINDER_CONTEXT = (
+    select(
+        Reminder.id,
+        Reminder.title,
+        Reminder.description,
+        Reminder.due_date,
+        Reminder.reminder_type,
+        Pet.name.label("pet_name"),
+        User.id.label("owner_id"),
+        User.first_name.label("owner_first_name"),
+        User.email.label("owner_email"),
+        User.phone_number.label("owner_phone_number"),
+    )
+    .join(Pet, Pet.id == Reminder.pet_id)
+    .join(User, User.id == Pet.owner_id)
+)
+
+APPOINTMENT_KINDS = (
+    APPOINTMENT_CONFIRMATION,
+    APPOINTMENT_CANCELLATION,
+    APPOINTMENT_RESCHEDULE,
+    APPOINTMENT_REMINDER,
+)
+
+
+def _recipient(context: Mapping[str, Any], channel: NotificationChannel) -> Optional[str]:
+    if channel == NotificationChannel.EMAIL:
+        return context["owner_email"]
+    if channel == NotificationChannel.SMS:
+        return context["owner_phone_number"]
+    return str(context["owner_id"])
+
+
+def _render(row: NotificationOutbox, context: Optional[Mapping[str, Any]]) -> Rendered:
+    """Render one row from its template, or None without a recipient."""
+    recipient = context and _recipient(context, row.channel)
+    if not recipient:
+        return None
+    try:
+        message = notification_templates.get(row.kind, row.channel).render(context)
+        return OutboundMessage(row.idempotency_key, recipient, message.body, message.subject)
+    except Exception as e:
+        return e
+
+
+async def render_messages(db: AsyncSession, rows: List[NotificationOutbox]) -> Dict[uuid.UUID, Rendered]:
+    """Rows that carry their own content."""
+    return {
+        row.id: OutboundMessage(row.idempotency_key, row.recipient, row.body, row.subject)
+        if row.recipient else None
+        for row in rows
+    }
+
+
+async def render_appointment_notifications(
+    db: AsyncSession,
+    rows: List[NotificationOutbox]
+) -> Dict[uuid.UUID, Rendered]:
+    """Appointment notifications, with their template fields selected in one query."""
+    ids = {uuid.UUID(row.payload["appointment_id"]) for row in rows}
+    result = await db.execute(APPOINTMENT_CONTEXT.where(Appointment.id.in_(ids)))
+    contexts = {}
+    for mapping in result.mappings():
+        context = dict(mapping)
+        context["appointment_type"] = appointment_type_label(context["appointment_type"])
+        contexts[context["id"]] = context
+
+    rendered: Dict[uuid.UUID, Rendered] = {}
+    for row in rows:
+        context = contexts.get(uuid.UUID(row.payload["appointment_id"]))
+        if context is not None and row.kind in (APPOINTMENT_REMINDER, APPOINTMENT_RESCHEDULE):
+            old_scheduled_at = row.payload.get("old_scheduled_at")
+            context = {
+                **context,
+                "reminder_type": reminder_lead(row.payload.get("reminder_type")),
+                "old_scheduled_at": old_scheduled_at and datetime.fromisoformat(old_scheduled_at),
+            }
+        rendered[row.id] = _render(row, context)
+    return rendered
+
+
+async def render_health_reminders(
+    db: AsyncSession,
+    rows: List[NotificationOutbox]
+) -> Dict[uuid.UUID, Rendered]:
+    """Health reminders, with their template fields selected in one query."""
+    ids = {uuid.UUID(row.payload["reminder_id"]) for row in rows}
+    result = await db.execute(HEALTH_REMINDER_CONTEXT.where(Reminder.id.in_(ids)))
+    contexts = {mapping["id"]: mapping for mapping in result.mappings()}
+
+    return {
+        row.id: _render(row, contexts.get(uuid.UUID(row.payload["reminder_id"])))
+        for row in rows
+    }
+
+
+RENDERERS: Dict[str, Renderer] = {
+    MESSAGE: render_messages,
+    **{kind: render_appointment_notifications for kind in APPOINTMENT_KINDS},
+    HEALTH_REMINDER: render_health_reminders,
+}
+
+
+async def render_rows(db: AsyncSession, rows: List[NotificationOutbox]) -> Dict[uuid.UUID, Rendered]:
+    """
+    Render a batch of outbox rows.
+
+    Returns, by row ID, the message to send, None when there is nothing to
+    send, or the error that prevented rendering.
+    """
+    by_renderer: Dict[Renderer, List[NotificationOutbox]] = {}
+    rendered: Dict[uuid.UUID, Rendered] = {}
+    for row in rows:
+        renderer = RENDERERS.get(row.kind)
+        if renderer is None:
+            rendered[row.id] = ValueError(f"Unknown notification kind: {row.kind}")
+        else:
+            by_renderer.setdefault(renderer, []).append(row)
+
+    for renderer, kind_rows in by_renderer.items():
+        try:
+            rendered.update(await renderer(db, kind_rows))
+        except Exception as e:
+            rendered.update({row.id: e for row in kind_rows})
+    return rendered
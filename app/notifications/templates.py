@@ -0,0 +1,271 @@
+"""
+Precompiled notification templates.
+
+Message text lives in templates/notifications/<locale>/<channel>/<name>.txt
+and is compiled once per process, at startup, into a Python function per
+subject and body that builds the message with f-strings from a plain dict
+context. Rendering does no parsing and no attribute access on ORM objects,
+so bulk runs render from rows selected column by column (see
+app.notifications.renderers).
+
+Template syntax:
+
+- an optional first line ``Subject: ...`` followed by a blank line;
+- ``{field}``, ``{field!r}`` and ``{field:spec}`` placeholders, e.g.
+  ``{due_date:%B %d, %Y}``; fields are plain context keys;
+- ``?field text`` includes the line only when field is truthy, and
+  ``?field=value text`` only when str(field) equals value;
+- a bare ``?field`` or ``?field=value`` line opens a block of lines with
+  that condition, closed by ``?end``. Blocks do not nest.
+
+Compiled templates are cached per (template, locale, channel). A locale
+without its own file for a template falls back to DEFAULT_LOCALE.
+"""
+
+from functools import lru_cache
+import logging
+from pathlib import Path
+import re
+from string import Formatter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCALE = "en"
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent.parent / "templates" / "notifications"
+
+_CONDITION = re.compile(r"\?(\w+)(?:=(\S+))?(?: (.*))?")
+_FIELD = re.compile(r"\w+")
+_SUBJECT_PREFIX = "Subject:"
+_ESCAPES = {"\\": "\\\\", "'": "\\'", "\n": "\\n", "\r": "\\r", "\t": "\\t", "{": "{{", "}": "}}"}
+
+# Dates in a bulk run repeat, and strftime dominates rendering them
+_strftime = lru_cache(maxsize=4096)(format)
+
+# (text, condition field, condition value); field is None for unconditional text
+_Part = Tuple[str, Optional[str], Optional[str]]
+
+
+class TemplateError(Exception):
+    """A template is missing, malformed, or cannot render a context."""
+
+
+class RenderedMessage(NamedTuple):
+    """Subject (None for channels without one) and body of a message."""
+
+    subject: Optional[str]
+    body: str
+
+
+def _split_parts(text: str, origin: str) -> List[_Part]:
+    """Split template text into runs of lines sharing one condition."""
+    parts: List[List[Any]] = []
+    block: Optional[Tuple[str, Optional[str]]] = None
+
+    def append(chunk: str, condition: Optional[Tuple[str, Optional[str]]]) -> None:
+        field, value = condition or (None, None)
+        if parts and parts[-1][1] == field and parts[-1][2] == value:
+            parts[-1][0] += chunk
+        else:
+            parts.append([chunk, field, value])
+
+    for number, line in enumerate(text.splitlines(keepends=True), 1):
+        content = line.rstrip("\n")
+        newline = line[len(content):]
+        if content == "?end":
+            if block is None:
+                raise TemplateError(f"{origin}:{number}: ?end without an open block")
+            block = None
+            continue
+        match = _CONDITION.fullmatch(content) if content.startswith("?") else None
+        if match is None:
+            append(line, block)
+            continue
+        if block is not None:
+            raise TemplateError(f"{origin}:{number}: conditions cannot be nested")
+        field, value, rest = match.groups()
+        if rest is None:
+            block = (field, value)
+        else:
+            append(rest + newline, (field, value))
+
+    if block is not None:
+        raise TemplateError(f"{origin}: block ?{block[0]} is never closed")
+    return [(chunk, field, value) for chunk, field, value in parts]
+
+
+def _escape(text: str) -> str:
+    """Escape literal text for the inside of a single-quoted f-string."""
+    return "".join(
+        _ESCAPES.get(char) or (char if char.isprintable() else f"\\U{ord(char):08x}")
+        for char in text
+    )
+
+
+def _fstring(text: str, origin: str, constants: Dict[str, Any]) -> str:
+    """
+    Source of an f-string producing text with its placeholders filled from c.
+    strftime specs are passed through constants, since f-string expressions
+    cannot hold quotes or backslashes.
+    """
+    source = []
+    try:
+        parsed = list(Formatter().parse(text))
+    except ValueError as e:
+        raise TemplateError(f"{origin}: {e}")
+    for literal, field, spec, conversion in parsed:
+        source.append(_escape(literal))
+        if field is None:
+            continue
+        if not _FIELD.fullmatch(field) or "{" in (spec or ""):
+            raise TemplateError(f"{origin}: unsupported placeholder {{{field}}}")
+        if spec.startswith("%") and not conversion:
+            name = f"_spec{len(constants)}"
+            constants[name] = spec
+            source.append(f'{{_strftime(c["{field}"], {name})}}')
+            continue
+        source.append(
+            f'{{c["{field}"]'
+            f"{'!' + conversion if conversion else ''}"
+            f"{':' + _escape(spec) if spec else ''}}}"
+        )
+    return "f'" + "".join(source) + "'"
+
+
+def _compile(text: str, origin: str) -> Callable[[Mapping[str, Any]], str]:
+    """Compile template text into a function of a context dict."""
+    parts = _split_parts(text, origin)
+    namespace: Dict[str, Any] = {"_strftime": _strftime}
+    terms = []
+    for chunk, field, value in parts:
+        expression = _fstring(chunk, origin, namespace)
+        if field is None:
+            terms.append(expression)
+        elif value is None:
+            terms.append(f'({expression} if c.get("{field}") else \'\')')
+        else:
+            terms.append(f'({expression} if str(c.get("{field}")) == {value!r} else \'\')')
+    body = " + ".join(terms) or "''"
+    if parts and parts[-1][1] is not None:
+        # A skipped last line leaves the previous line's newline
+        body = f"({body}).rstrip('\\n')"
+
+    exec(compile(f"def render(c):\n    return {body}\n", f"<template {origin}>", "exec"), namespace)
+    return namespace["render"]
+
+
+class CompiledTemplate:
+    """One template for one locale and channel, ready to render."""
+
+    __slots__ = ("name", "locale", "channel", "_subject", "_body")
+
+    def __init__(self, name: str, locale: str, channel: str, source: str):
+        self.name = name
+        self.locale = locale
+        self.channel = channel
+        origin = f"{locale}/{channel}/{name}"
+
+        source = source.rstrip("\n")
+        subject = None
+        if source.startswith(_SUBJECT_PREFIX):
+            first, _, source = source.partition("\n")
+            subject = _compile(first[len(_SUBJECT_PREFIX):].strip(), origin)
+            source = source[1:] if source.startswith("\n") else source
+        self._subject = subject
+        self._body = _compile(source, origin)
+
+    def __repr__(self) -> str:
+        return f"<CompiledTemplate({self.locale}/{self.channel}/{self.name})>"
+
+    def render(self, context: Mapping[str, Any]) -> RenderedMessage:
+        """Render the subject and body for one context."""
+        try:
+            return RenderedMessage(
+                self._subject(context) if self._subject else None,
+                self._body(context),
+            )
+        except (KeyError, AttributeError, ValueError, TypeError) as e:
+            raise TemplateError(f"{self!r} cannot render context: {e!r}")
+
+
+class NotificationTemplates:
+    """Loads, compiles and caches the notification templates of a directory."""
+
+    def __init__(self, directory: Optional[Path] = None, default_locale: str = DEFAULT_LOCALE):
+        self.directory = Path(directory or TEMPLATES_DIR)
+        self.default_locale = default_locale
+        self._compiled: Dict[Tuple[str, str, str], CompiledTemplate] = {}
+        self._loaded = False
+
+    def load(self) -> int:
+        """
+        Compile every template in the directory, replacing any loaded before.
+
+        Returns:
+            Number of templates compiled
+        """
+        compiled = {}
+        for path in sorted(self.directory.glob("*/*/*.txt")):
+            channel_dir = path.parent
+            locale, channel, name = channel_dir.parent.name, channel_dir.name, path.stem
+            compiled[(name, locale, channel)] = CompiledTemplate(
+                name, locale, channel, path.read_text(encoding="utf-8")
+            )
+        self._compiled = compiled
+        self._loaded = True
+        logger.info(f"Compiled {len(compiled)} notification templates from {self.directory}")
+        return len(compiled)
+
+    def get(self, name: str, channel: Any, locale: Optional[str] = None) -> CompiledTemplate:
+        """
+        Get the compiled template for a locale and channel.
+
+        Args:
+            name: Template name, e.g. "health_reminder"
+            channel: NotificationChannel or its value
+            locale: Locale (defaults to the default locale)
+        """
+        if not self._loaded:
+            self.load()
+        channel = getattr(channel, "value", channel)
+        locale = locale or self.default_locale
+        key = (name, locale, channel)
+        template = self._compiled.get(key)
+        if template is None:
+            template = self._compiled.get((name, self.default_locale, channel))
+            if template is None:
+                raise TemplateError(f"No {channel} template {name!r} for locale {locale!r}")
+            # Cache the fallback under the requested locale
+            self._compiled[key] = template
+        return template
+
+    def render(
+        self,
+        name: str,
+        channel: Any,
+        context: Mapping[str, Any],
+        locale: Optional[str] = None
+    ) -> RenderedMessage:
+        """Render one message."""
+        return self.get(name, channel, locale).render(context)
+
+    def render_many(
+        self,
+        name: str,
+        channel: Any,
+        contexts: Iterable[Mapping[str, Any]],
+        locale: Optional[str] = None
+    ) -> List[RenderedMessage]:
+        """Render one message per context with a single template lookup."""
+        render = self.get(name, channel, locale).render
+        return [render(context) for context in contexts]
+
+
+# Global template registry instance
+notification_templates = NotificationTemplates()
+
+
+def get_notification_templates() -> NotificationTemplates:
+    """Get notification template registry instance."""
+    return notification_templates
@@ -0,0 +1,202 @@
+"""
+Channel transports used by the outbox workers.
+
+A transport sends one batch of rendered messages and reports each message's
+outcome. Transports are created once per worker process and keep their
+connections open between batches; WorkerRuntime closes them on shutdown.
+
+Email goes over a small pool of persistent SMTP connections (aiosmtplib), so
+a batch pays for neither TCP nor TLS nor AUTH setup per message. Every
+email carries a Message-ID derived from its idempotency key, so a message
+re-sent after a lost acknowledgement can be recognised downstream. SMS and
+push have no provider configured yet and log their batches; a provider
+client implements send_batch with one API call per batch, passing each
+message's idempotency key.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from email.message import EmailMessage
+import hashlib
+import logging
+from typing import Dict, List, Optional
+
+import aiosmtplib
+
+from app.core.config import settings
+from app.models.notification import NotificationChannel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OutboundMessage:
+    """A rendered notification ready to send."""
+
+    idempotency_key: str
+    recipient: str
+    body: str
+    subject: Optional[str] = None
+
+
+class Transport:
+    """Sends batches of messages on one channel."""
+
+    async def send_batch(self, messages: List[OutboundMessage]) -> List[Optional[Exception]]:
+        """
+        Send messages; returns None for each delivered message and the
+        error for each failed one, in order.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Close any open connections."""
+
+
+class SmtpTransport(Transport):
+    """Email over a pool of persistent SMTP connections."""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        sender: Optional[str] = None,
+        pool_size: int = 2,
+        timeout: float = 30.0
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.sender = sender or username
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._pool: Optional[asyncio.Queue] = None
+        self._connections: List[aiosmtplib.SMTP] = []
+
+    def __repr__(self) -> str:
+        return f"<SmtpTransport(host={self.hostname}:{self.port}, pool_size={self.pool_size})>"
+
+    @classmethod
+    def from_settings(cls) -> "SmtpTransport":
+        return cls(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME or None,
+            password=settings.SMTP_PASSWORD or None,
+            use_tls=settings.SMTP_USE_TLS,
+            sender=settings.SMTP_FROM_EMAIL,
+            pool_size=settings.SMTP_POOL_SIZE,
+            timeout=settings.SMTP_TIMEOUT,
+        )
+
+    def _client(self) -> aiosmtplib.SMTP:
+        # Port 465 speaks TLS from the first byte; other ports upgrade with STARTTLS
+        implicit_tls = self.use_tls and self.port == 465
+        return aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=implicit_tls,
+            start_tls=self.use_tls and not implicit_tls,
+            timeout=self.timeout,
+        )
+
+    async def _ensure_connected(self, client: aiosmtplib.SMTP) -> None:
+        if client.is_connected:
+            return
+        await client.connect()
+        if self.username and self.password:
+            await client.login(self.username, self.password)
+
+    def _email(self, message: OutboundMessage) -> EmailMessage:
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = message.recipient
+        email["Subject"] = message.subject or ""
+        domain = (self.sender or "localhost").rpartition("@")[2] or "localhost"
+        digest = hashlib.sha256(message.idempotency_key.encode()).hexdigest()[:32]
+        email["Message-ID"] = f"<{digest}@{domain}>"
+        email["X-Idempotency-Key"] = message.idempotency_key
+        email.set_content(message.body)
+        return email
+
+    async def _send(self, message: OutboundMessage) -> Optional[Exception]:
+        client = await self._pool.get()
+        try:
+            await self._ensure_connected(client)
+            await client.send_message(self._email(message))
+            return None
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            return e
+        except Exception as e:
+            # The connection may be broken; reconnect on next use
+            if client.is_connected:
+                client.close()
+            return e
+        finally:
+            self._pool.put_nowait(client)
+
+    async def send_batch(self, messages: List[OutboundMessage]) -> List[Optional[Exception]]:
+        if self._pool is None:
+            self._pool = asyncio.Queue()
+            for _ in range(self.pool_size):
+                client = self._client()
+                self._connections.append(client)
+                self._pool.put_nowait(client)
+        return list(await asyncio.gather(*(self._send(message) for message in messages)))
+
+    async def close(self) -> None:
+        for client in self._connections:
+            if client.is_connected:
+                try:
+                    await client.quit()
+                except Exception:
+                    client.close()
+        self._connections = []
+        self._pool = None
+
+
+class LogTransport(Transport):
+    """Logs messages for channels without a provider."""
+
+    def __init__(self, channel: NotificationChannel):
+        self.channel = channel
+
+    async def send_batch(self, messages: List[OutboundMessage]) -> List[Optional[Exception]]:
+        for message in messages:
+            logger.info(
+                f"{self.channel.value.upper()} NOTIFICATION - To: {message.recipient}, "
+                f"Key: {message.idempotency_key}"
+            )
+            logger.info(f"Message: {message.body}")
+        return [None] * len(messages)
+
+
+# Transports of this worker process, created on first use
+_transports: Dict[NotificationChannel, Transport] = {}
+
+
+def get_transport(channel: NotificationChannel) -> Transport:
+    """Get this process's transport for a channel."""
+    transport = _transports.get(channel)
+    if transport is None:
+        if channel == NotificationChannel.EMAIL:
+            transport = SmtpTransport.from_settings()
+        else:
+            transport = LogTransport(channel)
+        _transports[channel] = transport
+    return transport
+
+
+async def close_transports() -> None:
+    """Close every transport of this process."""
+    while _transports:
+        _, transport = _transports.popitem()
+        try:
+            await transport.close()
+        except Exception as e:
+            logger.error(f"Failed to close {transport!r}: {e}")
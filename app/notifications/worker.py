@@ -0,0 +1,148 @@
+"""
+Draining the notification outbox, one channel per worker.
+
+Each batch is its own transaction:
+
+1. claim the channel's due pending rows with FOR UPDATE SKIP LOCKED, so
+   several workers for one channel take disjoint batches;
+2. render them (app.notifications.renderers) and send them in one
+   transport call;
+3. record each outcome and commit. Delivered rows are marked sent, rows with
+   nothing to send are skipped, and failed rows are retried with
+   exponential backoff until NOTIFICATION_MAX_ATTEMPTS, then dead-lettered
+   with their last error.
+
+A worker that dies mid-batch releases its locks, and the batch is sent again
+by the next run; the idempotency key travels with every message so the
+provider or mail server can recognise the repeat.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import logging
+from typing import Optional
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.notification import NotificationChannel, NotificationOutbox, OutboxStatus
+from .renderers import render_rows
+from .transports import OutboundMessage, Transport, get_transport
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxDrainResult:
+    """Totals of one drain run for one channel."""
+
+    channel: str
+    sent: int = 0
+    skipped: int = 0
+    retried: int = 0
+    dead: int = 0
+    batches: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "channel": self.channel,
+            "sent": self.sent,
+            "skipped": self.skipped,
+            "retried": self.retried,
+            "dead": self.dead,
+            "batches": self.batches,
+        }
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt after the given number of failures."""
+    seconds = settings.NOTIFICATION_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.NOTIFICATION_RETRY_MAX_SECONDS))
+
+
+async def claim_outbox_batch(db: AsyncSession, channel: NotificationChannel, limit: int):
+    """Lock the channel's next due pending rows until the caller commits."""
+    result = await db.execute(
+        select(NotificationOutbox)
+        .where(
+            and_(
+                NotificationOutbox.channel == channel,
+                NotificationOutbox.status == OutboxStatus.PENDING,
+                NotificationOutbox.next_attempt_at <= func.now()
+            )
+        )
+        .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(result.scalars().all())
+
+
+async def drain_outbox(
+    db: AsyncSession,
+    channel: NotificationChannel,
+    transport: Optional[Transport] = None,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None
+) -> OutboxDrainResult:
+    """
+    Send the channel's due notifications until none are left or max_batches
+    batches have been sent.
+
+    Args:
+        db: Session used for the batch transactions
+        channel: Channel to drain
+        transport: Sends the batches (defaults to the process's transport)
+        batch_size: Rows per batch
+        max_batches: Batches per run, so one run cannot hold the worker indefinitely
+
+    Returns:
+        Sent, skipped, retried and dead-lettered counts
+    """
+    transport = transport or get_transport(channel)
+    batch_size = batch_size or settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+    max_batches = max_batches or settings.NOTIFICATION_OUTBOX_MAX_BATCHES
+    result = OutboxDrainResult(channel.value)
+
+    while result.batches < max_batches:
+        rows = await claim_outbox_batch(db, channel, batch_size)
+        if not rows:
+            await db.rollback()
+            break
+        result.batches += 1
+
+        rendered = await render_rows(db, rows)
+        sendable = [row for row in rows if isinstance(rendered[row.id], OutboundMessage)]
+        errors = await transport.send_batch([rendered[row.id] for row in sendable]) if sendable else []
+        outcomes = {row.id: error for row, error in zip(sendable, errors)}
+
+        now = datetime.now(timezone.utc)
+        for row in rows:
+            outcome = outcomes.get(row.id, rendered[row.id])
+            if row.id in outcomes and outcome is None:
+                row.status = OutboxStatus.SENT
+                row.sent_at = now
+                result.sent += 1
+            elif outcome is None:
+                row.status = OutboxStatus.SKIPPED
+                result.skipped += 1
+            else:
+                row.attempts += 1
+                row.last_error = str(outcome)[:2000]
+                if row.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+                    row.status = OutboxStatus.DEAD
+                    result.dead += 1
+                    logger.error(
+                        f"Dead-lettered {channel.value} notification {row.idempotency_key} "
+                        f"after {row.attempts} attempts: {row.last_error}"
+                    )
+                else:
+                    row.next_attempt_at = now + retry_delay(row.attempts)
+                    result.retried += 1
+        await db.commit()
+
+        if len(rows) < batch_size:
+            break
+
+    return result
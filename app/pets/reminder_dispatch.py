@@ -0,0 +1,108 @@
+"""
+Chunked queueing of due health reminders.
+
+Due reminders are drained in chunks, each in its own transaction:
+
+1. claim the next chunk in (reminder_date, id) order with FOR UPDATE SKIP
+   LOCKED, so parallel workers take disjoint chunks;
+2. queue an outbox row per enabled channel for every reminder in the chunk;
+3. mark the chunk sent with one UPDATE and commit, so the queued
+   notifications and the flags are checkpointed together.
+
+Sending, with its retries, is left to the channel outbox workers
+(app.notifications.worker).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+import logging
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.notification import NotificationChannel
+from app.notifications.outbox import HEALTH_REMINDER, enqueue_notifications, outbox_row
+from app.pets.services import PetService
+from app.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReminderDispatchResult:
+    """Totals of one dispatch run."""
+
+    reminders: int = 0
+    queued: int = 0
+    chunks: int = 0
+
+    def as_dict(self) -> dict:
+        return {"reminders": self.reminders, "queued": self.queued, "chunks": self.chunks}
+
+
+def enabled_channels() -> Tuple[NotificationChannel, ...]:
+    """Channels health reminders go out on, per the notification settings."""
+    service = NotificationService()
+    return tuple(
+        channel for channel, enabled in (
+            (NotificationChannel.EMAIL, service.email_enabled),
+            (NotificationChannel.SMS, service.sms_enabled),
+            (NotificationChannel.PUSH, service.push_enabled),
+        )
+        if enabled
+    )
+
+
+async def dispatch_due_reminders(
+    db: AsyncSession,
+    due_date: Optional[date] = None,
+    chunk_size: Optional[int] = None
+) -> ReminderDispatchResult:
+    """
+    Queue every due, unsent reminder this worker can claim.
+
+    Args:
+        db: Session used for the chunk transactions
+        due_date: Queue reminders dated on or before this date (defaults to today)
+        chunk_size: Reminders per transaction
+
+    Returns:
+        Reminder and queued notification counts
+    """
+    due_date = due_date or date.today()
+    chunk_size = chunk_size or settings.HEALTH_REMINDER_CHUNK_SIZE
+    channels = enabled_channels()
+    pet_service = PetService(db)
+    result = ReminderDispatchResult()
+    after = None
+
+    while True:
+        reminders = await pet_service.claim_due_reminders(due_date, chunk_size, after=after)
+        if not reminders:
+            await db.rollback()
+            break
+        after = (reminders[-1].reminder_date, reminders[-1].id)
+        result.chunks += 1
+
+        rows = [
+            outbox_row(
+                channel,
+                HEALTH_REMINDER,
+                f"{HEALTH_REMINDER}:{reminder.id}:{reminder.reminder_date.isoformat()}:{channel.value}",
+                payload={"reminder_id": str(reminder.id)}
+            )
+            for reminder in reminders
+            for channel in channels
+        ]
+        await enqueue_notifications(db, rows)
+        await pet_service.mark_reminders_sent([reminder.id for reminder in reminders])
+
+        result.reminders += len(reminders)
+        result.queued += len(rows)
+        logger.info(f"Reminder chunk {result.chunks}: {len(rows)} notifications queued")
+
+        if len(reminders) < chunk_size:
+            break
+
+    return result
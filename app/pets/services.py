@@ -10,11 +10,48 @@ from typing import List, Tuple, Optional, Dict, Any, Union
 from datetime import date, datetime
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, delete
+from sqlalchemy import bindparam, select, func, and_, delete, tuple_, update
 from sqlalchemy.orm import selectinload
 
 from app.models.pet import Pet, PetGender, PetSize, HealthRecord, HealthRecordType, Reminder
 from app.core.exceptions import VetClinicException, NotFoundError, ValidationError
+from app.core.loader_profiles import Include, LoaderProfile
+from app.core.search import TextSearch
+from app.core.statement_cache import StatementCache
+from app.app_helpers.pagination_helpers import KeysetSort, count_rows, keyset_page, paginate_query
+
+
+PET_LIST_PROFILE = LoaderProfile(
+    "pets.list",
+    includes={
+        "include_health_records": Include(selectinload(Pet.health_records)),
+        "include_owner": Include(selectinload(Pet.owner)),
+    },
+)
+
+PET_DETAIL_PROFILE = LoaderProfile(
+    "pets.detail",
+    includes={
+        "include_health_records": Include(selectinload(Pet.health_records)),
+        "include_owner": Include(selectinload(Pet.owner)),
+        "include_appointments": Include(selectinload(Pet.appointments)),
+    },
+)
+
+PET_BY_ID = StatementCache(
+    "pets.by_id",
+    lambda: select(Pet).where(Pet.id == bindparam("pet_id")),
+    profile=PET_DETAIL_PROFILE,
+)
+
+PET_SEARCH = TextSearch(Pet.name, Pet.breed, Pet.species)
+
+# Sorts available to cursor pagination; "age" sorts on the nullable birth
+# date and is offset-only.
+PET_SORTS = {
+    "name": KeysetSort("name", [Pet.name], Pet.id),
+    "created_at": KeysetSort("created_at", [Pet.created_at], Pet.id, descending=True),
+}
 
 
 class PetService:
@@ -37,8 +74,10 @@ class PetService:
         include_health_records: bool = False,  # V2 parameter
         include_owner: bool = False,  # V2 parameter
         sort_by: Optional[str] = None,  # V2 parameter
+        cursor: Optional[str] = None,  # V2 parameter
+        count_mode: str = "exact",  # V2 parameter
         **kwargs
-    ) -> Tuple[List[Pet], int]:
+    ) -> Tuple[List[Pet], Optional[int]]:
         """
         List pets with pagination and filtering.
         Supports dynamic parameters for different API versions.
@@ -52,14 +91,16 @@ class PetService:
             gender: Filter by gender
             size: Filter by size
             is_active: Filter by active status
-            search: Search term for name or breed
+            search: Search term for name, breed or species; ranked unless sort_by is given
             include_health_records: Include health records (V2)
             include_owner: Include owner information (V2)
             sort_by: Sort by field (V2)
+            cursor: Continue after this cursor instead of using page (V2)
+            count_mode: Total count mode: exact, estimate or none (V2)
             **kwargs: Additional parameters for future versions
             
         Returns:
-            Tuple of (pets list, total count)
+            Tuple of (pets page, total count); the page carries next_cursor
         """
         try:
             # Build base query
@@ -97,53 +138,40 @@ class PetService:
             if is_active is not None:
                 conditions.append(Pet.is_active == is_active)
             
-            if search:
-                search_term = f"%{search}%"
-                conditions.append(
-                    or_(
-                        Pet.name.ilike(search_term),
-                        Pet.breed.ilike(search_term),
-                        Pet.species.ilike(search_term)
-                    )
-                )
+            search_condition = PET_SEARCH.condition(search)
+            if search_condition is not None:
+                conditions.append(search_condition)
             
             if conditions:
                 query = query.where(and_(*conditions))
                 count_query = count_query.where(and_(*conditions))
             
-            # Add relationships if requested (V2)
-            if include_health_records:
-                query = query.options(selectinload(Pet.health_records))
-            
-            if include_owner:
-                query = query.options(selectinload(Pet.owner))
-            
             # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
-            
-            # Apply sorting (V2 feature)
-            if sort_by:
-                if sort_by == "name":
-                    query = query.order_by(Pet.name)
-                elif sort_by == "created_at":
-                    query = query.order_by(Pet.created_at.desc())
-                elif sort_by == "age":
-                    query = query.order_by(Pet.birth_date.desc())
-                else:
-                    query = query.order_by(Pet.created_at.desc())
+            total = await count_rows(self.db, count_query, query, count_mode)
+            
+            # Apply sorting (V2 feature); searches default to relevance
+            if search_condition is not None and not sort_by:
+                keyset = None
+                query = query.order_by(PET_SEARCH.rank(search).desc(), Pet.name, Pet.id)
+            elif sort_by == "age":
+                keyset = None
+                query = query.order_by(Pet.birth_date.desc())
             else:
-                query = query.order_by(Pet.created_at.desc())
+                keyset = PET_SORTS.get(sort_by, PET_SORTS["created_at"])
             
             # Apply pagination
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
-            
-            # Execute query
-            result = await self.db.execute(query)
+            query = paginate_query(query, page, per_page, cursor=cursor, keyset=keyset)
+            
+            # Execute query with the relationships requested (V2)
+            result = await PET_LIST_PROFILE.execute(
+                self.db,
+                query,
+                include_health_records=include_health_records,
+                include_owner=include_owner,
+            )
             pets = result.scalars().all()
             
-            return list(pets), total
+            return keyset_page(pets, per_page, keyset), total
             
         except Exception as e:
             if isinstance(e, VetClinicException):
@@ -175,19 +203,14 @@ class PetService:
             NotFoundError: If pet not found
         """
         try:
-            query = select(Pet).where(Pet.id == pet_id)
-            
-            # Add optional relationships based on version needs
-            if include_health_records:
-                query = query.options(selectinload(Pet.health_records))
-            
-            if include_owner:
-                query = query.options(selectinload(Pet.owner))
-            
-            if include_appointments:
-                query = query.options(selectinload(Pet.appointments))
-            
-            result = await self.db.execute(query)
+            # Prebuilt per include combination; only pet_id is bound per call
+            result = await PET_BY_ID.execute(
+                self.db,
+                {"pet_id": pet_id},
+                include_health_records=include_health_records,
+                include_owner=include_owner,
+                include_appointments=include_appointments,
+            )
             pet = result.scalar_one_or_none()
             
             if not pet:
@@ -502,12 +525,11 @@ class PetService:
             if is_active is not None:
                 query = query.where(Pet.is_active == is_active)
             
-            if include_health_records:
-                query = query.options(selectinload(Pet.health_records))
-            
             query = query.order_by(Pet.created_at.desc())
             
-            result = await self.db.execute(query)
+            result = await PET_LIST_PROFILE.execute(
+                self.db, query, include_health_records=include_health_records
+            )
             pets = result.scalars().all()
             
             return list(pets)
@@ -829,6 +851,81 @@ class PetService:
         except Exception as e:
             raise VetClinicException(f"Failed to get due reminders: {str(e)}")
 
+    async def claim_due_reminders(
+        self,
+        due_date: date,
+        limit: int,
+        after: Optional[Tuple[date, uuid.UUID]] = None
+    ) -> List[Reminder]:
+        """
+        Lock the next chunk of due reminders for sending.
+        
+        Rows are taken in (reminder_date, id) order after the given position
+        with FOR UPDATE SKIP LOCKED, so concurrent workers claim disjoint
+        chunks. The locks are held until the caller commits.
+        
+        Args:
+            due_date: Send reminders dated on or before this date
+            limit: Chunk size
+            after: (reminder_date, id) of the last reminder of the previous chunk
+            
+        Returns:
+            Claimed reminders, oldest first
+        """
+        try:
+            query = select(Reminder).where(
+                and_(
+                    Reminder.reminder_date <= due_date,
+                    Reminder.is_sent == False,
+                    Reminder.is_completed == False
+                )
+            )
+            if after is not None:
+                query = query.where(tuple_(Reminder.reminder_date, Reminder.id) > tuple_(*after))
+            
+            query = (
+                query.order_by(Reminder.reminder_date, Reminder.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            
+            result = await self.db.execute(query)
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            raise VetClinicException(f"Failed to claim due reminders: {str(e)}")
+
+    async def mark_reminders_sent(self, reminder_ids: List[uuid.UUID]) -> int:
+        """
+        Mark reminders as sent with a single UPDATE and commit.
+        
+        Committing also releases the locks taken by claim_due_reminders, so it
+        is called even when nothing was sent.
+        
+        Args:
+            reminder_ids: Reminder UUIDs
+            
+        Returns:
+            Number of reminders marked
+        """
+        try:
+            marked = 0
+            if reminder_ids:
+                result = await self.db.execute(
+                    update(Reminder)
+                    .where(Reminder.id.in_(reminder_ids))
+                    .values(is_sent=True, sent_at=func.now())
+                    .execution_options(synchronize_session=False)
+                )
+                marked = result.rowcount
+            
+            await self.db.commit()
+            return marked
+            
+        except Exception as e:
+            await self.db.rollback()
+            raise VetClinicException(f"Failed to mark reminders as sent: {str(e)}")
+
     async def mark_reminder_sent(self, reminder_id: uuid.UUID) -> Reminder:
         """
         Mark a reminder as sent.
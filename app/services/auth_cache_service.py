@@ -1,8 +1,17 @@
 """
 Authentication caching service for Redis-based performance optimization.
 Handles caching of user data, JWT validation results, and cache invalidation.
+
+JWT validations are cached in two tiers: a per-worker LocalTokenCache in
+front of Redis. Revoking tokens (logout, deleted users) deletes them from
+Redis and publishes on AUTH_REVOCATION_CHANNEL so every worker's
+listen_for_revocations task evicts them locally too.
+
+Cached user data backs the request's AuthenticatedPrincipal and has its own
+short-lived in-process tier, evicted the same way whenever the user changes.
 """
 
+import asyncio
 import json
 import logging
 from typing import Optional, Dict, Any, List
@@ -13,10 +22,14 @@ from app.core.redis import redis_client
 from app.core.config import get_settings
 from app.models.user import User
 from app.schemas.clerk_schemas import ClerkUser
+from app.services.local_token_cache import LocalTokenCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Pub/sub channel carrying {"token_hash"|"clerk_id"|"session_id"|"user_data": ...} revocations
+AUTH_REVOCATION_CHANNEL = "auth:revocations"
+
 
 class AuthCacheService:
     """Service for authentication-related caching operations."""
@@ -25,6 +38,10 @@ class AuthCacheService:
         self.redis = redis_client
         self.user_cache_ttl = settings.REDIS_USER_CACHE_TTL
         self.jwt_cache_ttl = settings.REDIS_JWT_CACHE_TTL
+        self.local_jwt_cache = LocalTokenCache()
+        self.local_user_cache = LocalTokenCache(ttl_seconds=settings.USER_LOCAL_CACHE_TTL)
+        self.jwt_redis_hits = 0
+        self.jwt_redis_misses = 0
 
     # Cache key generators
     def _user_cache_key(self, clerk_id: str) -> str:
@@ -35,6 +52,14 @@ class AuthCacheService:
         """Generate cache key for JWT validation results."""
         return f"auth:jwt:{token_hash}"
 
+    def _user_tokens_key(self, clerk_id: str) -> str:
+        """Generate cache key for the set of a user's cached token hashes."""
+        return f"auth:jwt:user:{clerk_id}"
+
+    def _session_tokens_key(self, session_id: str) -> str:
+        """Generate cache key for the set of a session's cached token hashes."""
+        return f"auth:jwt:session:{session_id}"
+
     def _user_permissions_key(self, user_id: str) -> str:
         """Generate cache key for user permissions."""
         return f"auth:permissions:{user_id}"
@@ -48,12 +73,13 @@ class AuthCacheService:
         return hashlib.sha256(token.encode()).hexdigest()[:32]
 
     # User data caching
-    async def cache_user_data(self, user: User) -> bool:
+    async def cache_user_data(self, user: User, clinic_id: Optional[str] = None) -> bool:
         """
         Cache user data in Redis.
 
         Args:
             user: User object to cache
+            clinic_id: Clinic a veterinarian works at, needed to resolve a principal
 
         Returns:
             True if caching successful
@@ -81,11 +107,16 @@ class AuthCacheService:
                 "notification_settings": user.notification_settings or {},
                 "created_at": user.created_at.isoformat() if user.created_at else None,
                 "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+                "clinic_id": str(clinic_id) if clinic_id else None,
                 "cached_at": datetime.utcnow().isoformat()
             }
 
             success = await self.redis.set_json(cache_key, user_data, self.user_cache_ttl)
             
+            # Other workers may hold the previous role or status in process
+            self.local_user_cache.evict_token(user.clerk_id)
+            await self.redis.publish(AUTH_REVOCATION_CHANNEL, {"user_data": user.clerk_id})
+            
             if success:
                 logger.debug("Cached user data for clerk_id: %s", user.clerk_id)
             else:
@@ -122,6 +153,25 @@ class AuthCacheService:
             logger.error("Error retrieving cached user data for clerk_id %s: %s", clerk_id, str(e))
             return None
 
+    async def get_user_data(self, clerk_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached user data from the in-process tier, then Redis.
+
+        Args:
+            clerk_id: Clerk user ID
+
+        Returns:
+            User data dict or None if not cached in either tier
+        """
+        user_data = self.local_user_cache.get(clerk_id)
+        if user_data is not None:
+            return user_data
+
+        user_data = await self.get_cached_user_data(clerk_id)
+        if user_data:
+            self.local_user_cache.put(clerk_id, user_data)
+        return user_data
+
     async def invalidate_user_cache(self, clerk_id: str) -> bool:
         """
         Invalidate cached user data.
@@ -134,7 +184,9 @@ class AuthCacheService:
         """
         try:
             cache_key = self._user_cache_key(clerk_id)
+            self.local_user_cache.evict_token(clerk_id)
             success = await self.redis.delete(cache_key)
+            await self.redis.publish(AUTH_REVOCATION_CHANNEL, {"user_data": clerk_id})
             
             if success:
                 logger.debug("Invalidated user cache for clerk_id: %s", clerk_id)
@@ -181,6 +233,14 @@ class AuthCacheService:
             success = await self.redis.set_json(cache_key, cache_data, ttl)
             
             if success:
+                # Index by user and session so they can be revoked together
+                index_keys = []
+                if validation_result.get("clerk_id"):
+                    index_keys.append(self._user_tokens_key(validation_result["clerk_id"]))
+                if validation_result.get("session_id"):
+                    index_keys.append(self._session_tokens_key(validation_result["session_id"]))
+                if index_keys:
+                    await self.redis.add_to_sets(index_keys, token_hash, self.jwt_cache_ttl)
                 logger.debug("Cached JWT validation result for token hash: %s", token_hash)
             else:
                 logger.warning("Failed to cache JWT validation result")
@@ -202,32 +262,87 @@ class AuthCacheService:
             Validation result dict or None if not found/expired
         """
         try:
-            token_hash = self._hash_token(token)
-            cache_key = self._jwt_cache_key(token_hash)
-            
-            validation_data = await self.redis.get_json(cache_key)
-            
-            if validation_data:
-                # Check if token is still valid (not expired)
-                exp_timestamp = validation_data.get("exp")
-                if exp_timestamp:
-                    token_exp = datetime.fromtimestamp(exp_timestamp)
-                    if datetime.utcnow() >= token_exp:
-                        # Token has expired, remove from cache
-                        await self.redis.delete(cache_key)
-                        logger.debug("Removed expired JWT from cache: %s", token_hash)
-                        return None
-                
-                logger.debug("Retrieved cached JWT validation for token hash: %s", token_hash)
-                return validation_data
-            
-            logger.debug("No cached JWT validation found for token hash: %s", token_hash)
+            return await self._get_redis_jwt_validation(self._hash_token(token))
+
+        except Exception as e:
+            logger.error("Error retrieving cached JWT validation: %s", str(e))
             return None
 
+    async def _get_redis_jwt_validation(self, token_hash: str) -> Optional[Dict[str, Any]]:
+        cache_key = self._jwt_cache_key(token_hash)
+        
+        validation_data = await self.redis.get_json(cache_key)
+        
+        if validation_data:
+            # Check if token is still valid (not expired)
+            exp_timestamp = validation_data.get("exp")
+            if exp_timestamp:
+                token_exp = datetime.fromtimestamp(exp_timestamp)
+                if datetime.utcnow() >= token_exp:
+                    # Token has expired, remove from cache
+                    await self.redis.delete(cache_key)
+                    logger.debug("Removed expired JWT from cache: %s", token_hash)
+                    self.jwt_redis_misses += 1
+                    return None
+            
+            logger.debug("Retrieved cached JWT validation for token hash: %s", token_hash)
+            self.jwt_redis_hits += 1
+            return validation_data
+        
+        logger.debug("No cached JWT validation found for token hash: %s", token_hash)
+        self.jwt_redis_misses += 1
+        return None
+
+    async def get_jwt_validation(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached JWT validation result from the in-process tier, then Redis.
+
+        Redis hits are copied into the in-process tier.
+
+        Args:
+            token: JWT token
+
+        Returns:
+            Validation result dict or None if not cached in either tier
+        """
+        token_hash = self._hash_token(token)
+        validation_data = self.local_jwt_cache.get(token_hash)
+        if validation_data is not None:
+            return validation_data
+
+        try:
+            validation_data = await self._get_redis_jwt_validation(token_hash)
         except Exception as e:
             logger.error("Error retrieving cached JWT validation: %s", str(e))
             return None
 
+        if validation_data:
+            self.local_jwt_cache.put(token_hash, validation_data)
+        return validation_data
+
+    def peek_jwt_validation(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a JWT validation result from the in-process tier only.
+
+        Does not count towards hit ratios; for cheap identity lookups such as
+        rate limiting, before the token is verified.
+        """
+        return self.local_jwt_cache.peek(self._hash_token(token))
+
+    async def store_jwt_validation(self, token: str, validation_result: Dict[str, Any]) -> bool:
+        """
+        Cache a JWT validation result in both tiers.
+
+        Args:
+            token: JWT token
+            validation_result: Token validation result
+
+        Returns:
+            True if the Redis write succeeded
+        """
+        self.local_jwt_cache.put(self._hash_token(token), validation_result)
+        return await self.cache_jwt_validation(token, validation_result)
+
     async def invalidate_jwt_cache(self, token: str) -> bool:
         """
         Invalidate cached JWT token validation.
@@ -241,7 +356,9 @@ class AuthCacheService:
         try:
             token_hash = self._hash_token(token)
             cache_key = self._jwt_cache_key(token_hash)
+            self.local_jwt_cache.evict_token(token_hash)
             success = await self.redis.delete(cache_key)
+            await self.redis.publish(AUTH_REVOCATION_CHANNEL, {"token_hash": token_hash})
             
             if success:
                 logger.debug("Invalidated JWT cache for token hash: %s", token_hash)
@@ -252,6 +369,101 @@ class AuthCacheService:
             logger.error("Error invalidating JWT cache: %s", str(e))
             return False
 
+    async def revoke_jwt_validations(
+        self,
+        clerk_id: Optional[str] = None,
+        session_id: Optional[str] = None
+    ) -> bool:
+        """
+        Drop every cached JWT validation of a user or session, in all workers.
+
+        Args:
+            clerk_id: Clerk user ID whose tokens to drop
+            session_id: Session ID whose tokens to drop
+
+        Returns:
+            True if the revocation was applied and published
+        """
+        revocation = {key: value for key, value in (("clerk_id", clerk_id), ("session_id", session_id)) if value}
+        if not revocation:
+            return True
+
+        try:
+            self.apply_revocation(revocation)
+
+            index_keys = []
+            if clerk_id:
+                index_keys.append(self._user_tokens_key(clerk_id))
+            if session_id:
+                index_keys.append(self._session_tokens_key(session_id))
+            token_hashes = set()
+            for index_key in index_keys:
+                token_hashes.update(await self.redis.set_members(index_key))
+            await self.redis.delete_many(*index_keys, *(self._jwt_cache_key(h) for h in token_hashes))
+
+            await self.redis.publish(AUTH_REVOCATION_CHANNEL, revocation)
+            logger.debug("Revoked cached JWT validations: %s", revocation)
+            return True
+
+        except Exception as e:
+            logger.error("Error revoking cached JWT validations %s: %s", revocation, str(e))
+            return False
+
+    def apply_revocation(self, revocation: Dict[str, Any]) -> int:
+        """
+        Evict revoked tokens from this worker's in-process tier.
+
+        Args:
+            revocation: Message with a token_hash, clerk_id, session_id and/or user_data
+
+        Returns:
+            Number of cached validations evicted
+        """
+        evicted = 0
+        if revocation.get("token_hash"):
+            evicted += int(self.local_jwt_cache.evict_token(revocation["token_hash"]))
+        if revocation.get("clerk_id"):
+            evicted += self.local_jwt_cache.evict_user(revocation["clerk_id"])
+            evicted += int(self.local_user_cache.evict_token(revocation["clerk_id"]))
+        if revocation.get("user_data"):
+            evicted += int(self.local_user_cache.evict_token(revocation["user_data"]))
+        if revocation.get("session_id"):
+            evicted += self.local_jwt_cache.evict_session(revocation["session_id"])
+        return evicted
+
+    async def listen_for_revocations(self, retry_delay: float = 1.0) -> None:
+        """
+        Apply revocations published by any worker until cancelled.
+
+        Run once per process as a background task. While disconnected the
+        in-process tier cannot hear revocations, so it is cleared on every
+        (re)connect.
+        """
+        while True:
+            pubsub = None
+            try:
+                pubsub = await self.redis.subscribe(AUTH_REVOCATION_CHANNEL)
+                self.local_jwt_cache.clear()
+                self.local_user_cache.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self.apply_revocation(json.loads(message["data"]))
+                    except (TypeError, ValueError):
+                        logger.warning("Ignoring malformed auth revocation: %r", message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Auth revocation listener failed, retrying: %s", str(e))
+                await asyncio.sleep(retry_delay)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
     # User permissions and role caching
     async def cache_user_permissions(self, user_id: str, permissions: List[str]) -> bool:
         """
@@ -371,31 +583,28 @@ class AuthCacheService:
             user_id: Local user ID
 
         Returns:
-            True if all invalidations successful
+            True if the cache entries were deleted
         """
         try:
-            success = True
-            
-            # Invalidate user data cache
-            if not await self.invalidate_user_cache(clerk_id):
-                success = False
-            
-            # Invalidate permissions cache
-            permissions_key = self._user_permissions_key(user_id)
-            if not await self.redis.delete(permissions_key):
-                success = False
-            
-            # Invalidate role cache
-            role_key = self._user_role_key(user_id)
-            if not await self.redis.delete(role_key):
-                success = False
-            
-            if success:
-                logger.debug("Invalidated all cache for user: clerk_id=%s, user_id=%s", clerk_id, user_id)
-            else:
-                logger.warning("Partial cache invalidation for user: clerk_id=%s, user_id=%s", clerk_id, user_id)
-            
-            return success
+            # Evict this worker's copies, then everything in Redis in one
+            # DELETE: user data, permissions, role and cached token validations
+            self.apply_revocation({"clerk_id": clerk_id})
+            
+            user_tokens_key = self._user_tokens_key(clerk_id)
+            token_hashes = await self.redis.set_members(user_tokens_key)
+            await self.redis.delete_many(
+                self._user_cache_key(clerk_id),
+                self._user_permissions_key(user_id),
+                self._user_role_key(user_id),
+                user_tokens_key,
+                *(self._jwt_cache_key(token_hash) for token_hash in token_hashes)
+            )
+            
+            # Other workers drop their copies of the user and their tokens
+            await self.redis.publish(AUTH_REVOCATION_CHANNEL, {"clerk_id": clerk_id})
+            
+            logger.debug("Invalidated all cache for user: clerk_id=%s, user_id=%s", clerk_id, user_id)
+            return True
 
         except Exception as e:
             logger.error("Error invalidating user-related cache: %s", str(e))
@@ -418,7 +627,8 @@ class AuthCacheService:
                     "jwt_validation": 0,
                     "permissions": 0,
                     "roles": 0
-                }
+                },
+                "jwt_tiers": self.get_jwt_tier_statistics()
             }
             
             # Count cache keys by pattern (this is a simplified approach)
@@ -441,6 +651,22 @@ class AuthCacheService:
                 "error": str(e)
             }
 
+    def get_jwt_tier_statistics(self) -> Dict[str, Any]:
+        """
+        Hit ratios of the two JWT validation cache tiers.
+
+        The Redis tier only sees lookups that missed the in-process tier.
+        """
+        redis_lookups = self.jwt_redis_hits + self.jwt_redis_misses
+        return {
+            "local": self.local_jwt_cache.statistics(),
+            "redis": {
+                "hits": self.jwt_redis_hits,
+                "misses": self.jwt_redis_misses,
+                "hit_ratio": round(self.jwt_redis_hits / redis_lookups, 4) if redis_lookups else 0.0,
+            },
+        }
+
     async def clear_expired_cache(self) -> int:
         """
         Clear expired cache entries (maintenance operation).
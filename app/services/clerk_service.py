@@ -9,7 +9,6 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 import logging
 from functools import lru_cache
-from cryptography.hazmat.primitives import serialization
 
 from app.core.config import get_settings
 from app.core.exceptions import AuthenticationError, ExternalServiceError
@@ -21,6 +20,7 @@ from app.core.error_handlers import (
 )
 from app.core.logging_config import get_auth_logger
 from app.services.auth_cache_service import get_auth_cache_service
+from app.services.jwks_key_manager import JWKSKeyManager
 
 logger = logging.getLogger(__name__)
 auth_logger = get_auth_logger()
@@ -82,15 +82,19 @@ class ClerkService:
             settings.CLERK_JWKS_URL
             or f"{settings.CLERK_JWT_ISSUER}/.well-known/jwks.json"
         )
-        self._jwks_cache = {}
-        self._jwks_cache_time = None
+        self.jwks_keys = JWKSKeyManager(self.jwks_url)
         self.cache_service = get_auth_cache_service()
 
+    @property
+    def _jwks_cache(self) -> Dict[str, Any]:
+        """Parsed public keys by kid, as loaded by the JWKS key manager."""
+        return self.jwks_keys.keys
+
     @with_error_handling("jwt_token_verification")
     async def verify_jwt_token(self, token: str, request_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Verify JWT token with Clerk and extract user information.
-        Uses Redis caching for performance optimization and enhanced error handling.
+        Uses in-process and Redis caching for performance optimization and enhanced error handling.
 
         Args:
             token: JWT token to verify
@@ -104,8 +108,8 @@ class ClerkService:
         """
         async with error_context("jwt_token_verification", request_id=request_id):
             try:
-                # Check cache first
-                cached_result = await self.cache_service.get_cached_jwt_validation(token)
+                # Check the in-process tier, then Redis
+                cached_result = await self.cache_service.get_jwt_validation(token)
                 if cached_result:
                     logger.debug("Using cached JWT validation result")
                     auth_logger.log_authentication_success(
@@ -209,8 +213,8 @@ class ClerkService:
                     "session_id": payload.get("sid"),
                 }
 
-                # Cache the validation result
-                await self.cache_service.cache_jwt_validation(token, validation_result)
+                # Cache the validation result in both tiers
+                await self.cache_service.store_jwt_validation(token, validation_result)
 
                 # Log successful authentication
                 auth_logger.log_authentication_success(
@@ -451,7 +455,7 @@ class ClerkService:
             logger.error(f"Development login error: {e}")
             raise AuthenticationError("Login failed")
 
-    async def _get_public_key(self, kid: str, request_id: Optional[str] = None) -> str:
+    async def _get_public_key(self, kid: str, request_id: Optional[str] = None) -> Any:
         """
         Get public key from Clerk's JWKS endpoint for JWT verification.
 
@@ -467,37 +471,10 @@ class ClerkService:
             AuthenticationError: If key not found
         """
         try:
-            # Check cache first
-            if kid in self._jwks_cache:
-                return self._jwks_cache[kid]
-
-            # Fetch JWKS from Clerk
-            timeout = httpx.Timeout(settings.CLERK_REQUEST_TIMEOUT)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(self.jwks_url)
-                response.raise_for_status()
-                jwks = response.json()
-
-            # Find the key with matching kid
-            for key in jwks.get("keys", []):
-                if key.get("kid") == kid:
-                    # Convert JWK to PEM format
-                    public_key = jwt.algorithms.RSAAlgorithm.from_jwk(key)
-                    pem_key = (
-                        public_key.public_key()
-                        .public_bytes(
-                            encoding=serialization.Encoding.PEM,
-                            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-                        )
-                        .decode()
-                    )
-
-                    # Cache the key
-                    self._jwks_cache[kid] = pem_key
-                    return pem_key
-
-            raise AuthenticationError(f"Public key not found for kid: {kid}")
+            return await self.jwks_keys.get_key(kid)
 
+        except AuthenticationError:
+            raise
         except httpx.HTTPStatusError as e:
             raise handle_clerk_api_error(e, "get_public_key", None, request_id)
         except httpx.TimeoutException as e:
@@ -512,7 +489,7 @@ class ClerkService:
             )
             raise AuthenticationError("Failed to verify token signature")
 
-    async def _get_cached_public_key(self, kid: str, request_id: Optional[str] = None) -> Optional[str]:
+    async def _get_cached_public_key(self, kid: str, request_id: Optional[str] = None) -> Optional[Any]:
         """
         Fallback method to get public key from cache when JWKS endpoint is unavailable.
         
@@ -525,8 +502,9 @@ class ClerkService:
         """
         logger.warning(f"Using cached public key fallback for kid: {kid}")
         
-        if kid in self._jwks_cache:
-            return self._jwks_cache[kid]
+        cached_key = self.jwks_keys.get_cached_key(kid)
+        if cached_key is not None:
+            return cached_key
         
         # If no cached key available, we can't verify the token
         raise AuthenticationError(
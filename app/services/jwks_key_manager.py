@@ -0,0 +1,187 @@
+"""
+JWKS signing key manager for Clerk JWT verification.
+
+Keeps the parsed public keys of one JWKS endpoint. Concurrent lookups share
+a single in-flight fetch, keys are refreshed in the background shortly before
+they go stale, an unknown kid triggers a refresh at most once per
+JWKS_MIN_REFRESH_INTERVAL, and the raw key set is optionally shared through
+Redis so a fleet of workers fetches it once instead of once per worker.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+import jwt
+
+from app.core.config import get_settings
+from app.core.exceptions import AuthenticationError
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Redis key holding {"fetched_at": <epoch seconds>, "keys": [<jwk>, ...]}
+JWKS_SHARED_CACHE_KEY = "auth:jwks"
+
+
+class JWKSKeyManager:
+    """Cache of parsed JWKS public keys with single-flight refreshes."""
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl_seconds: int = settings.JWKS_CACHE_TTL,
+        refresh_ahead_seconds: int = settings.JWKS_REFRESH_AHEAD,
+        min_refresh_interval: int = settings.JWKS_MIN_REFRESH_INTERVAL,
+        shared_cache: bool = settings.JWKS_SHARED_CACHE,
+        request_timeout: float = settings.CLERK_REQUEST_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.jwks_url = jwks_url
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.min_refresh_interval = min_refresh_interval
+        self.shared_cache = shared_cache
+        self.request_timeout = request_timeout
+        self.transport = transport
+        self.redis = redis_client
+
+        # kid -> parsed public key; stale keys are kept for the fallback path
+        self.keys: Dict[str, Any] = {}
+        self.loaded_at: Optional[float] = None
+        self.last_fetch_attempt: Optional[float] = None
+        self.fetch_count = 0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _age(self) -> float:
+        return time.time() - self.loaded_at if self.loaded_at is not None else float("inf")
+
+    async def get_key(self, kid: str) -> Any:
+        """
+        Get the public key for a kid, refreshing the key set when needed.
+
+        Args:
+            kid: Key ID from JWT header
+
+        Returns:
+            Parsed public key usable with jwt.decode
+
+        Raises:
+            AuthenticationError: If the kid is not in the key set
+            httpx.HTTPError: If the JWKS endpoint could not be fetched
+        """
+        age = self._age()
+        if kid in self.keys and age < self.ttl_seconds:
+            if age >= self.ttl_seconds - self.refresh_ahead_seconds:
+                self._start_refresh()
+            return self.keys[kid]
+
+        if kid not in self.keys and age < self.ttl_seconds and not self._refresh_allowed():
+            # The key set is fresh and was fetched moments ago; do not let
+            # tokens with made-up kids hammer the JWKS endpoint.
+            raise AuthenticationError(f"Public key not found for kid: {kid}")
+
+        await self.refresh(kid)
+        if kid not in self.keys:
+            raise AuthenticationError(f"Public key not found for kid: {kid}")
+        return self.keys[kid]
+
+    def get_cached_key(self, kid: str) -> Optional[Any]:
+        """Get a previously loaded key for a kid, however old, without fetching."""
+        return self.keys.get(kid)
+
+    async def refresh(self, kid: Optional[str] = None) -> None:
+        """
+        Reload the key set, joining the refresh already in flight if any.
+
+        Args:
+            kid: Key ID that must be present for the shared Redis copy to be used
+        """
+        task = self._start_refresh(kid)
+        await asyncio.shield(task)
+
+    def _refresh_allowed(self) -> bool:
+        if self.last_fetch_attempt is None:
+            return True
+        return time.time() - self.last_fetch_attempt >= self.min_refresh_interval
+
+    def _start_refresh(self, kid: Optional[str] = None) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._load(kid))
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("JWKS refresh failed: %s", task.exception())
+
+    async def _load(self, kid: Optional[str]) -> None:
+        shared = await self._read_shared()
+        if shared and time.time() - shared["fetched_at"] < self.ttl_seconds - self.refresh_ahead_seconds:
+            shared_kids = {key.get("kid") for key in shared["keys"]}
+            if kid is None or kid in shared_kids:
+                self._install(shared["keys"], shared["fetched_at"])
+                return
+
+        self.last_fetch_attempt = time.time()
+        self.fetch_count += 1
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(self.request_timeout),
+            transport=self.transport
+        ) as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+            jwks = response.json()
+
+        fetched_at = time.time()
+        self._install(jwks.get("keys", []), fetched_at)
+        await self._write_shared(jwks.get("keys", []), fetched_at)
+
+    def _install(self, jwks_keys: List[Dict[str, Any]], fetched_at: float) -> None:
+        for jwk in jwks_keys:
+            key_id = jwk.get("kid")
+            if not key_id or jwk.get("kty") != "RSA":
+                continue
+            try:
+                self.keys[key_id] = jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
+            except (ValueError, TypeError, jwt.InvalidKeyError) as e:
+                logger.warning("Skipping unparseable JWKS key %s: %s", key_id, str(e))
+        self.loaded_at = fetched_at
+        logger.debug("Loaded %d JWKS keys", len(self.keys))
+
+    async def _read_shared(self) -> Optional[Dict[str, Any]]:
+        if not self.shared_cache:
+            return None
+        try:
+            shared = await self.redis.get_json(JWKS_SHARED_CACHE_KEY)
+        except Exception as e:
+            logger.warning("Error reading shared JWKS from Redis: %s", str(e))
+            return None
+        if not isinstance(shared, dict) or "fetched_at" not in shared or "keys" not in shared:
+            return None
+        return shared
+
+    async def _write_shared(self, jwks_keys: List[Dict[str, Any]], fetched_at: float) -> None:
+        if not self.shared_cache:
+            return
+        try:
+            await self.redis.set_json(
+                JWKS_SHARED_CACHE_KEY,
+                {"fetched_at": fetched_at, "keys": jwks_keys},
+                self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning("Error sharing JWKS through Redis: %s", str(e))
+
+    def statistics(self) -> Dict[str, Any]:
+        """Key set state for monitoring."""
+        return {
+            "keys": len(self.keys),
+            "age_seconds": None if self.loaded_at is None else round(self._age(), 1),
+            "fetches": self.fetch_count,
+            "refreshing": self._refresh_task is not None and not self._refresh_task.done(),
+        }
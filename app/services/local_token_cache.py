@@ -0,0 +1,129 @@
+"""
+In-process cache of JWT validation results.
+
+Sits in front of the Redis JWT cache so repeat requests with the same token
+skip the network round-trip. Entries are keyed by token hash, bounded in
+number (least recently used go first) and expire at the earlier of the local
+TTL and the token's own exp claim. Revocations reach every worker through
+AuthCacheService's Redis pub/sub channel, which evicts by token, user or
+session here.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import time
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+@dataclass
+class _Entry:
+    result: Dict[str, Any]
+    expires_at: float
+
+
+class LocalTokenCache:
+    """Bounded TTL/LRU map of token hash to validation result."""
+
+    def __init__(
+        self,
+        max_entries: int = settings.JWT_LOCAL_CACHE_SIZE,
+        ttl_seconds: int = settings.JWT_LOCAL_CACHE_TTL
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_user: Dict[str, Set[str]] = {}
+        self._by_session: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached result for a token, or None if absent or expired."""
+        entry = self._entries.get(token_hash)
+        if entry is not None and entry.expires_at > time.time():
+            self._entries.move_to_end(token_hash)
+            self.hits += 1
+            return entry.result
+        if entry is not None:
+            self._remove(token_hash)
+        self.misses += 1
+        return None
+
+    def peek(self, token_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached result for a token without counting a lookup or refreshing recency."""
+        entry = self._entries.get(token_hash)
+        if entry is not None and entry.expires_at > time.time():
+            return entry.result
+        return None
+
+    def put(self, token_hash: str, result: Dict[str, Any]) -> None:
+        """Cache a result until the local TTL or the token's exp, whichever is first."""
+        expires_at = time.time() + self.ttl_seconds
+        if result.get("exp"):
+            expires_at = min(expires_at, float(result["exp"]))
+        if expires_at <= time.time() or self.max_entries <= 0:
+            return
+
+        self._remove(token_hash)
+        self._entries[token_hash] = _Entry(result, expires_at)
+        self._index(self._by_user, result.get("clerk_id"), token_hash)
+        self._index(self._by_session, result.get("session_id"), token_hash)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def evict_token(self, token_hash: str) -> bool:
+        """Drop one token; True if it was cached."""
+        return self._remove(token_hash)
+
+    def evict_user(self, clerk_id: str) -> int:
+        """Drop every token of a user; returns how many were cached."""
+        return sum(self._remove(token_hash) for token_hash in list(self._by_user.get(clerk_id, ())))
+
+    def evict_session(self, session_id: str) -> int:
+        """Drop every token of a session; returns how many were cached."""
+        return sum(self._remove(token_hash) for token_hash in list(self._by_session.get(session_id, ())))
+
+    def clear(self) -> None:
+        """Drop everything, keeping the hit counters."""
+        self._entries.clear()
+        self._by_user.clear()
+        self._by_session.clear()
+
+    def statistics(self) -> Dict[str, Any]:
+        """Size and hit ratio for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    @staticmethod
+    def _index(index: Dict[str, Set[str]], key: Optional[str], token_hash: str) -> None:
+        if key:
+            index.setdefault(key, set()).add(token_hash)
+
+    @staticmethod
+    def _unindex(index: Dict[str, Set[str]], key: Optional[str], token_hash: str) -> None:
+        hashes = index.get(key) if key else None
+        if hashes is not None:
+            hashes.discard(token_hash)
+            if not hashes:
+                del index[key]
+
+    def _remove(self, token_hash: str) -> bool:
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return False
+        self._unindex(self._by_user, entry.result.get("clerk_id"), token_hash)
+        self._unindex(self._by_session, entry.result.get("session_id"), token_hash)
+        return True
@@ -11,6 +11,8 @@ import logging
 from app.models.user import User
 from app.models.pet import Pet, Reminder
 from app.core.config import settings
+from app.notifications.contexts import appointment_context, reminder_context
+from app.notifications.templates import notification_templates
 
 logger = logging.getLogger(__name__)
 
@@ -226,26 +228,9 @@ class NotificationService:
 
     def _format_reminder_message(self, user: User, pet: Pet, reminder: Reminder) -> str:
         """Format reminder message."""
-        message = f"Hello {user.first_name},\n\n"
-        message += f"This is a reminder for your pet {pet.name}:\n\n"
-        message += f"Reminder: {reminder.title}\n"
-        
-        if reminder.description:
-            message += f"Details: {reminder.description}\n"
-        
-        message += f"Due Date: {reminder.due_date.strftime('%B %d, %Y')}\n\n"
-        
-        if reminder.reminder_type == "vaccination":
-            message += "Please schedule an appointment with your veterinarian to ensure your pet stays up to date with their vaccinations.\n\n"
-        elif reminder.reminder_type == "medication":
-            message += "Please ensure your pet receives their medication as prescribed.\n\n"
-        elif reminder.reminder_type == "checkup":
-            message += "It's time for your pet's regular checkup. Please schedule an appointment with your veterinarian.\n\n"
-        
-        message += "Thank you for keeping your pet healthy!\n\n"
-        message += "Best regards,\nYour Veterinary Clinic Team"
-        
-        return message
+        return notification_templates.render(
+            "health_reminder", "email", reminder_context(user, pet, reminder)
+        ).body
 
     def _format_appointment_reminder_message(
         self, 
@@ -255,26 +240,10 @@ class NotificationService:
         reminder_type: str
     ) -> str:
         """Format appointment reminder message."""
-        time_text = "24 hours" if reminder_type == "24h" else "2 hours"
-        
-        message = f"Hello {user.first_name},\n\n"
-        message += f"This is a reminder that {pet.name} has an appointment in {time_text}.\n\n"
-        message += f"Appointment Details:\n"
-        message += f"Date: {appointment.scheduled_at.strftime('%B %d, %Y')}\n"
-        message += f"Time: {appointment.scheduled_at.strftime('%I:%M %p')}\n"
-        
-        if hasattr(appointment, 'veterinarian') and appointment.veterinarian:
-            message += f"Veterinarian: Dr. {appointment.veterinarian.user.last_name}\n"
-        
-        if hasattr(appointment, 'clinic') and appointment.clinic:
-            message += f"Location: {appointment.clinic.name}\n"
-        
-        message += f"\nPlease arrive 15 minutes early for check-in.\n\n"
-        message += "If you need to reschedule or cancel, please contact us as soon as possible.\n\n"
-        message += "Thank you!\n\n"
-        message += "Best regards,\nYour Veterinary Clinic Team"
-        
-        return message
+        return notification_templates.render(
+            "appointment_reminder", "email",
+            appointment_context(appointment, user, pet, reminder_type=reminder_type)
+        ).body
 
     # Utility methods
 
@@ -358,7 +327,7 @@ class NotificationService:
     async def send_appointment_confirmation_sms(self, appointment: Any) -> bool:
         """Send appointment confirmation SMS."""
         try:
-            message = f"Appointment confirmed for {appointment.pet.name} on {appointment.scheduled_at.strftime('%m/%d/%Y at %I:%M %p')}"
+            message = self._format_appointment_confirmation_sms(appointment)
             return await self._send_sms_notification(
                 appointment.pet_owner.phone_number, message, appointment
             )
@@ -381,7 +350,7 @@ class NotificationService:
     async def send_appointment_cancellation_sms(self, appointment: Any) -> bool:
         """Send appointment cancellation SMS."""
         try:
-            message = f"Appointment cancelled for {appointment.pet.name} on {appointment.scheduled_at.strftime('%m/%d/%Y at %I:%M %p')}"
+            message = self._format_appointment_cancellation_sms(appointment)
             return await self._send_sms_notification(
                 appointment.pet_owner.phone_number, message, appointment
             )
@@ -404,7 +373,7 @@ class NotificationService:
     async def send_appointment_reschedule_sms(self, appointment: Any, old_scheduled_at: datetime) -> bool:
         """Send appointment reschedule SMS."""
         try:
-            message = f"Appointment rescheduled for {appointment.pet.name} from {old_scheduled_at.strftime('%m/%d/%Y at %I:%M %p')} to {appointment.scheduled_at.strftime('%m/%d/%Y at %I:%M %p')}"
+            message = self._format_appointment_reschedule_sms(appointment, old_scheduled_at)
             return await self._send_sms_notification(
                 appointment.pet_owner.phone_number, message, appointment
             )
@@ -416,68 +385,44 @@ class NotificationService:
 
     def _format_appointment_reminder_sms(self, appointment: Any, reminder_type: str) -> str:
         """Format appointment reminder SMS message."""
-        time_text = "24 hours" if reminder_type == "24_hour" else "2 hours"
-        return f"Reminder: {appointment.pet.name} has an appointment in {time_text} on {appointment.scheduled_at.strftime('%m/%d/%Y at %I:%M %p')}"
+        return notification_templates.render(
+            "appointment_reminder", "sms", appointment_context(appointment, reminder_type=reminder_type)
+        ).body
+
+    def _format_appointment_confirmation_sms(self, appointment: Any) -> str:
+        """Format appointment confirmation SMS message."""
+        return notification_templates.render(
+            "appointment_confirmation", "sms", appointment_context(appointment)
+        ).body
+
+    def _format_appointment_cancellation_sms(self, appointment: Any) -> str:
+        """Format appointment cancellation SMS message."""
+        return notification_templates.render(
+            "appointment_cancellation", "sms", appointment_context(appointment)
+        ).body
+
+    def _format_appointment_reschedule_sms(self, appointment: Any, old_scheduled_at: datetime) -> str:
+        """Format appointment reschedule SMS message."""
+        return notification_templates.render(
+            "appointment_reschedule", "sms",
+            appointment_context(appointment, old_scheduled_at=old_scheduled_at)
+        ).body
 
     def _format_appointment_confirmation_message(self, appointment: Any) -> str:
         """Format appointment confirmation message."""
-        message = f"Hello {appointment.pet_owner.first_name},\n\n"
-        message += f"Your appointment for {appointment.pet.name} has been confirmed.\n\n"
-        message += f"Appointment Details:\n"
-        message += f"Date: {appointment.scheduled_at.strftime('%B %d, %Y')}\n"
-        message += f"Time: {appointment.scheduled_at.strftime('%I:%M %p')}\n"
-        message += f"Type: {appointment.appointment_type.value.replace('_', ' ').title()}\n"
-        
-        if hasattr(appointment, 'veterinarian') and appointment.veterinarian:
-            message += f"Veterinarian: Dr. {appointment.veterinarian.user.last_name}\n"
-        
-        if hasattr(appointment, 'clinic') and appointment.clinic:
-            message += f"Location: {appointment.clinic.name}\n"
-        
-        message += f"\nPlease arrive 15 minutes early for check-in.\n\n"
-        message += "If you need to make any changes, please contact us as soon as possible.\n\n"
-        message += "Thank you!\n\n"
-        message += "Best regards,\nYour Veterinary Clinic Team"
-        
-        return message
+        return notification_templates.render(
+            "appointment_confirmation", "email", appointment_context(appointment)
+        ).body
 
     def _format_appointment_cancellation_message(self, appointment: Any) -> str:
         """Format appointment cancellation message."""
-        message = f"Hello {appointment.pet_owner.first_name},\n\n"
-        message += f"Your appointment for {appointment.pet.name} has been cancelled.\n\n"
-        message += f"Cancelled Appointment Details:\n"
-        message += f"Date: {appointment.scheduled_at.strftime('%B %d, %Y')}\n"
-        message += f"Time: {appointment.scheduled_at.strftime('%I:%M %p')}\n"
-        
-        if appointment.cancellation_reason:
-            message += f"Reason: {appointment.cancellation_reason}\n"
-        
-        message += f"\nIf you would like to reschedule, please contact us to book a new appointment.\n\n"
-        message += "Thank you for your understanding.\n\n"
-        message += "Best regards,\nYour Veterinary Clinic Team"
-        
-        return message
+        return notification_templates.render(
+            "appointment_cancellation", "email", appointment_context(appointment)
+        ).body
 
     def _format_appointment_reschedule_message(self, appointment: Any, old_scheduled_at: datetime) -> str:
         """Format appointment reschedule message."""
-        message = f"Hello {appointment.pet_owner.first_name},\n\n"
-        message += f"Your appointment for {appointment.pet.name} has been rescheduled.\n\n"
-        message += f"Previous Appointment:\n"
-        message += f"Date: {old_scheduled_at.strftime('%B %d, %Y')}\n"
-        message += f"Time: {old_scheduled_at.strftime('%I:%M %p')}\n\n"
-        message += f"New Appointment:\n"
-        message += f"Date: {appointment.scheduled_at.strftime('%B %d, %Y')}\n"
-        message += f"Time: {appointment.scheduled_at.strftime('%I:%M %p')}\n"
-        
-        if hasattr(appointment, 'veterinarian') and appointment.veterinarian:
-            message += f"Veterinarian: Dr. {appointment.veterinarian.user.last_name}\n"
-        
-        if hasattr(appointment, 'clinic') and appointment.clinic:
-            message += f"Location: {appointment.clinic.name}\n"
-        
-        message += f"\nPlease arrive 15 minutes early for check-in.\n\n"
-        message += "If you have any questions, please contact us.\n\n"
-        message += "Thank you!\n\n"
-        message += "Best regards,\nYour Veterinary Clinic Team"
-        
-        return message
\ No newline at end of file
+        return notification_templates.render(
+            "appointment_reschedule", "email",
+            appointment_context(appointment, old_scheduled_at=old_scheduled_at)
+        ).body
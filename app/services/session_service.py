@@ -1,9 +1,11 @@
 """
 Session management service for secure user session handling with Redis.
 Provides session creation, validation, and cleanup functionality.
+
+Operations spanning several sessions use RedisClient's multi-key and
+pipelined commands, so they cost one round-trip rather than one per session.
 """
 
-import json
 import uuid
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -72,16 +74,14 @@ class SessionService:
                 "is_active": True
             }
             
-            # Store session data
+            # Store session data and add it to the user's session list
             session_key = f"{self.session_prefix}{session_id}"
-            await self.redis.setex(
-                session_key,
-                session_ttl,
-                json.dumps(session_data)
-            )
-            
-            # Add session to user's session list
-            await self._add_user_session(user_id, session_id, session_ttl)
+            user_sessions_key = f"{self.user_sessions_prefix}{user_id}"
+            async with self.redis.pipeline(binary=True) as pipe:
+                pipe.setex(session_key, session_ttl, self.redis.encode_value(session_data))
+                pipe.sadd(user_sessions_key, session_id)
+                pipe.expire(user_sessions_key, session_ttl + 3600)  # Extra hour buffer
+                await pipe.execute()
             
             # Cleanup old sessions if user has too many
             await self._cleanup_user_sessions(user_id)
@@ -105,12 +105,7 @@ class SessionService:
         """
         try:
             session_key = f"{self.session_prefix}{session_id}"
-            session_data = await self.redis.get(session_key)
-            
-            if not session_data:
-                return None
-            
-            return json.loads(session_data)
+            return await self.redis.get_json(session_key)
             
         except Exception as e:
             logger.error(f"Error getting session {session_id}: {e}")
@@ -127,8 +122,14 @@ class SessionService:
             Session data if valid, None otherwise
         """
         try:
-            session_data = await self.get_session(session_id)
+            # Read the session and its remaining TTL together
+            session_key = f"{self.session_prefix}{session_id}"
+            async with self.redis.pipeline(binary=True) as pipe:
+                pipe.get(session_key)
+                pipe.ttl(session_key)
+                raw_session, ttl = await pipe.execute()
             
+            session_data = self.redis.decode_value(raw_session)
             if not session_data or not session_data.get("is_active"):
                 return None
             
@@ -136,15 +137,8 @@ class SessionService:
             session_data["last_activity"] = datetime.utcnow().isoformat()
             
             # Update session in Redis
-            session_key = f"{self.session_prefix}{session_id}"
-            ttl = await self.redis.ttl(session_key)
-            
             if ttl > 0:
-                await self.redis.setex(
-                    session_key,
-                    ttl,
-                    json.dumps(session_data)
-                )
+                await self.redis.set(session_key, session_data, ttl)
             
             return session_data
             
@@ -168,15 +162,7 @@ class SessionService:
             if not session_data:
                 return False
             
-            user_id = session_data.get("user_id")
-            
-            # Remove session
-            session_key = f"{self.session_prefix}{session_id}"
-            await self.redis.delete(session_key)
-            
-            # Remove from user's session list
-            if user_id:
-                await self._remove_user_session(user_id, session_id)
+            await self._delete_sessions(session_data.get("user_id"), [session_id])
             
             logger.info(f"Invalidated session {session_id}")
             return True
@@ -202,13 +188,12 @@ class SessionService:
         """
         try:
             user_sessions = await self.get_user_sessions(user_id)
-            invalidated_count = 0
-            
-            for session in user_sessions:
-                session_id = session.get("session_id")
-                if session_id and session_id != exclude_session:
-                    if await self.invalidate_session(session_id):
-                        invalidated_count += 1
+            session_ids = [
+                session["session_id"] for session in user_sessions
+                if session.get("session_id") and session["session_id"] != exclude_session
+            ]
+            await self._delete_sessions(user_id, session_ids)
+            invalidated_count = len(session_ids)
             
             logger.info(f"Invalidated {invalidated_count} sessions for user {user_id}")
             return invalidated_count
@@ -229,15 +214,16 @@ class SessionService:
         """
         try:
             user_sessions_key = f"{self.user_sessions_prefix}{user_id}"
-            session_ids = await self.redis.smembers(user_sessions_key)
-            
-            sessions = []
-            for session_id in session_ids:
-                session_data = await self.get_session(session_id.decode())
-                if session_data and session_data.get("is_active"):
-                    sessions.append(session_data)
+            session_ids = list(await self.redis.set_members(user_sessions_key))
             
-            return sessions
+            # Fetch every session in one MGET
+            sessions = await self.redis.mget_json(
+                [f"{self.session_prefix}{session_id}" for session_id in session_ids]
+            )
+            return [
+                session_data for session_data in sessions
+                if session_data and session_data.get("is_active")
+            ]
             
         except Exception as e:
             logger.error(f"Error getting user sessions for {user_id}: {e}")
@@ -266,11 +252,7 @@ class SessionService:
             session_data["last_activity"] = datetime.utcnow().isoformat()
             
             # Refresh session with new TTL
-            await self.redis.setex(
-                session_key,
-                session_ttl,
-                json.dumps(session_data)
-            )
+            await self.redis.set(session_key, session_data, session_ttl)
             
             return True
             
@@ -291,22 +273,22 @@ class SessionService:
             pattern = f"{self.user_sessions_prefix}*"
             user_session_keys = []
             
-            async for key in self.redis.scan_iter(match=pattern):
-                user_session_keys.append(key.decode())
+            async for key in self.redis.scan_keys(pattern):
+                user_session_keys.append(key)
             
             cleaned_count = 0
             for user_sessions_key in user_session_keys:
-                user_id = user_sessions_key.replace(self.user_sessions_prefix, "")
-                session_ids = await self.redis.smembers(user_sessions_key)
+                session_ids = list(await self.redis.set_members(user_sessions_key))
+                sessions = await self.redis.mget_json(
+                    [f"{self.session_prefix}{session_id}" for session_id in session_ids]
+                )
                 
-                for session_id in session_ids:
-                    session_id_str = session_id.decode()
-                    session_data = await self.get_session(session_id_str)
-                    
-                    # If session doesn't exist or is inactive, remove from user list
-                    if not session_data or not session_data.get("is_active"):
-                        await self._remove_user_session(user_id, session_id_str)
-                        cleaned_count += 1
+                # If session doesn't exist or is inactive, remove from user list
+                stale_ids = [
+                    session_id for session_id, session_data in zip(session_ids, sessions)
+                    if not session_data or not session_data.get("is_active")
+                ]
+                cleaned_count += await self.redis.set_remove(user_sessions_key, *stale_ids)
             
             logger.info(f"Cleaned up {cleaned_count} expired sessions")
             return cleaned_count
@@ -315,22 +297,15 @@ class SessionService:
             logger.error(f"Error cleaning up expired sessions: {e}")
             return 0
 
-    async def _add_user_session(self, user_id: str, session_id: str, ttl: int) -> None:
-        """Add session to user's session list."""
-        try:
-            user_sessions_key = f"{self.user_sessions_prefix}{user_id}"
-            await self.redis.sadd(user_sessions_key, session_id)
-            await self.redis.expire(user_sessions_key, ttl + 3600)  # Extra hour buffer
-        except Exception as e:
-            logger.error(f"Error adding user session: {e}")
-
-    async def _remove_user_session(self, user_id: str, session_id: str) -> None:
-        """Remove session from user's session list."""
-        try:
-            user_sessions_key = f"{self.user_sessions_prefix}{user_id}"
-            await self.redis.srem(user_sessions_key, session_id)
-        except Exception as e:
-            logger.error(f"Error removing user session: {e}")
+    async def _delete_sessions(self, user_id: Optional[str], session_ids: List[str]) -> None:
+        """Delete sessions and remove them from the user's session list in one round-trip."""
+        if not session_ids:
+            return
+        async with self.redis.pipeline() as pipe:
+            pipe.delete(*(f"{self.session_prefix}{session_id}" for session_id in session_ids))
+            if user_id:
+                pipe.srem(f"{self.user_sessions_prefix}{user_id}", *session_ids)
+            await pipe.execute()
 
     async def _cleanup_user_sessions(self, user_id: str) -> None:
         """Cleanup old sessions if user has too many."""
@@ -342,10 +317,10 @@ class SessionService:
                 user_sessions.sort(key=lambda x: x.get("last_activity", ""))
                 sessions_to_remove = user_sessions[:-self.max_sessions_per_user]
                 
-                for session in sessions_to_remove:
-                    session_id = session.get("session_id")
-                    if session_id:
-                        await self.invalidate_session(session_id)
+                await self._delete_sessions(user_id, [
+                    session["session_id"] for session in sessions_to_remove
+                    if session.get("session_id")
+                ])
                         
         except Exception as e:
             logger.error(f"Error cleaning up user sessions: {e}")
@@ -20,6 +20,7 @@ from app.schemas.clerk_schemas import (
 )
 from app.core.exceptions import AuthenticationError
 from app.services.auth_cache_service import get_auth_cache_service
+from app.users.services import USER_BY_CLERK_ID
 
 logger = logging.getLogger(__name__)
 
@@ -290,8 +291,7 @@ class UserSyncService:
             User object or None if not found
         """
         try:
-            query = select(User).where(User.clerk_id == clerk_id)
-            result = await self.db.execute(query)
+            result = await USER_BY_CLERK_ID.execute(self.db, {"clerk_id": clerk_id})
             return result.scalar_one_or_none()
         except Exception as e:
             logger.error("Failed to get user by Clerk ID %s: %s", clerk_id, str(e))
@@ -1,7 +1,7 @@
 """
 System maintenance Celery tasks.
 """
-from app.core.celery_app import celery_app
+from app.core.celery_app import async_task, celery_app
 
 
 @celery_app.task(bind=True)
@@ -31,67 +31,27 @@ def backup_database(self):
     pass
 
 
-@celery_app.task(bind=True)
-def send_health_reminders(self):
+@async_task(bind=True)
+async def send_health_reminders(self):
     """
     Send scheduled health reminders task.
     
     This task runs daily to check for due reminders and send notifications.
     """
-    import asyncio
-    from datetime import date
     from app.core.database import get_db_session
-    from app.pets.services import PetService
-    from app.services.notification_service import NotificationService
-    
-    async def process_reminders():
-        """Process due reminders asynchronously."""
-        try:
-            # Get database session
-            async with get_db_session() as db:
-                pet_service = PetService(db)
-                notification_service = NotificationService()
-                
-                # Get due reminders
-                due_reminders = await pet_service.get_due_reminders(date.today())
-                
-                sent_count = 0
-                failed_count = 0
-                
-                for reminder in due_reminders:
-                    try:
-                        # Get pet and owner information
-                        pet = await pet_service.get_pet_by_id(
-                            reminder.pet_id, 
-                            include_owner=True
-                        )
-                        
-                        if not pet.owner:
-                            print(f"No owner found for pet {pet.id}, skipping reminder {reminder.id}")
-                            continue
-                        
-                        # Send notification
-                        await notification_service.send_reminder_notification(
-                            user=pet.owner,
-                            pet=pet,
-                            reminder=reminder
-                        )
-                        
-                        # Mark reminder as sent
-                        await pet_service.mark_reminder_sent(reminder.id)
-                        sent_count += 1
-                        
-                    except Exception as e:
-                        print(f"Failed to send reminder {reminder.id}: {str(e)}")
-                        failed_count += 1
-                
-                print(f"Health reminders task completed: {sent_count} sent, {failed_count} failed")
-                return {"sent": sent_count, "failed": failed_count}
-                
-        except Exception as e:
-            print(f"Health reminders task failed: {str(e)}")
-            raise
+    from app.pets.reminder_dispatch import dispatch_due_reminders
     
-    # Run the async function
-    return asyncio.run(process_reminders())
-    pass
\ No newline at end of file
+    try:
+        # Get database session, one chunk per transaction
+        async with get_db_session() as db:
+            result = await dispatch_due_reminders(db)
+            
+            print(
+                f"Health reminders task completed: {result.reminders} reminders, "
+                f"{result.queued} notifications queued in {result.chunks} chunks"
+            )
+            return result.as_dict()
+            
+    except Exception as e:
+        print(f"Health reminders task failed: {str(e)}")
+        raise
\ No newline at end of file
@@ -1,11 +1,41 @@
 """
 Notification-related Celery tasks.
+
+Ad-hoc messages are queued in the notification outbox and sent by the
+drain_notification_outbox task of their channel, which beat runs
+periodically for every channel.
 """
-from app.core.celery_app import celery_app
+from typing import Optional
+
+from app.core.celery_app import async_task
+from app.models.notification import NotificationChannel
+
+
+async def _queue_message(
+    channel: NotificationChannel,
+    recipient: str,
+    body: str,
+    subject: Optional[str] = None,
+    idempotency_key: Optional[str] = None
+) -> str:
+    from app.core.database import get_db_session
+    from app.notifications.outbox import enqueue_notifications, message_row
 
+    row = message_row(channel, recipient, body, subject=subject, idempotency_key=idempotency_key)
+    async with get_db_session() as db:
+        await enqueue_notifications(db, [row])
+        await db.commit()
+    return row["idempotency_key"]
 
-@celery_app.task(bind=True)
-def send_email_notification(self, recipient: str, subject: str, body: str):
+
+@async_task(bind=True)
+async def send_email_notification(
+    self,
+    recipient: str,
+    subject: str,
+    body: str,
+    idempotency_key: Optional[str] = None
+):
     """
     Send email notification task.
     
@@ -13,26 +43,41 @@ def send_email_notification(self, recipient: str, subject: str, body: str):
         recipient: Email recipient
         subject: Email subject
         body: Email body
+        idempotency_key: Key that deduplicates repeated requests
     """
-    # Implementation will be added in future tasks
-    pass
+    return await _queue_message(
+        NotificationChannel.EMAIL, recipient, body, subject=subject, idempotency_key=idempotency_key
+    )
 
 
-@celery_app.task(bind=True)
-def send_sms_notification(self, phone_number: str, message: str):
+@async_task(bind=True)
+async def send_sms_notification(
+    self,
+    phone_number: str,
+    message: str,
+    idempotency_key: Optional[str] = None
+):
     """
     Send SMS notification task.
     
     Args:
         phone_number: Recipient phone number
         message: SMS message
+        idempotency_key: Key that deduplicates repeated requests
     """
-    # Implementation will be added in future tasks
-    pass
+    return await _queue_message(
+        NotificationChannel.SMS, phone_number, message, idempotency_key=idempotency_key
+    )
 
 
-@celery_app.task(bind=True)
-def send_push_notification(self, user_id: str, title: str, body: str):
+@async_task(bind=True)
+async def send_push_notification(
+    self,
+    user_id: str,
+    title: str,
+    body: str,
+    idempotency_key: Optional[str] = None
+):
     """
     Send push notification task.
     
@@ -40,6 +85,29 @@ def send_push_notification(self, user_id: str, title: str, body: str):
         user_id: User ID
         title: Notification title
         body: Notification body
+        idempotency_key: Key that deduplicates repeated requests
     """
-    # Implementation will be added in future tasks
-    pass
\ No newline at end of file
+    return await _queue_message(
+        NotificationChannel.PUSH, user_id, body, subject=title, idempotency_key=idempotency_key
+    )
+
+
+@async_task(bind=True)
+async def drain_notification_outbox(self, channel: str):
+    """
+    Send one channel's due outbox notifications.
+    
+    Args:
+        channel: Channel to drain (email, sms or push)
+    """
+    from app.core.database import get_db_session
+    from app.notifications.worker import drain_outbox
+
+    async with get_db_session() as db:
+        result = await drain_outbox(db, NotificationChannel(channel))
+
+    print(
+        f"{channel} outbox drained: {result.sent} sent, {result.skipped} skipped, "
+        f"{result.retried} retried, {result.dead} dead-lettered in {result.batches} batches"
+    )
+    return result.as_dict()
@@ -1,27 +1,49 @@
 """
 Report generation Celery tasks.
 """
-from app.core.celery_app import celery_app
+from datetime import date, timedelta
+from typing import Optional
+import uuid
 
+from app.core.celery_app import async_task, celery_app
 
-@celery_app.task(bind=True)
-def generate_appointment_report(self, start_date: str, end_date: str):
+# Default window reconciled by the nightly report run. Appointments are booked
+# ahead, so the window reaches further forward than back.
+RECONCILE_DAYS_BACK = 7
+RECONCILE_DAYS_AHEAD = 180
+
+# Clinic analytics periods: days covered and the grouping reported
+ANALYTICS_PERIODS = {
+    "week": (7, "day"),
+    "month": (30, "day"),
+    "quarter": (90, "week"),
+    "year": (365, "month"),
+}
+
+
+@async_task(bind=True)
+async def generate_appointment_report(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
     """
     Generate appointment report task.
-    
+
+    Reconciles the appointment_daily_stats rollup for the period and reports
+    from it. Without dates it covers the nightly reconciliation window.
+
     Args:
-        start_date: Report start date
-        end_date: Report end date
+        start_date: Report start date (ISO format)
+        end_date: Report end date (ISO format)
     """
-    # Implementation will be added in future tasks
-    pass
+    today = date.today()
+    start = date.fromisoformat(start_date) if start_date else today - timedelta(days=RECONCILE_DAYS_BACK)
+    end = date.fromisoformat(end_date) if end_date else today + timedelta(days=RECONCILE_DAYS_AHEAD)
+    return await _reconcile_and_report(start, end, group_by="day")
 
 
 @celery_app.task(bind=True)
 def generate_health_report(self, pet_id: str):
     """
     Generate pet health report task.
-    
+
     Args:
         pet_id: Pet ID
     """
@@ -29,14 +51,52 @@ def generate_health_report(self, pet_id: str):
     pass
 
 
-@celery_app.task(bind=True)
-def generate_clinic_analytics(self, clinic_id: str, period: str):
+@async_task(bind=True)
+async def generate_clinic_analytics(self, clinic_id: str, period: str):
     """
     Generate clinic analytics report task.
-    
+
+    Reconciles the clinic's rollup rows for the trailing period and reports
+    from them.
+
     Args:
         clinic_id: Clinic ID
-        period: Analytics period
+        period: Analytics period (week, month, quarter, year)
     """
-    # Implementation will be added in future tasks
-    pass
\ No newline at end of file
+    if period not in ANALYTICS_PERIODS:
+        return {"success": False, "error": f"period must be one of: {', '.join(ANALYTICS_PERIODS)}"}
+
+    days, group_by = ANALYTICS_PERIODS[period]
+    end = date.today()
+    start = end - timedelta(days=days - 1)
+    return await _reconcile_and_report(start, end, group_by=group_by, clinic_id=uuid.UUID(clinic_id))
+
+
+async def _reconcile_and_report(
+    start_date: date,
+    end_date: date,
+    group_by: str,
+    clinic_id: Optional[uuid.UUID] = None
+):
+    """Rebuild rollup rows for the period, then read statistics from the rollup."""
+    from app.core.database import get_db_session
+    from app.appointments.daily_stats import rebuild_daily_stats
+    from app.appointments.services import AppointmentService
+
+    try:
+        async with get_db_session() as db:
+            rows = await rebuild_daily_stats(db, start_date, end_date, clinic_id=clinic_id)
+            await db.commit()
+
+            statistics = await AppointmentService(db).get_appointment_statistics(
+                clinic_id=clinic_id,
+                start_date=start_date,
+                end_date=end_date,
+                group_by=group_by,
+                from_rollup=True
+            )
+
+            return {"success": True, "rollup_rows": rows, "statistics": statistics}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
@@ -5,16 +5,29 @@ Handles all database operations and business rules for users across all API vers
 
 from typing import List, Tuple, Optional, Dict, Any, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, update, delete
+from sqlalchemy import bindparam, select, func, and_, update, delete
 from sqlalchemy.orm import selectinload
 from datetime import datetime
 import logging
 
 from app.models.user import User, UserRole
-from app.core.exceptions import NotFoundError, ConflictError, ValidationError, handle_database_error
+from app.core.exceptions import NotFoundError, ConflictError, ValidationError, VetClinicException, handle_database_error
+from app.core.search import TextSearch
+from app.core.statement_cache import StatementCache
+from app.app_helpers.pagination_helpers import KeysetSort, count_rows, keyset_page, paginate_query
 
 logger = logging.getLogger(__name__)
 
+USER_SEARCH = TextSearch(User.first_name, User.last_name, User.email)
+
+USER_LIST_SORT = KeysetSort("created_at", [User.created_at], User.id, descending=True)
+
+# Looked up on every authenticated request whose user data is not cached
+USER_BY_CLERK_ID = StatementCache(
+    "users.by_clerk_id",
+    lambda: select(User).where(User.clerk_id == bindparam("clerk_id")),
+)
+
 
 class UserService:
     """Version-agnostic service for user data access and core business logic."""
@@ -32,8 +45,10 @@ class UserService:
         timezone: Optional[str] = None,    # V3 feature
         language: Optional[str] = None,    # V3 feature
         is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,      # V2 feature
+        count_mode: str = "exact",         # V2 feature
         **kwargs  # Handle additional filters from future versions
-    ) -> Tuple[List[User], int]:
+    ) -> Tuple[List[User], Optional[int]]:
         """
         Retrieve users with filtering and pagination for all API versions.
         
@@ -46,10 +61,12 @@ class UserService:
             timezone: Timezone filter (V3+)
             language: Language filter (V3+)
             is_active: Active status filter
+            cursor: Continue after this cursor instead of using page (V2+)
+            count_mode: Total count mode: exact, estimate or none (V2+)
             **kwargs: Additional filters from future versions
             
         Returns:
-            Tuple[List[User], int]: (users, total_count)
+            Tuple[List[User], Optional[int]]: (users page with next_cursor, total_count)
         """
         try:
             # Build base query
@@ -59,15 +76,9 @@ class UserService:
             conditions = []
 
             # Search filter
-            if search:
-                search_term = f"%{search}%"
-                conditions.append(
-                    or_(
-                        User.first_name.ilike(search_term),
-                        User.last_name.ilike(search_term),
-                        User.email.ilike(search_term)
-                    )
-                )
+            search_condition = USER_SEARCH.condition(search)
+            if search_condition is not None:
+                conditions.append(search_condition)
 
             # Role filter
             if role:
@@ -108,19 +119,19 @@ class UserService:
                 count_query = count_query.where(and_(*conditions))
 
             # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar()
+            total = await count_rows(self.db, count_query, query, count_mode)
 
             # Apply pagination and ordering
-            offset = (page - 1) * size
-            query = query.order_by(User.created_at.desc()).offset(offset).limit(size)
+            query = paginate_query(query, page, size, cursor=cursor, keyset=USER_LIST_SORT)
             
             # Execute query
             result = await self.db.execute(query)
             users = result.scalars().all()
 
-            return list(users), total
+            return keyset_page(users, size, USER_LIST_SORT), total
 
+        except VetClinicException:
+            raise
         except Exception as e:
             logger.error(f"Error listing users: {e}")
             raise handle_database_error(e)
@@ -240,9 +251,7 @@ class UserService:
             Optional[User]: User entity or None if not found
         """
         try:
-            result = await self.db.execute(
-                select(User).where(User.clerk_id == clerk_id)
-            )
+            result = await USER_BY_CLERK_ID.execute(self.db, {"clerk_id": clerk_id})
             return result.scalar_one_or_none()
         except Exception as e:
             logger.error(f"Error getting user by Clerk ID {clerk_id}: {e}")
@@ -405,10 +414,10 @@ class UserService:
         role_filter: Optional[Union[UserRole, str]] = None
     ) -> List[User]:
         """
-        Search users by name or email.
+        Search users by name or email, best matches first.
         
         Args:
-            search_term: Search term
+            search_term: Search term; every word must match
             limit: Maximum number of results
             role_filter: Optional role filter
             
@@ -416,15 +425,11 @@ class UserService:
             List[User]: Matching users
         """
         try:
-            search_pattern = f"%{search_term}%"
-            conditions = [
-                User.is_active == True,
-                or_(
-                    User.first_name.ilike(search_pattern),
-                    User.last_name.ilike(search_pattern),
-                    User.email.ilike(search_pattern)
-                )
-            ]
+            search_condition = USER_SEARCH.condition(search_term)
+            if search_condition is None:
+                return []
+
+            conditions = [User.is_active == True, search_condition]
 
             if role_filter:
                 if isinstance(role_filter, str):
@@ -439,7 +444,7 @@ class UserService:
             result = await self.db.execute(
                 select(User)
                 .where(and_(*conditions))
-                .order_by(User.first_name, User.last_name)
+                .order_by(USER_SEARCH.rank(search_term).desc(), User.first_name, User.last_name)
                 .limit(limit)
             )
             return list(result.scalars().all())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Appointment statistics benchmark for Veterinary Clinic Backend.
+Seeds appointments with generate_series and times get_appointment_statistics
+for each grouping over a one-year window, against the appointments table and
+against the appointment_daily_stats rollup.
+
+Usage:
+    python scripts/benchmark_appointment_statistics.py --seed 1000000
+    python scripts/benchmark_appointment_statistics.py --cleanup
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.database import AsyncSessionLocal
+from app.appointments.daily_stats import rebuild_daily_stats
+from app.appointments.services import AppointmentService, STATISTICS_GROUPINGS
+from sqlalchemy import text
+import logging
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SEED_REASON = "statistics benchmark seed"
+
+SEED_SQL = text("""
+    WITH pets AS (
+        SELECT array_agg(id) AS ids, array_agg(owner_id) AS owners FROM pets
+    ),
+    vets AS (
+        SELECT array_agg(id) AS ids, array_agg(clinic_id) AS clinics FROM veterinarians
+    )
+    INSERT INTO appointments (
+        id, pet_id, pet_owner_id, veterinarian_id, clinic_id,
+        appointment_type, status, priority, scheduled_at, duration_minutes,
+        reason, estimated_cost, actual_cost,
+        reminder_sent_24h, reminder_sent_2h, follow_up_required
+    )
+    SELECT
+        gen_random_uuid(),
+        pets.ids[p], pets.owners[p], vets.ids[v], vets.clinics[v],
+        (enum_range(NULL::appointmenttype))[1 + (n % 11)],
+        (enum_range(NULL::appointmentstatus))[1 + ((n / 11) % 7)],
+        (enum_range(NULL::appointmentpriority))[1 + ((n / 77) % 5)],
+        make_date(:year, 1, 1) + (n % 365) * interval '1 day' + (n % 9 + 8) * interval '1 hour',
+        30,
+        :reason,
+        50 + (n % 200),
+        50 + (n % 250),
+        false, false, false
+    FROM generate_series(1, :count) AS n,
+         pets, vets,
+         LATERAL (SELECT 1 + (n % cardinality(pets.ids)) AS p,
+                         1 + (n % cardinality(vets.ids)) AS v) AS pick
+""")
+
+
+async def seed(count: int, year: int) -> None:
+    """Insert benchmark appointments against existing pets and veterinarians."""
+    async with AsyncSessionLocal() as session:
+        started = time.perf_counter()
+        await session.execute(SEED_SQL, {"count": count, "year": year, "reason": SEED_REASON})
+        await session.commit()
+        await session.execute(text("ANALYZE appointments"))
+        logger.info(f"🌱 Seeded {count} appointments in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        rows = await rebuild_daily_stats(session, date(year, 1, 1), date(year, 12, 31))
+        await session.commit()
+        logger.info(f"📦 Rebuilt {rows} rollup rows in {time.perf_counter() - started:.1f}s")
+
+
+async def cleanup() -> None:
+    """Remove appointments created by seed()."""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            text("DELETE FROM appointments WHERE reason = :reason"), {"reason": SEED_REASON}
+        )
+        await session.commit()
+        logger.info(f"🧹 Removed {result.rowcount} benchmark appointments")
+        logger.info("💡 Run generate_appointment_report to reconcile appointment_daily_stats")
+
+
+async def run(year: int, repeat: int) -> None:
+    """Time statistics for the whole year, ungrouped and by each grouping."""
+    async with AsyncSessionLocal() as session:
+        service = AppointmentService(session)
+        for from_rollup in (False, True):
+            for group_by in [None, *STATISTICS_GROUPINGS]:
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    statistics = await service.get_appointment_statistics(
+                        start_date=date(year, 1, 1),
+                        end_date=date(year, 12, 31),
+                        group_by=group_by,
+                        from_rollup=from_rollup
+                    )
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                logger.info(
+                    f"📊 source={'rollup' if from_rollup else 'appointments':<12} "
+                    f"group_by={group_by or '-':<12} "
+                    f"appointments={statistics['totals']['total_appointments']:<9} "
+                    f"groups={len(statistics.get('groups', [])):<5} "
+                    f"best={min(timings):.1f}ms median={sorted(timings)[len(timings) // 2]:.1f}ms"
+                )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="Number of appointments to insert first")
+    parser.add_argument("--year", type=int, default=date.today().year, help="Year to seed and report on")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per grouping")
+    parser.add_argument("--cleanup", action="store_true", help="Delete seeded appointments and exit")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        await cleanup()
+        return
+
+    if args.seed:
+        await seed(args.seed, args.year)
+
+    await run(args.year, args.repeat)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Cache codec benchmark for Veterinary Clinic Backend.
+Compares encode/decode time and stored bytes of the Redis cache codecs on
+AuthCacheService payloads: cached user data, a JWT validation result and a
+session list. No Redis connection is needed.
+
+Usage:
+    python scripts/benchmark_cache_codec.py
+    python scripts/benchmark_cache_codec.py --iterations 50000
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.cache_codec import CacheCodec, msgpack
+
+
+def build_payloads():
+    """Representative values as written by AuthCacheService and SessionService."""
+    now = datetime.utcnow().isoformat()
+    user_data = {
+        "id": str(uuid.uuid4()),
+        "clerk_id": "user_2abcDEFghiJKLmnoPQRstuVWX",
+        "email": "jane.owner@example.com",
+        "first_name": "Jane",
+        "last_name": "Owner",
+        "phone_number": "+15555550123",
+        "role": "pet_owner",
+        "is_active": True,
+        "is_verified": True,
+        "avatar_url": "https://img.clerk.com/avatars/user_2abcDEFghiJKLmnoPQRstuVWX.png",
+        "preferences": {"theme": "dark", "units": "metric"},
+        "notification_settings": {"email": True, "sms": False, "push": True},
+        "created_at": now,
+        "updated_at": now,
+        "clinic_id": None,
+        "cached_at": now,
+    }
+    jwt_validation = {
+        "user_id": user_data["clerk_id"],
+        "clerk_id": user_data["clerk_id"],
+        "email": user_data["email"],
+        "role": "pet_owner",
+        "permissions": ["pets:read", "pets:write", "appointments:read", "appointments:write"],
+        "exp": int(time.time()) + 3600,
+        "iat": int(time.time()),
+        "session_id": "sess_2abcDEFghiJKLmnoPQRstuVWX",
+        "cached_at": now,
+        "token_hash": "3f9a2c4b8e1d7f6a5b4c3d2e1f0a9b8c",
+    }
+    sessions = [
+        {
+            "session_id": str(uuid.uuid4()),
+            "user_id": user_data["id"],
+            "clerk_id": user_data["clerk_id"],
+            "email": user_data["email"],
+            "role": "pet_owner",
+            "permissions": jwt_validation["permissions"],
+            "created_at": now,
+            "last_activity": now,
+            "ip_address": "203.0.113.10",
+            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0) AppleWebKit/605.1.15",
+            "is_active": True,
+        }
+        for _ in range(10)
+    ]
+    return {"user_data": user_data, "jwt_validation": jwt_validation, "sessions": sessions}
+
+
+def time_per_call(func, value, iterations):
+    """Average microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(value)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Redis cache codecs")
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    codecs = {
+        "legacy json": (lambda value: json.dumps(value).encode(), json.loads),
+        "json": CacheCodec("json", compress_threshold=0),
+        "json+zlib": CacheCodec("json", compress_threshold=1024),
+    }
+    if msgpack is not None:
+        codecs["msgpack"] = CacheCodec("msgpack", compress_threshold=0)
+        codecs["msgpack+zlib"] = CacheCodec("msgpack", compress_threshold=1024)
+    else:
+        print("msgpack is not installed; skipping msgpack codecs\n")
+
+    print(f"{'payload':<16}{'codec':<14}{'bytes':>8}{'encode µs':>12}{'decode µs':>12}")
+    for payload_name, value in build_payloads().items():
+        for codec_name, codec in codecs.items():
+            encode, decode = codec if isinstance(codec, tuple) else (codec.encode, codec.decode)
+            encoded = encode(value)
+            assert decode(encoded) == value
+            print(
+                f"{payload_name:<16}{codec_name:<14}{len(encoded):>8}"
+                f"{time_per_call(encode, value, args.iterations):>12.2f}"
+                f"{time_per_call(decode, encoded, args.iterations):>12.2f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
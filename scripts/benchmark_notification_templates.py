@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Notification template benchmark for Veterinary Clinic Backend.
+Measures the CPU spent rendering a bulk run of health reminder emails three
+ways: the previous string-concatenating formatter reading ORM instances, the
+precompiled template fed from the same instances, and the precompiled
+template fed from plain dict contexts as the outbox renderers select them.
+No database connection is needed.
+
+Usage:
+    python scripts/benchmark_notification_templates.py
+    python scripts/benchmark_notification_templates.py --messages 200000
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.models.pet import Pet, Reminder
+from app.models.user import User
+from app.notifications.contexts import reminder_context
+from app.notifications.templates import NotificationTemplates
+
+REMINDER_TYPES = ["vaccination", "medication", "checkup", "other"]
+
+
+def legacy_format(user, pet, reminder):
+    """The formatter the templates replaced, kept here as the baseline."""
+    message = f"Hello {user.first_name},\n\n"
+    message += f"This is a reminder for your pet {pet.name}:\n\n"
+    message += f"Reminder: {reminder.title}\n"
+    if reminder.description:
+        message += f"Details: {reminder.description}\n"
+    message += f"Due Date: {reminder.due_date.strftime('%B %d, %Y')}\n\n"
+    if reminder.reminder_type == "vaccination":
+        message += "Please schedule an appointment with your veterinarian to ensure your pet stays up to date with their vaccinations.\n\n"
+    elif reminder.reminder_type == "medication":
+        message += "Please ensure your pet receives their medication as prescribed.\n\n"
+    elif reminder.reminder_type == "checkup":
+        message += "It's time for your pet's regular checkup. Please schedule an appointment with your veterinarian.\n\n"
+    message += "Thank you for keeping your pet healthy!\n\n"
+    message += "Best regards,\nYour Veterinary Clinic Team"
+    return f"Reminder: {reminder.title}", message
+
+
+def build_reminders(count):
+    """(owner, pet, reminder) ORM instances for count reminders."""
+    owners = [
+        User(id=uuid.uuid4(), email=f"owner{i}@example.com", first_name=f"Owner{i}", last_name="Doe")
+        for i in range(max(count // 4, 1))
+    ]
+    reminders = []
+    for i in range(count):
+        owner = owners[i % len(owners)]
+        pet = Pet(id=uuid.uuid4(), owner_id=owner.id, name=f"Pet{i}", species="dog")
+        pet.owner = owner
+        reminder = Reminder(
+            id=uuid.uuid4(),
+            pet_id=pet.id,
+            title="Annual Vaccination",
+            description="Rabies booster" if i % 3 else None,
+            reminder_type=REMINDER_TYPES[i % len(REMINDER_TYPES)],
+            due_date=date(2025, 1, 1) + timedelta(days=i % 365),
+            reminder_date=date(2024, 12, 25),
+        )
+        reminders.append((owner, pet, reminder))
+    return reminders
+
+
+def cpu_seconds(func):
+    start = time.process_time()
+    func()
+    return time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark notification template rendering")
+    parser.add_argument("--messages", type=int, default=100000, help="Reminder emails per measurement")
+    args = parser.parse_args()
+
+    reminders = build_reminders(args.messages)
+    contexts = [reminder_context(owner, pet, reminder) for owner, pet, reminder in reminders]
+
+    templates = NotificationTemplates()
+    load = cpu_seconds(templates.load)
+    template = templates.get("health_reminder", "email")
+
+    # The templates must reproduce the formatter they replaced
+    for (owner, pet, reminder), context in zip(reminders[:len(REMINDER_TYPES) * 3], contexts):
+        expected = legacy_format(owner, pet, reminder)
+        rendered = template.render(context)
+        assert (rendered.subject, rendered.body) == expected, (rendered, expected)
+
+    cases = [
+        ("f-strings on ORM objects", lambda: [legacy_format(*row) for row in reminders]),
+        ("template on ORM objects", lambda: [template.render(reminder_context(*row)) for row in reminders]),
+        ("template on dict contexts", lambda: templates.render_many("health_reminder", "email", contexts)),
+    ]
+
+    print(f"Compiled templates in {load * 1000:.1f} ms")
+    print(f"{'rendering':<28}{'total s':>10}{'µs/msg':>10}")
+    baseline = None
+    for name, run in cases:
+        run()
+        seconds = cpu_seconds(run)
+        baseline = baseline or seconds
+        print(f"{name:<28}{seconds:>10.2f}{seconds / args.messages * 1_000_000:>10.2f}"
+              f"{baseline / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ sys.path.insert(0, str(project_root))
 
 from app.core.database import engine, Base, init_db, DatabaseHealthCheck
 from app.core.config import get_settings
-from app.models import user, pet, appointment, clinic, communication
+from app.models import user, pet, appointment, clinic, communication, notification
 from app.models.user import User, UserRole
 import logging
 
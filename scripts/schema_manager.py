@@ -101,7 +101,7 @@ class SchemaManager:
         try:
             # Import all models to register them with Base.metadata
             from app.models import (
-                user, pet, appointment, clinic, communication
+                user, pet, appointment, clinic, communication, notification
             )
             
             model_tables = {}
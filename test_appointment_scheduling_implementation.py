@@ -25,7 +25,8 @@ async def test_appointment_scheduling():
         from app.appointments.services import AppointmentService
         from app.models.appointment import Appointment, AppointmentSlot, AppointmentStatus, AppointmentType, AppointmentPriority
         from app.api.v1.appointments import router as appointments_router
-        from app.tasks.appointment_tasks import send_appointment_reminders, send_appointment_confirmation
+        from app.tasks.appointment_tasks import send_appointment_reminders
+        from app.tasks.notification_tasks import drain_notification_outbox
         print("   ✅ All appointment modules imported successfully")
         
         # Test 2: Check appointment model structure
@@ -102,7 +103,7 @@ async def test_appointment_scheduling():
         
         # Check that tasks are properly defined
         assert callable(send_appointment_reminders)
-        assert callable(send_appointment_confirmation)
+        assert callable(drain_notification_outbox)
         print("   ✅ Background tasks are properly defined")
         
         # Test 6: Check appointment status transitions
@@ -15,6 +15,7 @@ import uuid
 from datetime import datetime, date, timedelta
 from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
@@ -22,7 +23,13 @@ from app.models.appointment import Appointment, AppointmentSlot, AppointmentStat
 from app.models.user import User
 from app.models.pet import Pet
 from app.models.clinic import Clinic, Veterinarian
+from app.models.notification import NotificationOutbox
 from app.core.database import get_db
+from app.notifications.outbox import (
+    APPOINTMENT_CANCELLATION,
+    APPOINTMENT_CONFIRMATION,
+    APPOINTMENT_RESCHEDULE,
+)
 from tests.conftest import test_db, test_client
 
 
@@ -201,7 +208,7 @@ class TestAppointmentScheduling:
         assert "conflicts" in data["data"]
         assert data["data"]["has_conflicts"] is False  # No conflicts initially
 
-    async def test_create_appointment_with_availability_check(self, test_client: TestClient, sample_data: dict):
+    async def test_create_appointment_with_availability_check(self, test_client: TestClient, sample_data: dict, test_db: AsyncSession):
         """Test creating an appointment with availability checking."""
         user = sample_data["user"]
         pet = sample_data["pet"]
@@ -222,11 +229,9 @@ class TestAppointmentScheduling:
             "priority": "normal"
         }
         
-        # Mock authentication and notification task
-        with patch("app.api.deps.get_current_user") as mock_auth, \
-             patch("app.tasks.appointment_tasks.send_appointment_confirmation.delay") as mock_task:
+        # Mock authentication
+        with patch("app.api.deps.get_current_user") as mock_auth:
             mock_auth.return_value = user
-            mock_task.return_value = None
             
             response = test_client.post(
                 "/api/v1/appointments/",
@@ -239,8 +244,11 @@ class TestAppointmentScheduling:
         assert data["data"]["pet_id"] == str(pet.id)
         assert data["data"]["status"] == "scheduled"
         
-        # Verify notification task was called
-        mock_task.assert_called_once()
+        # Verify notifications were queued in the outbox
+        queued = await test_db.execute(
+            select(NotificationOutbox).where(NotificationOutbox.kind == APPOINTMENT_CONFIRMATION)
+        )
+        assert {row.payload["appointment_id"] for row in queued.scalars().all()} == {data["data"]["id"]}
 
     async def test_create_appointment_with_conflict(self, test_client: TestClient, sample_data: dict, test_db: AsyncSession):
         """Test creating an appointment that conflicts with existing appointment."""
@@ -357,10 +365,8 @@ class TestAppointmentScheduling:
         await test_db.commit()
         
         # Cancel appointment
-        with patch("app.api.deps.get_current_user") as mock_auth, \
-             patch("app.tasks.appointment_tasks.send_appointment_cancellation.delay") as mock_task:
+        with patch("app.api.deps.get_current_user") as mock_auth:
             mock_auth.return_value = user
-            mock_task.return_value = None
             
             response = test_client.post(
                 f"/api/v1/appointments/{appointment.id}/cancel",
@@ -373,8 +379,11 @@ class TestAppointmentScheduling:
         assert data["data"]["status"] == "cancelled"
         assert data["data"]["cancellation_reason"] == "Personal emergency"
         
-        # Verify notification task was called
-        mock_task.assert_called_once()
+        # Verify notifications were queued in the outbox
+        queued = await test_db.execute(
+            select(NotificationOutbox).where(NotificationOutbox.kind == APPOINTMENT_CANCELLATION)
+        )
+        assert {row.payload["appointment_id"] for row in queued.scalars().all()} == {str(appointment.id)}
 
     async def test_appointment_reschedule_workflow(self, test_client: TestClient, sample_data: dict, test_db: AsyncSession):
         """Test appointment rescheduling workflow."""
@@ -403,10 +412,8 @@ class TestAppointmentScheduling:
         await test_db.commit()
         
         # Reschedule appointment
-        with patch("app.api.deps.get_current_user") as mock_auth, \
-             patch("app.tasks.appointment_tasks.send_appointment_reschedule.delay") as mock_task:
+        with patch("app.api.deps.get_current_user") as mock_auth:
             mock_auth.return_value = user
-            mock_task.return_value = None
             
             response = test_client.post(
                 f"/api/v1/appointments/{appointment.id}/reschedule",
@@ -419,8 +426,11 @@ class TestAppointmentScheduling:
         assert data["data"]["scheduled_at"] == new_time.isoformat()
         assert data["data"]["status"] == "scheduled"  # Reset to scheduled after reschedule
         
-        # Verify notification task was called
-        mock_task.assert_called_once()
+        # Verify notifications were queued in the outbox
+        queued = await test_db.execute(
+            select(NotificationOutbox).where(NotificationOutbox.kind == APPOINTMENT_RESCHEDULE)
+        )
+        assert {row.payload["appointment_id"] for row in queued.scalars().all()} == {str(appointment.id)}
 
     async def test_appointment_status_transitions(self, test_client: TestClient, sample_data: dict, test_db: AsyncSession):
         """Test complete appointment status transition workflow."""
@@ -963,10 +973,8 @@ class TestAppointmentScheduling:
             "priority": "normal"
         }
         
-        with patch("app.api.deps.get_current_user") as mock_auth, \
-             patch("app.tasks.appointment_tasks.send_appointment_confirmation.delay") as mock_task:
+        with patch("app.api.deps.get_current_user") as mock_auth:
             mock_auth.return_value = user
-            mock_task.return_value = None
             
             response = test_client.post(
                 "/api/v1/appointments/",
@@ -441,19 +441,18 @@ class TestAuthenticationCachingIntegration:
         with patch('app.services.auth_cache_service.redis_client', mock_redis_for_integration):
             
             cache_service = AuthCacheService()
-            mock_redis_for_integration.delete.return_value = True
+            mock_redis_for_integration.set_members.return_value = set()
             
             # Test bulk invalidation
             result = await cache_service.invalidate_user_related_cache("clerk_123", "user_456")
             
             assert result is True
             
-            # Should have called delete for user data, permissions, and role
-            assert mock_redis_for_integration.delete.call_count == 3
+            # Should have deleted user data, permissions, and role in one call
+            mock_redis_for_integration.delete_many.assert_called_once()
             
             # Verify the cache keys that were deleted
-            delete_calls = mock_redis_for_integration.delete.call_args_list
-            deleted_keys = [call[0][0] for call in delete_calls]
+            deleted_keys = mock_redis_for_integration.delete_many.call_args[0]
             
             assert "auth:user:clerk_123" in deleted_keys
             assert "auth:permissions:user_456" in deleted_keys
@@ -0,0 +1,129 @@
+"""
+Concurrency tests for appointment slot booking.
+
+Fires hundreds of bookings at one slot in parallel, each through its own
+session and connection, and checks the slot ends up booked exactly to
+capacity. Row locking and conditional UPDATEs only mean something against a
+real server, so these tests need PostgreSQL and are skipped unless
+TEST_DATABASE_URL points at one (postgresql+asyncpg://...). Tables are
+created in a throwaway schema that is dropped afterwards.
+"""
+
+import asyncio
+import os
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.appointments.services import AppointmentService
+from app.core.database import Base
+from app.core.exceptions import ConflictError
+from app.models.appointment import AppointmentSlot
+from app.models.clinic import Clinic, ClinicType, Veterinarian
+from app.models.user import User
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith("postgresql"),
+    reason="needs PostgreSQL; set TEST_DATABASE_URL",
+)
+
+PARALLEL_BOOKINGS = 300
+
+
+@asynccontextmanager
+async def slot_database(max_bookings):
+    """Session factory over a fresh schema holding one slot, and the slot's id."""
+    schema = f"slot_booking_{uuid.uuid4().hex[:12]}"
+    base_engine = create_async_engine(TEST_DATABASE_URL, pool_size=20, max_overflow=0)
+    async with base_engine.begin() as conn:
+        await conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    engine = base_engine.execution_options(schema_translate_map={None: schema})
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[User.__table__, Clinic.__table__, Veterinarian.__table__, AppointmentSlot.__table__],
+            )
+
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as session:
+            user = User(id=uuid.uuid4(), clerk_id="vet_clerk_id", email="vet@example.com", first_name="Jane", last_name="Smith")
+            clinic = Clinic(
+                id=uuid.uuid4(), name="Test Clinic", clinic_type=ClinicType.GENERAL_PRACTICE,
+                phone_number="555-0123", address_line1="123 Test St", city="Test City", state="TS", zip_code="12345",
+            )
+            session.add_all([user, clinic])
+            await session.flush()
+            veterinarian = Veterinarian(id=uuid.uuid4(), user_id=user.id, clinic_id=clinic.id, license_number="VET-1")
+            session.add(veterinarian)
+            await session.flush()
+            start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+            slot = AppointmentSlot(
+                veterinarian_id=veterinarian.id,
+                clinic_id=clinic.id,
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+                duration_minutes=30,
+                max_bookings=max_bookings,
+            )
+            session.add(slot)
+            await session.commit()
+
+        yield sessions, slot.id
+    finally:
+        async with base_engine.begin() as conn:
+            await conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        await base_engine.dispose()
+
+
+async def book(sessions, slot_id):
+    """Book the slot in a session of its own; True if a booking was taken."""
+    async with sessions() as session:
+        try:
+            await AppointmentService(session).book_slot(slot_id)
+            return True
+        except ConflictError:
+            return False
+
+
+async def booked(sessions, slot_id):
+    async with sessions() as session:
+        return await session.scalar(select(AppointmentSlot.current_bookings).where(AppointmentSlot.id == slot_id))
+
+
+class TestConcurrentSlotBooking:
+    """Test that parallel bookings never exceed a slot's capacity."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_bookings", [1, 7])
+    async def test_parallel_bookings_fill_slot_exactly(self, max_bookings):
+        """Exactly max_bookings of hundreds of simultaneous bookings succeed."""
+        async with slot_database(max_bookings) as (sessions, slot_id):
+            results = await asyncio.gather(*(book(sessions, slot_id) for _ in range(PARALLEL_BOOKINGS)))
+
+            assert results.count(True) == max_bookings
+            assert await booked(sessions, slot_id) == max_bookings
+
+    @pytest.mark.asyncio
+    async def test_parallel_releases_free_each_booking_once(self):
+        """Racing releases never take the count below zero, and freed capacity can be rebooked."""
+        async with slot_database(3) as (sessions, slot_id):
+            await asyncio.gather(*(book(sessions, slot_id) for _ in range(3)))
+
+            async def release():
+                async with sessions() as session:
+                    return await AppointmentService(session).release_slot(slot_id)
+
+            released = await asyncio.gather(*(release() for _ in range(50)))
+
+            assert sum(slot is not None for slot in released) == 3
+            assert await booked(sessions, slot_id) == 0
+
+            results = await asyncio.gather(*(book(sessions, slot_id) for _ in range(50)))
+            assert results.count(True) == 3
@@ -0,0 +1,145 @@
+"""
+Integration tests for the SMTP email transport.
+
+Sends batches through SmtpTransport to a local aiosmtpd server and checks
+delivery, the Message-ID derived from each idempotency key, and that the
+connection pool recovers after the server goes away.
+"""
+
+from email import message_from_bytes
+import hashlib
+import socket
+
+import pytest
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller
+
+from app.notifications.transports import OutboundMessage, SmtpTransport
+
+SENDER = "clinic@vetclinic.test"
+
+
+class RecordingHandler:
+    """Keeps every message the server accepts."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(message_from_bytes(envelope.content))
+        return "250 Message accepted for delivery"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(handler: RecordingHandler, port: int) -> Controller:
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    return controller
+
+
+def make_messages(count: int, prefix: str = "message"):
+    return [
+        OutboundMessage(f"{prefix}:{n}", f"owner{n}@example.com", f"Body {n}", f"Subject {n}")
+        for n in range(count)
+    ]
+
+
+@pytest.fixture
+def port():
+    return free_port()
+
+
+@pytest.fixture
+def handler():
+    return RecordingHandler()
+
+
+@pytest.fixture
+def server(handler, port):
+    controller = start_server(handler, port)
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+def transport(port):
+    """Transport to the test server; tests close it themselves."""
+    return SmtpTransport(hostname="127.0.0.1", port=port, sender=SENDER, pool_size=2, timeout=5)
+
+
+class TestSmtpTransport:
+    """Test sending batches to a real SMTP server."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_delivered(self, server, handler, transport):
+        try:
+            messages = make_messages(5)
+
+            results = await transport.send_batch(messages)
+
+            assert results == [None] * 5
+            received = {email["To"]: email for email in handler.messages}
+            assert set(received) == {message.recipient for message in messages}
+            for message in messages:
+                email = received[message.recipient]
+                assert email["From"] == SENDER
+                assert email["Subject"] == message.subject
+                assert email.get_payload().strip() == message.body
+        finally:
+            await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_between_batches(self, server, handler, transport):
+        try:
+            await transport.send_batch(make_messages(4, "first"))
+            clients = list(transport._connections)
+
+            assert await transport.send_batch(make_messages(4, "second")) == [None] * 4
+            assert transport._connections == clients
+            assert len(handler.messages) == 8
+        finally:
+            await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_message_id_is_stable_per_idempotency_key(self, server, handler, transport):
+        try:
+            message = OutboundMessage("health_reminder:42:2026-10-16:email", "owner@example.com", "Body")
+            digest = hashlib.sha256(message.idempotency_key.encode()).hexdigest()[:32]
+
+            await transport.send_batch([message])
+            await transport.send_batch([message])
+
+            assert [email["Message-ID"] for email in handler.messages] == [f"<{digest}@vetclinic.test>"] * 2
+            assert handler.messages[0]["X-Idempotency-Key"] == message.idempotency_key
+        finally:
+            await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_recovers_after_server_drops_connection(self, handler, port, transport):
+        try:
+            server = start_server(handler, port)
+            try:
+                assert await transport.send_batch(make_messages(2, "before")) == [None, None]
+            finally:
+                server.stop()
+
+            # Each message reports its own failure while the server is down
+            results = await transport.send_batch(make_messages(2, "down"))
+            assert all(isinstance(result, Exception) for result in results)
+
+            server = start_server(handler, port)
+            try:
+                assert await transport.send_batch(make_messages(3, "after")) == [None] * 3
+            finally:
+                server.stop()
+
+            keys = [email["X-Idempotency-Key"] for email in handler.messages]
+            assert sorted(keys) == ["after:0", "after:1", "after:2", "before:0", "before:1"]
+        finally:
+            await transport.close()
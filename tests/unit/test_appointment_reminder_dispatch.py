@@ -0,0 +1,127 @@
+"""
+Unit tests for chunked appointment reminder queueing.
+
+Tests the per-run scheduling window, the outbox rows queued per reminder
+kind, which appointments are checkpointed as reminded, and chunking with the
+keyset position.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.appointments.reminder_dispatch import (
+    REMINDER_2_HOUR,
+    REMINDER_24_HOUR,
+    dispatch_appointment_reminders,
+    reminder_window,
+)
+from app.models.notification import NotificationChannel
+from app.notifications.outbox import APPOINTMENT_REMINDER
+
+NOW = datetime(2024, 3, 4, 9, 0)
+
+
+def make_appointment(minutes=0):
+    appointment = MagicMock()
+    appointment.id = uuid.uuid4()
+    appointment.scheduled_at = NOW + timedelta(hours=24, minutes=minutes)
+    return appointment
+
+
+@pytest.fixture
+def appointment_service():
+    """Mock AppointmentService serving appointment chunks from a list."""
+    service = MagicMock()
+    service.chunks = []
+
+    async def claim(sent_flag, start_time, end_time, limit, after=None):
+        return service.chunks.pop(0) if service.chunks else []
+
+    service.claim_reminder_appointments = AsyncMock(side_effect=claim)
+    service.mark_reminders_sent = AsyncMock(side_effect=lambda flag, ids, sent_at: len(ids))
+
+    with patch("app.appointments.reminder_dispatch.AppointmentService", return_value=service):
+        yield service
+
+
+@pytest.fixture
+def enqueue():
+    with patch("app.appointments.reminder_dispatch.enqueue_notifications", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+class TestReminderWindow:
+    """Test the scheduling window of a run."""
+
+    def test_window_is_centred_on_the_lead_time(self):
+        start, end = reminder_window(REMINDER_2_HOUR, NOW, timedelta(minutes=60))
+
+        assert start == NOW + timedelta(hours=1, minutes=30)
+        assert end == NOW + timedelta(hours=2, minutes=30)
+
+    def test_consecutive_runs_do_not_overlap(self):
+        window = timedelta(minutes=60)
+        _, first_end = reminder_window(REMINDER_24_HOUR, NOW, window)
+        second_start, _ = reminder_window(REMINDER_24_HOUR, NOW + window, window)
+
+        assert first_end == second_start
+
+
+class TestDispatchAppointmentReminders:
+    """Test appointment reminder queueing."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_checkpointed_in_order(self, appointment_service, enqueue):
+        first = [make_appointment(1), make_appointment(2)]
+        second = [make_appointment(3)]
+        appointment_service.chunks = [first, second]
+
+        result = await dispatch_appointment_reminders(
+            AsyncMock(), REMINDER_24_HOUR, now=NOW, chunk_size=2
+        )
+
+        assert result.as_dict() == {"reminder_type": "24_hour", "appointments": 3, "queued": 6, "chunks": 2}
+        afters = [call.kwargs["after"] for call in appointment_service.claim_reminder_appointments.call_args_list]
+        assert afters == [None, (first[-1].scheduled_at, first[-1].id)]
+        appointment_service.mark_reminders_sent.assert_any_await(
+            "reminder_sent_24h", [appointment.id for appointment in first], NOW
+        )
+
+    @pytest.mark.asyncio
+    async def test_channels_follow_reminder_kind(self, appointment_service, enqueue):
+        appointment = make_appointment()
+        appointment_service.chunks = [[appointment]]
+
+        await dispatch_appointment_reminders(AsyncMock(), REMINDER_2_HOUR, now=NOW, chunk_size=10)
+
+        rows = enqueue.await_args.args[1]
+        assert [row["channel"] for row in rows] == [
+            NotificationChannel.EMAIL, NotificationChannel.SMS, NotificationChannel.PUSH
+        ]
+        assert all(row["kind"] == APPOINTMENT_REMINDER for row in rows)
+        assert rows[0]["payload"] == {"appointment_id": str(appointment.id), "reminder_type": "2_hour"}
+
+    @pytest.mark.asyncio
+    async def test_keys_identify_the_reminder_and_slot(self, appointment_service, enqueue):
+        appointment = make_appointment()
+        appointment_service.chunks = [[appointment]]
+
+        await dispatch_appointment_reminders(AsyncMock(), REMINDER_24_HOUR, now=NOW, chunk_size=10)
+
+        rows = enqueue.await_args.args[1]
+        assert rows[0]["idempotency_key"] == (
+            f"{APPOINTMENT_REMINDER}:24_hour:{appointment.scheduled_at.isoformat()}:{appointment.id}:email"
+        )
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_releases_the_transaction(self, appointment_service, enqueue):
+        db = AsyncMock()
+
+        result = await dispatch_appointment_reminders(db, REMINDER_24_HOUR, now=NOW, chunk_size=10)
+
+        assert result.chunks == 0
+        db.rollback.assert_awaited_once()
+        enqueue.assert_not_awaited()
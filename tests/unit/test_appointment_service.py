@@ -0,0 +1,262 @@
+"""
+Unit tests for AppointmentService.
+
+Tests the core business logic and data access methods for appointment
+management without HTTP layer dependencies.
+"""
+
+import pytest
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.appointments.daily_stats import (
+    _daily_stats_deltas,
+    apply_daily_stats_change,
+    daily_stats_contribution,
+)
+from app.appointments.services import AppointmentService
+from app.models.appointment import Appointment, AppointmentPriority, AppointmentStatus, AppointmentType
+from app.core.exceptions import ValidationError
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def appointment_service(mock_db):
+    """Create AppointmentService instance with mocked database."""
+    return AppointmentService(mock_db)
+
+
+@pytest.fixture
+def sample_appointment():
+    """Sample scheduled appointment."""
+    return Appointment(
+        id=uuid.uuid4(),
+        pet_id=uuid.uuid4(),
+        pet_owner_id=uuid.uuid4(),
+        veterinarian_id=uuid.uuid4(),
+        clinic_id=uuid.uuid4(),
+        appointment_type=AppointmentType.CONSULTATION,
+        status=AppointmentStatus.SCHEDULED,
+        priority=AppointmentPriority.NORMAL,
+        scheduled_at=datetime(2030, 5, 1, 23, 30, tzinfo=timezone(timedelta(hours=-5))),
+        duration_minutes=30,
+        reason="Checkup",
+        estimated_cost=80.0
+    )
+
+
+def aggregate_row(group_key=None, **values):
+    """Aggregate row as returned by the statistics query."""
+    row = {
+        "total": 0,
+        "estimated_revenue": 0,
+        "actual_revenue": 0,
+    }
+    if group_key is not None:
+        row = {"group_key": group_key, **row}
+    row.update(values)
+    return row
+
+
+def mock_rows(mock_db, rows):
+    """Make mock_db.execute return the given aggregate rows."""
+    mock_result = MagicMock()
+    mock_result.mappings.return_value.all.return_value = rows
+    mock_db.execute.return_value = mock_result
+
+
+class TestAppointmentStatistics:
+    """Test SQL-side appointment statistics."""
+
+    @pytest.mark.asyncio
+    async def test_statistics_single_aggregate_query(self, appointment_service, mock_db):
+        """Statistics are computed from one aggregate row without loading appointments."""
+        mock_rows(mock_db, [aggregate_row(
+            total=10,
+            estimated_revenue=1000.0,
+            actual_revenue=450.0,
+            status_completed=3,
+            status_scheduled=2,
+            status_confirmed=1,
+            status_cancelled=2,
+            status_no_show=2,
+            type_vaccination=10,
+            priority_normal=10,
+        )])
+
+        result = await appointment_service.get_appointment_statistics(
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31)
+        )
+
+        mock_db.execute.assert_called_once()
+        assert result["period"] == {"start_date": "2024-01-01", "end_date": "2024-12-31"}
+        assert result["totals"] == {
+            "total_appointments": 10,
+            "completed_appointments": 3,
+            "total_estimated_revenue": 1000.0,
+            "total_actual_revenue": 450.0,
+            "average_appointment_cost": 150.0,
+        }
+        assert result["counts_by_status"]["cancelled"] == 2
+        assert result["counts_by_status"]["in_progress"] == 0
+        assert result["counts_by_type"]["vaccination"] == 10
+        assert result["counts_by_priority"]["normal"] == 10
+        assert result["rates"] == {
+            "completion_rate": 50.0,
+            "no_show_rate": 20.0,
+            "cancellation_rate": 20.0,
+        }
+        assert "groups" not in result
+
+    @pytest.mark.asyncio
+    async def test_statistics_empty_period(self, appointment_service, mock_db):
+        """An empty period yields zero counts and rates."""
+        mock_rows(mock_db, [aggregate_row()])
+
+        result = await appointment_service.get_appointment_statistics(
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31)
+        )
+
+        assert result["totals"]["total_appointments"] == 0
+        assert result["totals"]["average_appointment_cost"] == 0
+        assert result["rates"]["completion_rate"] == 0
+
+    @pytest.mark.asyncio
+    async def test_statistics_grouped_by_veterinarian(self, appointment_service, mock_db):
+        """Grouped statistics report each group and the overall totals."""
+        vet_a, vet_b = uuid.uuid4(), uuid.uuid4()
+        mock_rows(mock_db, [
+            aggregate_row(group_key=vet_a, total=4, actual_revenue=200.0, status_completed=2),
+            aggregate_row(group_key=vet_b, total=6, actual_revenue=100.0, status_completed=1,
+                          status_no_show=3),
+        ])
+
+        result = await appointment_service.get_appointment_statistics(
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            group_by="veterinarian"
+        )
+
+        assert result["group_by"] == "veterinarian"
+        assert [group["key"] for group in result["groups"]] == [str(vet_a), str(vet_b)]
+        assert result["groups"][0]["totals"]["average_appointment_cost"] == 100.0
+        assert result["groups"][1]["rates"]["no_show_rate"] == 50.0
+        assert result["totals"]["total_appointments"] == 10
+        assert result["totals"]["total_actual_revenue"] == 300.0
+        assert result["counts_by_status"]["completed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_statistics_grouped_by_month(self, appointment_service, mock_db):
+        """Time buckets are truncated in SQL and reported as dates."""
+        mock_rows(mock_db, [aggregate_row(group_key=datetime(2024, 3, 1), total=1)])
+
+        result = await appointment_service.get_appointment_statistics(
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            group_by="month"
+        )
+
+        assert result["groups"][0]["key"] == "2024-03-01"
+        query = mock_db.execute.call_args[0][0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "date_trunc('month', appointments.scheduled_at)" in sql
+        assert "GROUP BY date_trunc('month', appointments.scheduled_at)" in sql
+        assert "FILTER (WHERE" in sql
+
+    @pytest.mark.asyncio
+    async def test_statistics_invalid_group_by(self, appointment_service, mock_db):
+        """Unknown groupings are rejected before querying."""
+        with pytest.raises(ValidationError):
+            await appointment_service.get_appointment_statistics(group_by="species")
+
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_statistics_from_rollup(self, appointment_service, mock_db):
+        """Rollup statistics sum appointment_daily_stats rows by day."""
+        mock_rows(mock_db, [aggregate_row(group_key=date(2024, 3, 4), total=7)])
+
+        result = await appointment_service.get_appointment_statistics(
+            start_date=date(2024, 3, 1),
+            end_date=date(2024, 3, 31),
+            group_by="day",
+            from_rollup=True
+        )
+
+        assert result["groups"][0]["key"] == "2024-03-04"
+        query = mock_db.execute.call_args[0][0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "FROM appointment_daily_stats" in sql
+        assert "sum(appointment_daily_stats.appointment_count)" in sql
+        assert "FROM appointments" not in sql
+
+
+class TestAppointmentDailyStats:
+    """Test incremental maintenance of the daily rollup."""
+
+    def test_contribution_uses_utc_day(self, sample_appointment):
+        """Rollup day is the UTC date of scheduled_at."""
+        contribution = daily_stats_contribution(sample_appointment)
+
+        assert contribution.key[2] == date(2030, 5, 2)
+        assert contribution.key[3] == AppointmentStatus.SCHEDULED
+        assert contribution.estimated_revenue == 80.0
+        assert contribution.actual_revenue == 0.0
+
+    def test_status_change_moves_count(self, sample_appointment):
+        """A status change moves one count between rollup rows."""
+        before = daily_stats_contribution(sample_appointment)
+        sample_appointment.status = AppointmentStatus.CANCELLED
+        after = daily_stats_contribution(sample_appointment)
+
+        deltas = _daily_stats_deltas(before, after)
+
+        assert deltas == {before.key: (-1, -80.0, 0.0), after.key: (1, 80.0, 0.0)}
+
+    def test_unrelated_change_writes_nothing(self, sample_appointment):
+        """Changes outside the rollup key and revenue produce no deltas."""
+        before = daily_stats_contribution(sample_appointment)
+        sample_appointment.notes = "Bring records"
+
+        assert _daily_stats_deltas(before, daily_stats_contribution(sample_appointment)) == {}
+
+    @pytest.mark.asyncio
+    async def test_apply_change_upserts(self, mock_db, sample_appointment):
+        """New appointments are added with an INSERT ... ON CONFLICT upsert."""
+        await apply_daily_stats_change(mock_db, None, daily_stats_contribution(sample_appointment))
+
+        mock_db.execute.assert_called_once()
+        statement = mock_db.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO appointment_daily_stats" in sql
+        assert "ON CONFLICT (clinic_id, veterinarian_id, day, status, appointment_type, priority) DO UPDATE" in sql
+        assert "appointment_count = (appointment_daily_stats.appointment_count + excluded.appointment_count)" in sql
+
+    @pytest.mark.asyncio
+    async def test_cancel_appointment_updates_rollup(self, appointment_service, mock_db, sample_appointment):
+        """Cancelling moves the appointment from the scheduled to the cancelled row."""
+        appointment_service.get_appointment_by_id = AsyncMock(return_value=sample_appointment)
+
+        await appointment_service.cancel_appointment(sample_appointment.id, "Owner request")
+
+        # Two rollup upserts and the queued cancellation notifications
+        assert mock_db.execute.call_count == 3
+        mock_db.commit.assert_called_once()
+        written = [
+            call[0][0].compile().params for call in mock_db.execute.call_args_list
+            if len(call[0]) == 1
+        ]
+        assert {(params["status"], params["appointment_count"]) for params in written} == {
+            (AppointmentStatus.SCHEDULED, -1),
+            (AppointmentStatus.CANCELLED, 1),
+        }
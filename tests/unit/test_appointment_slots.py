@@ -0,0 +1,151 @@
+"""
+Unit tests for set-based appointment slot generation.
+
+Tests the in-memory slot calculation, the clinic-wide schedule built from
+veterinarian availability and operating hours, and the round-trips made
+when slots are written.
+"""
+
+import pytest
+import uuid
+from datetime import date, datetime, time, timezone
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.appointments.services import AppointmentService
+from app.appointments.slots import DailyWindow, day_slots, intersect_windows, weekday
+from app.models.clinic import ClinicOperatingHours, DayOfWeek, VeterinarianAvailability
+
+MONDAY = date(2026, 10, 19)
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+def result_with(rows=None, scalars=None):
+    """Mocked execute() result."""
+    result = MagicMock()
+    result.all.return_value = rows or []
+    result.scalars.return_value.all.return_value = scalars or []
+    return result
+
+
+def inserted(mock_db):
+    """Statement and parameter rows passed to the bulk insert."""
+    statement, rows = mock_db.scalars.call_args.args
+    return str(statement.compile(dialect=postgresql.dialect())), rows
+
+
+class TestSlotGeneration:
+    """Test slot calculation and bulk insertion."""
+
+    def test_day_slots_fill_window(self):
+        """A working day yields back-to-back slots ending by the close."""
+        slots = day_slots(MONDAY, DailyWindow(time(9), time(17)), 30)
+
+        assert len(slots) == 16
+        assert slots[0] == (
+            datetime(2026, 10, 19, 9, tzinfo=timezone.utc),
+            datetime(2026, 10, 19, 9, 30, tzinfo=timezone.utc),
+        )
+        assert slots[-1][1] == datetime(2026, 10, 19, 17, tzinfo=timezone.utc)
+
+    def test_day_slots_skip_breaks(self):
+        """No slot overlaps a break; slots resume when it ends."""
+        window = DailyWindow(time(9), time(17), ((time(12, 15), time(13)),))
+
+        slots = day_slots(MONDAY, window, 30)
+
+        starts = [start.time() for start, _ in slots]
+        assert time(11, 30) in starts
+        assert time(12) not in starts
+        assert time(13) in starts
+        assert len(slots) == 14
+
+    def test_intersect_with_operating_hours(self):
+        """Veterinarian hours are clipped to the clinic's and both breaks apply."""
+        availability = VeterinarianAvailability(
+            is_available=True, start_time=time(8), end_time=time(18),
+            break_start_time=time(12), break_end_time=time(13),
+        )
+        hours = ClinicOperatingHours(
+            is_open=True, open_time=time(9), close_time=time(17),
+            break_start_time=time(15), break_end_time=time(15, 30),
+        )
+
+        window = intersect_windows(availability, hours)
+
+        assert (window.start, window.end) == (time(9), time(17))
+        assert window.breaks == ((time(12), time(13)), (time(15), time(15, 30)))
+
+    def test_closed_clinic_has_no_window(self):
+        """Days the clinic is closed produce no slots."""
+        availability = VeterinarianAvailability(is_available=True, start_time=time(9), end_time=time(17))
+
+        assert intersect_windows(availability, ClinicOperatingHours(is_open=False)) is None
+        assert intersect_windows(availability, None) == DailyWindow(time(9), time(17))
+
+    @pytest.mark.asyncio
+    async def test_create_slots_in_two_round_trips(self, mock_db):
+        """Existing slots are read once and the rest inserted in one statement."""
+        veterinarian_id, clinic_id = uuid.uuid4(), uuid.uuid4()
+        taken = datetime(2026, 10, 19, 9, tzinfo=timezone.utc)
+        mock_db.execute.return_value = result_with(rows=[(veterinarian_id, clinic_id, taken)])
+        mock_db.scalars.return_value = MagicMock(all=MagicMock(return_value=["slot"]))
+
+        created = await AppointmentService(mock_db).create_appointment_slots(
+            veterinarian_id=veterinarian_id,
+            clinic_id=clinic_id,
+            start_date=MONDAY,
+            end_date=date(2026, 10, 25),
+        )
+
+        assert created == ["slot"]
+        assert mock_db.execute.call_count == 1
+        mock_db.refresh.assert_not_called()
+        mock_db.commit.assert_called_once()
+        sql, rows = inserted(mock_db)
+        assert "ON CONFLICT (veterinarian_id, clinic_id, start_time) DO NOTHING RETURNING" in sql
+        # Five weekdays of 16 slots, less the one already present
+        assert len(rows) == 79
+        assert taken not in {row["start_time"] for row in rows}
+
+    @pytest.mark.asyncio
+    async def test_create_clinic_slots_from_availability(self, mock_db):
+        """Clinic-wide generation follows each veterinarian's weekly availability."""
+        clinic_id, vet_a, vet_b = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        mock_db.execute.side_effect = [
+            result_with(scalars=[vet_a, vet_b]),
+            result_with(scalars=[ClinicOperatingHours(
+                day_of_week=DayOfWeek.MONDAY, is_open=True, open_time=time(9), close_time=time(12),
+            )]),
+            result_with(scalars=[
+                VeterinarianAvailability(
+                    veterinarian_id=vet_a, day_of_week=DayOfWeek.MONDAY, is_available=True,
+                    start_time=time(8), end_time=time(11), default_appointment_duration=30,
+                ),
+                VeterinarianAvailability(
+                    veterinarian_id=vet_b, day_of_week=DayOfWeek.TUESDAY, is_available=True,
+                    start_time=time(14), end_time=time(15), default_appointment_duration=20,
+                ),
+            ]),
+            result_with(),
+        ]
+        mock_db.scalars.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+        await AppointmentService(mock_db).create_clinic_appointment_slots(
+            clinic_id=clinic_id, start_date=MONDAY, end_date=date(2026, 10, 20)
+        )
+
+        _, rows = inserted(mock_db)
+        by_vet = {vet: [row for row in rows if row["veterinarian_id"] == vet] for vet in (vet_a, vet_b)}
+        # Monday 9:00-11:00 for vet A; Tuesday 14:00-15:00 in 20-minute slots for vet B
+        assert len(by_vet[vet_a]) == 4
+        assert by_vet[vet_a][0]["start_time"].time() == time(9)
+        assert len(by_vet[vet_b]) == 3
+        assert {row["duration_minutes"] for row in by_vet[vet_b]} == {20}
+        assert weekday(MONDAY) == DayOfWeek.MONDAY
@@ -348,24 +348,31 @@ class TestAuthCacheService:
     async def test_invalidate_user_related_cache_success(self, auth_cache_service, mock_redis_client):
         """Test successful invalidation of all user-related cache."""
         service = auth_cache_service
-        mock_redis_client.delete.return_value = True
+        mock_redis_client.set_members.return_value = {"hash_1"}
         
         result = await service.invalidate_user_related_cache("clerk_123", "user_456")
         
         assert result is True
-        # Should call delete 3 times (user data, permissions, role)
-        assert mock_redis_client.delete.call_count == 3
+        # Should delete user data, permissions, role and tokens in one call
+        mock_redis_client.delete_many.assert_called_once_with(
+            "auth:user:clerk_123",
+            "auth:permissions:user_456",
+            "auth:role:user_456",
+            "auth:jwt:user:clerk_123",
+            "auth:jwt:hash_1"
+        )
+        mock_redis_client.delete.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_invalidate_user_related_cache_partial_failure(self, auth_cache_service, mock_redis_client):
-        """Test partial failure in user-related cache invalidation."""
+    async def test_invalidate_user_related_cache_failure(self, auth_cache_service, mock_redis_client):
+        """Test failure in user-related cache invalidation."""
         service = auth_cache_service
-        # First call succeeds, second fails, third succeeds
-        mock_redis_client.delete.side_effect = [True, False, True]
+        mock_redis_client.set_members.return_value = set()
+        mock_redis_client.delete_many.side_effect = Exception("Redis unavailable")
         
         result = await service.invalidate_user_related_cache("clerk_123", "user_456")
         
-        assert result is False  # Should return False due to partial failure
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_get_cache_statistics(self, auth_cache_service):
@@ -0,0 +1,156 @@
+"""
+Unit tests for cache-first principal resolution.
+
+Tests AuthenticatedPrincipal, the in-process user data tier and the
+get_current_principal dependency.
+"""
+
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+
+from app.api.deps import get_current_principal, require_principal_role
+from app.auth.principal import AuthenticatedPrincipal
+from app.models.user import UserRole
+from app.services.auth_cache_service import AUTH_REVOCATION_CHANNEL, AuthCacheService
+
+
+def cached_user(role="pet_owner", is_active=True, clinic_id=None):
+    """User data as stored by AuthCacheService.cache_user_data."""
+    return {
+        "id": str(uuid.uuid4()),
+        "clerk_id": "user_123",
+        "email": "owner@example.com",
+        "role": role,
+        "is_active": is_active,
+        "clinic_id": clinic_id,
+    }
+
+
+@pytest.fixture
+def cache_service():
+    """AuthCacheService with mocked Redis."""
+    service = AuthCacheService()
+    service.redis = AsyncMock()
+    service.redis.get_json.return_value = None
+    return service
+
+
+class TestAuthenticatedPrincipal:
+    """Test building principals from cached data."""
+
+    def test_from_cached_user_data(self):
+        """Role permissions are resolved without the ORM User."""
+        principal = AuthenticatedPrincipal.from_cached_user_data(cached_user())
+
+        assert principal.role == UserRole.PET_OWNER
+        assert principal.has_permission("pets:write")
+        assert not principal.has_permission("clinic:write")
+        assert principal.clinic_id is None
+
+    def test_veterinarian_needs_clinic(self):
+        """A veterinarian cached without a clinic cannot become a principal."""
+        assert AuthenticatedPrincipal.from_cached_user_data(cached_user("veterinarian")) is None
+
+        clinic_id = str(uuid.uuid4())
+        principal = AuthenticatedPrincipal.from_cached_user_data(cached_user("veterinarian", clinic_id=clinic_id))
+        assert principal.clinic_id == uuid.UUID(clinic_id)
+
+    def test_incomplete_data_is_rejected(self):
+        """Data missing identity fields is treated as a cache miss."""
+        assert AuthenticatedPrincipal.from_cached_user_data({"clerk_id": "user_123"}) is None
+
+    def test_admin_has_every_permission(self):
+        """Admins keep the wildcard permission."""
+        principal = AuthenticatedPrincipal.from_cached_user_data(cached_user("admin"))
+        assert principal.is_admin and principal.has_permission("anything:at_all")
+
+
+class TestUserDataTiers:
+    """Test the in-process tier in front of the Redis user cache."""
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_fills_local_tier(self, cache_service):
+        """User data is read from Redis once per worker."""
+        cache_service.redis.get_json.return_value = cached_user()
+
+        await cache_service.get_user_data("user_123")
+        await cache_service.get_user_data("user_123")
+
+        cache_service.redis.get_json.assert_called_once_with("auth:user:user_123")
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_workers(self, cache_service):
+        """Dropping a user's data evicts it locally and is published."""
+        cache_service.redis.get_json.return_value = cached_user()
+        await cache_service.get_user_data("user_123")
+
+        await cache_service.invalidate_user_cache("user_123")
+
+        assert cache_service.local_user_cache.get("user_123") is None
+        cache_service.redis.publish.assert_called_once_with(AUTH_REVOCATION_CHANNEL, {"user_data": "user_123"})
+
+    def test_published_revocation_evicts_user_data(self, cache_service):
+        """Other workers' updates evict this worker's copy."""
+        cache_service.local_user_cache.put("user_123", cached_user())
+
+        assert cache_service.apply_revocation({"user_data": "user_123"}) == 1
+        assert cache_service.local_user_cache.get("user_123") is None
+
+
+class TestGetCurrentPrincipal:
+    """Test the principal dependency."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self, cache_service):
+        """A cached user resolves without touching the database session."""
+        cache_service.redis.get_json.return_value = cached_user()
+        db = AsyncMock()
+
+        with patch("app.api.deps.get_auth_cache_service", return_value=cache_service), \
+             patch("app.api.deps.UserSyncService") as sync_service_class:
+            principal = await get_current_principal({"clerk_id": "user_123"}, db)
+
+        assert principal.clerk_id == "user_123"
+        sync_service_class.assert_not_called()
+        db.execute.assert_not_called()
+        db.scalar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_is_rejected(self, cache_service):
+        """Deactivated accounts are refused from the cache as well."""
+        cache_service.redis.get_json.return_value = cached_user(is_active=False)
+
+        with patch("app.api.deps.get_auth_cache_service", return_value=cache_service):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_principal({"clerk_id": "user_123"}, AsyncMock())
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_syncs_user(self, cache_service):
+        """Without cached data the user is synced and a principal built from it."""
+        local_user = MagicMock(id=uuid.uuid4(), clerk_id="user_123", role=UserRole.PET_OWNER, is_active=True)
+        sync_service = AsyncMock()
+        sync_service.sync_user_data.return_value = MagicMock(success=True)
+        sync_service.get_user_by_clerk_id.return_value = local_user
+
+        with patch("app.api.deps.get_auth_cache_service", return_value=cache_service), \
+             patch("app.api.deps.get_clerk_service", return_value=AsyncMock()), \
+             patch("app.api.deps.UserSyncService", return_value=sync_service):
+            principal = await get_current_principal({"clerk_id": "user_123"}, AsyncMock())
+
+        assert principal.id == local_user.id
+        sync_service.sync_user_data.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_principal_role_check(self):
+        """Role checks run against the principal."""
+        principal = AuthenticatedPrincipal.from_cached_user_data(cached_user())
+        checker = require_principal_role([UserRole.ADMIN])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await checker(principal)
+
+        assert exc_info.value.status_code == 403
@@ -0,0 +1,89 @@
+"""
+Unit tests for the Redis cache value codec.
+"""
+
+import json
+import pytest
+
+from app.core.cache_codec import (
+    FLAG_ZLIB,
+    FORMAT_JSON,
+    FORMAT_MSGPACK,
+    CacheCodec,
+    CacheCodecError,
+    msgpack,
+)
+
+USER_DATA = {
+    "id": "8d3f5c1e-0000-4000-8000-000000000001",
+    "clerk_id": "user_123",
+    "email": "owner@example.com",
+    "role": "pet_owner",
+    "is_active": True,
+    "preferences": {},
+    "clinic_id": None,
+}
+
+requires_msgpack = pytest.mark.skipif(msgpack is None, reason="msgpack not installed")
+
+
+class TestCacheCodec:
+    """Test encoding, compression and cross-format decoding."""
+
+    def test_json_round_trip(self):
+        """JSON values carry the JSON header byte."""
+        codec = CacheCodec("json", compress_threshold=0)
+        encoded = codec.encode(USER_DATA)
+
+        assert encoded[0] == FORMAT_JSON
+        assert codec.decode(encoded) == USER_DATA
+
+    @requires_msgpack
+    def test_msgpack_round_trip(self):
+        """msgpack values are smaller than JSON and decode identically."""
+        codec = CacheCodec("msgpack", compress_threshold=0)
+        encoded = codec.encode(USER_DATA)
+
+        assert encoded[0] == FORMAT_MSGPACK
+        assert len(encoded) < len(json.dumps(USER_DATA))
+        assert codec.decode(encoded) == USER_DATA
+
+    def test_large_values_are_compressed(self):
+        """Payloads over the threshold are zlib-compressed and flagged."""
+        codec = CacheCodec("json", compress_threshold=64)
+        value = {"sessions": [USER_DATA] * 50}
+        encoded = codec.encode(value)
+
+        assert encoded[0] == FORMAT_JSON | FLAG_ZLIB
+        assert len(encoded) < len(json.dumps(value)) / 5
+        assert codec.decode(encoded) == value
+
+    def test_small_values_are_not_compressed(self):
+        """Payloads under the threshold are stored as-is."""
+        assert CacheCodec("json", compress_threshold=4096).encode(USER_DATA)[0] == FORMAT_JSON
+
+    @requires_msgpack
+    def test_any_format_decodes_values_written_by_another(self):
+        """Workers configured differently read each other's values during a rollout."""
+        json_codec = CacheCodec("json", compress_threshold=1)
+        msgpack_codec = CacheCodec("msgpack", compress_threshold=1)
+
+        assert json_codec.decode(msgpack_codec.encode(USER_DATA)) == USER_DATA
+        assert msgpack_codec.decode(json_codec.encode(USER_DATA)) == USER_DATA
+
+    def test_legacy_plain_json_is_decoded(self):
+        """Values cached before the codec existed still decode."""
+        legacy = json.dumps(USER_DATA)
+
+        assert CacheCodec("json").decode(legacy.encode()) == USER_DATA
+        assert CacheCodec("json").decode(legacy) == USER_DATA
+
+    def test_unknown_format_is_rejected(self):
+        """A format from a newer release is reported, not misread."""
+        with pytest.raises(CacheCodecError):
+            CacheCodec("json").decode(b"\x7f\x00\x01")
+
+    def test_unknown_codec_name(self):
+        """Misconfiguration fails fast."""
+        with pytest.raises(ValueError):
+            CacheCodec("pickle")
@@ -0,0 +1,48 @@
+"""
+Unit tests for the Celery beat schedule.
+
+Tests that every periodic task lands on a queue that the worker deployed in
+docker-compose.yml consumes, so no scheduled run sits unread in a queue.
+"""
+
+from fnmatch import fnmatch
+from pathlib import Path
+import re
+
+import pytest
+
+from app.core.celery_app import celery_app
+
+COMPOSE_FILE = Path(__file__).resolve().parents[2] / "docker-compose.yml"
+
+
+def consumed_queues() -> set:
+    """Queues named by the --queues option of the deployed worker commands."""
+    queues = set()
+    for match in re.finditer(r"celery .*\bworker\b.*--queues[= ](\S+)", COMPOSE_FILE.read_text()):
+        queues.update(match.group(1).split(","))
+    return queues
+
+
+def resolve_queue(entry: dict) -> str:
+    """Queue a beat entry is published to: its own option, else task_routes, else the default."""
+    queue = entry.get("options", {}).get("queue")
+    if queue:
+        return queue
+    for pattern, route in celery_app.conf.task_routes.items():
+        if fnmatch(entry["task"], pattern):
+            return route["queue"]
+    return celery_app.conf.task_default_queue
+
+
+class TestBeatSchedule:
+    """Test the periodic task schedule against the deployed workers."""
+
+    def test_worker_queues_are_declared(self):
+        assert consumed_queues() >= {"notifications", "reports", "maintenance"}
+
+    @pytest.mark.parametrize("name", sorted(celery_app.conf.beat_schedule))
+    def test_entry_queue_is_consumed(self, name):
+        entry = celery_app.conf.beat_schedule[name]
+
+        assert resolve_queue(entry) in consumed_queues(), name
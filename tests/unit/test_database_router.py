@@ -0,0 +1,75 @@
+"""
+Unit tests for read replica routing.
+
+Tests replica selection by replication lag, the lag check interval and the
+fallback to the primary, with replica engines mocked out.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.database import DatabaseRouter
+
+
+def replica_engine(lag=0.0, error=None):
+    """Mock async engine whose lag query returns lag or raises error."""
+    conn = MagicMock()
+    if error:
+        conn.execute = AsyncMock(side_effect=error)
+    else:
+        conn.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=lag)))
+
+    engine = MagicMock()
+    engine.url.host = "replica"
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    return engine
+
+
+class TestDatabaseRouter:
+    """Test replica selection."""
+
+    @pytest.mark.asyncio
+    async def test_no_replicas_reads_from_primary(self):
+        assert await DatabaseRouter([]).read_replica() is None
+
+    @pytest.mark.asyncio
+    async def test_replicas_used_round_robin(self):
+        first, second = replica_engine(), replica_engine()
+        router = DatabaseRouter([first, second], max_lag=5, check_interval=10)
+
+        chosen = [(await router.read_replica()).engine for _ in range(4)]
+
+        assert chosen == [first, second, first, second]
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_is_skipped(self):
+        lagging, current = replica_engine(lag=30.0), replica_engine(lag=0.5)
+        router = DatabaseRouter([lagging, current], max_lag=5, check_interval=10)
+
+        assert (await router.read_replica()).engine is current
+        assert (await router.read_replica()).engine is current
+
+    @pytest.mark.asyncio
+    async def test_all_replicas_lagging_falls_back_to_primary(self):
+        router = DatabaseRouter([replica_engine(lag=30.0)], max_lag=5, check_interval=10)
+
+        assert await router.read_replica() is None
+        assert router.statistics()[0]["lag_seconds"] == 30.0
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_to_primary(self):
+        router = DatabaseRouter([replica_engine(error=ConnectionError("down"))], max_lag=5, check_interval=10)
+
+        assert await router.read_replica() is None
+        assert router.statistics()[0]["healthy"] is False
+
+    @pytest.mark.asyncio
+    async def test_lag_is_checked_once_per_interval(self):
+        engine = replica_engine()
+        router = DatabaseRouter([engine], max_lag=5, check_interval=10)
+
+        for _ in range(5):
+            await router.read_replica()
+
+        assert engine.connect.call_count == 1
@@ -0,0 +1,93 @@
+"""
+Unit tests for radius search helpers.
+
+Tests the bounding-box prefilter, great-circle distances and the SQL used by
+the clinic and veterinarian location searches.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clinics.services import ClinicService
+from app.core.geo import bounding_box, haversine_miles, within_radius
+from app.models.clinic import Clinic
+
+NEW_YORK = (40.7128, -74.0060)
+PHILADELPHIA = (39.9526, -75.1652)
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+def compile_pg(statement):
+    """Render a statement for PostgreSQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestGeo:
+    """Test bounding boxes and distances."""
+
+    def test_haversine_known_distance(self):
+        """New York to Philadelphia is about 80 miles."""
+        assert haversine_miles(*NEW_YORK, *PHILADELPHIA) == pytest.approx(80.6, abs=0.5)
+
+    def test_bounding_box_contains_circle(self):
+        """Points at the radius in each direction fall inside the box."""
+        box = bounding_box(*NEW_YORK, 25)
+
+        assert box.min_latitude < NEW_YORK[0] - 0.36 < box.max_latitude
+        assert box.min_longitude < NEW_YORK[1] - 0.47 < box.max_longitude
+        assert haversine_miles(NEW_YORK[0], NEW_YORK[1], NEW_YORK[0], box.max_longitude) == pytest.approx(25, rel=0.01)
+
+    def test_bounding_box_across_antimeridian(self):
+        """Boxes crossing 180 degrees match both sides of the line."""
+        box = bounding_box(0.0, 179.9, 50)
+
+        sql = compile_pg(select(Clinic.id).where(box.condition(Clinic.latitude, Clinic.longitude)))
+
+        assert box.max_longitude > 180
+        assert "clinics.longitude >= %(longitude_1)s OR clinics.longitude <= %(longitude_2)s" in sql
+
+    def test_bounding_box_at_pole(self):
+        """A circle containing a pole spans every longitude."""
+        box = bounding_box(89.9, 0.0, 50)
+
+        sql = compile_pg(select(Clinic.id).where(box.condition(Clinic.latitude, Clinic.longitude)))
+
+        assert box.max_latitude == 90.0
+        assert "longitude" not in sql.split("WHERE")[1]
+
+    def test_within_radius_prefilters_by_box(self):
+        """The indexable box comes before the exact distance check."""
+        sql = compile_pg(select(Clinic.id).where(within_radius(Clinic.latitude, Clinic.longitude, *NEW_YORK, 25)))
+
+        where = sql.split("WHERE")[1]
+        assert where.index("clinics.latitude BETWEEN") < where.index("asin(")
+        assert "clinics.longitude BETWEEN" in where
+        assert "acos" not in where
+
+    @pytest.mark.asyncio
+    async def test_list_clinics_returns_distance(self, mock_db):
+        """Location searches set distance_miles on each returned clinic."""
+        clinic = Clinic(id=None, name="Philly Vets", latitude=PHILADELPHIA[0], longitude=PHILADELPHIA[1])
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 1
+        mock_result.scalars.return_value.all.return_value = [clinic]
+        mock_db.execute.return_value = mock_result
+
+        clinics, total = await ClinicService(mock_db).list_clinics(
+            latitude=NEW_YORK[0], longitude=NEW_YORK[1], radius_miles=100, sort_by="distance"
+        )
+
+        assert clinics[0].distance_miles == pytest.approx(80.6, abs=0.5)
+        sql = compile_pg(mock_db.execute.call_args[0][0])
+        assert "clinics.latitude BETWEEN" in sql
+        order_by = sql.split("ORDER BY")[1]
+        assert "asin(" in order_by
+        assert "clinics.id" in order_by
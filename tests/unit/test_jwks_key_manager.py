@@ -0,0 +1,151 @@
+"""
+Unit tests for the JWKS key manager.
+
+Runs the manager against a local JWKS stub served through httpx's
+MockTransport, with Redis mocked out.
+"""
+
+import asyncio
+import json
+import time
+import httpx
+import jwt
+import pytest
+from unittest.mock import AsyncMock
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core.exceptions import AuthenticationError
+from app.services.jwks_key_manager import JWKS_SHARED_CACHE_KEY, JWKSKeyManager
+
+
+def rsa_jwk(kid):
+    """Public JWK of a freshly generated RSA key."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return jwk
+
+
+class JWKSStub:
+    """JWKS endpoint stub that counts requests and can be made slow or failing."""
+
+    def __init__(self, *kids):
+        self.keys = [rsa_jwk(kid) for kid in kids]
+        self.requests = 0
+        self.delay = 0.0
+        self.status_code = 200
+
+    async def handler(self, request):
+        self.requests += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return httpx.Response(self.status_code, json={"keys": self.keys})
+
+    def manager(self, **kwargs):
+        options = {"ttl_seconds": 3600, "refresh_ahead_seconds": 300, "min_refresh_interval": 30}
+        options.update(kwargs)
+        manager = JWKSKeyManager(
+            "https://clerk.test/.well-known/jwks.json",
+            transport=httpx.MockTransport(self.handler),
+            **options
+        )
+        manager.redis = AsyncMock()
+        manager.redis.get_json.return_value = None
+        return manager
+
+
+class TestJWKSKeyManager:
+    """Test key loading, refresh and sharing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self):
+        """A cold cache hit by many requests fetches the key set once."""
+        stub = JWKSStub("kid_1")
+        stub.delay = 0.05
+        manager = stub.manager()
+
+        keys = await asyncio.gather(*(manager.get_key("kid_1") for _ in range(20)))
+
+        assert stub.requests == 1
+        assert all(key is keys[0] for key in keys)
+
+    @pytest.mark.asyncio
+    async def test_keys_are_parsed_once(self):
+        """Verification receives the same parsed key object every time."""
+        stub = JWKSStub("kid_1")
+        manager = stub.manager()
+
+        first = await manager.get_key("kid_1")
+        second = await manager.get_key("kid_1")
+
+        assert first is second
+        assert not isinstance(first, (str, bytes))
+        assert stub.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refetch_is_rate_limited(self):
+        """A kid missing from a fresh key set refetches at most once per interval."""
+        stub = JWKSStub("kid_1")
+        manager = stub.manager(min_refresh_interval=60)
+        await manager.get_key("kid_1")
+
+        for _ in range(5):
+            with pytest.raises(AuthenticationError):
+                await manager.get_key("unknown")
+
+        assert stub.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_rotated_key_is_picked_up(self):
+        """A new kid triggers a refetch once the interval allows it."""
+        stub = JWKSStub("kid_1")
+        manager = stub.manager(min_refresh_interval=0)
+        await manager.get_key("kid_1")
+
+        stub.keys.append(rsa_jwk("kid_2"))
+
+        assert await manager.get_key("kid_2") is not None
+        assert stub.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_before_expiry(self):
+        """Lookups near expiry are served from cache while a refresh runs."""
+        stub = JWKSStub("kid_1")
+        manager = stub.manager()
+        await manager.get_key("kid_1")
+        manager.loaded_at = time.time() - 3400
+
+        assert await manager.get_key("kid_1") is not None
+        await manager._refresh_task
+
+        assert stub.requests == 2
+        assert time.time() - manager.loaded_at < 5
+
+    @pytest.mark.asyncio
+    async def test_stale_keys_survive_failed_refresh(self):
+        """An unreachable endpoint leaves previously loaded keys for the fallback."""
+        stub = JWKSStub("kid_1")
+        manager = stub.manager()
+        key = await manager.get_key("kid_1")
+        manager.loaded_at = time.time() - 7200
+        stub.status_code = 503
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await manager.get_key("kid_1")
+
+        assert manager.get_cached_key("kid_1") is key
+
+    @pytest.mark.asyncio
+    async def test_key_set_shared_through_redis(self):
+        """Workers reuse a fresh key set another worker stored in Redis."""
+        stub = JWKSStub("kid_1")
+        first = stub.manager()
+        await first.get_key("kid_1")
+        key, shared, ttl = first.redis.set_json.call_args.args
+        assert key == JWKS_SHARED_CACHE_KEY and ttl == 3600
+
+        second = stub.manager()
+        second.redis.get_json.return_value = shared
+
+        assert await second.get_key("kid_1") is not None
+        assert stub.requests == 1
@@ -0,0 +1,193 @@
+"""
+Unit tests for the two-tier JWT validation cache.
+
+Tests the in-process LocalTokenCache, AuthCacheService's lookups through the
+in-process tier and Redis, and revocations published to other workers.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.auth_cache_service import AUTH_REVOCATION_CHANNEL, AuthCacheService
+from app.services import local_token_cache
+from app.services.local_token_cache import LocalTokenCache
+
+
+def validation(clerk_id="user_123", session_id="sess_123", expires_in=3600, now=None):
+    """JWT validation result as produced by ClerkService."""
+    return {
+        "user_id": clerk_id,
+        "clerk_id": clerk_id,
+        "role": "pet_owner",
+        "exp": int((time.time() if now is None else now) + expires_in),
+        "session_id": session_id,
+    }
+
+
+@pytest.fixture
+def mock_redis_client():
+    """Mock Redis client for testing."""
+    mock_redis = AsyncMock()
+    mock_redis.get_json.return_value = None
+    mock_redis.set_json.return_value = True
+    mock_redis.set_members.return_value = set()
+    return mock_redis
+
+
+@pytest.fixture
+def cache_service(mock_redis_client):
+    """AuthCacheService with mocked Redis."""
+    service = AuthCacheService()
+    service.redis = mock_redis_client
+    return service
+
+
+class TestLocalTokenCache:
+    """Test the bounded in-process tier."""
+
+    def test_least_recently_used_entries_are_dropped(self):
+        """The cache never grows past max_entries."""
+        cache = LocalTokenCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", validation("u1"))
+        cache.put("b", validation("u2"))
+        cache.get("a")
+        cache.put("c", validation("u3"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert len(cache) == 2
+
+    def test_entries_expire_with_the_token(self, monkeypatch):
+        """A token's exp caps the local TTL; expired tokens are never cached."""
+        clock = SimpleNamespace(now=1_700_000_000.0)
+        monkeypatch.setattr(local_token_cache, "time", SimpleNamespace(time=lambda: clock.now))
+        cache = LocalTokenCache(ttl_seconds=300)
+        cache.put("expired", validation(expires_in=-1, now=clock.now))
+        cache.put("short", validation(expires_in=10, now=clock.now))
+
+        assert cache.get("expired") is None
+        assert cache.get("short") is not None
+        clock.now += 11
+        assert cache.get("short") is None
+
+    def test_evict_by_user_and_session(self):
+        """Revocations drop every token of a user or session."""
+        cache = LocalTokenCache()
+        cache.put("a", validation("u1", "s1"))
+        cache.put("b", validation("u1", "s2"))
+        cache.put("c", validation("u2", "s3"))
+
+        assert cache.evict_session("s2") == 1
+        assert cache.evict_user("u1") == 1
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_statistics(self):
+        """Hits and misses give the tier's hit ratio."""
+        cache = LocalTokenCache()
+        cache.put("a", validation())
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.statistics()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 1)
+        assert stats["hit_ratio"] == pytest.approx(0.6667)
+
+
+class TestTwoTierLookup:
+    """Test lookups and writes across both tiers."""
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_redis(self, cache_service, mock_redis_client):
+        """After a validation is stored, repeat lookups make no Redis round-trip."""
+        await cache_service.store_jwt_validation("header.payload.sig", validation())
+        mock_redis_client.get_json.reset_mock()
+
+        for _ in range(3):
+            assert (await cache_service.get_jwt_validation("header.payload.sig"))["clerk_id"] == "user_123"
+
+        mock_redis_client.get_json.assert_not_called()
+        tiers = cache_service.get_jwt_tier_statistics()
+        assert tiers["local"]["hits"] == 3
+        assert tiers["redis"]["hits"] + tiers["redis"]["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_fills_local_tier(self, cache_service, mock_redis_client):
+        """A validation cached by another worker is read from Redis once."""
+        mock_redis_client.get_json.return_value = validation()
+
+        await cache_service.get_jwt_validation("token")
+        await cache_service.get_jwt_validation("token")
+
+        mock_redis_client.get_json.assert_called_once()
+        assert cache_service.get_jwt_tier_statistics()["redis"]["hit_ratio"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_cached_tokens_are_indexed_by_user_and_session(self, cache_service, mock_redis_client):
+        """Redis keeps per-user and per-session sets of token hashes for revocation."""
+        await cache_service.cache_jwt_validation("token", validation())
+
+        keys, member, _ = mock_redis_client.add_to_sets.call_args.args
+        assert keys == ["auth:jwt:user:user_123", "auth:jwt:session:sess_123"]
+        assert member == cache_service._hash_token("token")
+
+
+class TestRevocation:
+    """Test revocations across workers."""
+
+    @pytest.mark.asyncio
+    async def test_revoke_user_deletes_and_publishes(self, cache_service, mock_redis_client):
+        """Revoking a user drops its Redis entries and tells every worker."""
+        await cache_service.store_jwt_validation("token", validation())
+        token_hash = cache_service._hash_token("token")
+        mock_redis_client.set_members.return_value = {token_hash}
+
+        assert await cache_service.revoke_jwt_validations(clerk_id="user_123") is True
+
+        assert await cache_service.get_jwt_validation("token") is None
+        mock_redis_client.delete_many.assert_called_once_with(
+            "auth:jwt:user:user_123", f"auth:jwt:{token_hash}"
+        )
+        mock_redis_client.publish.assert_called_once_with(AUTH_REVOCATION_CHANNEL, {"clerk_id": "user_123"})
+
+    @pytest.mark.asyncio
+    async def test_listener_applies_published_revocations(self, cache_service, mock_redis_client):
+        """Messages from other workers evict tokens from this worker's tier."""
+        cache_service.local_jwt_cache.put("hash_a", validation("u1", "s1"))
+
+        async def messages():
+            cache_service.local_jwt_cache.put("hash_a", validation("u1", "s1"))
+            yield {"type": "message", "data": "not json"}
+            yield {"type": "message", "data": json.dumps({"session_id": "s1"})}
+            await asyncio.Event().wait()
+
+        pubsub = MagicMock(close=AsyncMock())
+        pubsub.listen.return_value = messages()
+        mock_redis_client.subscribe.return_value = pubsub
+
+        listener = asyncio.create_task(cache_service.listen_for_revocations())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+        mock_redis_client.subscribe.assert_called_once_with(AUTH_REVOCATION_CHANNEL)
+        assert cache_service.local_jwt_cache.get("hash_a") is None
+        pubsub.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_user_invalidation_revokes_tokens(self, cache_service, mock_redis_client):
+        """Invalidating a deleted user's cache also revokes their tokens."""
+        await cache_service.store_jwt_validation("token", validation("clerk_123"))
+
+        await cache_service.invalidate_user_related_cache("clerk_123", "user_456")
+
+        assert await cache_service.get_jwt_validation("token") is None
+        mock_redis_client.publish.assert_called_once_with(AUTH_REVOCATION_CHANNEL, {"clerk_id": "clerk_123"})
@@ -0,0 +1,207 @@
+"""
+Unit tests for loader profiles and query budgets.
+
+Covers profile option/budget resolution, statement counting against a real
+SQLite engine, and the relationship defaults the profiles rely on.
+"""
+
+import pytest
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.exceptions import QueryBudgetExceededError
+from app.core.loader_profiles import (
+    Include,
+    LoaderProfile,
+    QueryBudgetMiddleware,
+    enforce_query_budgets,
+    install_query_counter,
+    track_profile,
+    track_request_queries,
+)
+from app.models.appointment import Appointment
+from app.models.clinic import Clinic, Veterinarian
+from app.models.pet import Pet
+from app.pets.services import PET_DETAIL_PROFILE, PetService
+from app.appointments.services import APPOINTMENT_DETAIL_PROFILE
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the statement counter installed."""
+    engine = create_engine("sqlite://")
+    install_query_counter(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestLoaderProfile:
+    """Test profile option and budget resolution."""
+
+    def test_budget_counts_selected_includes(self):
+        """Budget is one SELECT plus one per eager load requested."""
+        assert PET_DETAIL_PROFILE.budget() == 1
+        assert PET_DETAIL_PROFILE.budget(include_owner=True) == 2
+        assert PET_DETAIL_PROFILE.budget(
+            include_owner=True, include_health_records=True, include_appointments=True
+        ) == 4
+
+    def test_nested_include_declares_its_queries(self):
+        """Veterinarian include loads the vet and its user."""
+        assert APPOINTMENT_DETAIL_PROFILE.budget(include_veterinarian=True) == 3
+        assert len(APPOINTMENT_DETAIL_PROFILE.options(include_veterinarian=True)) == 1
+
+    def test_always_include_applies_without_flags(self):
+        """Always-loaded relationships are part of every plan."""
+        profile = LoaderProfile(
+            "test.always",
+            always=Include(selectinload(Veterinarian.user)),
+            includes={"include_clinic": Include(selectinload(Veterinarian.clinic))},
+        )
+
+        assert len(profile.options()) == 1
+        assert len(profile.options(include_clinic=True)) == 2
+        assert profile.budget(include_clinic=False) == 2
+
+    def test_unknown_flag_rejected(self):
+        """Flags that the profile does not declare raise ValueError."""
+        with pytest.raises(ValueError, match="include_reviews"):
+            PET_DETAIL_PROFILE.options(include_reviews=True)
+
+    def test_apply_without_options_returns_query(self):
+        """A profile with nothing selected leaves the query untouched."""
+        query = select(Pet)
+        assert PET_DETAIL_PROFILE.apply(query) is query
+
+    @pytest.mark.asyncio
+    async def test_execute_passes_profile_options(self):
+        """execute() runs the query with the profile's loader options."""
+        mock_db = AsyncMock(spec=AsyncSession)
+
+        await PET_DETAIL_PROFILE.execute(mock_db, select(Pet), include_owner=True)
+
+        mock_db.execute.assert_called_once()
+        executed_query = mock_db.execute.call_args[0][0]
+        assert len(executed_query._with_options) == 1
+
+
+class TestQueryBudgets:
+    """Test statement counting and budget enforcement."""
+
+    def test_statements_counted_within_budget(self, engine):
+        """Statements issued inside a tracked block are counted."""
+        with enforce_query_budgets("strict"):
+            with track_profile("test.count", allowed=2) as execution:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    conn.execute(text("SELECT 2"))
+
+        assert execution.executed == 2
+        assert not execution.exceeded
+
+    def test_strict_mode_raises_when_exceeded(self, engine):
+        """Strict mode fails when a profile issues more queries than planned."""
+        with enforce_query_budgets("strict"):
+            with pytest.raises(QueryBudgetExceededError) as exc_info:
+                with track_profile("test.strict", allowed=1):
+                    with engine.connect() as conn:
+                        conn.execute(text("SELECT 1"))
+                        conn.execute(text("SELECT 2"))
+
+        assert exc_info.value.details == {"profile": "test.strict", "allowed": 1, "executed": 2}
+
+    def test_warn_mode_logs_when_exceeded(self, engine, caplog):
+        """Warn mode logs the overrun instead of raising."""
+        with enforce_query_budgets("warn"):
+            with track_profile("test.warn", allowed=0) as execution:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+
+        assert execution.exceeded
+        assert "test.warn issued 1 queries (budget 0)" in caplog.text
+
+    def test_install_query_counter_is_idempotent(self, engine):
+        """Installing the counter twice does not double count."""
+        install_query_counter(engine)
+
+        with track_profile("test.idempotent", allowed=1) as execution:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        assert execution.executed == 1
+
+    def test_request_log_collects_profile_executions(self, engine):
+        """Request log totals statements and records each profile run."""
+        with enforce_query_budgets("warn"):
+            with track_request_queries("GET /api/v2/pets") as request_log:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    with track_profile("test.request", allowed=1):
+                        conn.execute(text("SELECT 2"))
+                        conn.execute(text("SELECT 3"))
+
+        assert request_log.total == 3
+        assert [execution.name for execution in request_log.executions] == ["test.request"]
+        assert [execution.name for execution in request_log.violations] == ["test.request"]
+
+    def test_invalid_mode_rejected(self):
+        """Only off, warn and strict are accepted."""
+        with pytest.raises(ValueError):
+            with enforce_query_budgets("loud"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_middleware_tracks_http_requests(self, engine, caplog):
+        """Middleware reports per-endpoint statement counts."""
+        async def app(scope, receive, send):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        middleware = QueryBudgetMiddleware(app)
+
+        with caplog.at_level("DEBUG", logger="app.core.loader_profiles"):
+            await middleware({"type": "http", "method": "GET", "path": "/api/v2/pets"}, None, None)
+
+        assert "GET /api/v2/pets: 1 queries" in caplog.text
+
+
+class TestRelationshipDefaults:
+    """Relationships no longer load implicitly."""
+
+    @pytest.mark.parametrize("attribute, strategy", [
+        (Pet.appointments, "raise"),
+        (Pet.reminders, "raise"),
+        (Pet.veterinarians, "raise"),
+        (Pet.owner, "noload"),
+        (Pet.health_records, "noload"),
+        (Clinic.appointments, "raise"),
+        (Clinic.veterinarians, "raise"),
+        (Clinic.reviews, "noload"),
+        (Veterinarian.appointments, "raise"),
+        (Veterinarian.pets, "raise"),
+        (Veterinarian.user, "noload"),
+        (Appointment.clinic, "noload"),
+    ])
+    def test_lazy_strategy(self, attribute, strategy):
+        """Heavy collections raise; schema-facing relationships are noload."""
+        assert attribute.property.lazy == strategy
+
+
+class TestPetServiceProfiles:
+    """PetService routes its include flags through loader profiles."""
+
+    @pytest.mark.asyncio
+    async def test_get_pet_by_id_uses_requested_includes(self):
+        """Only the requested relationships are attached to the query."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = Pet(id=uuid.uuid4(), name="Rex")
+        mock_db.execute.return_value = mock_result
+
+        await PetService(mock_db).get_pet_by_id(uuid.uuid4(), include_owner=True)
+
+        executed_query = mock_db.execute.call_args[0][0]
+        assert len(executed_query._with_options) == 1
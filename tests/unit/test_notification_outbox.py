@@ -0,0 +1,189 @@
+"""
+Unit tests for the notification outbox.
+
+Tests outbox rows and their idempotency keys, backoff between attempts, and
+how a drain run records sent, skipped, retried and dead-lettered rows.
+"""
+
+import uuid
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.notification import NotificationChannel, OutboxStatus
+from app.notifications.outbox import (
+    APPOINTMENT_CONFIRMATION,
+    APPOINTMENT_RESCHEDULE,
+    MESSAGE,
+    appointment_rows,
+    enqueue_notifications,
+    message_row,
+)
+from app.notifications.transports import OutboundMessage, Transport
+from app.notifications.worker import drain_outbox, retry_delay
+
+
+def make_row(attempts=0):
+    row = MagicMock()
+    row.id = uuid.uuid4()
+    row.idempotency_key = f"{MESSAGE}:{row.id}"
+    row.attempts = attempts
+    row.status = OutboxStatus.PENDING
+    return row
+
+
+class RecordingTransport(Transport):
+    """Transport returning preset outcomes and recording its batches."""
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.batches = []
+
+    async def send_batch(self, messages):
+        self.batches.append(messages)
+        return [self.errors.get(message.idempotency_key) for message in messages]
+
+
+@pytest.fixture
+def outbox():
+    """Serve outbox batches from a list and render rows from a dict."""
+    state = MagicMock(batches=[], rendered={})
+
+    async def claim(db, channel, limit):
+        return state.batches.pop(0) if state.batches else []
+
+    async def render(db, rows):
+        return {row.id: state.rendered[row.id] for row in rows}
+
+    with patch("app.notifications.worker.claim_outbox_batch", side_effect=claim), \
+            patch("app.notifications.worker.render_rows", side_effect=render):
+        yield state
+
+
+def message_for(row):
+    return OutboundMessage(row.idempotency_key, "owner@example.com", "body", "subject")
+
+
+class TestOutboxRows:
+    """Test outbox row construction."""
+
+    def test_appointment_rows_share_a_key_per_channel(self):
+        appointment_id = uuid.uuid4()
+
+        rows = appointment_rows(APPOINTMENT_CONFIRMATION, appointment_id)
+
+        assert [row["channel"] for row in rows] == [NotificationChannel.EMAIL, NotificationChannel.SMS]
+        assert [row["idempotency_key"] for row in rows] == [
+            f"{APPOINTMENT_CONFIRMATION}:{appointment_id}:email",
+            f"{APPOINTMENT_CONFIRMATION}:{appointment_id}:sms",
+        ]
+        assert all(row["status"] == OutboxStatus.PENDING and row["attempts"] == 0 for row in rows)
+
+    def test_event_distinguishes_repeated_changes(self):
+        appointment_id = uuid.uuid4()
+
+        first = appointment_rows(APPOINTMENT_RESCHEDULE, appointment_id, event="2024-03-04T09:00:00")
+        second = appointment_rows(APPOINTMENT_RESCHEDULE, appointment_id, event="2024-03-05T09:00:00")
+
+        assert first[0]["idempotency_key"] != second[0]["idempotency_key"]
+        assert first[0]["payload"] == {"appointment_id": str(appointment_id)}
+
+    def test_message_without_key_is_never_deduplicated(self):
+        first = message_row(NotificationChannel.SMS, "+15550100", "hi")
+        second = message_row(NotificationChannel.SMS, "+15550100", "hi")
+
+        assert first["idempotency_key"] != second["idempotency_key"]
+        assert message_row(NotificationChannel.SMS, "+15550100", "hi", idempotency_key="k")["idempotency_key"] == "k"
+
+    @pytest.mark.asyncio
+    async def test_enqueue_inserts_all_rows_in_one_statement(self):
+        db = AsyncMock()
+        rows = appointment_rows(APPOINTMENT_CONFIRMATION, uuid.uuid4())
+
+        await enqueue_notifications(db, rows)
+        await enqueue_notifications(db, [])
+
+        db.execute.assert_awaited_once()
+        assert db.execute.await_args.args[1] == rows
+        db.commit.assert_not_awaited()
+
+
+class TestRetryDelay:
+    """Test backoff between attempts."""
+
+    def test_delay_doubles_up_to_the_cap(self):
+        with patch("app.notifications.worker.settings") as settings:
+            settings.NOTIFICATION_RETRY_BASE_SECONDS = 30
+            settings.NOTIFICATION_RETRY_MAX_SECONDS = 100
+
+            assert retry_delay(1) == timedelta(seconds=30)
+            assert retry_delay(2) == timedelta(seconds=60)
+            assert retry_delay(3) == timedelta(seconds=100)
+
+
+class TestDrainOutbox:
+    """Test draining a channel's outbox."""
+
+    @pytest.mark.asyncio
+    async def test_outcomes_are_recorded_per_row(self, outbox):
+        sent, skipped, failed = make_row(), make_row(), make_row()
+        outbox.batches = [[sent, skipped, failed]]
+        outbox.rendered = {sent.id: message_for(sent), skipped.id: None, failed.id: message_for(failed)}
+        transport = RecordingTransport({failed.idempotency_key: RuntimeError("mailbox unavailable")})
+        db = AsyncMock()
+
+        result = await drain_outbox(db, NotificationChannel.EMAIL, transport, batch_size=10)
+
+        assert result.as_dict() == {
+            "channel": "email", "sent": 1, "skipped": 1, "retried": 1, "dead": 0, "batches": 1
+        }
+        assert len(transport.batches) == 1 and len(transport.batches[0]) == 2
+        assert sent.status == OutboxStatus.SENT
+        assert skipped.status == OutboxStatus.SKIPPED
+        assert failed.status == OutboxStatus.PENDING
+        assert failed.attempts == 1
+        assert failed.last_error == "mailbox unavailable"
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_render_errors_count_as_failed_attempts(self, outbox):
+        row = make_row()
+        outbox.batches = [[row]]
+        outbox.rendered = {row.id: ValueError("Unknown notification kind: x")}
+        transport = RecordingTransport()
+
+        result = await drain_outbox(AsyncMock(), NotificationChannel.SMS, transport, batch_size=10)
+
+        assert result.retried == 1
+        assert transport.batches == []
+
+    @pytest.mark.asyncio
+    async def test_last_attempt_is_dead_lettered(self, outbox):
+        row = make_row(attempts=4)
+        outbox.batches = [[row]]
+        outbox.rendered = {row.id: message_for(row)}
+        transport = RecordingTransport({row.idempotency_key: RuntimeError("rejected")})
+
+        with patch("app.notifications.worker.settings") as settings:
+            settings.NOTIFICATION_MAX_ATTEMPTS = 5
+            result = await drain_outbox(
+                AsyncMock(), NotificationChannel.EMAIL, transport, batch_size=10, max_batches=1
+            )
+
+        assert result.dead == 1
+        assert row.status == OutboxStatus.DEAD
+
+    @pytest.mark.asyncio
+    async def test_run_stops_after_max_batches(self, outbox):
+        rows = [make_row() for _ in range(4)]
+        outbox.batches = [rows[:2], rows[2:]]
+        outbox.rendered = {row.id: message_for(row) for row in rows}
+        db = AsyncMock()
+
+        result = await drain_outbox(
+            db, NotificationChannel.PUSH, RecordingTransport(), batch_size=2, max_batches=1
+        )
+
+        assert (result.sent, result.batches) == (2, 1)
+        assert outbox.batches == [rows[2:]]
@@ -0,0 +1,180 @@
+"""
+Unit tests for precompiled notification templates.
+
+Tests the template syntax (subjects, conditional lines and blocks,
+strftime placeholders), per-locale caching with fallback to the default
+locale, compile and render errors, and the shipped templates.
+"""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.notifications.contexts import appointment_context, reminder_context
+from app.notifications.templates import (
+    CompiledTemplate,
+    NotificationTemplates,
+    TemplateError,
+    get_notification_templates,
+)
+
+
+def compile_template(source):
+    return CompiledTemplate("test", "en", "email", source)
+
+
+@pytest.fixture
+def templates(tmp_path):
+    """Registry over a directory with an English and a French template."""
+    for locale, greeting in (("en", "Hello"), ("fr", "Bonjour")):
+        directory = tmp_path / locale / "email"
+        directory.mkdir(parents=True)
+        (directory / "greeting.txt").write_text(f"Subject: {greeting}\n\n{greeting} {{name}}\n")
+    (tmp_path / "en" / "sms").mkdir()
+    (tmp_path / "en" / "sms" / "greeting.txt").write_text("Hi {name}\n")
+    return NotificationTemplates(tmp_path)
+
+
+class TestTemplateSyntax:
+    """Test compiling and rendering template text."""
+
+    def test_subject_is_split_from_body(self):
+        message = compile_template("Subject: Reminder: {title}\n\nBody for {title}\n").render({"title": "Rabies"})
+
+        assert message.subject == "Reminder: Rabies"
+        assert message.body == "Body for Rabies"
+
+    def test_body_without_subject(self):
+        message = compile_template("Just {name}").render({"name": "Buddy"})
+
+        assert message.subject is None
+        assert message.body == "Just Buddy"
+
+    def test_conditional_line_needs_a_truthy_field(self):
+        template = compile_template("Start\n?details Details: {details}\nEnd")
+
+        assert template.render({"details": "Booster"}).body == "Start\nDetails: Booster\nEnd"
+        assert template.render({"details": None}).body == "Start\nEnd"
+
+    def test_conditional_block_matches_a_value(self):
+        template = compile_template(
+            "Due\n\n?kind=vaccination\nBook a vaccination.\n\n?end\nThanks"
+        )
+
+        assert template.render({"kind": "vaccination"}).body == "Due\n\nBook a vaccination.\n\nThanks"
+        assert template.render({"kind": "checkup"}).body == "Due\n\nThanks"
+
+    def test_skipped_last_line_leaves_no_trailing_newline(self):
+        template = compile_template("?lead=24_hour In 24 hours\n?lead=2_hour In 2 hours")
+
+        assert template.render({"lead": "24_hour"}).body == "In 24 hours"
+
+    def test_strftime_and_format_specs(self):
+        template = compile_template("{day:%B %d, %Y} at {time:%I:%M %p} [{name:>5}] {{literal}}")
+
+        body = template.render({"day": date(2025, 1, 15), "time": datetime(2025, 1, 15, 10), "name": "ab"}).body
+
+        assert body == "January 15, 2025 at 10:00 AM [   ab] {literal}"
+
+    def test_quotes_and_backslashes_are_literal(self):
+        body = compile_template("It's a \\ test: {name}").render({"name": "'x'"}).body
+
+        assert body == "It's a \\ test: 'x'"
+
+    @pytest.mark.parametrize("source", [
+        "{pet.name}",
+        "{unclosed",
+        "?end",
+        "?open\nnever closed",
+        "?outer\n?inner text\n?end",
+    ])
+    def test_malformed_templates_fail_to_compile(self, source):
+        with pytest.raises(TemplateError):
+            compile_template(source)
+
+    def test_missing_field_raises_template_error(self):
+        with pytest.raises(TemplateError):
+            compile_template("Hello {name}").render({})
+
+
+class TestNotificationTemplates:
+    """Test loading and looking up templates."""
+
+    def test_load_compiles_every_template(self, templates):
+        assert templates.load() == 3
+
+    def test_templates_are_cached_per_locale_and_channel(self, templates):
+        english = templates.get("greeting", "email")
+
+        assert templates.get("greeting", "email", "en") is english
+        assert templates.get("greeting", "email", "fr").render({"name": "Léa"}).subject == "Bonjour"
+        assert templates.get("greeting", "sms").render({"name": "Sam"}).body == "Hi Sam"
+
+    def test_missing_locale_falls_back_to_default(self, templates):
+        assert templates.get("greeting", "sms", "fr") is templates.get("greeting", "sms", "en")
+
+    def test_missing_template_raises(self, templates):
+        with pytest.raises(TemplateError):
+            templates.get("greeting", "push")
+
+    def test_render_many(self, templates):
+        messages = templates.render_many("greeting", "email", [{"name": "A"}, {"name": "B"}])
+
+        assert [message.body for message in messages] == ["Hello A", "Hello B"]
+
+
+class TestShippedTemplates:
+    """Test the templates in templates/notifications."""
+
+    @pytest.fixture
+    def appointment(self):
+        return SimpleNamespace(
+            pet_owner=SimpleNamespace(first_name="John"),
+            pet=SimpleNamespace(name="Buddy"),
+            scheduled_at=datetime(2025, 1, 15, 10, 0),
+            appointment_type=SimpleNamespace(value="routine_checkup"),
+            veterinarian=SimpleNamespace(user=SimpleNamespace(last_name="Smith")),
+            clinic=None,
+            cancellation_reason="Owner request",
+        )
+
+    def test_health_reminder_email(self):
+        context = reminder_context(
+            SimpleNamespace(first_name="John"),
+            SimpleNamespace(name="Buddy"),
+            SimpleNamespace(
+                title="Vaccination Reminder", description=None, reminder_type="medication",
+                due_date=date(2025, 1, 15)
+            ),
+        )
+
+        message = get_notification_templates().render("health_reminder", "email", context)
+
+        assert message.subject == "Reminder: Vaccination Reminder"
+        assert "Details:" not in message.body
+        assert "Due Date: January 15, 2025\n\nPlease ensure your pet receives their medication" in message.body
+
+    @pytest.mark.parametrize("reminder_type, lead", [("24h", "24 hours"), ("24_hour", "24 hours"), ("2_hour", "2 hours")])
+    def test_appointment_reminder_lead_time(self, appointment, reminder_type, lead):
+        context = appointment_context(appointment, reminder_type=reminder_type)
+
+        sms = get_notification_templates().render("appointment_reminder", "sms", context)
+
+        assert sms.body == f"Reminder: Buddy has an appointment in {lead} on 01/15/2025 at 10:00 AM"
+
+    def test_appointment_confirmation_email(self, appointment):
+        message = get_notification_templates().render(
+            "appointment_confirmation", "email", appointment_context(appointment)
+        )
+
+        assert message.subject == "Appointment Confirmed - Buddy"
+        assert "Type: Routine Checkup\nVeterinarian: Dr. Smith\n\nPlease arrive" in message.body
+        assert "Location:" not in message.body
+
+    def test_appointment_reschedule_sms(self, appointment):
+        context = appointment_context(appointment, old_scheduled_at=datetime(2025, 1, 14, 9, 30))
+
+        body = get_notification_templates().render("appointment_reschedule", "sms", context).body
+
+        assert body == "Appointment rescheduled for Buddy from 01/14/2025 at 09:30 AM to 01/15/2025 at 10:00 AM"
@@ -0,0 +1,195 @@
+"""
+Unit tests for keyset pagination and count modes.
+
+Tests cursor encoding, keyset conditions and the count helpers used by the
+list services, plus cursor mode end to end through PetService.list_pets.
+"""
+
+import pytest
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.app_helpers.pagination_helpers import (
+    KeysetSort,
+    count_rows,
+    estimate_rows,
+    keyset_page,
+    paginate_query,
+)
+from app.appointments.services import APPOINTMENT_SORTS
+from app.core.exceptions import ValidationError
+from app.models.appointment import Appointment, AppointmentPriority
+from app.models.pet import Pet
+from app.pets.services import PET_SORTS, PetService
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+def compile_pg(statement):
+    """Render a statement for PostgreSQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def make_pet(name, created_at):
+    """Pet with the columns the pet sorts read."""
+    return Pet(id=uuid.uuid4(), owner_id=uuid.uuid4(), name=name, species="dog", created_at=created_at)
+
+
+class TestKeysetSort:
+    """Test cursor encoding and keyset conditions."""
+
+    def test_cursor_round_trip(self):
+        """A cursor decodes back to the row's sort values and id."""
+        appointment = Appointment(id=uuid.uuid4(), priority=AppointmentPriority.URGENT)
+        keyset = APPOINTMENT_SORTS["priority"]
+
+        condition = keyset.after(keyset.cursor_for(appointment))
+
+        params = condition.compile().params
+        assert AppointmentPriority.URGENT in params.values()
+        assert appointment.id in params.values()
+        assert compile_pg(condition).startswith("(appointments.priority, appointments.id) <")
+
+    def test_ascending_sort_continues_after_cursor(self):
+        """Ascending sorts continue with greater (value, id) pairs."""
+        pet = make_pet("Rex", datetime(2024, 1, 1, tzinfo=timezone.utc))
+        keyset = PET_SORTS["name"]
+
+        sql = compile_pg(keyset.after(keyset.cursor_for(pet)))
+
+        assert sql.startswith("(pets.name, pets.id) >")
+
+    def test_cursor_from_other_sort_rejected(self):
+        """Cursors cannot be replayed against a different sort."""
+        pet = make_pet("Rex", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        with pytest.raises(ValidationError):
+            PET_SORTS["created_at"].after(PET_SORTS["name"].cursor_for(pet))
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!!"])
+    def test_malformed_cursor_rejected(self, cursor):
+        """Garbage cursors raise ValidationError instead of reaching the database."""
+        with pytest.raises(ValidationError):
+            PET_SORTS["name"].after(cursor)
+
+    def test_paginate_with_cursor_skips_offset(self):
+        """Cursor pages seek by keyset instead of OFFSET and fetch one extra row."""
+        pet = make_pet("Rex", datetime(2024, 1, 1, tzinfo=timezone.utc))
+        keyset = PET_SORTS["created_at"]
+
+        query = paginate_query(select(Pet), page=50, per_page=20, cursor=keyset.cursor_for(pet), keyset=keyset)
+
+        sql = compile_pg(query)
+        assert "OFFSET" not in sql
+        assert "ORDER BY pets.created_at DESC, pets.id DESC" in sql
+        assert "(pets.created_at, pets.id) <" in sql
+        assert query._limit == 21
+
+    def test_paginate_offset_mode(self):
+        """Without a cursor the page offset still applies."""
+        query = paginate_query(select(Pet), page=3, per_page=20, keyset=PET_SORTS["name"])
+
+        assert query._offset == 40
+        assert query._limit == 21
+
+    def test_cursor_requires_keyset(self):
+        """Offset-only sorts reject cursors."""
+        with pytest.raises(ValidationError):
+            paginate_query(select(Pet), page=1, per_page=20, cursor="abc", keyset=None)
+
+    def test_keyset_page_trims_look_ahead_row(self):
+        """The extra row signals another page and is not returned."""
+        keyset = KeysetSort("name", [Pet.name], Pet.id)
+        pets = [make_pet(name, None) for name in ("A", "B", "C")]
+
+        page = keyset_page(pets, 2, keyset)
+
+        assert page == pets[:2]
+        assert keyset.after(page.next_cursor) is not None
+        assert keyset_page(pets, 3, keyset).next_cursor is None
+
+
+class TestCountRows:
+    """Test the count modes."""
+
+    @pytest.mark.asyncio
+    async def test_count_none_skips_query(self, mock_db):
+        """count=none never queries."""
+        total = await count_rows(mock_db, select(func.count(Pet.id)), select(Pet), "none")
+
+        assert total is None
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_exact(self, mock_db):
+        """count=exact runs the count query."""
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 7
+        mock_db.execute.return_value = mock_result
+
+        assert await count_rows(mock_db, select(func.count(Pet.id)), select(Pet)) == 7
+
+    @pytest.mark.asyncio
+    async def test_count_invalid_mode(self, mock_db):
+        """Unknown count modes are rejected."""
+        with pytest.raises(ValidationError):
+            await count_rows(mock_db, select(func.count(Pet.id)), select(Pet), "approximate")
+
+    @pytest.mark.asyncio
+    async def test_estimate_unfiltered_uses_pg_class(self, mock_db):
+        """An unfiltered table reads reltuples without scanning."""
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 1234.0
+        mock_db.execute.return_value = mock_result
+
+        assert await estimate_rows(mock_db, select(Pet)) == 1234
+
+        statement, params = mock_db.execute.call_args[0]
+        assert "pg_class" in str(statement)
+        assert params == {"table": "pets"}
+
+    @pytest.mark.asyncio
+    async def test_estimate_filtered_uses_explain(self, mock_db):
+        """Filtered queries use the planner's row estimate."""
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = '[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 42}}]'
+        mock_db.execute.return_value = mock_result
+
+        assert await estimate_rows(mock_db, select(Pet).where(Pet.species == "cat")) == 42
+
+        sql = compile_pg(mock_db.execute.call_args[0][0])
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "WHERE pets.species = %(species_1)s" in sql
+
+
+class TestPetListCursor:
+    """Test cursor mode through PetService.list_pets."""
+
+    @pytest.mark.asyncio
+    async def test_list_pets_cursor_without_count(self, mock_db):
+        """count=none with a cursor runs a single keyset query."""
+        pets = [make_pet(name, None) for name in ("A", "B", "C")]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = pets
+        mock_db.execute.return_value = mock_result
+        cursor = PET_SORTS["name"].cursor_for(make_pet("0", None))
+
+        page, total = await PetService(mock_db).list_pets(
+            per_page=2, sort_by="name", cursor=cursor, count_mode="none"
+        )
+
+        assert total is None
+        assert page == pets[:2]
+        assert page.next_cursor == PET_SORTS["name"].cursor_for(pets[1])
+        mock_db.execute.assert_called_once()
+        sql = compile_pg(mock_db.execute.call_args[0][0])
+        assert "OFFSET" not in sql
+        assert "(pets.name, pets.id) >" in sql
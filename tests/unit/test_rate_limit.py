@@ -0,0 +1,148 @@
+"""
+Unit tests for sliding-window rate limiting.
+
+Tests the in-process pre-check, the Redis-backed limiter with the Lua script
+mocked out, and the RateLimiter dependency's headers and 429 responses.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException, Response
+from starlette.requests import Request
+
+from app.api.deps import RateLimiter
+from app.core.rate_limit import (
+    SLIDING_WINDOW_SCRIPT,
+    LocalRateLimitPrecheck,
+    RateLimitResult,
+    SlidingWindowRateLimiter,
+)
+
+
+def make_request(path="/api/v1/appointments/statistics", host="203.0.113.10", token=None):
+    """Starlette request with an optional bearer token."""
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": headers,
+        "client": (host, 12345),
+        "query_string": b"",
+    })
+
+
+@pytest.fixture
+def limiter():
+    """SlidingWindowRateLimiter with mocked Redis."""
+    limiter = SlidingWindowRateLimiter()
+    limiter.redis = AsyncMock()
+    limiter.redis.run_script.return_value = [1, 4, 60000]
+    return limiter
+
+
+class TestLocalRateLimitPrecheck:
+    """Test the in-process flood shedding."""
+
+    def test_exceeds_after_limit(self):
+        """Only requests beyond the limit in one window are shed."""
+        precheck = LocalRateLimitPrecheck()
+
+        results = [precheck.exceeded("client", 3, 60)[0] for _ in range(5)]
+
+        assert results == [False, False, False, True, True]
+
+    def test_keys_are_bounded(self):
+        """The counter table never grows past max_keys."""
+        precheck = LocalRateLimitPrecheck(max_keys=10)
+        for i in range(100):
+            precheck.exceeded(f"client_{i}", 3, 60)
+
+        assert len(precheck._windows) <= 10
+
+
+class TestSlidingWindowRateLimiter:
+    """Test the Redis-backed limiter."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_request(self, limiter):
+        """The script result becomes limit, remaining and reset."""
+        result = await limiter.hit("api:ip:1.2.3.4", 5, 60)
+
+        assert result == RateLimitResult(allowed=True, limit=5, remaining=4, reset_seconds=60)
+        script, = limiter.redis.run_script.call_args.args
+        assert script == SLIDING_WINDOW_SCRIPT
+        assert limiter.redis.run_script.call_args.kwargs["keys"] == ["rate_limit:api:ip:1.2.3.4"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_request(self, limiter):
+        """A full window is rejected with the time until a slot frees up."""
+        limiter.redis.run_script.return_value = [0, 0, 1500]
+
+        result = await limiter.hit("api:ip:1.2.3.4", 5, 60)
+
+        assert not result.allowed
+        assert result.reset_seconds == 2
+
+    @pytest.mark.asyncio
+    async def test_local_flood_skips_redis(self, limiter):
+        """Once this worker alone has exceeded the limit, Redis is not asked."""
+        for _ in range(3):
+            await limiter.hit("api:ip:1.2.3.4", 3, 60)
+        limiter.redis.run_script.reset_mock()
+
+        result = await limiter.hit("api:ip:1.2.3.4", 3, 60)
+
+        assert not result.allowed
+        limiter.redis.run_script.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_fails_open(self, limiter):
+        """An unavailable Redis does not take the API down."""
+        limiter.redis.run_script.side_effect = ConnectionError("Redis unavailable")
+
+        assert (await limiter.hit("api:ip:1.2.3.4", 5, 60)).allowed
+
+
+class TestRateLimiterDependency:
+    """Test the FastAPI dependency."""
+
+    @pytest.mark.asyncio
+    async def test_headers_on_allowed_request(self):
+        """Allowed responses carry the RateLimit-* headers."""
+        mock_limiter = MagicMock(hit=AsyncMock(return_value=RateLimitResult(True, 20, 19, 60)))
+        response = Response()
+
+        with patch("app.api.deps.get_rate_limiter", return_value=mock_limiter):
+            await RateLimiter(20, 60, name="expensive", per_route=True)(make_request(), response)
+
+        assert response.headers["RateLimit-Limit"] == "20"
+        assert response.headers["RateLimit-Remaining"] == "19"
+        assert response.headers["RateLimit-Reset"] == "60"
+        key = mock_limiter.hit.call_args.args[0]
+        assert key == "expensive:ip:203.0.113.10:GET:/api/v1/appointments/statistics"
+
+    @pytest.mark.asyncio
+    async def test_rejected_request_is_429(self):
+        """Rejections are 429 with Retry-After."""
+        mock_limiter = MagicMock(hit=AsyncMock(return_value=RateLimitResult(False, 20, 0, 7)))
+
+        with patch("app.api.deps.get_rate_limiter", return_value=mock_limiter):
+            with pytest.raises(HTTPException) as exc_info:
+                await RateLimiter(20, 60)(make_request(), Response())
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "7"
+
+    @pytest.mark.asyncio
+    async def test_verified_users_are_keyed_by_user(self):
+        """Clients whose token this worker already verified are limited per user."""
+        mock_limiter = MagicMock(hit=AsyncMock(return_value=RateLimitResult(True, 20, 19, 60)))
+        cache_service = MagicMock()
+        cache_service.peek_jwt_validation.return_value = {"clerk_id": "user_123"}
+
+        with patch("app.api.deps.get_rate_limiter", return_value=mock_limiter), \
+             patch("app.api.deps.get_auth_cache_service", return_value=cache_service):
+            await RateLimiter(20, 60, name="api")(make_request(token="header.payload.sig"), Response())
+
+        assert mock_limiter.hit.call_args.args[0] == "api:user:user_123"
@@ -0,0 +1,128 @@
+"""
+Unit tests for the review rating aggregates kept on clinics and veterinarians.
+
+Tests the UPDATE issued with each new review, the averages derived from the
+stored counts and the rating sort and filter.
+"""
+
+import pytest
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Update
+
+from app.clinics.services import ClinicService, VETERINARIAN_SORTS
+from app.models.clinic import Clinic, ClinicType, Veterinarian
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def clinic():
+    """Clinic with two reviews recorded."""
+    return Clinic(
+        id=uuid.uuid4(),
+        name="Rated Clinic",
+        clinic_type=ClinicType.GENERAL_PRACTICE,
+        phone_number="555-0123",
+        address_line1="1 Main St",
+        city="Springfield",
+        state="IL",
+        zip_code="62701",
+        rating_count=2,
+        rating_sum=9,
+        rating_average=4.5,
+    )
+
+
+def compile_pg(statement):
+    """Render a statement for PostgreSQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def executed_updates(mock_db):
+    """UPDATE statements passed to the mocked session."""
+    return [call.args[0] for call in mock_db.execute.call_args_list if isinstance(call.args[0], Update)]
+
+
+class TestRatingAggregates:
+    """Test maintained rating counts, sums and averages."""
+
+    def test_average_from_stored_aggregates(self, clinic):
+        """Averages come from the stored sum and count, not loaded reviews."""
+        assert clinic.average_rating == 4.5
+
+    def test_average_is_none_without_reviews(self):
+        """Unreviewed rows report no average."""
+        veterinarian = Veterinarian(rating_count=0, rating_sum=0, expertise_rating_count=0, expertise_rating_sum=0)
+
+        assert veterinarian.average_rating is None
+        assert veterinarian.average_expertise_rating is None
+
+    @pytest.mark.asyncio
+    async def test_clinic_review_updates_aggregates(self, mock_db, clinic):
+        """A new clinic review increments the clinic's aggregates in the same transaction."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = clinic
+        mock_db.execute.return_value = mock_result
+
+        await ClinicService(mock_db).create_clinic_review(clinic_id=clinic.id, reviewer_id=uuid.uuid4(), rating=4)
+
+        update, = executed_updates(mock_db)
+        sql = compile_pg(update)
+        assert "rating_count=(clinics.rating_count + %(rating_count_1)s)" in sql
+        assert "rating_sum=(clinics.rating_sum + %(rating_sum_1)s)" in sql
+        assert "rating_average=(CAST(clinics.rating_sum + %(rating_sum_2)s AS FLOAT) /" in sql
+        assert update.compile().params["rating_sum_1"] == 4
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_veterinarian_review_counts_given_sub_ratings(self, mock_db):
+        """Only the sub-ratings included in a review are counted."""
+        veterinarian = Veterinarian(id=uuid.uuid4(), clinic_id=uuid.uuid4(), license_number="VET1")
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = veterinarian
+        mock_db.execute.return_value = mock_result
+
+        await ClinicService(mock_db).create_veterinarian_review(
+            veterinarian_id=veterinarian.id,
+            reviewer_id=uuid.uuid4(),
+            rating=5,
+            expertise_rating=4,
+        )
+
+        update, = executed_updates(mock_db)
+        sql = compile_pg(update)
+        assert "expertise_rating_count=" in sql
+        assert "expertise_rating_sum=" in sql
+        assert "bedside_manner_rating_count" not in sql
+        assert "communication_rating_count" not in sql
+
+    @pytest.mark.asyncio
+    async def test_list_clinics_sorts_and_filters_by_rating(self, mock_db, clinic):
+        """The rating sort and filter use the indexed aggregate columns."""
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 1
+        mock_result.scalars.return_value.all.return_value = [clinic]
+        mock_db.execute.return_value = mock_result
+
+        clinics, total = await ClinicService(mock_db).list_clinics(sort_by="rating", min_rating=4)
+
+        sql = compile_pg(mock_db.execute.call_args[0][0])
+        assert "clinics.rating_average >= %(rating_average_1)s" in sql
+        assert "ORDER BY clinics.rating_average DESC, clinics.rating_count DESC, clinics.id DESC" in sql
+        assert "clinic_reviews" not in sql
+
+    def test_veterinarian_rating_sort_supports_cursors(self):
+        """Rating sort positions round-trip through a cursor."""
+        sort = VETERINARIAN_SORTS["rating"]
+        veterinarian = Veterinarian(id=uuid.uuid4(), rating_average=4.25, rating_count=8)
+
+        condition = compile_pg(sort.after(sort.cursor_for(veterinarian)))
+
+        assert "(veterinarians.rating_average, veterinarians.rating_count, veterinarians.id) <" in condition
@@ -0,0 +1,102 @@
+"""
+Unit tests for chunked health reminder queueing.
+
+Tests chunking with the keyset position, one outbox row per enabled channel
+with stable idempotency keys, and that each chunk is marked with a single
+update.
+"""
+
+import uuid
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.notification import NotificationChannel
+from app.notifications.outbox import HEALTH_REMINDER
+from app.pets.reminder_dispatch import dispatch_due_reminders
+
+
+def make_reminder(day=1):
+    reminder = MagicMock()
+    reminder.id = uuid.uuid4()
+    reminder.reminder_date = date(2024, 1, day)
+    return reminder
+
+
+@pytest.fixture
+def pet_service():
+    """Mock PetService serving reminder chunks from a list."""
+    service = MagicMock()
+    service.chunks = []
+
+    async def claim(due_date, limit, after=None):
+        return service.chunks.pop(0) if service.chunks else []
+
+    service.claim_due_reminders = AsyncMock(side_effect=claim)
+    service.mark_reminders_sent = AsyncMock(side_effect=lambda ids: len(ids))
+
+    with patch("app.pets.reminder_dispatch.PetService", return_value=service):
+        yield service
+
+
+@pytest.fixture
+def enqueue():
+    with patch("app.pets.reminder_dispatch.enqueue_notifications", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.fixture
+def email_only():
+    with patch(
+        "app.pets.reminder_dispatch.enabled_channels",
+        return_value=(NotificationChannel.EMAIL,)
+    ):
+        yield
+
+
+class TestDispatchDueReminders:
+    """Test reminder queueing."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_claimed_after_the_previous_chunk(self, pet_service, enqueue, email_only):
+        first = [make_reminder(1), make_reminder(2)]
+        second = [make_reminder(3)]
+        pet_service.chunks = [first, second]
+
+        result = await dispatch_due_reminders(AsyncMock(), chunk_size=2)
+
+        assert result.as_dict() == {"reminders": 3, "queued": 3, "chunks": 2}
+        afters = [call.kwargs["after"] for call in pet_service.claim_due_reminders.call_args_list]
+        assert afters == [None, (first[-1].reminder_date, first[-1].id)]
+        assert pet_service.mark_reminders_sent.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_queues_a_row_per_enabled_channel(self, pet_service, enqueue):
+        reminder = make_reminder(5)
+        pet_service.chunks = [[reminder]]
+
+        with patch(
+            "app.pets.reminder_dispatch.enabled_channels",
+            return_value=(NotificationChannel.EMAIL, NotificationChannel.SMS)
+        ):
+            result = await dispatch_due_reminders(AsyncMock(), chunk_size=10)
+
+        rows = enqueue.await_args.args[1]
+        assert result.queued == 2
+        assert [row["channel"] for row in rows] == [NotificationChannel.EMAIL, NotificationChannel.SMS]
+        assert all(row["kind"] == HEALTH_REMINDER for row in rows)
+        assert all(row["payload"] == {"reminder_id": str(reminder.id)} for row in rows)
+        assert rows[0]["idempotency_key"] == f"{HEALTH_REMINDER}:{reminder.id}:2024-01-05:email"
+        pet_service.mark_reminders_sent.assert_awaited_once_with([reminder.id])
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_releases_the_transaction(self, pet_service, enqueue, email_only):
+        db = AsyncMock()
+
+        result = await dispatch_due_reminders(db, chunk_size=10)
+
+        assert result.chunks == 0
+        db.rollback.assert_awaited_once()
+        enqueue.assert_not_awaited()
+        pet_service.mark_reminders_sent.assert_not_awaited()
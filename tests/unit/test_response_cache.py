@@ -0,0 +1,193 @@
+"""
+Unit tests for the read-through response cache.
+
+Tests key normalization, ETag handling, the cached_response decorator on a
+small FastAPI app with Redis mocked out, and tag invalidation from ClinicService.
+"""
+
+import time
+import uuid
+import pytest
+from contextlib import asynccontextmanager
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import FastAPI, Query
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clinics.services import ClinicService
+from app.core.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    cached_response,
+    etag_for,
+    etag_matches,
+)
+
+
+@pytest.fixture
+def cache():
+    """ResponseCache with mocked Redis and an empty store."""
+    cache = ResponseCache(ttl=60, stale_ttl=30)
+    cache.redis = AsyncMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.store = AsyncMock(
+        side_effect=lambda key, body, tags=(): CachedResponse(body, etag_for(body), time.time() + 60)
+    )
+    cache.acquire_revalidation = AsyncMock(return_value=True)
+    return cache
+
+
+@pytest.fixture
+def calls():
+    """Number of times the endpoint body actually ran."""
+    return []
+
+
+@pytest.fixture
+def client(calls):
+    """App with one cached endpoint."""
+    app = FastAPI()
+
+    @app.get("/clinics/{clinic_id}")
+    @cached_response(tags=["clinic:{clinic_id}"], role_param=None)
+    async def get_clinic(clinic_id: uuid.UUID, city: Optional[str] = Query(None)):
+        calls.append(clinic_id)
+        return {"id": str(clinic_id), "city": city}
+
+    return TestClient(app)
+
+
+class TestKeysAndETags:
+    """Test cache key normalization and ETag comparison."""
+
+    def test_parameter_order_does_not_matter(self):
+        """The same validated parameters give the same key."""
+        cache = ResponseCache()
+
+        assert cache.build_key("/clinics", "pet_owner", {"page": 1, "city": "Austin"}) == \
+            cache.build_key("/clinics", "pet_owner", {"city": "Austin", "page": 1})
+
+    def test_role_is_part_of_the_key(self):
+        """Roles never share entries."""
+        cache = ResponseCache()
+
+        assert cache.build_key("/clinics", "pet_owner", {"page": 1}) != \
+            cache.build_key("/clinics", "admin", {"page": 1})
+
+    def test_etag_matching(self):
+        """Weak validators, lists and * match."""
+        etag = etag_for(b"{}")
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestCachedResponse:
+    """Test the decorator through FastAPI."""
+
+    def test_miss_stores_rendered_body_under_tags(self, client, cache, calls):
+        """A miss runs the endpoint and stores its JSON with the formatted tags."""
+        clinic_id = uuid.uuid4()
+
+        with patch("app.core.response_cache.get_response_cache", return_value=cache):
+            response = client.get(f"/clinics/{clinic_id}", params={"city": "Austin"})
+
+        assert response.status_code == 200
+        assert response.json() == {"id": str(clinic_id), "city": "Austin"}
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.headers["ETag"] == etag_for(response.content)
+        key, body, tags = cache.store.call_args.args
+        assert tags == [f"clinic:{clinic_id}"]
+        assert len(calls) == 1
+
+    def test_fresh_hit_skips_the_endpoint(self, client, cache, calls):
+        """A fresh entry is returned as stored."""
+        body = b'{"id": "cached"}'
+        cache.get.return_value = CachedResponse(body, etag_for(body), time.time() + 60)
+
+        with patch("app.core.response_cache.get_response_cache", return_value=cache):
+            response = client.get(f"/clinics/{uuid.uuid4()}")
+
+        assert response.content == body
+        assert response.headers["X-Cache"] == "HIT"
+        assert calls == []
+
+    def test_matching_if_none_match_is_304(self, client, cache, calls):
+        """Clients holding the current ETag get 304 without a body."""
+        body = b'{"id": "cached"}'
+        cache.get.return_value = CachedResponse(body, etag_for(body), time.time() + 60)
+
+        with patch("app.core.response_cache.get_response_cache", return_value=cache):
+            response = client.get(f"/clinics/{uuid.uuid4()}", headers={"If-None-Match": etag_for(body)})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert calls == []
+
+    def test_stale_entry_served_while_another_request_revalidates(self, client, cache, calls):
+        """Only the request holding the revalidation lock recomputes."""
+        body = b'{"id": "stale"}'
+        cache.get.return_value = CachedResponse(body, etag_for(body), time.time() - 1)
+        cache.acquire_revalidation.return_value = False
+
+        with patch("app.core.response_cache.get_response_cache", return_value=cache):
+            response = client.get(f"/clinics/{uuid.uuid4()}")
+
+        assert response.content == body
+        assert response.headers["X-Cache"] == "STALE"
+        assert calls == []
+
+    def test_stale_entry_recomputed_by_lock_holder(self, client, cache, calls):
+        """The lock holder refreshes the entry."""
+        body = b'{"id": "stale"}'
+        cache.get.return_value = CachedResponse(body, etag_for(body), time.time() - 1)
+
+        with patch("app.core.response_cache.get_response_cache", return_value=cache):
+            response = client.get(f"/clinics/{uuid.uuid4()}")
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert len(calls) == 1
+        cache.store.assert_awaited_once()
+
+
+class TestInvalidation:
+    """Test tag invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_deletes_tagged_responses(self):
+        """Every response under a tag and the tag index go in one DEL."""
+        cache = ResponseCache()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[{"response:a", "response:b"}, {"response:b"}])
+
+        @asynccontextmanager
+        async def pipeline(transaction=False, binary=False):
+            yield pipe
+
+        cache.redis = AsyncMock()
+        cache.redis.pipeline = pipeline
+
+        removed = await cache.invalidate_tags("clinic:1", "clinics")
+
+        assert removed == 2
+        assert sorted(cache.redis.delete_many.call_args.args) == [
+            "response:a", "response:b", "response:tag:clinic:1", "response:tag:clinics"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_clinic_review_invalidates_clinic_responses(self):
+        """Creating a review drops the clinic's cached responses and clinic lists."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        service = ClinicService(mock_db)
+        service.get_clinic_by_id = AsyncMock()
+        cache = MagicMock(invalidate_tags=AsyncMock(return_value=1))
+        clinic_id = uuid.uuid4()
+
+        with patch("app.clinics.services.get_response_cache", return_value=cache):
+            await service.create_clinic_review(clinic_id=clinic_id, reviewer_id=uuid.uuid4(), rating=5)
+
+        cache.invalidate_tags.assert_awaited_once_with(f"clinic:{clinic_id}", "clinics")
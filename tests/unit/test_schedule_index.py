@@ -0,0 +1,191 @@
+"""
+Unit tests for the in-process schedule index.
+
+Tests interval overlap queries, caching and invalidation of loaded days, and
+the conflict and free-slot searches built on them.
+"""
+
+import pytest
+import random
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.appointments.schedule_index import Interval, IntervalList, ScheduleIndex, SCHEDULE_INDEX
+from app.appointments.services import AppointmentService
+from app.models.appointment import Appointment, AppointmentSlot
+
+DAY = date(2026, 10, 19)
+VET = uuid.uuid4()
+CLINIC = uuid.uuid4()
+
+
+def at(hour, minute=0, day=DAY):
+    """UTC time on a test day."""
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=timezone.utc)
+
+
+def make_slot(start, minutes=30, veterinarian_id=VET, max_bookings=1, current_bookings=0):
+    """Open appointment slot."""
+    return AppointmentSlot(
+        id=uuid.uuid4(),
+        veterinarian_id=veterinarian_id,
+        clinic_id=CLINIC,
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+        duration_minutes=minutes,
+        slot_type="regular",
+        max_bookings=max_bookings,
+        current_bookings=current_bookings,
+    )
+
+
+def loads(appointments=(), slots=()):
+    """execute() results for one schedule load: appointment rows, then slots."""
+    appointment_result = MagicMock()
+    appointment_result.all.return_value = list(appointments)
+    slot_result = MagicMock()
+    slot_result.scalars.return_value.all.return_value = list(slots)
+    return [appointment_result, slot_result]
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture(autouse=True)
+def empty_index():
+    """Start every test with nothing cached in the shared index."""
+    SCHEDULE_INDEX.clear()
+    yield
+    SCHEDULE_INDEX.clear()
+
+
+class TestIntervalList:
+    """Test overlap queries on sorted intervals."""
+
+    def test_overlapping_matches_brute_force(self):
+        """Bisected overlap queries agree with a linear scan."""
+        rng = random.Random(7)
+        intervals = []
+        for _ in range(300):
+            start = at(0) + timedelta(minutes=rng.randrange(0, 24 * 60))
+            intervals.append(Interval(start, start + timedelta(minutes=rng.choice([15, 30, 90])), uuid.uuid4()))
+        index = IntervalList(intervals)
+
+        for _ in range(200):
+            start = at(0) + timedelta(minutes=rng.randrange(0, 24 * 60))
+            end = start + timedelta(minutes=rng.randrange(1, 120))
+            expected = {i.id for i in intervals if i.start < end and i.end > start}
+            assert {i.id for i in index.overlapping(start, end)} == expected
+
+    def test_touching_intervals_do_not_overlap(self):
+        """Intervals are half-open, so back-to-back bookings are fine."""
+        index = IntervalList([Interval(at(9), at(9, 30), uuid.uuid4())])
+
+        assert index.overlapping(at(9, 30), at(10)) == []
+        assert index.overlapping(at(8, 30), at(9)) == []
+        assert len(index.overlapping(at(9, 29), at(9, 31))) == 1
+
+
+class TestScheduleIndex:
+    """Test loading, caching and invalidation of day schedules."""
+
+    @pytest.mark.asyncio
+    async def test_days_are_cached_until_invalidated(self, mock_db):
+        """A loaded day answers later checks without queries until invalidated."""
+        booked = uuid.uuid4()
+        mock_db.execute.side_effect = loads([(booked, VET, at(9), at(9, 30))]) + loads()
+        index = ScheduleIndex()
+
+        assert await index.conflicts(mock_db, VET, at(9, 15), at(9, 45)) == [booked]
+        assert await index.conflicts(mock_db, VET, at(10), at(10, 30)) == []
+        assert mock_db.execute.call_count == 2
+
+        index.invalidate(VET)
+        assert await index.conflicts(mock_db, VET, at(9, 15), at(9, 45)) == []
+        assert mock_db.execute.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_load_racing_a_write_is_not_cached(self, mock_db):
+        """Schedules read before an invalidation are used once but not kept."""
+        index = ScheduleIndex()
+        results = loads() + loads()
+
+        async def execute(statement):
+            if len(results) == 4:
+                index.invalidate(VET)
+            return results.pop(0)
+
+        mock_db.execute.side_effect = execute
+        await index.conflicts(mock_db, VET, at(9), at(10))
+        await index.conflicts(mock_db, VET, at(9), at(10))
+
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_free_slots_skip_booked_times(self, mock_db):
+        """Single-booking slots under an appointment are not offered; shared ones are."""
+        taken = make_slot(at(9))
+        shared = make_slot(at(9), max_bookings=4, current_bookings=1)
+        free = make_slot(at(9, 30))
+        mock_db.execute.side_effect = loads([(uuid.uuid4(), VET, at(9), at(9, 30))], [taken, shared, free])
+
+        slots = await ScheduleIndex().free_slots(mock_db, [VET], CLINIC, at(0), at(0, day=DAY + timedelta(days=1)))
+
+        assert [slot.id for slot in slots] == [shared.id, free.id]
+        assert slots[0].remaining_capacity == 3
+
+    @pytest.mark.asyncio
+    async def test_next_available_across_veterinarians(self, mock_db):
+        """Slots of every veterinarian at the clinic are merged by start time."""
+        other_vet = uuid.uuid4()
+        slots = [make_slot(at(11)), make_slot(at(9), veterinarian_id=other_vet), make_slot(at(10))]
+        vets = MagicMock()
+        vets.scalars.return_value.all.return_value = [VET, other_vet]
+        mock_db.execute.side_effect = [vets] + loads(slots=slots)
+
+        found = await AppointmentService(mock_db).get_next_available_slots(
+            clinic_id=CLINIC, count=2, after=at(8), horizon_days=1
+        )
+
+        assert [slot.start_time for slot in found] == [at(9), at(10)]
+        assert found[0].veterinarian_id == other_vet
+
+
+class TestAppointmentSchedule:
+    """Test ends_at and the service's use of the index."""
+
+    def test_ends_at_follows_start_and_duration(self):
+        """ends_at is recomputed when the start time or duration changes."""
+        appointment = Appointment(scheduled_at=at(9), duration_minutes=45)
+        assert appointment.ends_at == at(9, 45)
+
+        appointment.duration_minutes = 20
+        appointment.scheduled_at = at(14)
+        assert appointment.ends_at == at(14, 20)
+
+    @pytest.mark.asyncio
+    async def test_conflict_check_without_conflicts_loads_no_appointments(self, mock_db):
+        """A free time is confirmed from the index alone."""
+        mock_db.execute.side_effect = loads([(uuid.uuid4(), VET, at(9), at(9, 30))])
+        service = AppointmentService(mock_db)
+
+        assert await service.check_appointment_conflicts(VET, at(10), 30) == []
+        assert await service.check_appointment_conflicts(VET, at(11), 30) == []
+        assert mock_db.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rescheduled_appointment_is_not_its_own_conflict(self, mock_db):
+        """exclude_appointment_id removes the appointment being moved."""
+        moving = uuid.uuid4()
+        mock_db.execute.side_effect = loads([(moving, VET, at(9), at(9, 30))])
+
+        conflicts = await AppointmentService(mock_db).check_appointment_conflicts(
+            VET, at(9, 15), 30, exclude_appointment_id=moving
+        )
+
+        assert conflicts == []
@@ -0,0 +1,136 @@
+"""
+Unit tests for trigram-backed text search.
+
+Checks the PostgreSQL SQL that the search conditions and rank compile to,
+and runs the SQLite fallback against an in-memory table.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.search import TextSearch, trigram_indexes
+from app.models.pet import Pet
+from app.pets.services import PET_SEARCH, PetService
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def animals():
+    """In-memory SQLite table searched on name and breed."""
+    metadata = MetaData()
+    table = Table(
+        "animals",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("breed", String),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(table), [
+            {"id": 1, "name": "Bella", "breed": "Labrador"},
+            {"id": 2, "name": "Max", "breed": "Beagle"},
+            {"id": 3, "name": "Isabella", "breed": "Poodle"},
+            {"id": 4, "name": "Maxine", "breed": "Labrador"},
+            {"id": 5, "name": "Rex_1", "breed": "Boxer"},
+        ])
+    return engine, table
+
+
+def compile_pg(statement):
+    """Render a statement for PostgreSQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def search_ids(animals, search, ranked=False):
+    """Ids matching a search on the SQLite table."""
+    engine, table = animals
+    text_search = TextSearch(table.c.name, table.c.breed)
+    query = select(table.c.id).where(text_search.condition(search))
+    if ranked:
+        query = query.order_by(text_search.rank(search).desc(), table.c.id)
+    else:
+        query = query.order_by(table.c.id)
+    with engine.connect() as connection:
+        return list(connection.execute(query).scalars())
+
+
+class TestTextSearch:
+    """Test search conditions, ranking and the SQLite fallback."""
+
+    def test_long_words_match_anywhere(self, animals):
+        """Words of three or more characters match inside a column."""
+        assert search_ids(animals, "bella") == [1, 3]
+
+    def test_short_words_match_prefix_only(self, animals):
+        """One- and two-letter words only match at the start of a column."""
+        assert search_ids(animals, "ma") == [2, 4]
+        assert search_ids(animals, "la") == [1, 4]
+
+    def test_every_word_must_match(self, animals):
+        """Multi-word terms narrow the result across columns."""
+        assert search_ids(animals, "max lab") == [4]
+
+    def test_like_wildcards_are_literal(self, animals):
+        """% and _ in the term are not treated as wildcards."""
+        assert search_ids(animals, "x_1") == [5]
+        assert search_ids(animals, "e%") == []
+
+    def test_prefix_matches_rank_first(self, animals):
+        """Columns starting with the term outrank infix matches."""
+        assert search_ids(animals, "bel", ranked=True) == [1, 3]
+        assert search_ids(animals, "ella", ranked=True) == [1, 3]
+
+    def test_blank_search_has_no_condition(self):
+        """Whitespace-only terms do not filter."""
+        assert PET_SEARCH.condition("   ") is None
+        assert PET_SEARCH.condition(None) is None
+
+    def test_postgresql_condition_uses_indexable_ilike(self):
+        """Each word becomes an OR of ILIKE patterns the trigram indexes serve."""
+        sql = compile_pg(select(Pet).where(PET_SEARCH.condition("Rex Lab")))
+
+        assert sql.count("pets.name ILIKE") == 2
+        assert "pets.breed ILIKE" in sql
+        params = PET_SEARCH.condition("Rex Lab").compile(dialect=postgresql.dialect()).params
+        assert set(params.values()) == {"%rex%", "%lab%"}
+
+    def test_postgresql_rank_uses_word_similarity(self):
+        """Ranking uses pg_trgm word_similarity over every searched column."""
+        sql = compile_pg(select(PET_SEARCH.rank("rex")))
+
+        assert "greatest(word_similarity(" in sql
+        assert "pets.species)) AS" in sql
+
+    def test_trigram_indexes(self):
+        """Searched columns get GIN trigram indexes."""
+        index_names = {index.name for index in Pet.__table__.indexes}
+
+        assert {"ix_pets_name_trgm", "ix_pets_breed_trgm", "ix_pets_species_trgm"} <= index_names
+        index, = trigram_indexes("pets", "name")
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+        assert index.dialect_options["postgresql"]["ops"] == {"name": "gin_trgm_ops"}
+
+    @pytest.mark.asyncio
+    async def test_list_pets_search_orders_by_rank(self, mock_db):
+        """A search without sort_by is ordered by relevance, offset-paginated."""
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 0
+        mock_result.scalars.return_value.all.return_value = []
+        mock_db.execute.return_value = mock_result
+
+        pets, total = await PetService(mock_db).list_pets(search="rex")
+
+        sql = compile_pg(mock_db.execute.call_args[0][0])
+        assert "ORDER BY CASE WHEN" in sql
+        assert "word_similarity" in sql
+        assert pets.next_cursor is None
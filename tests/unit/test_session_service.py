@@ -0,0 +1,124 @@
+"""
+Unit tests for session service.
+Tests that multi-session operations are batched into single Redis round-trips.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.cache_codec import CacheCodec
+from app.services.session_service import SessionService
+
+
+def session(session_id, user_id="user_123", is_active=True, last_activity="2024-01-01T00:00:00"):
+    """Session data as stored by SessionService.create_session."""
+    return {
+        "session_id": session_id,
+        "user_id": user_id,
+        "is_active": is_active,
+        "last_activity": last_activity,
+    }
+
+
+@pytest.fixture
+def pipe():
+    """Pipeline mock recording queued commands."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    return pipe
+
+
+@pytest.fixture
+def mock_redis_client(pipe):
+    """Mock RedisClient whose pipeline() yields the pipe fixture."""
+    mock_redis = AsyncMock()
+
+    @asynccontextmanager
+    async def pipeline(transaction=False, binary=False):
+        yield pipe
+
+    codec = CacheCodec("json")
+    mock_redis.pipeline = pipeline
+    mock_redis.encode_value = MagicMock(side_effect=codec.encode)
+    mock_redis.decode_value = MagicMock(side_effect=codec.decode)
+    mock_redis.set_members.return_value = set()
+    mock_redis.mget_json.return_value = []
+    return mock_redis
+
+
+@pytest.fixture
+def session_service(mock_redis_client):
+    """SessionService with mocked Redis."""
+    service = SessionService()
+    service.redis = mock_redis_client
+    return service
+
+
+class TestSessionService:
+    """Test batched session operations."""
+
+    @pytest.mark.asyncio
+    async def test_create_session_is_one_pipeline(self, session_service, pipe):
+        """Session data and the user's session list are written together."""
+        result = await session_service.create_session(
+            user_id="user_123", clerk_id="clerk_123", email="a@example.com",
+            role="pet_owner", permissions=[]
+        )
+
+        pipe.setex.assert_called_once()
+        pipe.sadd.assert_called_once_with("user_sessions:user_123", result["session_id"])
+        pipe.expire.assert_called_once()
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_user_sessions_uses_one_mget(self, session_service, mock_redis_client):
+        """All of a user's sessions are fetched with a single MGET."""
+        mock_redis_client.set_members.return_value = {"s1", "s2", "s3"}
+        mock_redis_client.mget_json.return_value = [session("s1"), None, session("s3", is_active=False)]
+
+        sessions = await session_service.get_user_sessions("user_123")
+
+        assert [s["session_id"] for s in sessions] == ["s1"]
+        mock_redis_client.mget_json.assert_awaited_once()
+        assert len(mock_redis_client.mget_json.call_args.args[0]) == 3
+        mock_redis_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_sessions_is_one_pipeline(self, session_service, mock_redis_client, pipe):
+        """Every session but the excluded one is deleted in one round-trip."""
+        mock_redis_client.set_members.return_value = {"s1", "s2", "keep"}
+        mock_redis_client.mget_json.return_value = [session("s1"), session("s2"), session("keep")]
+
+        count = await session_service.invalidate_user_sessions("user_123", exclude_session="keep")
+
+        assert count == 2
+        assert sorted(pipe.delete.call_args.args) == ["session:s1", "session:s2"]
+        assert sorted(pipe.srem.call_args.args[1:]) == ["s1", "s2"]
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_validate_session_reads_data_and_ttl_together(self, session_service, mock_redis_client, pipe):
+        """Validation pipelines GET and TTL, then rewrites with the remaining TTL."""
+        pipe.execute.return_value = [CacheCodec("json").encode(session("s1")), 120]
+
+        result = await session_service.validate_session("s1")
+
+        assert result["session_id"] == "s1"
+        pipe.get.assert_called_once_with("session:s1")
+        pipe.ttl.assert_called_once_with("session:s1")
+        assert mock_redis_client.set.call_args.args[2] == 120
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_sessions_removes_stale_ids_at_once(self, session_service, mock_redis_client):
+        """Stale session IDs of a user are removed with one SREM."""
+        async def scan_keys(pattern):
+            yield "user_sessions:user_123"
+
+        mock_redis_client.scan_keys = scan_keys
+        mock_redis_client.set_members.return_value = ["s1", "s2"]
+        mock_redis_client.mget_json.return_value = [None, session("s2")]
+        mock_redis_client.set_remove.return_value = 1
+
+        assert await session_service.cleanup_expired_sessions() == 1
+        mock_redis_client.set_remove.assert_awaited_once_with("user_sessions:user_123", "s1")
@@ -0,0 +1,143 @@
+"""
+Unit tests for request coalescing.
+
+Tests in-worker deduplication of identical concurrent calls and the
+cross-worker Redis lock and result key with Redis mocked out.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.single_flight import SingleFlight, single_flight_key
+
+
+@pytest.fixture
+def flight():
+    """SingleFlight with mocked Redis."""
+    flight = SingleFlight()
+    flight.redis = AsyncMock()
+    flight.redis.get_json.return_value = None
+    flight.redis.set_if_absent.return_value = True
+    return flight
+
+
+def slow_call(calls, result, delay=0.05):
+    """Coroutine function counting its runs."""
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+    return call
+
+
+class TestSingleFlightKey:
+    """Test call identity."""
+
+    def test_argument_order_does_not_matter(self):
+        assert single_flight_key("stats", clinic_id=1, group_by="day") == \
+            single_flight_key("stats", group_by="day", clinic_id=1)
+
+    def test_different_arguments_differ(self):
+        assert single_flight_key("stats", clinic_id=1) != single_flight_key("stats", clinic_id=2)
+
+
+class TestSingleFlight:
+    """Test in-worker coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_run_once(self, flight):
+        """Followers get the leader's result."""
+        calls = []
+        results = await asyncio.gather(*[
+            flight.do("stats:a", slow_call(calls, {"total": 3})) for _ in range(10)
+        ])
+
+        assert calls == [1]
+        assert results == [{"total": 3}] * 10
+        assert flight.statistics()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self, flight):
+        calls = []
+        await asyncio.gather(
+            flight.do("stats:a", slow_call(calls, 1)),
+            flight.do("stats:b", slow_call(calls, 2)),
+        )
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self, flight):
+        """Only in-flight calls are shared."""
+        calls = []
+        await flight.do("stats:a", slow_call(calls, 1, delay=0))
+        await flight.do("stats:a", slow_call(calls, 1, delay=0))
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_leader_exception_reaches_followers(self, flight):
+        async def failing():
+            await asyncio.sleep(0.05)
+            raise ValueError("query failed")
+
+        results = await asyncio.gather(
+            *[flight.do("stats:a", failing) for _ in range(3)], return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over_to_follower(self, flight):
+        """A follower of a cancelled leader runs the call itself."""
+        calls = []
+        leader = asyncio.create_task(flight.do("stats:a", slow_call(calls, 1, delay=1)))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("stats:a", slow_call(calls, 2, delay=0)))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == 2
+        assert len(calls) == 2
+
+
+class TestDistributedSingleFlight:
+    """Test coalescing across workers through Redis."""
+
+    @pytest.mark.asyncio
+    async def test_leader_publishes_result_and_releases_lock(self, flight):
+        calls = []
+
+        assert await flight.do("stats:a", slow_call(calls, {"total": 3}, delay=0), distributed=True) == {"total": 3}
+
+        flight.redis.set_json.assert_awaited_once()
+        assert flight.redis.set_json.call_args.args[1] == {"value": {"total": 3}}
+        flight.redis.delete.assert_awaited_once_with("single_flight:stats:a:lock")
+
+    @pytest.mark.asyncio
+    async def test_follower_waits_for_other_workers_result(self, flight):
+        """Without the lock, the published result is used instead of the database."""
+        calls = []
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b"published", 1])
+        pipeline = MagicMock()
+        pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        flight.redis.pipeline = pipeline
+        flight.redis.decode_value = MagicMock(return_value={"value": {"total": 5}})
+        flight.redis.set_if_absent.return_value = False
+
+        result = await flight.do("stats:a", slow_call(calls, {"total": 3}), distributed=True)
+
+        assert result == {"total": 5}
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_runs_locally(self, flight):
+        calls = []
+        flight.redis.get_json.side_effect = ConnectionError("Redis unavailable")
+
+        assert await flight.do("stats:a", slow_call(calls, 1, delay=0), distributed=True) == 1
+        assert calls == [1]
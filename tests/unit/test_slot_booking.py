@@ -0,0 +1,190 @@
+"""
+Unit tests for race-free appointment slot booking.
+
+Tests the conditional UPDATE used to take and release slot bookings, how
+appointments claim and give back their slot, and how overlap violations from
+the database are reported. Parallel bookings against a real database are
+covered in tests/integration/test_slot_booking_concurrency.py.
+"""
+
+import pytest
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+
+from app.appointments.services import AppointmentService
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.models.appointment import (
+    Appointment, AppointmentPriority, AppointmentSlot, AppointmentStatus, AppointmentType
+)
+
+VET = uuid.uuid4()
+CLINIC = uuid.uuid4()
+START = datetime.utcnow().replace(microsecond=0) + timedelta(days=2)
+
+
+def make_slot(current_bookings=1, max_bookings=1):
+    """Slot as returned by the booking UPDATE."""
+    return AppointmentSlot(
+        id=uuid.uuid4(),
+        veterinarian_id=VET,
+        clinic_id=CLINIC,
+        start_time=START,
+        end_time=START + timedelta(minutes=30),
+        duration_minutes=30,
+        max_bookings=max_bookings,
+        current_bookings=current_bookings,
+    )
+
+
+def returning(slot):
+    """scalars() result of an UPDATE ... RETURNING."""
+    result = MagicMock()
+    result.first.return_value = slot
+    return result
+
+
+def statement_sql(call):
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session."""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def no_stats():
+    """Daily statistics upkeep is covered elsewhere."""
+    with patch("app.appointments.services.apply_daily_stats_change", new=AsyncMock()):
+        yield
+
+
+class TestSlotBooking:
+    """Test booking and releasing slots with conditional updates."""
+
+    @pytest.mark.asyncio
+    async def test_booking_is_one_conditional_update(self, mock_db):
+        """The count is incremented in SQL, guarded by the capacity check."""
+        slot = make_slot()
+        mock_db.scalars.return_value = returning(slot)
+
+        assert await AppointmentService(mock_db).book_slot(slot.id) is slot
+
+        sql = statement_sql(mock_db.scalars.call_args)
+        assert sql.startswith("UPDATE appointment_slots SET current_bookings=(appointment_slots.current_bookings +")
+        assert "appointment_slots.current_bookings < appointment_slots.max_bookings" in sql
+        assert "RETURNING" in sql
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_full_slot_is_a_conflict(self, mock_db):
+        """No row back from an existing slot means it has no capacity left."""
+        mock_db.scalars.return_value = returning(None)
+        mock_db.scalar.return_value = 1
+
+        with pytest.raises(ConflictError):
+            await AppointmentService(mock_db).book_slot(uuid.uuid4())
+        mock_db.rollback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_slot_is_not_found(self, mock_db):
+        """No row back from a slot that does not exist is a 404."""
+        mock_db.scalars.return_value = returning(None)
+        mock_db.scalar.return_value = 0
+
+        with pytest.raises(NotFoundError):
+            await AppointmentService(mock_db).book_slot(uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_release_never_goes_below_zero(self, mock_db):
+        """Releases are guarded by current_bookings > 0."""
+        mock_db.scalars.return_value = returning(None)
+
+        assert await AppointmentService(mock_db).release_slot(uuid.uuid4()) is None
+        sql = statement_sql(mock_db.scalars.call_args)
+        assert "current_bookings=(appointment_slots.current_bookings -" in sql
+        assert "appointment_slots.current_bookings > %(current_bookings_2)s" in sql
+
+
+class TestAppointmentSlotLink:
+    """Test appointments that hold a slot booking."""
+
+    @pytest.mark.asyncio
+    async def test_create_appointment_claims_slot(self, mock_db, no_stats):
+        """The slot is booked in the appointment's transaction and linked to it."""
+        slot = make_slot()
+        mock_db.scalars.return_value = returning(slot)
+
+        appointment = await AppointmentService(mock_db).create_appointment(
+            pet_id=uuid.uuid4(), pet_owner_id=uuid.uuid4(), veterinarian_id=VET, clinic_id=CLINIC,
+            appointment_type=AppointmentType.CONSULTATION, scheduled_at=START, reason="Check-up",
+            slot_id=slot.id,
+        )
+
+        assert appointment.slot_id == slot.id
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_slot_of_another_veterinarian_is_rejected(self, mock_db, no_stats):
+        """A mismatched slot rolls back, undoing the booking just taken."""
+        slot = make_slot()
+        mock_db.scalars.return_value = returning(slot)
+
+        with pytest.raises(ValidationError):
+            await AppointmentService(mock_db).create_appointment(
+                pet_id=uuid.uuid4(), pet_owner_id=uuid.uuid4(), veterinarian_id=uuid.uuid4(), clinic_id=CLINIC,
+                appointment_type=AppointmentType.CONSULTATION, scheduled_at=START, reason="Check-up",
+                slot_id=slot.id,
+            )
+
+        mock_db.commit.assert_not_called()
+        mock_db.rollback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_releases_slot(self, mock_db, no_stats):
+        """Cancelling gives the slot's booking back and unlinks it."""
+        slot_id = uuid.uuid4()
+        appointment = Appointment(
+            id=uuid.uuid4(), veterinarian_id=VET, clinic_id=CLINIC, scheduled_at=START,
+            appointment_type=AppointmentType.CONSULTATION, priority=AppointmentPriority.NORMAL,
+            status=AppointmentStatus.SCHEDULED, slot_id=slot_id,
+        )
+        mock_db.scalars.return_value = returning(make_slot(current_bookings=0))
+        service = AppointmentService(mock_db)
+        service.get_appointment_by_id = AsyncMock(return_value=appointment)
+
+        await service.cancel_appointment(appointment.id)
+
+        assert appointment.slot_id is None
+        assert "current_bookings -" in statement_sql(mock_db.scalars.call_args)
+
+    @pytest.mark.asyncio
+    async def test_overlap_violation_is_a_conflict(self, mock_db, no_stats):
+        """The exclusion constraint firing at commit surfaces as ConflictError."""
+        mock_db.commit.side_effect = IntegrityError(
+            "INSERT INTO appointments ...", {},
+            Exception('conflicting key value violates exclusion constraint "ex_appointments_vet_overlap"'),
+        )
+
+        with pytest.raises(ConflictError):
+            await AppointmentService(mock_db).create_appointment(
+                pet_id=uuid.uuid4(), pet_owner_id=uuid.uuid4(), veterinarian_id=VET, clinic_id=CLINIC,
+                appointment_type=AppointmentType.CONSULTATION, scheduled_at=START, reason="Check-up",
+            )
+
+    def test_overlap_exclusion_constraint(self):
+        """Active appointments of one veterinarian exclude each other unless they share a slot."""
+        ddl = str(CreateTable(Appointment.__table__).compile(dialect=postgresql.dialect()))
+
+        assert (
+            "CONSTRAINT ex_appointments_vet_overlap EXCLUDE USING gist "
+            "(veterinarian_id WITH =, tstzrange(scheduled_at, ends_at) WITH &&, coalesce(slot_id, id) WITH <>) "
+            "WHERE (status IN ('SCHEDULED', 'CONFIRMED', 'IN_PROGRESS'))"
+        ) in ddl
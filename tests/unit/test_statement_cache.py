@@ -0,0 +1,67 @@
+"""
+Unit tests for prebuilt statements.
+
+Tests that statements are built once per include combination and executed
+with their values bound as parameters.
+"""
+
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.statement_cache import StatementCache
+from app.models.pet import Pet
+from app.pets.services import PET_BY_ID, PET_DETAIL_PROFILE, PetService
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session returning one pet."""
+    mock_db = AsyncMock(spec=AsyncSession)
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = Pet(id=uuid.uuid4(), name="Rex")
+    mock_db.execute.return_value = mock_result
+    return mock_db
+
+
+class TestStatementCache:
+    """Test statement reuse."""
+
+    def test_same_includes_reuse_the_statement(self):
+        cache = StatementCache("pets.test", lambda: select(Pet).where(Pet.id == bindparam("pet_id")),
+                               profile=PET_DETAIL_PROFILE)
+
+        first = cache.get(include_owner=True)
+
+        assert cache.get(include_owner=True) is first
+        assert cache.get(include_owner=True, include_appointments=False) is first
+        assert cache.get() is not first
+        assert cache.statistics() == {"statements": 2, "hits": 2, "misses": 2}
+
+    def test_includes_are_applied_once(self):
+        statement = StatementCache(
+            "pets.test", lambda: select(Pet), profile=PET_DETAIL_PROFILE
+        ).get(include_owner=True, include_health_records=True)
+
+        assert len(statement._with_options) == 2
+
+    def test_size_is_bounded(self):
+        cache = StatementCache("pets.test", lambda: select(Pet), profile=PET_DETAIL_PROFILE, maxsize=2)
+        cache.get()
+        cache.get(include_owner=True)
+        cache.get(include_appointments=True)
+
+        assert cache.statistics()["statements"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_pet_by_id_binds_the_id(self, mock_db):
+        """PetService executes the shared statement with pet_id as a parameter."""
+        pet_id = uuid.uuid4()
+
+        await PetService(mock_db).get_pet_by_id(pet_id, include_owner=True)
+
+        statement, params = mock_db.execute.call_args.args
+        assert statement is PET_BY_ID.get(include_owner=True)
+        assert params == {"pet_id": pet_id}
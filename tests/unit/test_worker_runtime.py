@@ -0,0 +1,78 @@
+"""
+Unit tests for the Celery worker async runtime.
+
+Tests that coroutines share one long-lived loop, that interrupted waits
+cancel their coroutine, and that pools are opened and closed once, with the
+pool setup mocked out.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.worker_runtime import WorkerRuntime
+
+
+@pytest.fixture
+def runtime():
+    """Runtime with pool setup and teardown mocked."""
+    with patch.object(WorkerRuntime, "_open_pools", AsyncMock()) as open_pools, \
+         patch.object(WorkerRuntime, "_close_pools", AsyncMock()) as close_pools:
+        runtime = WorkerRuntime()
+        runtime.open_pools, runtime.close_pools = open_pools, close_pools
+        yield runtime
+        runtime.stop()
+
+
+class TestWorkerRuntime:
+    """Test the worker event loop."""
+
+    def test_tasks_share_one_loop(self, runtime):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loops = {runtime.run(current_loop()) for _ in range(3)}
+
+        assert len(loops) == 1
+        assert runtime.tasks_run == 3
+        runtime.open_pools.assert_awaited_once()
+
+    def test_start_is_idempotent(self, runtime):
+        runtime.start()
+        runtime.start()
+
+        runtime.open_pools.assert_awaited_once()
+
+    def test_errors_propagate(self, runtime):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            runtime.run(fail())
+
+    def test_interrupted_wait_cancels_the_coroutine(self, runtime):
+        cancelled = threading.Event()
+        runtime.start()
+
+        async def slow():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch("concurrent.futures.Future.result", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                runtime.run(slow())
+
+        assert cancelled.wait(timeout=1)
+
+    def test_stop_closes_pools_once(self, runtime):
+        runtime.start()
+
+        runtime.stop()
+        runtime.stop()
+
+        runtime.close_pools.assert_awaited_once()